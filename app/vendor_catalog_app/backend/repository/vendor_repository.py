@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import tempfile
 import threading
+from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from vendor_catalog_app.backend.repository_mixins import (
@@ -18,14 +21,44 @@ from vendor_catalog_app.backend.repository_mixins import (
 )
 from vendor_catalog_app.core.config import AppConfig
 from vendor_catalog_app.core.env import (
+    TVENDOR_AUDIT_FLUSH_BATCH_SIZE,
+    TVENDOR_AUDIT_FLUSH_INTERVAL_MS,
+    TVENDOR_AUDIT_SPOOL_DIR,
+    TVENDOR_AUDIT_SPOOL_ENABLED,
+    TVENDOR_AUDIT_SPOOL_FSYNC,
+    TVENDOR_GLOBAL_SEARCH_BUDGET_MS,
+    TVENDOR_LOCAL_FTS_ENABLED,
+    TVENDOR_OPTION_REGISTRY_REVALIDATE_SEC,
+    TVENDOR_PAGE_COUNT_CACHE_TTL_SEC,
     TVENDOR_REPO_CACHE_ENABLED,
     TVENDOR_REPO_CACHE_MAX_ENTRIES,
     TVENDOR_REPO_CACHE_TTL_SEC,
+    TVENDOR_REQUEST_MEMO_ENABLED,
+    TVENDOR_TYPEAHEAD_INDEX_ENABLED,
+    TVENDOR_TYPEAHEAD_INDEX_MAX_ROWS,
+    TVENDOR_TYPEAHEAD_INDEX_REVALIDATE_SEC,
+    TVENDOR_USAGE_LOG_BACKPRESSURE_SAMPLE_RATE,
+    TVENDOR_USAGE_LOG_BUFFER_ENABLED,
+    TVENDOR_USAGE_LOG_BUFFER_MAX_EVENTS,
+    TVENDOR_USAGE_LOG_FLUSH_BATCH_SIZE,
+    TVENDOR_USAGE_LOG_FLUSH_INTERVAL_MS,
+    TVENDOR_VENDOR_SEARCH_DOC_ENABLED,
+    get_env,
     get_env_bool,
+    get_env_float,
     get_env_int,
 )
+from vendor_catalog_app.core.role_policy import RolePolicyTable
+from vendor_catalog_app.infrastructure.buffered_writer import BufferedBatchWriter
 from vendor_catalog_app.infrastructure.cache import LruTtlCache
 from vendor_catalog_app.infrastructure.db import DatabricksSQLClient
+from vendor_catalog_app.infrastructure.paging import BackgroundCountCache
+from vendor_catalog_app.infrastructure.registry import VersionedRegistry
+from vendor_catalog_app.infrastructure.spool import DurableSpool
+
+# Scratch default so local runs never write into the source tree; deployments must point
+# TVENDOR_AUDIT_SPOOL_DIR at persistent storage or unflushed audit rows are lost on reboot.
+DEFAULT_AUDIT_SPOOL_DIR = Path(tempfile.gettempdir()) / "tvendor_audit_spool"
 
 
 class VendorRepository(
@@ -63,8 +96,60 @@ class VendorRepository(
             max_entries=self._repo_cache_max_entries,
             clone_value=self._clone_cache_value,
         )
+        self._request_memo_enabled = get_env_bool(TVENDOR_REQUEST_MEMO_ENABLED, default=True)
+        self._role_policy_table = RolePolicyTable()
+        self._option_registry = VersionedRegistry(
+            revalidate_sec=get_env_int(TVENDOR_OPTION_REGISTRY_REVALIDATE_SEC, default=30, min_value=0, max_value=3600),
+        )
+        # Bumped by every cache clear (i.e. every write), so in-memory indexes rebuild after writes.
+        self._data_generation = 0
+        self._typeahead_index_enabled = get_env_bool(TVENDOR_TYPEAHEAD_INDEX_ENABLED, default=True)
+        self._typeahead_index_max_rows = get_env_int(TVENDOR_TYPEAHEAD_INDEX_MAX_ROWS, default=50000, min_value=1)
+        self._typeahead_registry = VersionedRegistry(
+            revalidate_sec=get_env_int(TVENDOR_TYPEAHEAD_INDEX_REVALIDATE_SEC, default=30, min_value=0, max_value=3600),
+            rebuild_in_background=True,
+        )
+        self._vendor_search_doc_enabled = get_env_bool(TVENDOR_VENDOR_SEARCH_DOC_ENABLED, default=True)
+        self._vendor_search_doc_lock = threading.Lock()
+        self._vendor_search_doc_available = False
+        self._vendor_search_doc_checked_at: float | None = None
+        self._vendor_search_doc_full_rebuild_needed = False
+        # Start of the last full rebuild or catch-up; rows updated since then are caught up.
+        self._vendor_search_doc_synced_at: datetime | None = None
+        self._vendor_search_doc_sync_lock = threading.Lock()
+        self._vendor_search_doc_sync_thread: threading.Thread | None = None
+        self._local_fts_enabled = get_env_bool(TVENDOR_LOCAL_FTS_ENABLED, default=True)
+        self._local_fts_table_names: frozenset[str] | None = None
+        self._global_search_budget_ms = get_env_int(TVENDOR_GLOBAL_SEARCH_BUDGET_MS, default=300, min_value=1)
+        self._page_count_cache = BackgroundCountCache(
+            ttl_seconds=get_env_int(TVENDOR_PAGE_COUNT_CACHE_TTL_SEC, default=60, min_value=0),
+        )
         self._usage_event_lock = threading.Lock()
         self._usage_event_last_seen: dict[tuple[str, str, str], float] = {}
+        self._usage_writer = BufferedBatchWriter[tuple[str, str, str, Any, str]](
+            name="usage_log",
+            flush_batch=self._write_usage_event_batch,
+            enabled=get_env_bool(TVENDOR_USAGE_LOG_BUFFER_ENABLED, default=True),
+            max_queue=get_env_int(TVENDOR_USAGE_LOG_BUFFER_MAX_EVENTS, default=5000, min_value=1),
+            batch_size=get_env_int(TVENDOR_USAGE_LOG_FLUSH_BATCH_SIZE, default=200, min_value=1),
+            flush_interval_ms=get_env_int(TVENDOR_USAGE_LOG_FLUSH_INTERVAL_MS, default=2000, min_value=10),
+            backpressure_sample_rate=get_env_float(
+                TVENDOR_USAGE_LOG_BACKPRESSURE_SAMPLE_RATE,
+                default=0.25,
+                min_value=0.0,
+                max_value=1.0,
+            ),
+        )
+        audit_spool_dir = get_env(TVENDOR_AUDIT_SPOOL_DIR) or str(DEFAULT_AUDIT_SPOOL_DIR)
+        self._audit_spool = DurableSpool(
+            name="audit_entity_change",
+            directory=audit_spool_dir,
+            flush_batch=self._write_audit_entity_change_batch,
+            enabled=get_env_bool(TVENDOR_AUDIT_SPOOL_ENABLED, default=True),
+            batch_size=get_env_int(TVENDOR_AUDIT_FLUSH_BATCH_SIZE, default=100, min_value=1),
+            flush_interval_ms=get_env_int(TVENDOR_AUDIT_FLUSH_INTERVAL_MS, default=1000, min_value=10),
+            fsync=get_env_bool(TVENDOR_AUDIT_SPOOL_FSYNC, default=True),
+        )
 
     def cache_info(self):
         class CacheInfo:
@@ -2,6 +2,7 @@ from .audit import RepositoryCoreAuditMixin
 from .cache_runtime import RepositoryCoreCacheMixin
 from .frame_utils import RepositoryCoreFrameMixin
 from .identity import RepositoryCoreIdentityMixin
+from .local_search import RepositoryCoreLocalSearchMixin
 from .lookup_schema import RepositoryCoreLookupMixin
 from .sql_io import RepositoryCoreSqlMixin
 
@@ -10,6 +11,7 @@ __all__ = [
     "RepositoryCoreCacheMixin",
     "RepositoryCoreFrameMixin",
     "RepositoryCoreIdentityMixin",
+    "RepositoryCoreLocalSearchMixin",
     "RepositoryCoreLookupMixin",
     "RepositoryCoreSqlMixin",
 ]
@@ -4,6 +4,7 @@ import json
 import logging
 import re
 import uuid
+from datetime import datetime
 from typing import Any
 
 import pandas as pd
@@ -16,6 +17,8 @@ from vendor_catalog_app.core.security import (
 from vendor_catalog_app.infrastructure.db import DataConnectionError, DataExecutionError
 
 LOGGER = logging.getLogger(__name__)
+# Nine bound values per row keeps each statement under SQLite's variable limit.
+AUDIT_INSERT_CHUNK_ROWS = 100
 
 
 class RepositoryCoreAuditMixin:
@@ -198,23 +201,23 @@ class RepositoryCoreAuditMixin:
         request_id: str | None = None,
     ) -> str:
         change_event_id = str(uuid.uuid4())
-        actor_ref = self._actor_ref(actor_user_principal)
+        record = {
+            "change_event_id": change_event_id,
+            "entity_name": entity_name,
+            "entity_id": entity_id,
+            "action_type": action_type,
+            "before_json": json.dumps(before_json, default=str) if before_json is not None else None,
+            "after_json": json.dumps(after_json, default=str) if after_json is not None else None,
+            "actor_user_principal": actor_user_principal,
+            "event_ts": self._now().isoformat(),
+            "request_id": request_id,
+        }
         try:
-            self._execute_file(
-                "inserts/audit_entity_change.sql",
-                params=(
-                    change_event_id,
-                    entity_name,
-                    entity_id,
-                    action_type,
-                    json.dumps(before_json, default=str) if before_json is not None else None,
-                    json.dumps(after_json, default=str) if after_json is not None else None,
-                    actor_ref,
-                    self._now(),
-                    request_id,
-                ),
-                audit_entity_change=self._table("audit_entity_change"),
-            )
+            try:
+                self._audit_spool.append(record)
+            except OSError:
+                LOGGER.warning("Failed to spool audit record; writing it directly.", exc_info=True)
+                self._write_audit_entity_change_batch([record])
         except (DataExecutionError, DataConnectionError):
             LOGGER.debug(
                 "Failed to write audit_entity_change for '%s/%s'.",
@@ -224,3 +227,58 @@ class RepositoryCoreAuditMixin:
             )
         return change_event_id
 
+    def flush_audit_entity_changes(self) -> int:
+        """Deliver spooled audit records now instead of waiting for the flusher thread."""
+        try:
+            return self._audit_spool.flush()
+        except OSError:
+            LOGGER.warning("Failed to flush the audit spool.", exc_info=True)
+            return 0
+
+    def start_audit_spool(self) -> bool:
+        """Take ownership of the audit spool and replay records a previous process left behind."""
+        try:
+            return self._audit_spool.start()
+        except OSError:
+            LOGGER.warning("Failed to start the audit spool.", exc_info=True)
+            return False
+
+    def _write_audit_entity_change_batch(self, records: list[dict[str, Any]]) -> None:
+        """Insert spooled audit records, skipping change_event_ids already written (spool replays)."""
+        actor_refs: dict[str, str] = {}
+        rows: list[tuple[Any, ...]] = []
+        for record in records:
+            actor_principal = str(record.get("actor_user_principal") or "")
+            if actor_principal not in actor_refs:
+                actor_refs[actor_principal] = self._actor_ref(actor_principal)
+            try:
+                event_ts = datetime.fromisoformat(str(record.get("event_ts")))
+            except ValueError:
+                event_ts = self._now()
+            rows.append(
+                (
+                    record.get("change_event_id") or str(uuid.uuid4()),
+                    record.get("entity_name"),
+                    record.get("entity_id"),
+                    record.get("action_type"),
+                    record.get("before_json"),
+                    record.get("after_json"),
+                    actor_refs[actor_principal],
+                    event_ts,
+                    record.get("request_id"),
+                )
+            )
+        sql_path = (
+            "local/insert_audit_entity_changes_batch.sql"
+            if self.config.use_local_db
+            else "inserts/audit_entity_changes_batch.sql"
+        )
+        for start in range(0, len(rows), AUDIT_INSERT_CHUNK_ROWS):
+            chunk = rows[start : start + AUDIT_INSERT_CHUNK_ROWS]
+            self._execute_file(
+                sql_path,
+                params=tuple(value for row in chunk for value in row),
+                audit_entity_change=self._table("audit_entity_change"),
+                values_rows=",\n  ".join("(%s, %s, %s, %s, %s, %s, %s, %s, %s)" for _ in chunk),
+            )
+        self._refresh_vendor_search_docs_for_changes(records)
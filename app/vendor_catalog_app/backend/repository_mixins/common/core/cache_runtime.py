@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from copy import deepcopy
 from typing import Any
 
 import pandas as pd
 
 from vendor_catalog_app.core.env import TVENDOR_USAGE_LOG_MIN_INTERVAL_SEC, get_env
+from vendor_catalog_app.infrastructure.db import (
+    clear_request_memo,
+    request_memo_lookup,
+    request_memo_store,
+)
 
 
 class RepositoryCoreCacheMixin:
@@ -19,10 +24,17 @@ class RepositoryCoreCacheMixin:
             return deepcopy(value)
         return value
 
-    def _cache_clear(self) -> None:
+    def _cache_clear(self, *, tables: Iterable[str] | None = None) -> None:
+        """Drop cached reads after a write to ``tables`` (None when the tables are unknown)."""
         self._repo_cache.clear()
+        clear_request_memo()
+        self._data_generation = getattr(self, "_data_generation", 0) + 1
+        self._invalidate_typeahead_indexes(tables)
+        self._mark_vendor_search_docs_stale(tables)
 
     def close(self) -> None:
+        self._usage_writer.close()
+        self._audit_spool.close()
         self.client.close()
 
     def _cached(
@@ -35,6 +47,21 @@ class RepositoryCoreCacheMixin:
         ttl = self._repo_cache_ttl_seconds if ttl_seconds is None else max(0, int(ttl_seconds))
         return self._repo_cache.get_or_load(key, loader, ttl_seconds=ttl)
 
+    def _request_memoized(self, key: tuple[Any, ...], loader: Callable[[], Any]) -> Any:
+        """Dedupe identical reads within one request; writes clear the memo."""
+        if not self._request_memo_enabled:
+            return loader()
+        try:
+            hash(key)
+        except TypeError:
+            return loader()
+        found, value = request_memo_lookup(key)
+        if found:
+            return self._clone_cache_value(value)
+        value = loader()
+        request_memo_store(key, self._clone_cache_value(value))
+        return value
+
     def _allow_usage_event(
         self,
         *,
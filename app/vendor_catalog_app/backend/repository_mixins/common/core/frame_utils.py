@@ -29,10 +29,15 @@ class RepositoryCoreFrameMixin:
         return normalized
 
     def _query_or_empty(
-        self, statement: str, params: tuple | None = None, columns: list[str] | None = None
+        self,
+        statement: str,
+        params: tuple | None = None,
+        columns: list[str] | None = None,
+        *,
+        use_cache: bool = True,
     ) -> pd.DataFrame:
         try:
-            return self.client.query(statement, params)
+            return self.client.query(statement, params, use_cache=use_cache)
         except (DataQueryError, DataConnectionError):
             return pd.DataFrame(columns=columns or [])
 
@@ -346,7 +346,10 @@ class RepositoryCoreIdentityMixin:
             return login_identifier
 
     def _actor_ref(self, user_principal: str) -> str:
-        return self.resolve_user_id(user_principal, allow_create=True) or UNKNOWN_USER_PRINCIPAL
+        return self._request_memoized(
+            ("actor_ref", str(user_principal or "").strip()),
+            lambda: self.resolve_user_id(user_principal, allow_create=True) or UNKNOWN_USER_PRINCIPAL,
+        )
 
     def _user_display_lookup(self) -> dict[str, str]:
         def _load() -> dict[str, str]:
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+
+from vendor_catalog_app.infrastructure.db import DataConnectionError, DataQueryError
+
+LOGGER = logging.getLogger(__name__)
+
+# Search name -> FTS5 table from setup/v1_schema/local_db/08_create_search_fts.sql.
+LOCAL_FTS_TABLES: dict[str, str] = {
+    "vendors": "search_fts_vendor",
+    "offerings": "search_fts_offering",
+    "projects": "search_fts_project",
+    "contracts": "search_fts_contract",
+    "vendor_contacts": "search_fts_vendor_contact",
+    "offering_contacts": "search_fts_offering_contact",
+    "vendor_search_docs": "search_fts_vendor_search_doc",
+}
+# The trigram tokenizer cannot answer shorter substrings from the index.
+LOCAL_FTS_MIN_QUERY_CHARS = 3
+
+
+class RepositoryCoreLocalSearchMixin:
+    """Routes local-mode ``LIKE '%q%'`` searches to the trigram FTS5 indexes.
+
+    A quoted trigram phrase matches exactly the rows a case-insensitive substring
+    ``LIKE`` would, so callers swap their per-column ``LIKE`` block for a rowid
+    membership test. Queries shorter than three characters, queries containing ``LIKE``
+    wildcards, Databricks mode and databases built before the FTS script keep the
+    ``LIKE`` path.
+    """
+
+    def _local_fts_tables(self) -> frozenset[str]:
+        if not self.config.use_local_db or not self._local_fts_enabled:
+            return frozenset()
+        if self._local_fts_table_names is None:
+            try:
+                rows = self._probe_file("local/select_search_fts_tables.sql")
+                self._local_fts_table_names = frozenset(str(name) for name in rows.get("name", []))
+            except (DataQueryError, DataConnectionError):
+                LOGGER.warning("Failed to inspect local FTS tables; using LIKE search.", exc_info=True)
+                self._local_fts_table_names = frozenset()
+        return self._local_fts_table_names
+
+    def _local_fts_query(self, name: str, text: str, *, columns: Sequence[str] = ()) -> str | None:
+        """FTS5 MATCH expression for ``text`` on search ``name``, or None to keep using LIKE."""
+        needle = str(text or "").strip()
+        if len(needle) < LOCAL_FTS_MIN_QUERY_CHARS or "%" in needle or "_" in needle:
+            return None
+        if LOCAL_FTS_TABLES[name] not in self._local_fts_tables():
+            return None
+        phrase = '"' + needle.replace('"', '""') + '"'
+        return "{" + " ".join(columns) + "}: " + phrase if columns else phrase
+
+    @staticmethod
+    def _local_fts_clause(name: str, rowid_expr: str) -> str:
+        table = LOCAL_FTS_TABLES[name]
+        return f"{rowid_expr} IN (SELECT rowid FROM {table} WHERE {table} MATCH %s)"
+
+    def _local_fts_vendor_name_clause(
+        self,
+        vendor_id_expr: str,
+        *,
+        name_expr: str = "coalesce(fv.display_name, fv.legal_name, fv.vendor_id)",
+    ) -> str:
+        """Matches ``name_expr`` of the vendor referenced by ``vendor_id_expr``.
+
+        Binds the vendors MATCH expression and then the ``LIKE`` pattern that rechecks
+        ``name_expr`` on the few vendors the index returns.
+        """
+        return (
+            f"{vendor_id_expr} IN ("
+            f"SELECT fv.vendor_id FROM {self._table('core_vendor')} fv"
+            f" WHERE {self._local_fts_clause('vendors', 'fv.rowid')}"
+            f" AND lower({name_expr}) LIKE lower(%s))"
+        )
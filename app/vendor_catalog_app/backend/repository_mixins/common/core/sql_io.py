@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import re
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
+# Table placeholder a write statement targets (INSERT/MERGE INTO, UPDATE, DELETE FROM).
+_WRITE_TARGET_PATTERN = re.compile(r"\b(?:INTO|UPDATE|DELETE\s+FROM)\s+\{(\w+)\}", re.IGNORECASE)
+
 
 class RepositoryCoreSqlMixin:
     def _table(self, name: str) -> str:
@@ -38,10 +42,11 @@ class RepositoryCoreSqlMixin:
             loaded += 1
         return loaded
 
+    def _sql_template(self, relative_path: str) -> str:
+        return self._read_sql_file(str((self._sql_root() / relative_path).resolve()))
+
     def _sql(self, relative_path: str, **format_args: Any) -> str:
-        sql_root = self._sql_root()
-        sql_path = (sql_root / relative_path).resolve()
-        template = self._read_sql_file(str(sql_path))
+        template = self._sql_template(relative_path)
         return template.format(**format_args) if format_args else template
 
     def _query_file(
@@ -50,10 +55,15 @@ class RepositoryCoreSqlMixin:
         *,
         params: tuple | None = None,
         columns: list[str] | None = None,
+        use_cache: bool = True,
         **format_args: Any,
     ) -> pd.DataFrame:
+        """Run a SQL template; ``use_cache=False`` skips the client query cache (not the request memo)."""
         statement = self._sql(relative_path, **format_args)
-        return self._query_or_empty(statement, params=params, columns=columns)
+        return self._request_memoized(
+            ("query_file", statement, params, tuple(columns or ()), use_cache),
+            lambda: self._query_or_empty(statement, params=params, columns=columns, use_cache=use_cache),
+        )
 
     def _execute_file(
         self,
@@ -64,7 +74,14 @@ class RepositoryCoreSqlMixin:
     ) -> None:
         statement = self._sql(relative_path, **format_args)
         self.client.execute(statement, params)
-        self._cache_clear()
+        # Write targets are table placeholders named after their table; tables read by the
+        # statement stay valid. An unrecognized target marks every table written.
+        tables = [
+            name
+            for name in _WRITE_TARGET_PATTERN.findall(self._sql_template(relative_path))
+            if format_args.get(name) == self._table(name)
+        ]
+        self._cache_clear(tables=tables or None)
 
     def _probe_file(
         self,
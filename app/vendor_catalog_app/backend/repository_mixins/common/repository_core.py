@@ -5,6 +5,7 @@ from vendor_catalog_app.backend.repository_mixins.common.core import (
     RepositoryCoreCacheMixin,
     RepositoryCoreFrameMixin,
     RepositoryCoreIdentityMixin,
+    RepositoryCoreLocalSearchMixin,
     RepositoryCoreLookupMixin,
     RepositoryCoreSqlMixin,
 )
@@ -16,6 +17,7 @@ class RepositoryCoreMixin(
     RepositoryCoreFrameMixin,
     RepositoryCoreLookupMixin,
     RepositoryCoreIdentityMixin,
+    RepositoryCoreLocalSearchMixin,
     RepositoryCoreAuditMixin,
 ):
     pass
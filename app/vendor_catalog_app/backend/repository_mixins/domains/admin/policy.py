@@ -7,6 +7,7 @@ from typing import Any
 
 import pandas as pd
 
+from vendor_catalog_app.core.role_policy import CompiledRolePolicy
 from vendor_catalog_app.core.security import (
     CHANGE_APPROVAL_LEVELS,
     MAX_APPROVAL_LEVEL,
@@ -72,6 +73,8 @@ class RepositoryAdminPolicyMixin:
             setting_value={"version": next_version, "updated_by": actor, "updated_at": self._now().isoformat()},
         )
         self._cache_clear()
+        self._option_registry.invalidate(("known_roles",))
+        self._role_policy_table.clear()
         return next_version
 
     def list_role_definitions(self) -> pd.DataFrame:
@@ -181,6 +184,34 @@ class RepositoryAdminPolicyMixin:
 
         return self._cached(cache_key, _load, ttl_seconds=300)
 
+    def compiled_known_roles(self) -> tuple[str, ...]:
+        """Known roles, compiled once per security policy version."""
+        return self._option_registry.get(
+            ("known_roles",),
+            version=self.get_security_policy_version,
+            build=lambda: tuple(self.list_known_roles()),
+        )
+
+    def compiled_role_policy(
+        self,
+        user_roles: set[str],
+        *,
+        policy_version: int | None = None,
+        resolved_policy: dict[str, Any] | None = None,
+    ) -> CompiledRolePolicy:
+        """Return the shared compiled policy for a role set at the given policy version.
+
+        ``resolved_policy`` (e.g. from a session snapshot) is compiled on a table miss
+        instead of resolving role definitions again.
+        """
+        version = self.get_security_policy_version() if policy_version is None else int(policy_version)
+        roles = set(user_roles or set())
+        return self._role_policy_table.get(
+            roles,
+            version,
+            lambda: resolved_policy if resolved_policy is not None else self.resolve_role_policy(roles),
+        )
+
     def resolve_role_policy(self, user_roles: set[str]) -> dict[str, Any]:
         """Resolve effective capabilities for the supplied role set."""
         active_roles = {str(role).strip() for role in (user_roles or set()) if str(role).strip()}
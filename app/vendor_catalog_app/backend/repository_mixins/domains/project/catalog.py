@@ -98,7 +98,25 @@ class RepositoryProjectCatalogMixin:
         if status != "all":
             where_parts.append("lower(p.status) = lower(%s)")
             params.append(status)
-        if search_text.strip():
+        fts_query = self._local_fts_query(
+            "projects",
+            search_text,
+            columns=("project_id", "project_name", "project_type", "owner_principal", "description"),
+        )
+        vendor_fts_query = self._local_fts_query("vendors", search_text, columns=("display_name",))
+        if fts_query is not None and vendor_fts_query is not None:
+            like = f"%{search_text.strip()}%"
+            where_parts.append(
+                "("
+                + self._local_fts_clause("projects", "p.rowid")
+                + " OR lower(coalesce(ou.login_identifier, '')) LIKE lower(%s)"
+                " OR lower(coalesce(ou.display_name, '')) LIKE lower(%s)"
+                " OR "
+                + self._local_fts_vendor_name_clause("p.vendor_id", name_expr="coalesce(fv.display_name, '')")
+                + ")"
+            )
+            params.extend([fts_query, like, like, vendor_fts_query, like])
+        elif search_text.strip():
             where_parts.append(
                 "("
                 "lower(p.project_id) LIKE lower(%s)"
@@ -1,11 +1,15 @@
 from .executive import RepositoryReportingExecutiveMixin
+from .global_search import RepositoryReportingGlobalSearchMixin
 from .portfolio import RepositoryReportingPortfolioMixin
 from .search import RepositoryReportingSearchMixin
+from .search_docs import RepositoryReportingSearchDocsMixin
 from .vendors import RepositoryReportingVendorsMixin
 
 __all__ = [
     "RepositoryReportingExecutiveMixin",
+    "RepositoryReportingGlobalSearchMixin",
     "RepositoryReportingPortfolioMixin",
+    "RepositoryReportingSearchDocsMixin",
     "RepositoryReportingSearchMixin",
     "RepositoryReportingVendorsMixin",
 ]
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 import pandas as pd
 
 from vendor_catalog_app.core.repository_constants import *
+from vendor_catalog_app.infrastructure.parallel import LoadGraph
 
 LOGGER = logging.getLogger(__name__)
 
@@ -149,40 +151,193 @@ class RepositoryReportingExecutiveMixin:
             ttl_seconds=60,
         )
 
-    def executive_summary(self, org_id: str = "all", months: int = 12, horizon_days: int = 180) -> dict[str, float]:
-        def _load() -> dict[str, float]:
-            spend_trend = self.executive_monthly_spend_trend(org_id=org_id, months=months)
-            risk = self.executive_risk_distribution(org_id=org_id)
-            renewals = self.executive_renewal_pipeline(org_id=org_id, horizon_days=horizon_days)
-            demos = self.demo_outcomes()
-
-            total_spend = float(spend_trend["total_spend"].sum()) if "total_spend" in spend_trend else 0.0
-            high_risk_count = 0
-            if not risk.empty and {"risk_tier", "vendor_count"}.issubset(risk.columns):
-                high_risk_count = int(
-                    risk[risk["risk_tier"].astype(str).str.lower().isin(["high", "critical"])]["vendor_count"].sum()
-                )
+    def demo_outcome_rates(self, window: int = 500) -> dict[str, int]:
+        window = max(1, min(int(window), 500))
 
-            renewal_value = (
-                float(renewals["annual_value"].sum()) if not renewals.empty and "annual_value" in renewals else 0.0
+        def _load() -> dict[str, int]:
+            frame = self._query_file(
+                "reporting/demo_outcome_rates.sql",
+                columns=["total_demos", "not_selected_demos"],
+                core_vendor_demo=self._table("core_vendor_demo"),
+                limit_rows=window,
             )
-            not_selected_rate = 0.0
-            if not demos.empty and "selection_outcome" in demos.columns:
-                total_demos = len(demos)
-                not_selected = int((demos["selection_outcome"] == "not_selected").sum())
-                not_selected_rate = (not_selected / total_demos) if total_demos else 0.0
-
+            if frame.empty:
+                return {"total_demos": 0, "not_selected_demos": 0}
+            row = frame.iloc[0]
             return {
-                "total_spend_window": total_spend,
-                "high_risk_vendors": float(high_risk_count),
-                "renewals_due_count": float(len(renewals)),
-                "renewals_due_value": renewal_value,
-                "not_selected_demo_rate": not_selected_rate,
+                "total_demos": int(row.get("total_demos") or 0),
+                "not_selected_demos": int(row.get("not_selected_demos") or 0),
             }
 
+        return self._cached(("demo_outcome_rates", window), _load, ttl_seconds=60)
+
+    @staticmethod
+    def build_executive_summary(
+        spend_trend: pd.DataFrame,
+        risk: pd.DataFrame,
+        renewals: pd.DataFrame,
+        demo_rates: dict[str, int],
+    ) -> dict[str, float]:
+        total_spend = float(spend_trend["total_spend"].sum()) if "total_spend" in spend_trend else 0.0
+        high_risk_count = 0
+        if not risk.empty and {"risk_tier", "vendor_count"}.issubset(risk.columns):
+            high_risk_count = int(
+                risk[risk["risk_tier"].astype(str).str.lower().isin(["high", "critical"])]["vendor_count"].sum()
+            )
+
+        renewal_value = (
+            float(renewals["annual_value"].sum()) if not renewals.empty and "annual_value" in renewals else 0.0
+        )
+        total_demos = int(demo_rates.get("total_demos") or 0)
+        not_selected = int(demo_rates.get("not_selected_demos") or 0)
+        not_selected_rate = (not_selected / total_demos) if total_demos else 0.0
+
+        return {
+            "total_spend_window": total_spend,
+            "high_risk_vendors": float(high_risk_count),
+            "renewals_due_count": float(len(renewals)),
+            "renewals_due_value": renewal_value,
+            "not_selected_demo_rate": not_selected_rate,
+        }
+
+    def executive_summary(self, org_id: str = "all", months: int = 12, horizon_days: int = 180) -> dict[str, float]:
+        def _load() -> dict[str, float]:
+            return self.build_executive_summary(
+                self.executive_monthly_spend_trend(org_id=org_id, months=months),
+                self.executive_risk_distribution(org_id=org_id),
+                self.executive_renewal_pipeline(org_id=org_id, horizon_days=horizon_days),
+                self.demo_outcome_rates(),
+            )
+
         return self._cached(
             ("executive_summary", str(org_id), int(months), int(horizon_days)),
             _load,
             ttl_seconds=60,
         )
 
+    def _dashboard_rollup_sql(self, file_name: str) -> str:
+        # SQLite has no GROUPING SETS; local mode runs an equivalent UNION ALL rollup.
+        return f"local/{file_name}" if self.config.use_local_db else f"reporting/{file_name}"
+
+    def executive_dashboard_spend_rollup(self, months: int = 12) -> pd.DataFrame:
+        """Spend by category, month and vendor for every org plus the all-org rollup, in one scan."""
+        months = max(1, min(months, 36))
+        return self._cached(
+            ("executive_dashboard_spend_rollup", int(months)),
+            lambda: self._query_file(
+                self._dashboard_rollup_sql("executive_dashboard_spend_rollup.sql"),
+                columns=[
+                    "org_id",
+                    "all_orgs",
+                    "grain",
+                    "category",
+                    "month",
+                    "vendor_id",
+                    "vendor_name",
+                    "risk_tier",
+                    "total_spend",
+                ],
+                rpt_spend_fact=self._table("rpt_spend_fact"),
+                core_vendor=self._table("core_vendor"),
+                months_back=(months - 1),
+            ),
+            ttl_seconds=60,
+        )
+
+    def executive_dashboard_risk_rollup(self) -> pd.DataFrame:
+        return self._cached(
+            ("executive_dashboard_risk_rollup",),
+            lambda: self._query_file(
+                self._dashboard_rollup_sql("executive_dashboard_risk_rollup.sql"),
+                columns=["org_id", "all_orgs", "risk_tier", "vendor_count"],
+                core_vendor=self._table("core_vendor"),
+            ),
+            ttl_seconds=60,
+        )
+
+    @staticmethod
+    def _rollup_rows_for_org(frame: pd.DataFrame, org_id: str) -> pd.DataFrame:
+        if frame.empty:
+            return frame
+        all_orgs = pd.to_numeric(frame["all_orgs"], errors="coerce").fillna(0).astype(int) == 1
+        if not org_id or org_id == "all":
+            return frame[all_orgs]
+        return frame[~all_orgs & (frame["org_id"].astype(str) == str(org_id))]
+
+    @classmethod
+    def _spend_grain(cls, frame: pd.DataFrame, org_id: str, grain: str, columns: list[str]) -> pd.DataFrame:
+        rows = cls._rollup_rows_for_org(frame, org_id)
+        if rows.empty:
+            return pd.DataFrame(columns=columns)
+        rows = rows[rows["grain"].astype(str) == grain]
+        return rows[columns].reset_index(drop=True)
+
+    def dashboard_data(
+        self,
+        org_id: str = "all",
+        months: int = 12,
+        horizon_days: int = 180,
+        *,
+        top_vendor_limit: int = 10,
+        recent_limit: int = 10,
+    ) -> dict[str, Any]:
+        """Everything the executive dashboard renders, loaded concurrently and cached per filter set.
+
+        Spend and risk come from org-keyed rollups shared by every org filter; renewals,
+        recent demos and recent cancellations push their filters and limits into SQL.
+        """
+        months = max(1, min(months, 36))
+        horizon_days = max(30, min(horizon_days, 365))
+        top_vendor_limit = max(3, min(top_vendor_limit, 25))
+        recent_limit = max(1, min(recent_limit, 100))
+
+        def _load() -> dict[str, Any]:
+            loads = (
+                LoadGraph("dashboard")
+                .add("kpis", self.dashboard_kpis)
+                .add("spend", lambda: self.executive_dashboard_spend_rollup(months=months))
+                .add("risk", self.executive_dashboard_risk_rollup)
+                .add(
+                    "renewals",
+                    lambda: self.executive_renewal_pipeline(org_id=org_id, horizon_days=horizon_days),
+                )
+                .add("demo_rates", self.demo_outcome_rates)
+                .add("recent_demos", lambda: self.demo_outcomes(limit=recent_limit))
+                .add("recent_cancellations", lambda: self.contract_cancellations(limit=recent_limit))
+                .run()
+            )
+            spend = loads["spend"]
+            by_category = self._spend_grain(spend, org_id, "category", ["category", "total_spend"])
+            by_category = by_category.sort_values("total_spend", ascending=False, kind="stable")
+            trend = self._spend_grain(spend, org_id, "month", ["month", "total_spend"])
+            trend = trend.sort_values("month", kind="stable")
+            top_vendors = self._spend_grain(
+                spend, org_id, "vendor", ["vendor_id", "vendor_name", "risk_tier", "total_spend"]
+            )
+            top_vendors = top_vendors.sort_values("total_spend", ascending=False, kind="stable").head(
+                top_vendor_limit
+            )
+            risk = self._rollup_rows_for_org(loads["risk"], org_id)
+            risk = (
+                risk[["risk_tier", "vendor_count"]].sort_values("vendor_count", ascending=False, kind="stable")
+                if not risk.empty
+                else pd.DataFrame(columns=["risk_tier", "vendor_count"])
+            )
+            renewals = loads["renewals"]
+            return {
+                "kpis": loads["kpis"],
+                "summary": self.build_executive_summary(trend, risk, renewals, loads["demo_rates"]),
+                "by_category": by_category.reset_index(drop=True),
+                "trend": trend.reset_index(drop=True),
+                "top_vendors": top_vendors.reset_index(drop=True),
+                "risk_dist": risk.reset_index(drop=True),
+                "renewals": renewals,
+                "recent_demos": loads["recent_demos"],
+                "recent_cancellations": loads["recent_cancellations"],
+            }
+
+        return self._cached(
+            ("dashboard_data", str(org_id), int(months), int(horizon_days), top_vendor_limit, recent_limit),
+            _load,
+            ttl_seconds=60,
+        )
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from vendor_catalog_app.backend.repository_mixins.domains.reporting.search import TYPEAHEAD_INDEX_FIELDS
+from vendor_catalog_app.infrastructure.parallel import run_within_budget
+from vendor_catalog_app.infrastructure.search_index import match_tier
+
+LOGGER = logging.getLogger(__name__)
+
+# Searchable types in display order; ties between groups keep this order.
+GLOBAL_SEARCH_TYPES: tuple[str, ...] = ("vendors", "offerings", "projects", "contracts", "contacts", "help_articles")
+
+
+class RepositoryReportingGlobalSearchMixin:
+    def _global_search_rows(
+        self,
+        name: str,
+        q: str,
+        limit: int,
+        where: Callable[[dict[str, Any]], bool] | None,
+    ) -> list[dict[str, Any]]:
+        try:
+            if name == "vendors":
+                frame = self.search_vendors_typeahead(q=q, limit=limit)
+            elif name == "offerings":
+                frame = self.search_offerings_typeahead(q=q, limit=limit)
+            elif name == "projects":
+                frame = self.search_projects_typeahead(q=q, limit=limit)
+            elif name == "contracts":
+                frame = self.search_contracts_typeahead(q=q, limit=limit)
+            elif name == "contacts":
+                frame = self.search_contacts_typeahead(q=q, limit=limit)
+            else:
+                frame = self.search_help_articles_typeahead(q=q, limit=limit, where=where)
+        except Exception:
+            LOGGER.warning("Global search failed for one type; omitting it. type=%s", name, exc_info=True)
+            return []
+        return frame.astype(object).where(frame.notna(), None).to_dict("records") if not frame.empty else []
+
+    def search_global(
+        self,
+        *,
+        q: str,
+        limit_per_type: int = 5,
+        types: Iterable[str] | None = None,
+        budget_ms: int | None = None,
+        help_article_filter: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> dict[str, Any]:
+        """Search every entity type at once against the typeahead indexes.
+
+        Returns ``groups`` ordered by their best match (then ``GLOBAL_SEARCH_TYPES``
+        order), each holding at most ``limit_per_type`` rows sorted by ``rank`` (see
+        ``match_tier``) and a ``has_more`` flag. Types that miss the latency budget are
+        listed in ``timed_out`` instead of delaying the response.
+        """
+        needle = str(q or "").strip()
+        limit = max(1, min(int(limit_per_type or 5), 50))
+        wanted = set(types) if types is not None else set(GLOBAL_SEARCH_TYPES)
+        selected = [name for name in GLOBAL_SEARCH_TYPES if name in wanted]
+        if not needle or not selected:
+            return {"groups": [], "timed_out": []}
+        budget = self._global_search_budget_ms if budget_ms is None else max(1, int(budget_ms))
+        results, timed_out = run_within_budget(
+            {
+                name: (
+                    lambda name=name: self._global_search_rows(
+                        name,
+                        needle,
+                        limit + 1,
+                        help_article_filter if name == "help_articles" else None,
+                    )
+                )
+                for name in selected
+            },
+            budget_ms=budget,
+        )
+        groups: list[dict[str, Any]] = []
+        for name in selected:
+            rows = results.get(name) or []
+            if not rows:
+                continue
+            fields, primary_fields = TYPEAHEAD_INDEX_FIELDS[name]
+            for row in rows:
+                row["rank"] = match_tier(row, needle, fields=fields, primary_fields=primary_fields)
+            ranked = sorted(rows[:limit], key=lambda row: row["rank"])
+            groups.append(
+                {
+                    "type": name,
+                    "rank": min(row["rank"] for row in ranked),
+                    "has_more": len(rows) > limit,
+                    "items": ranked,
+                }
+            )
+        groups.sort(key=lambda group: (group["rank"], GLOBAL_SEARCH_TYPES.index(group["type"])))
+        if timed_out:
+            LOGGER.info(
+                "Global search exceeded its latency budget. budget_ms=%s timed_out=%s",
+                budget,
+                ",".join(timed_out),
+                extra={"event": "global_search_timed_out", "budget_ms": budget, "timed_out": timed_out},
+            )
+        return {"groups": groups, "timed_out": timed_out}
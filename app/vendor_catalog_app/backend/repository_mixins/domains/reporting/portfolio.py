@@ -6,11 +6,13 @@ from typing import Any
 import pandas as pd
 
 from vendor_catalog_app.core.repository_constants import *
+from vendor_catalog_app.infrastructure.db import WORKLOAD_REPORTING, workload
 
 LOGGER = logging.getLogger(__name__)
 
 
 class RepositoryReportingPortfolioMixin:
+    @workload(WORKLOAD_REPORTING)
     def report_vendor_inventory(
         self,
         *,
@@ -153,6 +155,7 @@ class RepositoryReportingPortfolioMixin:
         out["owner_roles"] = out.get("owner_roles", "").fillna("")
         return out[columns].sort_values(["display_name", "vendor_id"]).head(limit)
 
+    @workload(WORKLOAD_REPORTING)
     def report_project_portfolio(
         self,
         *,
@@ -249,6 +252,7 @@ class RepositoryReportingPortfolioMixin:
             out[count_col] = pd.to_numeric(out.get(count_col), errors="coerce").fillna(0).astype(int)
         return out[columns].sort_values(["status", "project_name"]).head(limit)
 
+    @workload(WORKLOAD_REPORTING)
     def report_contract_renewals(
         self,
         *,
@@ -286,6 +290,7 @@ class RepositoryReportingPortfolioMixin:
         out["annual_value"] = pd.to_numeric(out.get("annual_value"), errors="coerce").fillna(0.0)
         return out[columns].sort_values(["renewal_date", "vendor_name", "contract_id"]).head(limit)
 
+    @workload(WORKLOAD_REPORTING)
     def report_demo_outcomes(
         self,
         *,
@@ -327,6 +332,7 @@ class RepositoryReportingPortfolioMixin:
         out["overall_score"] = pd.to_numeric(out.get("overall_score"), errors="coerce")
         return out[columns].sort_values("demo_date", ascending=False).head(limit)
 
+    @workload(WORKLOAD_REPORTING)
     def report_vendor_warnings(
         self,
         *,
@@ -398,6 +404,7 @@ class RepositoryReportingPortfolioMixin:
             return pd.DataFrame(columns=columns)
         return out[columns]
 
+    @workload(WORKLOAD_REPORTING)
     def report_vendor_data_quality_overview(
         self,
         *,
@@ -483,6 +490,7 @@ class RepositoryReportingPortfolioMixin:
             out[count_col] = pd.to_numeric(out.get(count_col), errors="coerce").fillna(0).astype(int)
         return out[columns]
 
+    @workload(WORKLOAD_REPORTING)
     def report_owner_coverage(
         self,
         *,
@@ -525,6 +533,7 @@ class RepositoryReportingPortfolioMixin:
             )
         return out[columns].sort_values(["owner_principal", "entity_type", "entity_name"]).head(limit)
 
+    @workload(WORKLOAD_REPORTING)
     def report_offering_budget_variance(
         self,
         *,
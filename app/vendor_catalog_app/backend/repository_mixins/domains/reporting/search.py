@@ -1,22 +1,241 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Iterable
+from datetime import date
 from typing import Any
 
 import pandas as pd
 
 from vendor_catalog_app.core.repository_constants import *
+from vendor_catalog_app.infrastructure.fuzzy_match import FuzzyNameIndex
+from vendor_catalog_app.infrastructure.search_index import NgramIndex
 
 LOGGER = logging.getLogger(__name__)
 
+# name -> (searched fields, primary fields ranked first)
+TYPEAHEAD_INDEX_FIELDS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "vendors": (("vendor_id", "display_name", "legal_name"), ("display_name", "legal_name")),
+    "offerings": (
+        ("offering_id", "offering_name", "offering_type", "lob", "service_type", "vendor_display_name"),
+        ("offering_name",),
+    ),
+    "projects": (
+        ("project_id", "project_name", "status", "owner_principal", "description", "vendor_match_text"),
+        ("project_name",),
+    ),
+    "contracts": (
+        (
+            "contract_id",
+            "contract_number",
+            "vendor_id",
+            "offering_id",
+            "contract_status",
+            "vendor_match_text",
+            "offering_match_text",
+        ),
+        ("contract_number", "contract_id"),
+    ),
+    "contacts": (
+        ("full_name", "email", "phone", "contact_type", "vendor_display_name"),
+        ("full_name", "email"),
+    ),
+    "help_articles": (("title", "section", "slug", "content_md"), ("title",)),
+}
+# name -> tables the index is loaded from; writes to any other table keep the index. Each
+# table needs an ``updated_at`` column for the shared data version.
+TYPEAHEAD_INDEX_TABLES: dict[str, tuple[str, ...]] = {
+    "vendors": ("core_vendor",),
+    "offerings": ("core_vendor_offering", "core_vendor"),
+    "projects": ("app_project", "core_vendor"),
+    "contracts": ("core_contract", "core_vendor", "core_vendor_offering"),
+    "contacts": ("core_vendor_contact", "core_offering_contact", "core_vendor_offering", "core_vendor"),
+    "help_articles": ("vendor_help_article",),
+}
+# name -> (id field, fuzzy-matched name fields, group field) for import matching.
+IMPORT_MATCH_FIELDS: dict[str, tuple[str, tuple[str, ...], str | None]] = {
+    "vendors": ("vendor_id", ("display_name", "legal_name"), None),
+    "offerings": ("offering_id", ("offering_name",), "vendor_id"),
+    "projects": ("project_id", ("project_name",), None),
+}
+HELP_ARTICLE_SEARCH_COLUMNS = ["article_id", "slug", "title", "section", "article_type", "role_visibility"]
+
+
+def _contract_is_active_or_future(row: dict[str, Any]) -> bool:
+    if str(row.get("cancelled_flag") or "").strip().lower() in {"1", "true"}:
+        return False
+    if str(row.get("contract_status") or "").strip().lower() == "active":
+        return True
+    return str(row.get("start_date") or "")[:10] > date.today().isoformat()
+
 
 class RepositoryReportingSearchMixin:
+    def _load_typeahead_index_rows(self, name: str, limit: int) -> pd.DataFrame:
+        # The index is itself the cache; reading through the query cache could rebuild stale rows.
+        if name == "vendors":
+            return self._query_file(
+                "reporting/search_vendors_typeahead.sql",
+                use_cache=False,
+                where_clause="1 = 1",
+                limit=limit,
+                core_vendor=self._table("core_vendor"),
+            )
+        if name == "offerings":
+            self._ensure_local_offering_columns()
+            return self._query_file(
+                "reporting/search_offerings_typeahead.sql",
+                use_cache=False,
+                where_clause="1 = 1",
+                limit=limit,
+                core_vendor_offering=self._table("core_vendor_offering"),
+                core_vendor=self._table("core_vendor"),
+            )
+        if name == "projects":
+            return self._query_file(
+                "reporting/typeahead_index_projects.sql",
+                use_cache=False,
+                limit=limit,
+                app_project=self._table("app_project"),
+                core_vendor=self._table("core_vendor"),
+            )
+        if name == "contracts":
+            return self._query_file(
+                "reporting/typeahead_index_contracts.sql",
+                use_cache=False,
+                limit=limit,
+                core_contract=self._table("core_contract"),
+                core_vendor=self._table("core_vendor"),
+                core_vendor_offering=self._table("core_vendor_offering"),
+            )
+        if name == "help_articles":
+            return pd.DataFrame(self.list_help_articles_full()[:limit])
+        return self._query_file(
+            "reporting/search_contacts_typeahead.sql",
+            use_cache=False,
+            where_clause="coalesce(src.active_flag, true) = true AND coalesce(trim(src.full_name), '') <> ''",
+            limit=limit,
+            core_vendor_contact=self._table("core_vendor_contact"),
+            core_offering_contact=self._table("core_offering_contact"),
+            core_vendor_offering=self._table("core_vendor_offering"),
+            core_vendor=self._table("core_vendor"),
+        )
+
+    def _build_typeahead_index(self, name: str) -> NgramIndex | None:
+        max_rows = int(self._typeahead_index_max_rows)
+        frame = self._load_typeahead_index_rows(name, max_rows + 1)
+        if len(frame) > max_rows:
+            LOGGER.info(
+                "Typeahead index skipped; table exceeds row cap. index=%s max_rows=%s",
+                name,
+                max_rows,
+                extra={"event": "typeahead_index_skipped", "typeahead_index": name, "max_rows": max_rows},
+            )
+            return None
+        fields, primary_fields = TYPEAHEAD_INDEX_FIELDS[name]
+        rows = frame.astype(object).where(frame.notna(), None).to_dict("records")
+        return NgramIndex(rows, fields=fields, primary_fields=primary_fields)
+
+    def _typeahead_tables_version(self, tables: Iterable[str]) -> tuple[tuple[Any, Any], ...]:
+        """Row count and latest ``updated_at`` per table; changes with any worker's writes."""
+        versions = []
+        for table in tables:
+            # Bypasses the query cache, which would hide other workers' writes for its TTL.
+            frame = self._query_file(
+                "reporting/typeahead_table_version.sql",
+                use_cache=False,
+                source_table=self._table(table),
+            )
+            row = frame.iloc[0] if not frame.empty else {}
+            versions.append((int(row.get("row_count") or 0), str(row.get("last_updated_at") or "")))
+        return tuple(versions)
+
+    def _invalidate_typeahead_indexes(self, tables: Iterable[str] | None) -> None:
+        """Drop indexes loaded from ``tables`` (all when None) so the next read rebuilds inline."""
+        written = None if tables is None else set(tables)
+        for name, index_tables in TYPEAHEAD_INDEX_TABLES.items():
+            if written is None or written.intersection(index_tables):
+                self._typeahead_registry.invalidate(name)
+                self._typeahead_registry.invalidate(("import_match", name))
+
+    def _typeahead_index(self, name: str) -> NgramIndex | None:
+        """Process-resident index for ``name``, or None to fall back to the SQL search.
+
+        A write in this process to one of its ``TYPEAHEAD_INDEX_TABLES`` drops the index,
+        so the next search rebuilds it inline and sees the write. Other workers' writes are
+        detected by the tables' data version, checked every
+        ``TVENDOR_TYPEAHEAD_INDEX_REVALIDATE_SEC``; those rebuilds run on a background
+        thread while the previous index keeps serving.
+        """
+        if not self._typeahead_index_enabled:
+            return None
+        tables = TYPEAHEAD_INDEX_TABLES[name]
+        try:
+            return self._typeahead_registry.get(
+                name,
+                version=lambda: self._typeahead_tables_version(tables),
+                build=lambda: self._build_typeahead_index(name),
+            )
+        except Exception:
+            LOGGER.warning("Failed to build typeahead index; using SQL search. index=%s", name, exc_info=True)
+            return None
+
+    def warm_typeahead_indexes(self) -> dict[str, int]:
+        """Build every typeahead index now; returns indexed row counts (-1 when skipped)."""
+        if not self._typeahead_index_enabled:
+            return {}
+        counts: dict[str, int] = {}
+        for name in TYPEAHEAD_INDEX_FIELDS:
+            index = self._typeahead_index(name)
+            counts[name] = -1 if index is None else len(index)
+        return counts
+
+    def _build_import_name_index(self, name: str) -> FuzzyNameIndex | None:
+        max_rows = int(self._typeahead_index_max_rows)
+        frame = self._load_typeahead_index_rows(name, max_rows + 1)
+        if len(frame) > max_rows:
+            LOGGER.info(
+                "Import name index skipped; table exceeds row cap. index=%s max_rows=%s",
+                name,
+                max_rows,
+                extra={"event": "import_name_index_skipped", "import_name_index": name, "max_rows": max_rows},
+            )
+            return None
+        id_field, name_fields, group_field = IMPORT_MATCH_FIELDS[name]
+        rows = frame.astype(object).where(frame.notna(), None).to_dict("records")
+        return FuzzyNameIndex(rows, id_field=id_field, name_fields=name_fields, group_field=group_field)
+
+    def import_name_index(self, name: str) -> FuzzyNameIndex | None:
+        """Fuzzy name matcher over every vendor, offering or (active) project.
+
+        Loaded with the typeahead index query and rebuilt on the same schedule, so an
+        import preview matches all of its rows without per-row queries. Returns None
+        when the table exceeds ``TVENDOR_TYPEAHEAD_INDEX_MAX_ROWS`` or cannot be loaded;
+        callers then fall back to the typeahead searches.
+        """
+        tables = TYPEAHEAD_INDEX_TABLES[name]
+        try:
+            return self._typeahead_registry.get(
+                ("import_match", name),
+                version=lambda: self._typeahead_tables_version(tables),
+                build=lambda: self._build_import_name_index(name),
+            )
+        except Exception:
+            LOGGER.warning("Failed to build import name index; using typeahead search. index=%s", name, exc_info=True)
+            return None
+
     def search_vendors_typeahead(self, *, q: str = "", limit: int = 20) -> pd.DataFrame:
         limit = max(1, min(int(limit or 20), 100))
         columns = ["vendor_id", "label", "display_name", "legal_name", "lifecycle_state"]
+        index = self._typeahead_index("vendors")
+        if index is not None:
+            return pd.DataFrame(index.search(q, limit=limit), columns=columns)
         params: list[Any] = []
         where = "1 = 1"
-        if q.strip():
+        fts_query = self._local_fts_query("vendors", q)
+        if fts_query is not None:
+            where = self._local_fts_clause("vendors", "v.rowid")
+            params.append(fts_query)
+        elif q.strip():
             like = f"%{q.strip()}%"
             where = (
                 "("
@@ -49,12 +268,27 @@ class RepositoryReportingSearchMixin:
             "label",
         ]
         filter_vendor = str(vendor_id or "").strip()
+        index = self._typeahead_index("offerings")
+        if index is not None:
+            where = (lambda row: row.get("vendor_id") == filter_vendor) if filter_vendor else None
+            return pd.DataFrame(index.search(q, limit=limit, where=where), columns=columns)
         where_parts = []
         params: list[Any] = []
         if filter_vendor:
             where_parts.append("o.vendor_id = %s")
             params.append(filter_vendor)
-        if q.strip():
+        fts_query = self._local_fts_query("offerings", q)
+        vendor_fts_query = self._local_fts_query("vendors", q)
+        if fts_query is not None and vendor_fts_query is not None:
+            where_parts.append(
+                "("
+                + self._local_fts_clause("offerings", "o.rowid")
+                + " OR "
+                + self._local_fts_vendor_name_clause("o.vendor_id")
+                + ")"
+            )
+            params.extend([fts_query, vendor_fts_query, f"%{q.strip()}%"])
+        elif q.strip():
             like = f"%{q.strip()}%"
             where_parts.append(
                 "("
@@ -82,9 +316,27 @@ class RepositoryReportingSearchMixin:
     def search_projects_typeahead(self, *, q: str = "", limit: int = 20) -> pd.DataFrame:
         limit = max(1, min(int(limit or 20), 100))
         columns = ["project_id", "project_name", "status", "vendor_id", "vendor_display_name", "label"]
+        index = self._typeahead_index("projects")
+        if index is not None:
+            return pd.DataFrame(index.search(q, limit=limit), columns=columns)
         params: list[Any] = []
         where_parts = ["coalesce(p.active_flag, true) = true"]
-        if q.strip():
+        fts_query = self._local_fts_query(
+            "projects",
+            q,
+            columns=("project_id", "project_name", "status", "owner_principal", "description"),
+        )
+        vendor_fts_query = self._local_fts_query("vendors", q)
+        if fts_query is not None and vendor_fts_query is not None:
+            where_parts.append(
+                "("
+                + self._local_fts_clause("projects", "p.rowid")
+                + " OR "
+                + self._local_fts_vendor_name_clause("p.vendor_id")
+                + ")"
+            )
+            params.extend([fts_query, vendor_fts_query, f"%{q.strip()}%"])
+        elif q.strip():
             like = f"%{q.strip()}%"
             where_parts.append(
                 "("
@@ -108,6 +360,38 @@ class RepositoryReportingSearchMixin:
             core_vendor=self._table("core_vendor"),
         )
 
+    def _contract_search_clause(self, text: str) -> tuple[str, list[Any]]:
+        like = f"%{text.strip()}%"
+        fts_query = self._local_fts_query("contracts", text)
+        vendor_fts_query = self._local_fts_query("vendors", text)
+        offering_fts_query = self._local_fts_query("offerings", text, columns=("offering_name",))
+        if fts_query is not None and vendor_fts_query is not None and offering_fts_query is not None:
+            clause = (
+                "("
+                + self._local_fts_clause("contracts", "c.rowid")
+                + " OR "
+                + self._local_fts_vendor_name_clause("c.vendor_id")
+                + " OR c.offering_id IN (SELECT fo.offering_id FROM "
+                + self._table("core_vendor_offering")
+                + " fo WHERE "
+                + self._local_fts_clause("offerings", "fo.rowid")
+                + ")"
+                + ")"
+            )
+            return clause, [fts_query, vendor_fts_query, like, offering_fts_query]
+        clause = (
+            "("
+            "lower(c.contract_id) LIKE lower(%s)"
+            " OR lower(coalesce(c.contract_number, '')) LIKE lower(%s)"
+            " OR lower(coalesce(c.vendor_id, '')) LIKE lower(%s)"
+            " OR lower(coalesce(c.offering_id, '')) LIKE lower(%s)"
+            " OR lower(coalesce(c.contract_status, '')) LIKE lower(%s)"
+            " OR lower(coalesce(v.display_name, v.legal_name, c.vendor_id, '')) LIKE lower(%s)"
+            " OR lower(coalesce(o.offering_name, c.offering_id, '')) LIKE lower(%s)"
+            ")"
+        )
+        return clause, [like] * 7
+
     def search_contracts_typeahead(
         self,
         *,
@@ -126,6 +410,10 @@ class RepositoryReportingSearchMixin:
             "offering_name",
             "label",
         ]
+        index = self._typeahead_index("contracts")
+        if index is not None:
+            where = _contract_is_active_or_future if active_or_future_only else None
+            return pd.DataFrame(index.search(q, limit=limit, where=where), columns=columns)
         params: list[Any] = []
         where_parts: list[str] = ["1 = 1"]
         if active_or_future_only:
@@ -137,19 +425,9 @@ class RepositoryReportingSearchMixin:
             )
             where_parts.append("coalesce(c.cancelled_flag, false) = false")
         if q.strip():
-            like = f"%{q.strip()}%"
-            where_parts.append(
-                "("
-                "lower(c.contract_id) LIKE lower(%s)"
-                " OR lower(coalesce(c.contract_number, '')) LIKE lower(%s)"
-                " OR lower(coalesce(c.vendor_id, '')) LIKE lower(%s)"
-                " OR lower(coalesce(c.offering_id, '')) LIKE lower(%s)"
-                " OR lower(coalesce(c.contract_status, '')) LIKE lower(%s)"
-                " OR lower(coalesce(v.display_name, v.legal_name, c.vendor_id, '')) LIKE lower(%s)"
-                " OR lower(coalesce(o.offering_name, c.offering_id, '')) LIKE lower(%s)"
-                ")"
-            )
-            params.extend([like, like, like, like, like, like, like])
+            clause, clause_params = self._contract_search_clause(q)
+            where_parts.append(clause)
+            params.extend(clause_params)
         where = " AND ".join(where_parts)
         return self._query_file(
             "reporting/search_contracts_typeahead.sql",
@@ -175,6 +453,10 @@ class RepositoryReportingSearchMixin:
             "label",
         ]
         filter_vendor = str(vendor_id or "").strip()
+        index = self._typeahead_index("contacts")
+        if index is not None:
+            where = (lambda row: row.get("vendor_id") == filter_vendor) if filter_vendor else None
+            return pd.DataFrame(index.search(q, limit=limit, where=where), columns=columns)
         where_parts = [
             "coalesce(src.active_flag, true) = true",
             "coalesce(trim(src.full_name), '') <> ''",
@@ -183,7 +465,27 @@ class RepositoryReportingSearchMixin:
         if filter_vendor:
             where_parts.append("src.vendor_id = %s")
             params.append(filter_vendor)
-        if q.strip():
+        sql_path = "reporting/search_contacts_typeahead.sql"
+        fts_queries = [
+            self._local_fts_query("vendor_contacts", q),
+            self._local_fts_query("offering_contacts", q),
+            self._local_fts_query("vendors", q),
+        ]
+        if all(query is not None for query in fts_queries):
+            # The local variant exposes each contact's source table and rowid.
+            sql_path = "local/search_contacts_typeahead.sql"
+            where_parts.append(
+                "("
+                "(src.source_kind = 'vendor' AND "
+                + self._local_fts_clause("vendor_contacts", "src.source_rowid")
+                + ") OR (src.source_kind = 'offering' AND "
+                + self._local_fts_clause("offering_contacts", "src.source_rowid")
+                + ") OR "
+                + self._local_fts_vendor_name_clause("src.vendor_id")
+                + ")"
+            )
+            params.extend([*fts_queries, f"%{q.strip()}%"])
+        elif q.strip():
             like = f"%{q.strip()}%"
             where_parts.append(
                 "("
@@ -197,7 +499,7 @@ class RepositoryReportingSearchMixin:
             params.extend([like, like, like, like, like])
         where = " AND ".join(where_parts)
         return self._query_file(
-            "reporting/search_contacts_typeahead.sql",
+            sql_path,
             params=tuple(params) if params else None,
             columns=columns,
             where_clause=where,
@@ -208,6 +510,28 @@ class RepositoryReportingSearchMixin:
             core_vendor=self._table("core_vendor"),
         )
 
+    def search_help_articles_typeahead(
+        self,
+        *,
+        q: str = "",
+        limit: int = 20,
+        where: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> pd.DataFrame:
+        """Help articles whose title, section, slug or body contains ``q``; ``where`` filters rows (e.g. by role)."""
+        limit = max(1, min(int(limit or 20), 100))
+        index = self._typeahead_index("help_articles")
+        if index is not None:
+            return pd.DataFrame(index.search(q, limit=limit, where=where), columns=HELP_ARTICLE_SEARCH_COLUMNS)
+        fields, _primary_fields = TYPEAHEAD_INDEX_FIELDS["help_articles"]
+        needle = q.strip().lower()
+        rows = [
+            row
+            for row in self.list_help_articles_full()
+            if (not needle or any(needle in str(row.get(field) or "").lower() for field in fields))
+            and (where is None or where(row))
+        ]
+        return pd.DataFrame(rows[:limit], columns=HELP_ARTICLE_SEARCH_COLUMNS)
+
     def list_contracts_workspace(
         self,
         *,
@@ -252,19 +576,9 @@ class RepositoryReportingSearchMixin:
             where_parts.append("coalesce(trim(c.offering_id), '') <> ''")
 
         if search_text.strip():
-            like = f"%{search_text.strip()}%"
-            where_parts.append(
-                "("
-                "lower(c.contract_id) LIKE lower(%s)"
-                " OR lower(coalesce(c.contract_number, '')) LIKE lower(%s)"
-                " OR lower(coalesce(c.vendor_id, '')) LIKE lower(%s)"
-                " OR lower(coalesce(c.offering_id, '')) LIKE lower(%s)"
-                " OR lower(coalesce(c.contract_status, '')) LIKE lower(%s)"
-                " OR lower(coalesce(v.display_name, v.legal_name, c.vendor_id, '')) LIKE lower(%s)"
-                " OR lower(coalesce(o.offering_name, c.offering_id, '')) LIKE lower(%s)"
-                ")"
-            )
-            params.extend([like, like, like, like, like, like, like])
+            clause, clause_params = self._contract_search_clause(search_text)
+            where_parts.append(clause)
+            params.extend(clause_params)
 
         where_clause = " AND ".join(where_parts)
 
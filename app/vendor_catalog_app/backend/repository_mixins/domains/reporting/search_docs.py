@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import Any
+
+from vendor_catalog_app.infrastructure.db import (
+    DataConnectionError,
+    DataExecutionError,
+    DataQueryError,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# Ids bound per refresh statement during a partial refresh.
+VENDOR_SEARCH_DOC_CHUNK_IDS = 200
+# How long a successful readiness check is trusted before row counts are compared again.
+VENDOR_SEARCH_DOC_RECHECK_SEC = 300
+# The change catch-up re-reads this far behind its last run, so rows stamped just before a
+# sync but committed after it are not missed. Refreshing a vendor twice is harmless.
+VENDOR_SEARCH_DOC_CATCH_UP_OVERLAP_SEC = 60
+# Tables whose rows feed app_vendor_search_doc; writes to them schedule a catch-up.
+VENDOR_SEARCH_DOC_SOURCE_TABLES = frozenset(
+    {
+        "core_vendor",
+        "core_vendor_offering",
+        "core_contract",
+        "core_vendor_business_owner",
+        "core_offering_business_owner",
+        "core_vendor_contact",
+        "core_offering_contact",
+        "core_vendor_demo",
+        "app_project",
+    }
+)
+
+# Audited entities whose rows feed app_vendor_search_doc. Vendor-keyed entities carry
+# vendor_id in their audit payload; offering-keyed ones only carry offering_id.
+_VENDOR_KEYED_SEARCH_ENTITIES = frozenset(
+    {
+        "core_vendor",
+        "core_vendor_offering",
+        "core_contract",
+        "core_vendor_business_owner",
+        "core_vendor_contact",
+        "core_vendor_demo",
+        "app_project",
+    }
+)
+_OFFERING_KEYED_SEARCH_ENTITIES = frozenset({"core_offering_business_owner", "core_offering_contact"})
+
+
+def _audit_payload_values(record: dict[str, Any], key: str) -> set[str]:
+    values: set[str] = set()
+    for field in ("before_json", "after_json"):
+        raw = record.get(field)
+        if not raw:
+            continue
+        try:
+            payload = json.loads(raw) if isinstance(raw, str) else raw
+        except ValueError:
+            continue
+        if isinstance(payload, dict):
+            value = str(payload.get(key) or "").strip()
+            if value:
+                values.add(value)
+    return values
+
+
+class RepositoryReportingSearchDocsMixin:
+    """Maintains ``app_vendor_search_doc``, one lowercased search text per vendor.
+
+    Vendor paging matches a single ``LIKE`` against this table instead of OR-ing 39
+    predicates over EXISTS subqueries. Docs are upserted by vendor id, so a refresh never
+    leaves a vendor without its doc and repeated refreshes are harmless. They are built
+    on startup (``ensure_vendor_search_docs``), refreshed for the affected vendors as
+    audit records are flushed, and fully rebuilt on a background thread when the row
+    count drifts from ``core_vendor`` or a change could not be traced to a vendor. Writes
+    that are not audited, including other workers', are caught up in the background from
+    the source tables' ``updated_at``. Reads use the per-table clause until the docs are
+    complete.
+    """
+
+    def refresh_vendor_search_docs(
+        self,
+        *,
+        vendor_ids: Iterable[str] | None = None,
+        offering_ids: Iterable[str] | None = None,
+    ) -> None:
+        """Rebuild docs for the given vendors (and offerings' vendors), or for all vendors when both are None."""
+        self._ensure_local_offering_columns()
+        with self._vendor_search_doc_lock:
+            if vendor_ids is None and offering_ids is None:
+                started = self._now()
+                self._vendor_search_doc_full_rebuild_needed = False
+                try:
+                    self._write_vendor_search_docs("1 = 1", ())
+                except Exception:
+                    self._vendor_search_doc_full_rebuild_needed = True
+                    raise
+                self._vendor_search_doc_synced_at = started
+                return
+            vendor_set = {str(item).strip() for item in vendor_ids or () if str(item).strip()}
+            # Offerings are resolved to vendor ids up front: MERGE clause conditions on
+            # Databricks do not accept subqueries.
+            vendor_set.update(self._vendor_ids_for_offerings(offering_ids or ()))
+            vendor_list = sorted(vendor_set)
+            for start in range(0, len(vendor_list), VENDOR_SEARCH_DOC_CHUNK_IDS):
+                chunk = vendor_list[start : start + VENDOR_SEARCH_DOC_CHUNK_IDS]
+                self._write_vendor_search_docs("{column} IN (" + ", ".join("%s" for _ in chunk) + ")", tuple(chunk))
+
+    def _vendor_ids_for_offerings(self, offering_ids: Iterable[str]) -> set[str]:
+        offering_list = sorted({str(item).strip() for item in offering_ids if str(item).strip()})
+        vendor_ids: set[str] = set()
+        for start in range(0, len(offering_list), VENDOR_SEARCH_DOC_CHUNK_IDS):
+            chunk = offering_list[start : start + VENDOR_SEARCH_DOC_CHUNK_IDS]
+            rows = self._probe_file(
+                "reporting/select_vendor_ids_for_offerings.sql",
+                params=tuple(chunk),
+                offering_ids_placeholders=", ".join("%s" for _ in chunk),
+                core_vendor_offering=self._table("core_vendor_offering"),
+            )
+            vendor_ids.update(str(value).strip() for value in rows.get("vendor_id", []) if str(value or "").strip())
+        return vendor_ids
+
+    def _catch_up_vendor_search_docs(self) -> None:
+        """Refresh docs of vendors whose source rows changed since the last sync, audited or not."""
+        started = self._now()
+        since: datetime | None = self._vendor_search_doc_synced_at
+        if since is not None:
+            watermark = (since - timedelta(seconds=VENDOR_SEARCH_DOC_CATCH_UP_OVERLAP_SEC)).isoformat()
+            rows = self._probe_file(
+                "reporting/select_vendor_ids_changed_since.sql",
+                params=(watermark,) * 9,
+                **{table: self._table(table) for table in VENDOR_SEARCH_DOC_SOURCE_TABLES},
+            )
+            vendor_ids = {str(value).strip() for value in rows.get("vendor_id", []) if str(value or "").strip()}
+            if vendor_ids:
+                self.refresh_vendor_search_docs(vendor_ids=vendor_ids)
+        self._vendor_search_doc_synced_at = started
+
+    def _mark_vendor_search_docs_stale(self, tables: Iterable[str] | None) -> None:
+        """Re-check the docs on the next vendor search after a write to one of their source tables."""
+        if tables is None or VENDOR_SEARCH_DOC_SOURCE_TABLES.intersection(tables):
+            self._vendor_search_doc_checked_at = None
+
+    def _write_vendor_search_docs(self, vendor_filter: str, params: tuple[Any, ...]) -> None:
+        """Upsert the docs of vendors matching ``vendor_filter`` and drop docs of deleted ones."""
+        tables = {
+            "app_vendor_search_doc": self._table("app_vendor_search_doc"),
+            "core_vendor": self._table("core_vendor"),
+            "core_vendor_offering": self._table("core_vendor_offering"),
+            "core_contract": self._table("core_contract"),
+            "core_vendor_business_owner": self._table("core_vendor_business_owner"),
+            "core_offering_business_owner": self._table("core_offering_business_owner"),
+            "core_vendor_contact": self._table("core_vendor_contact"),
+            "core_offering_contact": self._table("core_offering_contact"),
+            "core_vendor_demo": self._table("core_vendor_demo"),
+            "app_project": self._table("app_project"),
+        }
+        now = self._now().isoformat()
+        if not self.config.use_local_db:
+            # One MERGE keyed on vendor_id: readers see either the old or the new doc.
+            self._execute_file(
+                "updates/merge_vendor_search_docs.sql",
+                params=(now, *params, *params),
+                vendor_filter=vendor_filter.format(column="v.vendor_id"),
+                target_filter=vendor_filter.format(column="t.vendor_id"),
+                **tables,
+            )
+            return
+        self._execute_file(
+            "local/upsert_vendor_search_docs.sql",
+            params=(now, *params),
+            vendor_filter=vendor_filter.format(column="v.vendor_id"),
+            **tables,
+        )
+        self._execute_file(
+            "local/delete_orphaned_vendor_search_docs.sql",
+            params=params,
+            app_vendor_search_doc=tables["app_vendor_search_doc"],
+            core_vendor=tables["core_vendor"],
+            target_filter=vendor_filter.format(column="vendor_id"),
+        )
+
+    def ensure_vendor_search_docs(self) -> bool:
+        """Build the search docs now if they are missing or incomplete; run on startup.
+
+        Returns whether the docs are ready for vendor paging.
+        """
+        if not self._vendor_search_doc_enabled:
+            return False
+        try:
+            if self._vendor_search_doc_rebuild_needed():
+                self.refresh_vendor_search_docs()
+            elif self._vendor_search_doc_synced_at is None:
+                self._vendor_search_doc_synced_at = self._now()
+            available = True
+        except (DataQueryError, DataConnectionError, DataExecutionError):
+            LOGGER.warning("Vendor search docs unavailable; using the per-table search clause.", exc_info=True)
+            available = False
+        self._vendor_search_doc_available = available
+        self._vendor_search_doc_checked_at = time.monotonic()
+        return available
+
+    def _vendor_search_doc_rebuild_needed(self) -> bool:
+        status = self._probe_file(
+            "reporting/vendor_search_doc_status.sql",
+            core_vendor=self._table("core_vendor"),
+            app_vendor_search_doc=self._table("app_vendor_search_doc"),
+        )
+        vendor_rows = int(status.iloc[0]["vendor_rows"]) if not status.empty else 0
+        doc_rows = int(status.iloc[0]["doc_rows"]) if not status.empty else -1
+        return self._vendor_search_doc_full_rebuild_needed or vendor_rows != doc_rows
+
+    def _vendor_search_doc_ready(self) -> bool:
+        """Whether vendor paging can use the docs. Never writes: a needed rebuild is started in the background."""
+        if not self._vendor_search_doc_enabled:
+            return False
+        now = time.monotonic()
+        checked_at = self._vendor_search_doc_checked_at
+        if (
+            checked_at is not None
+            and not self._vendor_search_doc_full_rebuild_needed
+            and now - checked_at < VENDOR_SEARCH_DOC_RECHECK_SEC
+        ):
+            return self._vendor_search_doc_available
+        available = False
+        try:
+            if self._vendor_search_doc_rebuild_needed():
+                self._sync_vendor_search_docs_async(full=True)
+            else:
+                available = True
+                self._sync_vendor_search_docs_async(full=False)
+        except (DataQueryError, DataConnectionError, DataExecutionError):
+            LOGGER.warning("Vendor search docs unavailable; using the per-table search clause.", exc_info=True)
+        self._vendor_search_doc_available = available
+        self._vendor_search_doc_checked_at = now
+        return available
+
+    def _sync_vendor_search_docs_async(self, *, full: bool) -> None:
+        """Run a full rebuild or a change catch-up on one background thread; no-op while one runs."""
+        with self._vendor_search_doc_sync_lock:
+            thread = self._vendor_search_doc_sync_thread
+            if thread is not None and thread.is_alive():
+                return
+
+            def _run() -> None:
+                try:
+                    if full:
+                        self.refresh_vendor_search_docs()
+                    else:
+                        self._catch_up_vendor_search_docs()
+                except Exception:
+                    LOGGER.warning("Background vendor search doc sync failed. full=%s", full, exc_info=True)
+                finally:
+                    if full:
+                        # Re-check on the next search instead of trusting the pre-rebuild status.
+                        self._vendor_search_doc_checked_at = None
+
+            thread = threading.Thread(target=_run, name="vendor-search-doc-sync", daemon=True)
+            self._vendor_search_doc_sync_thread = thread
+            thread.start()
+
+    def _refresh_vendor_search_docs_for_changes(self, records: list[dict[str, Any]]) -> None:
+        if not self._vendor_search_doc_enabled:
+            return
+        vendor_ids: set[str] = set()
+        offering_ids: set[str] = set()
+        for record in records:
+            entity_name = str(record.get("entity_name") or "")
+            if entity_name in _VENDOR_KEYED_SEARCH_ENTITIES:
+                found = _audit_payload_values(record, "vendor_id")
+                if entity_name == "core_vendor":
+                    found.add(str(record.get("entity_id") or "").strip())
+                elif entity_name == "core_vendor_offering":
+                    offering_ids.add(str(record.get("entity_id") or "").strip())
+                elif not found:
+                    self._vendor_search_doc_full_rebuild_needed = True
+                vendor_ids.update(found)
+            elif entity_name in _OFFERING_KEYED_SEARCH_ENTITIES:
+                found = _audit_payload_values(record, "offering_id")
+                if not found:
+                    # e.g. an owner removal audited without a payload; rebuild in the background.
+                    self._vendor_search_doc_full_rebuild_needed = True
+                offering_ids.update(found)
+        vendor_ids.discard("")
+        offering_ids.discard("")
+        if not vendor_ids and not offering_ids:
+            return
+        try:
+            self.refresh_vendor_search_docs(vendor_ids=vendor_ids, offering_ids=offering_ids)
+        except (DataQueryError, DataConnectionError, DataExecutionError):
+            LOGGER.warning("Failed to refresh vendor search docs; scheduling a full rebuild.", exc_info=True)
+            self._vendor_search_doc_full_rebuild_needed = True
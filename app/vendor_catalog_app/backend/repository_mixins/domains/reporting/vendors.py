@@ -14,6 +14,13 @@ from vendor_catalog_app.infrastructure.db import (
     DataExecutionError,
     DataQueryError,
 )
+from vendor_catalog_app.infrastructure.paging import (
+    cursor_scope,
+    decode_cursor,
+    encode_cursor,
+    keyset_clause,
+    keyset_params,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -30,7 +37,14 @@ class RepositoryReportingVendorsMixin:
         page_size: int = 25,
         sort_by: str = "vendor_name",
         sort_dir: str = "asc",
+        cursor: str = "",
     ) -> tuple[pd.DataFrame, int]:
+        """One page of vendors and the (possibly slightly stale) total.
+
+        ``cursor`` is the ``next_cursor`` attr of the previous page's frame; when it
+        matches the current filters and sort the page is read by keyset instead of
+        ``OFFSET``. Totals come from the background-refreshed page count cache.
+        """
         page = max(1, int(page or 1))
         page_size = max(1, min(int(page_size or 25), 200))
         sort_dir = "desc" if str(sort_dir).strip().lower() == "desc" else "asc"
@@ -62,46 +76,86 @@ class RepositoryReportingVendorsMixin:
             params.append(risk_tier)
         if search_text.strip():
             like = f"%{search_text.strip()}%"
-            where_parts.append(
-                self._sql(
-                    "reporting/filter_vendors_page_search_clause.sql",
-                    core_vendor_offering=self._table("core_vendor_offering"),
-                    core_contract=self._table("core_contract"),
-                    core_vendor_business_owner=self._table("core_vendor_business_owner"),
-                    core_offering_business_owner=self._table("core_offering_business_owner"),
-                    core_vendor_contact=self._table("core_vendor_contact"),
-                    core_offering_contact=self._table("core_offering_contact"),
-                    core_vendor_demo=self._table("core_vendor_demo"),
-                    app_project=self._table("app_project"),
+            fts_query = self._local_fts_query("vendor_search_docs", search_text)
+            if fts_query is not None and self._vendor_search_doc_ready():
+                where_parts.append(
+                    self._sql(
+                        "local/filter_vendors_page_search_doc_clause.sql",
+                        app_vendor_search_doc=self._table("app_vendor_search_doc"),
+                        fts_clause=self._local_fts_clause("vendor_search_docs", "sd.rowid"),
+                    )
                 )
-            )
-            params.extend([like] * 39)
+                params.append(fts_query)
+            elif self._vendor_search_doc_ready():
+                where_parts.append(
+                    self._sql(
+                        "reporting/filter_vendors_page_search_doc_clause.sql",
+                        app_vendor_search_doc=self._table("app_vendor_search_doc"),
+                    )
+                )
+                params.append(like.lower())
+            else:
+                where_parts.append(
+                    self._sql(
+                        "reporting/filter_vendors_page_search_clause.sql",
+                        core_vendor_offering=self._table("core_vendor_offering"),
+                        core_contract=self._table("core_contract"),
+                        core_vendor_business_owner=self._table("core_vendor_business_owner"),
+                        core_offering_business_owner=self._table("core_offering_business_owner"),
+                        core_vendor_contact=self._table("core_vendor_contact"),
+                        core_offering_contact=self._table("core_offering_contact"),
+                        core_vendor_demo=self._table("core_vendor_demo"),
+                        app_project=self._table("app_project"),
+                    )
+                )
+                params.extend([like] * 39)
 
         where_clause = " AND ".join(where_parts)
+        keyset_keys = [(sort_expr, sort_dir), ("lower(v.vendor_id)", "asc")]
+        scope = cursor_scope(where_clause, params, sort_expr, sort_dir)
+        after = decode_cursor(cursor, scope=scope, size=len(keyset_keys))
+        data_where, data_params, data_offset = where_clause, list(params), offset
+        if after is not None:
+            data_where = f"{where_clause} AND {keyset_clause(keyset_keys)}"
+            data_params.extend(keyset_params(after))
+            data_offset = 0
 
         try:
-            total_df = self._query_file(
+            count_statement = self._sql(
                 "reporting/list_vendors_page_count.sql",
-                params=tuple(params),
-                columns=["total_rows"],
                 where_clause=where_clause,
                 core_vendor=self._table("core_vendor"),
             )
-            total = int(total_df.iloc[0]["total_rows"]) if not total_df.empty else 0
+            total = self._page_count_cache.get(
+                (count_statement, tuple(params)),
+                lambda: self._page_count(count_statement, tuple(params)),
+                version=self._data_generation,
+            )
             rows = self._query_file(
                 "reporting/list_vendors_page_data.sql",
-                params=tuple(params + [page_size, offset]),
-                where_clause=where_clause,
+                params=tuple(data_params + [page_size, data_offset]),
+                where_clause=data_where,
                 sort_expr=sort_expr,
                 sort_dir=sort_dir,
                 core_vendor=self._table("core_vendor"),
             )
+            # A cached total can lag writes; the rows actually read bound it.
+            if len(rows.index) < page_size and (offset == 0 or not rows.empty):
+                total = offset + len(rows.index)
+            else:
+                total = max(total, offset + len(rows.index))
             if rows.empty:
                 return pd.DataFrame(columns=columns), total
+            next_cursor = ""
+            last = rows.iloc[-1]
+            if len(rows.index) == page_size and not pd.isna(last.get("sort_key")):
+                next_cursor = encode_cursor([last["sort_key"], last["sort_key_id"]], scope=scope)
             for col in columns:
                 if col not in rows.columns:
                     rows[col] = None
-            return rows[columns], total
+            out = rows[columns].copy()
+            out.attrs["next_cursor"] = next_cursor
+            return out, total
         except (DataQueryError, DataConnectionError):
             LOGGER.warning("Primary vendor paging query failed; using fallback search.", exc_info=True)
             fallback = self.search_vendors(search_text=search_text, lifecycle_state=lifecycle_state).copy()
@@ -118,6 +172,11 @@ class RepositoryReportingVendorsMixin:
                     out[col] = None
             return out[columns], total
 
+    def _page_count(self, statement: str, params: tuple[Any, ...]) -> int:
+        # Not request-memoized: background refreshes run outside the request.
+        frame = self.client.query(statement, params)
+        return int(frame.iloc[0]["total_rows"]) if not frame.empty else 0
+
     def search_vendors(self, search_text: str = "", lifecycle_state: str = "all") -> pd.DataFrame:
         self._ensure_local_offering_columns()
         state_clause = ""
@@ -730,12 +789,23 @@ class RepositoryReportingVendorsMixin:
         )
 
     def vendor_summary(self, vendor_id: str, months: int = 12) -> dict[str, Any]:
-        profile = self.get_vendor_profile(vendor_id)
-        offerings = self.get_vendor_offerings(vendor_id)
-        contracts = self.get_vendor_contracts(vendor_id)
-        demos = self.get_vendor_demos(vendor_id)
-        spend = self.vendor_monthly_spend_trend(vendor_id, months=months)
+        return self.build_vendor_summary(
+            profile=self.get_vendor_profile(vendor_id),
+            offerings=self.get_vendor_offerings(vendor_id),
+            contracts=self.get_vendor_contracts(vendor_id),
+            demos=self.get_vendor_demos(vendor_id),
+            spend=self.vendor_monthly_spend_trend(vendor_id, months=months),
+        )
 
+    @staticmethod
+    def build_vendor_summary(
+        *,
+        profile: pd.DataFrame,
+        offerings: pd.DataFrame,
+        contracts: pd.DataFrame,
+        demos: pd.DataFrame,
+        spend: pd.DataFrame,
+    ) -> dict[str, Any]:
         active_contracts = 0
         if not contracts.empty and "contract_status" in contracts.columns:
             active_contracts = int((contracts["contract_status"].astype(str).str.lower() == "active").sum())
@@ -1,7 +1,29 @@
 from __future__ import annotations
 
+import logging
+import re
+from collections.abc import Callable, Sequence
 from typing import Any
 
+from vendor_catalog_app.infrastructure.db import DataConnectionError, DataExecutionError
+from vendor_catalog_app.infrastructure.search_index import Bm25Index
+
+LOGGER = logging.getLogger(__name__)
+
+# Rendered help articles written per delete/insert statement pair.
+HELP_ARTICLE_RENDER_CHUNK_ROWS = 50
+
+# Term frequency weight per field for help search; a title term counts three times a body term.
+HELP_SEARCH_FIELD_WEIGHTS = {"title": 3.0, "search_text": 1.0}
+
+
+def _plain_text(markdown: str | None) -> str:
+    text = str(markdown or "")
+    text = re.sub(r"`{1,3}.*?`{1,3}", " ", text, flags=re.S)
+    text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)
+    text = re.sub(r"[#>*_\-]+", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
 
 class RepositoryHelpMixin:
     def list_help_article_index(self) -> list[dict[str, Any]]:
@@ -47,6 +69,34 @@ class RepositoryHelpMixin:
 
         return self._cached(("help_articles_full",), _load, ttl_seconds=180)
 
+    def help_search_index(self) -> Bm25Index:
+        """BM25 index over the help articles, built alongside the help article cache."""
+
+        def _build() -> Bm25Index:
+            rows = [
+                {**article, "search_text": _plain_text(article.get("content_md"))}
+                for article in self.list_help_articles_full()
+            ]
+            return Bm25Index(rows, fields=HELP_SEARCH_FIELD_WEIGHTS, snippet_field="search_text")
+
+        return self._cached(("help_search_index",), _build, ttl_seconds=180)
+
+    def search_help_articles(
+        self,
+        query: str,
+        *,
+        where: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Articles matching ``query`` with ``score`` and ``snippet``, best first."""
+        index = self.help_search_index()
+        results: list[dict[str, Any]] = []
+        for position, score, offset in index.search(query, where=where):
+            record = {key: value for key, value in index.rows[position].items() if key != "search_text"}
+            record["score"] = round(score, 3)
+            record["snippet"] = index.snippet(position, offset)
+            results.append(record)
+        return sorted(results, key=lambda row: (-row["score"], str(row.get("title") or "")))
+
     def get_help_article_by_slug(self, slug: str) -> dict[str, Any] | None:
         normalized = str(slug or "").strip()
         if not normalized:
@@ -78,6 +128,65 @@ class RepositoryHelpMixin:
 
         return self._cached(("help_article", normalized.lower()), _load, ttl_seconds=180)
 
+    def list_help_article_renders(self) -> dict[str, dict[str, str]]:
+        """Persisted article renders by article id: ``{"content_hash", "content_html"}``."""
+
+        def _load() -> dict[str, dict[str, str]]:
+            rows = self._query_file(
+                "help/select_help_article_renders.sql",
+                columns=["article_id", "content_hash", "content_html"],
+                app_help_article_render=self._table("app_help_article_render"),
+            )
+            return {
+                str(row["article_id"]): {
+                    "content_hash": str(row["content_hash"] or ""),
+                    "content_html": str(row["content_html"] or ""),
+                }
+                for row in rows.to_dict("records")
+            }
+
+        return self._cached(("help_article_renders",), _load, ttl_seconds=180)
+
+    def save_help_article_renders(self, renders: Sequence[tuple[str, str, str]]) -> None:
+        """Persist ``(article_id, content_hash, content_html)`` renders; failures only cost a re-render."""
+        now = self._now().isoformat()
+        saved: dict[str, dict[str, str]] = {}
+        for start in range(0, len(renders), HELP_ARTICLE_RENDER_CHUNK_ROWS):
+            chunk = renders[start : start + HELP_ARTICLE_RENDER_CHUNK_ROWS]
+            table = self._table("app_help_article_render")
+            try:
+                # Renders are derived data; keep the query caches warm.
+                self.client.execute(
+                    self._sql(
+                        "updates/delete_help_article_renders.sql",
+                        app_help_article_render=table,
+                        article_ids=", ".join("%s" for _ in chunk),
+                    ),
+                    tuple(article_id for article_id, _hash, _html in chunk),
+                    invalidate_cache=False,
+                )
+                self.client.execute(
+                    self._sql(
+                        "inserts/insert_help_article_renders.sql",
+                        app_help_article_render=table,
+                        values_rows=",\n  ".join("(%s, %s, %s, %s)" for _ in chunk),
+                    ),
+                    tuple(value for article_id, content_hash, html in chunk for value in (article_id, content_hash, html, now)),
+                    invalidate_cache=False,
+                )
+            except (DataExecutionError, DataConnectionError):
+                LOGGER.warning("Failed to persist %s help article renders.", len(chunk), exc_info=True)
+                continue
+            saved.update(
+                {article_id: {"content_hash": content_hash, "content_html": html} for article_id, content_hash, html in chunk}
+            )
+        if saved:
+            self._repo_cache.set(
+                ("help_article_renders",),
+                {**self.list_help_article_renders(), **saved},
+                ttl_seconds=180,
+            )
+
     def create_help_article(
         self,
         *,
@@ -110,6 +219,7 @@ class RepositoryHelpMixin:
             ),
             vendor_help_article=self._table("vendor_help_article"),
         )
+        self.help_search_index()
         return article_id
 
     def record_help_feedback(
@@ -13,6 +13,8 @@ from vendor_catalog_app.core.repository_errors import SchemaBootstrapRequiredErr
 from vendor_catalog_app.infrastructure.db import DataConnectionError, DataExecutionError, DataQueryError
 
 LOGGER = logging.getLogger(__name__)
+# Six bound values per row keeps each statement well under SQLite's variable limit.
+USAGE_EVENT_INSERT_CHUNK_ROWS = 100
 
 class RepositoryIdentityMixin:
     def ensure_runtime_tables(self) -> None:
@@ -201,22 +203,47 @@ class RepositoryIdentityMixin:
             event_type=event_type,
         ):
             return
-        actor_ref = self._actor_ref(user_principal)
-        try:
-            self._execute_file(
-                "inserts/log_usage_event.sql",
-                params=(
+        self._usage_writer.submit(
+            (
+                str(user_principal or ""),
+                page_name,
+                event_type,
+                self._now(),
+                self._serialize_payload(payload),
+            )
+        )
+
+    def flush_usage_events(self) -> int:
+        return self._usage_writer.flush()
+
+    def _write_usage_event_batch(self, events: list[tuple[str, str, str, Any, str]]) -> None:
+        """Insert buffered usage events; actor refs are resolved here, off the request path."""
+        actor_refs: dict[str, str] = {}
+        rows: list[tuple[Any, ...]] = []
+        for user_principal, page_name, event_type, event_ts, payload_json in events:
+            if user_principal not in actor_refs:
+                actor_refs[user_principal] = self._actor_ref(user_principal)
+            rows.append(
+                (
                     str(uuid.uuid4()),
-                    actor_ref,
+                    actor_refs[user_principal],
                     page_name,
                     event_type,
-                    self._now(),
-                    self._serialize_payload(payload),
-                ),
+                    event_ts,
+                    payload_json,
+                )
+            )
+        for start in range(0, len(rows), USAGE_EVENT_INSERT_CHUNK_ROWS):
+            chunk = rows[start : start + USAGE_EVENT_INSERT_CHUNK_ROWS]
+            statement = self._sql(
+                "inserts/log_usage_events_batch.sql",
                 app_usage_log=self._table("app_usage_log"),
+                values_rows=",\n  ".join("(%s, %s, %s, %s, %s, %s)" for _ in chunk),
             )
-        except (DataExecutionError, DataConnectionError):
-            LOGGER.debug("Failed to write usage event '%s' for '%s'.", event_type, user_principal, exc_info=True)
+            params = tuple(value for row in chunk for value in row)
+            # Usage rows are never read through the query caches, so keep them warm. Errors
+            # propagate so the writer logs the failed batch and counts it in ``failed_total``.
+            self.client.execute(statement, params, invalidate_cache=False)
 
     def get_current_user(self) -> str:
         if self.config.use_local_db:
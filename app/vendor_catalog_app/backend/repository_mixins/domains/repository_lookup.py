@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import logging
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TypeVar
 
 import pandas as pd
 
@@ -11,7 +12,13 @@ from vendor_catalog_app.core.repository_constants import *
 
 LOGGER = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
 class RepositoryLookupMixin:
+    LOOKUP_OPTIONS_VERSION_SETTING_KEY = "lookup_options_version"
+    LOOKUP_OPTIONS_VERSION_ACTOR = "system:lookup-options"
+
     @staticmethod
     def _lookup_columns() -> list[str]:
         return [
@@ -134,6 +141,47 @@ class RepositoryLookupMixin:
             kind="stable",
         ).reset_index(drop=True)
 
+    def get_lookup_options_version(self) -> int:
+        """Return the current lookup options version used to refresh compiled option sets."""
+        cache_key = ("lookup_options_version",)
+
+        def _load() -> int:
+            payload = self.get_user_setting(
+                self.LOOKUP_OPTIONS_VERSION_ACTOR,
+                self.LOOKUP_OPTIONS_VERSION_SETTING_KEY,
+            )
+            try:
+                version = int(payload.get("version", 1)) if isinstance(payload, dict) else 1
+            except Exception:
+                version = 1
+            return max(1, version)
+
+        return int(self._cached(cache_key, _load, ttl_seconds=30))
+
+    def bump_lookup_options_version(self, *, updated_by: str | None = None) -> int:
+        """Bump lookup options version so every process recompiles its option sets."""
+        next_version = max(1, self.get_lookup_options_version() + 1)
+        actor = str(updated_by or self.LOOKUP_OPTIONS_VERSION_ACTOR).strip() or self.LOOKUP_OPTIONS_VERSION_ACTOR
+        self.save_user_setting(
+            user_principal=self.LOOKUP_OPTIONS_VERSION_ACTOR,
+            setting_key=self.LOOKUP_OPTIONS_VERSION_SETTING_KEY,
+            setting_value={"version": next_version, "updated_by": actor, "updated_at": self._now().isoformat()},
+        )
+        self._cache_clear()
+        self._option_registry.invalidate()
+        return next_version
+
+    def compiled_lookup_options(self, name: str, build: Callable[[pd.DataFrame], T]) -> T:
+        """Return ``build(active lookup rows)``, compiled once per lookup options version.
+
+        The result is shared across requests and must not be mutated by callers.
+        """
+        return self._option_registry.get(
+            ("lookup_options", str(name)),
+            version=self.get_lookup_options_version,
+            build=lambda: build(self.list_lookup_options(active_only=True)),
+        )
+
     def list_doc_source_options(self) -> list[str]:
         rows = self.list_lookup_options(LOOKUP_TYPE_DOC_SOURCE, active_only=True)
         if rows.empty:
@@ -437,6 +485,7 @@ class RepositoryLookupMixin:
                 ),
                 app_lookup_option=self._table("app_lookup_option"),
             )
+        self.bump_lookup_options_version(updated_by=updated_by)
 
     def delete_lookup_option(
         self,
@@ -543,6 +592,7 @@ class RepositoryLookupMixin:
                 ),
                 app_lookup_option=self._table("app_lookup_option"),
             )
+        self.bump_lookup_options_version(updated_by=updated_by)
 
     def record_contract_cancellation(
         self, contract_id: str, reason_code: str, notes: str, actor_user_principal: str
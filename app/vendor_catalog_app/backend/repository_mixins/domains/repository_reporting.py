@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from .reporting import (
     RepositoryReportingExecutiveMixin,
+    RepositoryReportingGlobalSearchMixin,
     RepositoryReportingPortfolioMixin,
+    RepositoryReportingSearchDocsMixin,
     RepositoryReportingSearchMixin,
     RepositoryReportingVendorsMixin,
 )
@@ -10,7 +12,9 @@ from .reporting import (
 
 class RepositoryReportingMixin(
     RepositoryReportingExecutiveMixin,
+    RepositoryReportingGlobalSearchMixin,
     RepositoryReportingPortfolioMixin,
+    RepositoryReportingSearchDocsMixin,
     RepositoryReportingSearchMixin,
     RepositoryReportingVendorsMixin,
 ):
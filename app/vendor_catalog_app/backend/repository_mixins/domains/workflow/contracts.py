@@ -10,13 +10,15 @@ LOGGER = logging.getLogger(__name__)
 
 
 class RepositoryWorkflowContractMixin:
-    def contract_cancellations(self) -> pd.DataFrame:
+    def contract_cancellations(self, limit: int = 500) -> pd.DataFrame:
+        limit = max(1, min(int(limit), 500))
         return self._cached(
-            ("contract_cancellations",),
+            ("contract_cancellations", limit),
             lambda: self.client.query(
                 self._sql(
                     "reporting/contract_cancellations.sql",
                     rpt_contract_cancellations=self._table("rpt_contract_cancellations"),
+                    limit_rows=limit,
                 )
             ),
             ttl_seconds=120,
@@ -12,13 +12,15 @@ LOGGER = logging.getLogger(__name__)
 
 
 class RepositoryWorkflowDemoMixin:
-    def demo_outcomes(self) -> pd.DataFrame:
+    def demo_outcomes(self, limit: int = 500) -> pd.DataFrame:
+        limit = max(1, min(int(limit), 500))
         return self._cached(
-            ("demo_outcomes",),
+            ("demo_outcomes", limit),
             lambda: self.client.query(
                 self._sql(
                     "reporting/demo_outcomes.sql",
                     core_vendor_demo=self._table("core_vendor_demo"),
+                    limit_rows=limit,
                 )
             ),
             ttl_seconds=60,
@@ -17,6 +17,8 @@ from vendor_catalog_app.core.env import (
     DATABRICKS_CLIENT_ID,
     DATABRICKS_CLIENT_SECRET,
     DATABRICKS_HTTP_PATH_KEYS,
+    DATABRICKS_REPORTING_HTTP_PATH,
+    DATABRICKS_REPORTING_WAREHOUSE_ID,
     DATABRICKS_RESOURCE_WAREHOUSE_KEYS,
     DATABRICKS_SERVER_HOSTNAME_KEYS,
     DATABRICKS_TOKEN,
@@ -66,6 +68,16 @@ def _resolve_http_path() -> str:
     return ""
 
 
+def _resolve_reporting_http_path() -> str:
+    direct_path = get_env(DATABRICKS_REPORTING_HTTP_PATH)
+    if direct_path:
+        return direct_path
+    warehouse_id = get_env(DATABRICKS_REPORTING_WAREHOUSE_ID)
+    if warehouse_id:
+        return f"/sql/1.0/warehouses/{warehouse_id}"
+    return ""
+
+
 def _repo_root() -> Path:
     # app/vendor_catalog_app/core/config.py -> repo root
     # parents[0]=core, [1]=vendor_catalog_app, [2]=app, [3]=repo root
@@ -134,6 +146,7 @@ class AppConfig:
     allowed_write_verbs: tuple[str, ...] = DEFAULT_ALLOWED_WRITE_VERBS
     schema_bootstrap_sql_path: str = DEFAULT_SCHEMA_BOOTSTRAP_SQL_PATH
     dev_allow_all_access: bool = False
+    databricks_reporting_http_path: str = ""
 
     @property
     def fq_schema(self) -> str:
@@ -182,4 +195,5 @@ class AppConfig:
                 env_name in DEV_ENV_NAMES
                 and get_env_bool(TVENDOR_DEV_ALLOW_ALL_ACCESS, default=False)
             ),
+            databricks_reporting_http_path=_resolve_reporting_http_path(),
         )
@@ -17,12 +17,21 @@ TVENDOR_LOCKED_MODE = "TVENDOR_LOCKED_MODE"
 TVENDOR_ENFORCE_PROD_SQL_POLICY = "TVENDOR_ENFORCE_PROD_SQL_POLICY"
 TVENDOR_SCHEMA_BOOTSTRAP_SQL = "TVENDOR_SCHEMA_BOOTSTRAP_SQL"
 TVENDOR_SQL_PRELOAD_ON_STARTUP = "TVENDOR_SQL_PRELOAD_ON_STARTUP"
+TVENDOR_TEMPLATE_PRECOMPILE_ON_STARTUP = "TVENDOR_TEMPLATE_PRECOMPILE_ON_STARTUP"
+TVENDOR_TEMPLATE_BYTECODE_CACHE_ENABLED = "TVENDOR_TEMPLATE_BYTECODE_CACHE_ENABLED"
+TVENDOR_TEMPLATE_BYTECODE_CACHE_DIR = "TVENDOR_TEMPLATE_BYTECODE_CACHE_DIR"
 TVENDOR_SESSION_SECRET = "TVENDOR_SESSION_SECRET"
 TVENDOR_SESSION_HTTPS_ONLY = "TVENDOR_SESSION_HTTPS_ONLY"
 TVENDOR_ALLOW_DEFAULT_SESSION_SECRET = "TVENDOR_ALLOW_DEFAULT_SESSION_SECRET"
+TVENDOR_SESSION_BACKEND = "TVENDOR_SESSION_BACKEND"
+TVENDOR_SESSION_SQLITE_PATH = "TVENDOR_SESSION_SQLITE_PATH"
+TVENDOR_SESSION_MAX_AGE_SEC = "TVENDOR_SESSION_MAX_AGE_SEC"
+TVENDOR_SESSION_MEMORY_MAX_ENTRIES = "TVENDOR_SESSION_MEMORY_MAX_ENTRIES"
 TVENDOR_PERF_LOG_ENABLED = "TVENDOR_PERF_LOG_ENABLED"
 TVENDOR_PERF_RESPONSE_HEADER = "TVENDOR_PERF_RESPONSE_HEADER"
+TVENDOR_SERVER_TIMING_ENABLED = "TVENDOR_SERVER_TIMING_ENABLED"
 TVENDOR_SLOW_QUERY_MS = "TVENDOR_SLOW_QUERY_MS"
+TVENDOR_N_PLUS_ONE_THRESHOLD = "TVENDOR_N_PLUS_ONE_THRESHOLD"
 TVENDOR_ERROR_INCLUDE_DETAILS = "TVENDOR_ERROR_INCLUDE_DETAILS"
 TVENDOR_REQUEST_ID_HEADER_ENABLED = "TVENDOR_REQUEST_ID_HEADER_ENABLED"
 TVENDOR_TRUST_FORWARDED_IDENTITY_HEADERS = "TVENDOR_TRUST_FORWARDED_IDENTITY_HEADERS"
@@ -35,12 +44,30 @@ TVENDOR_CSRF_ENABLED = "TVENDOR_CSRF_ENABLED"
 TVENDOR_WRITE_RATE_LIMIT_ENABLED = "TVENDOR_WRITE_RATE_LIMIT_ENABLED"
 TVENDOR_WRITE_RATE_LIMIT_WINDOW_SEC = "TVENDOR_WRITE_RATE_LIMIT_WINDOW_SEC"
 TVENDOR_WRITE_RATE_LIMIT_MAX_REQUESTS = "TVENDOR_WRITE_RATE_LIMIT_MAX_REQUESTS"
+TVENDOR_WRITE_RATE_LIMIT_BACKEND = "TVENDOR_WRITE_RATE_LIMIT_BACKEND"
+TVENDOR_WRITE_RATE_LIMIT_SQLITE_PATH = "TVENDOR_WRITE_RATE_LIMIT_SQLITE_PATH"
 TVENDOR_QUERY_CACHE_ENABLED = "TVENDOR_QUERY_CACHE_ENABLED"
 TVENDOR_QUERY_CACHE_TTL_SEC = "TVENDOR_QUERY_CACHE_TTL_SEC"
 TVENDOR_QUERY_CACHE_MAX_ENTRIES = "TVENDOR_QUERY_CACHE_MAX_ENTRIES"
 TVENDOR_REPO_CACHE_ENABLED = "TVENDOR_REPO_CACHE_ENABLED"
 TVENDOR_REPO_CACHE_TTL_SEC = "TVENDOR_REPO_CACHE_TTL_SEC"
 TVENDOR_REPO_CACHE_MAX_ENTRIES = "TVENDOR_REPO_CACHE_MAX_ENTRIES"
+TVENDOR_REQUEST_MEMO_ENABLED = "TVENDOR_REQUEST_MEMO_ENABLED"
+TVENDOR_OPTION_REGISTRY_REVALIDATE_SEC = "TVENDOR_OPTION_REGISTRY_REVALIDATE_SEC"
+TVENDOR_TYPEAHEAD_INDEX_ENABLED = "TVENDOR_TYPEAHEAD_INDEX_ENABLED"
+TVENDOR_TYPEAHEAD_INDEX_REVALIDATE_SEC = "TVENDOR_TYPEAHEAD_INDEX_REVALIDATE_SEC"
+TVENDOR_TYPEAHEAD_INDEX_MAX_ROWS = "TVENDOR_TYPEAHEAD_INDEX_MAX_ROWS"
+TVENDOR_TYPEAHEAD_INDEX_WARM_ON_STARTUP = "TVENDOR_TYPEAHEAD_INDEX_WARM_ON_STARTUP"
+TVENDOR_VENDOR_SEARCH_DOC_ENABLED = "TVENDOR_VENDOR_SEARCH_DOC_ENABLED"
+TVENDOR_LOCAL_FTS_ENABLED = "TVENDOR_LOCAL_FTS_ENABLED"
+TVENDOR_GLOBAL_SEARCH_BUDGET_MS = "TVENDOR_GLOBAL_SEARCH_BUDGET_MS"
+TVENDOR_BUDGET_LOAD_MAX_WORKERS = "TVENDOR_BUDGET_LOAD_MAX_WORKERS"
+TVENDOR_MARKDOWN_RENDER_CACHE_MAX_ENTRIES = "TVENDOR_MARKDOWN_RENDER_CACHE_MAX_ENTRIES"
+TVENDOR_HELP_PRERENDER_ON_STARTUP = "TVENDOR_HELP_PRERENDER_ON_STARTUP"
+TVENDOR_IMPORT_SOURCE_CACHE_DIR = "TVENDOR_IMPORT_SOURCE_CACHE_DIR"
+TVENDOR_PAGE_COUNT_CACHE_TTL_SEC = "TVENDOR_PAGE_COUNT_CACHE_TTL_SEC"
+TVENDOR_PARALLEL_LOAD_ENABLED = "TVENDOR_PARALLEL_LOAD_ENABLED"
+TVENDOR_PARALLEL_LOAD_MAX_WORKERS = "TVENDOR_PARALLEL_LOAD_MAX_WORKERS"
 TVENDOR_SQL_TRACE_ENABLED = "TVENDOR_SQL_TRACE_ENABLED"
 TVENDOR_SQL_TRACE_MAX_LEN = "TVENDOR_SQL_TRACE_MAX_LEN"
 TVENDOR_SECURITY_HEADERS_ENABLED = "TVENDOR_SECURITY_HEADERS_ENABLED"
@@ -64,8 +91,16 @@ TVENDOR_ALERT_ERROR_RATE_PCT = "TVENDOR_ALERT_ERROR_RATE_PCT"
 TVENDOR_ALERT_DB_AVG_MS = "TVENDOR_ALERT_DB_AVG_MS"
 TVENDOR_DB_POOL_ENABLED = "TVENDOR_DB_POOL_ENABLED"
 TVENDOR_DB_POOL_MAX_SIZE = "TVENDOR_DB_POOL_MAX_SIZE"
+TVENDOR_DB_POOL_REPORTING_MAX_SIZE = "TVENDOR_DB_POOL_REPORTING_MAX_SIZE"
 TVENDOR_DB_POOL_ACQUIRE_TIMEOUT_SEC = "TVENDOR_DB_POOL_ACQUIRE_TIMEOUT_SEC"
 TVENDOR_DB_POOL_IDLE_TTL_SEC = "TVENDOR_DB_POOL_IDLE_TTL_SEC"
+TVENDOR_DB_READ_RETRY_MAX_ATTEMPTS = "TVENDOR_DB_READ_RETRY_MAX_ATTEMPTS"
+TVENDOR_DB_READ_RETRY_BASE_DELAY_MS = "TVENDOR_DB_READ_RETRY_BASE_DELAY_MS"
+TVENDOR_DB_READ_RETRY_MAX_DELAY_MS = "TVENDOR_DB_READ_RETRY_MAX_DELAY_MS"
+TVENDOR_WORKER_THREADS = "TVENDOR_WORKER_THREADS"
+TVENDOR_WORKER_ADMISSION_ENABLED = "TVENDOR_WORKER_ADMISSION_ENABLED"
+TVENDOR_WORKER_MAX_QUEUE = "TVENDOR_WORKER_MAX_QUEUE"
+TVENDOR_WORKER_RETRY_AFTER_SEC = "TVENDOR_WORKER_RETRY_AFTER_SEC"
 TVENDOR_LOG_LEVEL = "TVENDOR_LOG_LEVEL"
 TVENDOR_LOG_JSON = "TVENDOR_LOG_JSON"
 TVENDOR_LOG_CAPTURE_ROOT = "TVENDOR_LOG_CAPTURE_ROOT"
@@ -81,6 +116,16 @@ TVENDOR_LOCAL_DB_RESET_ON_START = "TVENDOR_LOCAL_DB_RESET_ON_START"
 TVENDOR_LOCAL_DB_SEED = "TVENDOR_LOCAL_DB_SEED"
 TVENDOR_LOCAL_DB_SEED_PROFILE = "TVENDOR_LOCAL_DB_SEED_PROFILE"
 TVENDOR_USAGE_LOG_MIN_INTERVAL_SEC = "TVENDOR_USAGE_LOG_MIN_INTERVAL_SEC"
+TVENDOR_USAGE_LOG_BUFFER_ENABLED = "TVENDOR_USAGE_LOG_BUFFER_ENABLED"
+TVENDOR_USAGE_LOG_BUFFER_MAX_EVENTS = "TVENDOR_USAGE_LOG_BUFFER_MAX_EVENTS"
+TVENDOR_USAGE_LOG_FLUSH_BATCH_SIZE = "TVENDOR_USAGE_LOG_FLUSH_BATCH_SIZE"
+TVENDOR_USAGE_LOG_FLUSH_INTERVAL_MS = "TVENDOR_USAGE_LOG_FLUSH_INTERVAL_MS"
+TVENDOR_USAGE_LOG_BACKPRESSURE_SAMPLE_RATE = "TVENDOR_USAGE_LOG_BACKPRESSURE_SAMPLE_RATE"
+TVENDOR_AUDIT_SPOOL_ENABLED = "TVENDOR_AUDIT_SPOOL_ENABLED"
+TVENDOR_AUDIT_SPOOL_DIR = "TVENDOR_AUDIT_SPOOL_DIR"
+TVENDOR_AUDIT_SPOOL_FSYNC = "TVENDOR_AUDIT_SPOOL_FSYNC"
+TVENDOR_AUDIT_FLUSH_BATCH_SIZE = "TVENDOR_AUDIT_FLUSH_BATCH_SIZE"
+TVENDOR_AUDIT_FLUSH_INTERVAL_MS = "TVENDOR_AUDIT_FLUSH_INTERVAL_MS"
 TVENDOR_USER_DIRECTORY_TOUCH_TTL_SEC = "TVENDOR_USER_DIRECTORY_TOUCH_TTL_SEC"
 TVENDOR_DATABRICKS_REPORTS_JSON = "TVENDOR_DATABRICKS_REPORTS_JSON"
 TVENDOR_DATABRICKS_REPORTS_ALLOW_EMBED = "TVENDOR_DATABRICKS_REPORTS_ALLOW_EMBED"
@@ -95,6 +140,8 @@ TVENDOR_CONNECTION_LAB_OVERRIDE_TTL_SEC = "TVENDOR_CONNECTION_LAB_OVERRIDE_TTL_S
 DATABRICKS_SERVER_HOSTNAME = "DATABRICKS_SERVER_HOSTNAME"
 DATABRICKS_HTTP_PATH = "DATABRICKS_HTTP_PATH"
 DATABRICKS_WAREHOUSE_ID = "DATABRICKS_WAREHOUSE_ID"
+DATABRICKS_REPORTING_HTTP_PATH = "DATABRICKS_REPORTING_HTTP_PATH"
+DATABRICKS_REPORTING_WAREHOUSE_ID = "DATABRICKS_REPORTING_WAREHOUSE_ID"
 DATABRICKS_TOKEN = "DATABRICKS_TOKEN"
 DATABRICKS_CLIENT_ID = "DATABRICKS_CLIENT_ID"
 DATABRICKS_CLIENT_SECRET = "DATABRICKS_CLIENT_SECRET"
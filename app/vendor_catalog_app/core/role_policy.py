@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from vendor_catalog_app.core.security import (
+    CHANGE_ACTION_CHOICES,
+    CHANGE_APPROVAL_LEVELS,
+    DEFAULT_APPROVAL_LEVEL,
+)
+
+# One bit per known change action, in stable (sorted) order.
+CHANGE_ACTION_BITS: dict[str, int] = {action: 1 << index for index, action in enumerate(CHANGE_ACTION_CHOICES)}
+
+
+def change_action_mask(actions: Iterable[str]) -> int:
+    mask = 0
+    for action in actions or ():
+        mask |= CHANGE_ACTION_BITS.get(str(action or "").strip().lower(), 0)
+    return mask
+
+
+@dataclass(frozen=True)
+class CompiledRolePolicy:
+    """Resolved capabilities for one role set, with change permissions as a bitset.
+
+    ``applicable_mask`` has a bit set for every known change action the role set may
+    apply (allowed and at a sufficient approval level), so permission checks are a
+    single dict lookup and bit test. ``policy`` is the plain dict form kept on
+    ``UserContext.role_policy`` and in session snapshots; it is shared and read-only.
+    """
+
+    roles: frozenset[str]
+    approval_level: int
+    allowed_mask: int
+    applicable_mask: int
+    allows_unlisted: bool
+    policy: dict[str, Any]
+
+    @classmethod
+    def from_policy(cls, policy: dict[str, Any]) -> CompiledRolePolicy:
+        try:
+            approval_level = int(policy.get("approval_level") or 0)
+        except Exception:
+            approval_level = 0
+        allowed_mask = change_action_mask(policy.get("allowed_change_actions") or ())
+        applicable_mask = 0
+        for action, bit in CHANGE_ACTION_BITS.items():
+            if allowed_mask & bit and approval_level >= int(CHANGE_APPROVAL_LEVELS[action]):
+                applicable_mask |= bit
+        return cls(
+            roles=frozenset(str(role).strip() for role in (policy.get("roles") or ()) if str(role).strip()),
+            approval_level=approval_level,
+            allowed_mask=allowed_mask,
+            applicable_mask=applicable_mask,
+            allows_unlisted=approval_level >= DEFAULT_APPROVAL_LEVEL,
+            policy=dict(policy),
+        )
+
+    def allows(self, change_type: str) -> bool:
+        bit = CHANGE_ACTION_BITS.get(str(change_type or "").strip().lower())
+        if bit is None:
+            return self.allows_unlisted
+        return bool(self.applicable_mask & bit)
+
+
+class RolePolicyTable:
+    """Process-wide compiled policies keyed by ``(frozenset(roles), policy_version)``.
+
+    Every user with the same effective roles shares one entry. Entries compiled for an
+    older policy version are dropped as soon as a newer version is compiled.
+    """
+
+    def __init__(self, *, max_entries: int = 1024) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[frozenset[str], int], CompiledRolePolicy] = {}
+        self._latest_version = 0
+        self._compiles = 0
+
+    def get(
+        self,
+        roles: Iterable[str],
+        policy_version: int,
+        resolve: Callable[[], dict[str, Any]],
+    ) -> CompiledRolePolicy:
+        key = (frozenset(str(role).strip() for role in (roles or ()) if str(role).strip()), int(policy_version))
+        compiled = self._entries.get(key)
+        if compiled is not None:
+            return compiled
+        compiled = CompiledRolePolicy.from_policy(resolve())
+        with self._lock:
+            if key[1] > self._latest_version:
+                self._latest_version = key[1]
+                self._entries = {
+                    entry_key: entry for entry_key, entry in self._entries.items() if entry_key[1] >= key[1]
+                }
+            if len(self._entries) >= self._max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = compiled
+            self._compiles += 1
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "compiles": int(self._compiles),
+                "policy_version": int(self._latest_version),
+            }
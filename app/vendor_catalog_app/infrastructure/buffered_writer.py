@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BufferedBatchWriter(Generic[T]):
+    """Bounded in-process queue drained in batches by a background flusher thread.
+
+    Items are flushed every ``flush_interval_ms`` or as soon as ``batch_size`` items are
+    queued. Once the queue passes half of ``max_queue`` new items are sampled at
+    ``backpressure_sample_rate``; a full queue drops new items. When disabled, items are
+    written synchronously one at a time.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        flush_batch: Callable[[list[T]], None],
+        enabled: bool,
+        max_queue: int,
+        batch_size: int,
+        flush_interval_ms: int,
+        backpressure_sample_rate: float = 1.0,
+    ) -> None:
+        self.name = str(name or "buffered_writer")
+        self._flush_batch = flush_batch
+        self._enabled = bool(enabled)
+        self._max_queue = max(1, int(max_queue))
+        self._batch_size = max(1, int(batch_size))
+        self._flush_interval_sec = max(0.01, float(flush_interval_ms) / 1000.0)
+        self._sample_rate = min(1.0, max(0.0, float(backpressure_sample_rate)))
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._queue: deque[T] = deque()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._submitted_total = 0
+        self._written_total = 0
+        self._dropped_total = 0
+        self._sampled_out_total = 0
+        self._failed_total = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "name": self.name,
+                "enabled": self._enabled,
+                "queued": len(self._queue),
+                "max_queue": self._max_queue,
+                "submitted_total": self._submitted_total,
+                "written_total": self._written_total,
+                "dropped_total": self._dropped_total,
+                "sampled_out_total": self._sampled_out_total,
+                "failed_total": self._failed_total,
+            }
+
+    def submit(self, item: T) -> bool:
+        """Queue one item for writing; returns ``False`` when it was dropped or sampled out."""
+        if not self._enabled or self._closed:
+            self._write([item])
+            return True
+        with self._condition:
+            self._submitted_total += 1
+            depth = len(self._queue)
+            if depth >= self._max_queue:
+                self._dropped_total += 1
+                return False
+            if depth * 2 >= self._max_queue and random.random() >= self._sample_rate:
+                self._sampled_out_total += 1
+                return False
+            self._queue.append(item)
+            self._ensure_thread_locked()
+            if len(self._queue) >= self._batch_size:
+                self._condition.notify()
+        return True
+
+    def flush(self) -> int:
+        """Synchronously write everything currently queued. Returns the number of items flushed."""
+        flushed = 0
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return flushed
+            self._write(batch)
+            flushed += len(batch)
+
+    def close(self, *, timeout_sec: float = 5.0) -> None:
+        with self._condition:
+            self._closed = True
+            thread = self._thread
+            self._condition.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=max(0.0, float(timeout_sec)))
+        self.flush()
+
+    def _ensure_thread_locked(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"tvendor-{self.name}-flusher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _take_batch(self) -> list[T]:
+        with self._condition:
+            count = min(self._batch_size, len(self._queue))
+            return [self._queue.popleft() for _ in range(count)]
+
+    def _write(self, batch: list[T]) -> None:
+        with self._flush_lock:
+            try:
+                self._flush_batch(batch)
+            except Exception:
+                with self._condition:
+                    self._failed_total += len(batch)
+                LOGGER.warning(
+                    "Buffered writer '%s' failed to flush %s items.",
+                    self.name,
+                    len(batch),
+                    exc_info=True,
+                    extra={"event": "buffered_writer_flush_failed", "writer": self.name, "items": len(batch)},
+                )
+                return
+        with self._condition:
+            self._written_total += len(batch)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._closed and len(self._queue) < self._batch_size:
+                    deadline = time.monotonic() + self._flush_interval_sec
+                    while not self._closed and len(self._queue) < self._batch_size:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(timeout=remaining)
+                if self._closed:
+                    return
+            self.flush()
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import contextvars
+import functools
 import hashlib
 import logging
+import random
 import re
 import sqlite3
 import threading
 import time
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
@@ -15,6 +17,7 @@ from typing import Any
 
 import pandas as pd
 from databricks import sql as dbsql
+from databricks.sql import exc as dbsql_exc
 
 try:
     from databricks.sdk.core import Config as DatabricksSDKConfig
@@ -29,6 +32,10 @@ from vendor_catalog_app.core.env import (
     TVENDOR_DB_POOL_ENABLED,
     TVENDOR_DB_POOL_IDLE_TTL_SEC,
     TVENDOR_DB_POOL_MAX_SIZE,
+    TVENDOR_DB_POOL_REPORTING_MAX_SIZE,
+    TVENDOR_DB_READ_RETRY_BASE_DELAY_MS,
+    TVENDOR_DB_READ_RETRY_MAX_ATTEMPTS,
+    TVENDOR_DB_READ_RETRY_MAX_DELAY_MS,
     TVENDOR_QUERY_CACHE_ENABLED,
     TVENDOR_QUERY_CACHE_MAX_ENTRIES,
     TVENDOR_QUERY_CACHE_TTL_SEC,
@@ -42,10 +49,23 @@ from vendor_catalog_app.core.env import (
 from vendor_catalog_app.infrastructure.cache import LruTtlCache
 
 PERF_LOGGER = logging.getLogger("vendor_catalog_app.perf")
+# Parallel loads share one request perf context across threads.
+_REQUEST_PERF_LOCK = threading.Lock()
 _REQUEST_PERF_CONTEXT: contextvars.ContextVar[dict[str, Any] | None] = contextvars.ContextVar(
     "tvendor_request_perf",
     default=None,
 )
+# Driver errors meaning the session or transport is gone rather than the statement failing:
+# transport/session failures (RequestError), use of a closed connection or cursor
+# (InterfaceError) and socket-level resets. Statement timeouts and SQL errors surface as
+# other DatabaseError subclasses and are never treated as connection failures.
+_CONNECTION_ERROR_TYPES: tuple[type[BaseException], ...] = (
+    dbsql_exc.RequestError,
+    dbsql_exc.InterfaceError,
+    ConnectionError,
+)
+# The connector already spent its own retry budget on these; another attempt only adds latency.
+_NON_RETRYABLE_CONNECTION_ERROR_TYPES: tuple[type[BaseException], ...] = (dbsql_exc.MaxRetryDurationError,)
 
 
 def start_request_perf_context(
@@ -66,7 +86,12 @@ def start_request_perf_context(
             "db_max_ms": 0.0,
             "db_cache_hits": 0,
             "db_errors": 0,
+            "db_retries": 0,
             "slow_queries": [],
+            "query_fingerprints": {},
+            "phase_ms": {},
+            "memo": {},
+            "memo_hits": 0,
         }
     )
 
@@ -79,6 +104,152 @@ def clear_request_perf_context(token: contextvars.Token) -> None:
     _REQUEST_PERF_CONTEXT.reset(token)
 
 
+def fork_request_perf_context() -> dict[str, Any] | None:
+    """Empty perf context for work that may outlive the current request.
+
+    The fork starts with zeroed counters and a snapshot of the request memo. Bind it in
+    the worker with ``bind_request_perf_context`` and fold it back with
+    ``merge_request_perf_context`` only if the result is used, so abandoned work never
+    writes to a context the request has already logged.
+    """
+    request_ctx = get_request_perf_context()
+    if request_ctx is None:
+        return None
+    return {
+        "request_id": request_ctx.get("request_id"),
+        "method": request_ctx.get("method"),
+        "path": request_ctx.get("path"),
+        "slow_query_ms": request_ctx.get("slow_query_ms"),
+        "db_calls": 0,
+        "db_total_ms": 0.0,
+        "db_max_ms": 0.0,
+        "db_cache_hits": 0,
+        "db_errors": 0,
+        "db_retries": 0,
+        "slow_queries": [],
+        "query_fingerprints": {},
+        "phase_ms": {},
+        "memo": dict(request_ctx.get("memo") or {}),
+        "memo_hits": 0,
+    }
+
+
+def bind_request_perf_context(request_ctx: dict[str, Any] | None) -> contextvars.Token:
+    return _REQUEST_PERF_CONTEXT.set(request_ctx)
+
+
+def merge_request_perf_context(forked: dict[str, Any] | None) -> None:
+    """Add the counters of a ``fork_request_perf_context`` fork to the current request."""
+    request_ctx = get_request_perf_context()
+    if request_ctx is None or not forked:
+        return
+    with _REQUEST_PERF_LOCK:
+        for key in ("db_calls", "db_cache_hits", "db_errors", "db_retries", "memo_hits"):
+            request_ctx[key] = int(request_ctx.get(key, 0)) + int(forked.get(key, 0))
+        request_ctx["db_total_ms"] = float(request_ctx.get("db_total_ms", 0.0)) + float(forked.get("db_total_ms", 0.0))
+        request_ctx["db_max_ms"] = max(float(request_ctx.get("db_max_ms", 0.0)), float(forked.get("db_max_ms", 0.0)))
+        slow_queries = request_ctx.setdefault("slow_queries", [])
+        slow_queries.extend(list(forked.get("slow_queries") or [])[: max(0, 10 - len(slow_queries))])
+        fingerprints = request_ctx.setdefault("query_fingerprints", {})
+        for sql_hash, fingerprint in dict(forked.get("query_fingerprints") or {}).items():
+            existing = fingerprints.get(sql_hash)
+            if existing is not None:
+                existing["count"] = int(existing.get("count", 0)) + int(fingerprint.get("count", 0))
+            elif len(fingerprints) < 256:
+                fingerprints[sql_hash] = dict(fingerprint)
+        phases = request_ctx.setdefault("phase_ms", {})
+        for phase, elapsed_ms in dict(forked.get("phase_ms") or {}).items():
+            phases[phase] = float(phases.get(phase, 0.0)) + float(elapsed_ms)
+        request_ctx.setdefault("load_graphs", []).extend(list(forked.get("load_graphs") or []))
+
+
+def record_request_phase_ms(phase: str, elapsed_ms: float) -> None:
+    request_ctx = get_request_perf_context()
+    if request_ctx is None:
+        return
+    with _REQUEST_PERF_LOCK:
+        phases = request_ctx.setdefault("phase_ms", {})
+        phases[phase] = float(phases.get(phase, 0.0)) + max(0.0, float(elapsed_ms))
+
+
+def request_memo_lookup(key: Any) -> tuple[bool, Any]:
+    """Return ``(found, value)`` for ``key`` in the current request's read memo."""
+    request_ctx = get_request_perf_context()
+    if request_ctx is None:
+        return False, None
+    memo = request_ctx.get("memo")
+    if not isinstance(memo, dict) or key not in memo:
+        return False, None
+    with _REQUEST_PERF_LOCK:
+        request_ctx["memo_hits"] = int(request_ctx.get("memo_hits", 0)) + 1
+    return True, memo[key]
+
+
+def request_memo_store(key: Any, value: Any) -> None:
+    request_ctx = get_request_perf_context()
+    if request_ctx is None:
+        return
+    request_ctx.setdefault("memo", {})[key] = value
+
+
+def clear_request_memo() -> None:
+    request_ctx = get_request_perf_context()
+    if request_ctx is None:
+        return
+    memo = request_ctx.get("memo")
+    if isinstance(memo, dict):
+        memo.clear()
+
+
+@contextmanager
+def request_phase_timer(phase: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_request_phase_ms(phase, (time.perf_counter() - started) * 1000.0)
+
+
+WORKLOAD_INTERACTIVE = "interactive"
+WORKLOAD_REPORTING = "reporting"
+WORKLOAD_CLASSES: tuple[str, ...] = (WORKLOAD_INTERACTIVE, WORKLOAD_REPORTING)
+_WORKLOAD_CLASS: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "tvendor_workload_class",
+    default=WORKLOAD_INTERACTIVE,
+)
+
+
+def current_workload_class() -> str:
+    return _WORKLOAD_CLASS.get()
+
+
+@contextmanager
+def workload_scope(workload_class: str):
+    """Route DB calls made inside the block to the pool for ``workload_class``."""
+    cleaned = str(workload_class or "").strip().lower()
+    if cleaned not in WORKLOAD_CLASSES:
+        raise ValueError(f"Unknown workload class: {workload_class!r}")
+    token = _WORKLOAD_CLASS.set(cleaned)
+    try:
+        yield cleaned
+    finally:
+        _WORKLOAD_CLASS.reset(token)
+
+
+def workload(workload_class: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Declare the workload class used by every DB call a repository method makes."""
+
+    def _decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def _wrapper(*args: Any, **kwargs: Any) -> Any:
+            with workload_scope(workload_class):
+                return func(*args, **kwargs)
+
+        return _wrapper
+
+    return _decorate
+
+
 class DataConnectionError(RuntimeError):
     """Raised when a database connection cannot be established."""
 
@@ -91,6 +262,29 @@ class DataExecutionError(RuntimeError):
     """Raised when a non-query execution fails."""
 
 
+class _WorkloadPool:
+    """Connection pool state for one workload class."""
+
+    def __init__(self, *, name: str, max_size: int, http_path: str = "") -> None:
+        self.name = name
+        self.max_size = max(1, int(max_size))
+        self.http_path = str(http_path or "").strip()
+        self.condition = threading.Condition()
+        self.available: list[tuple[float, Any]] = []
+        self.total_connections = 0
+        self.closed = False
+
+    def snapshot(self) -> dict[str, Any]:
+        with self.condition:
+            return {
+                "workload": self.name,
+                "max_size": int(self.max_size),
+                "open_connections": int(self.total_connections),
+                "idle_connections": len(self.available),
+                "dedicated_warehouse": bool(self.http_path),
+            }
+
+
 class DatabricksSQLClient:
     def __init__(self, config: AppConfig) -> None:
         self.config = config
@@ -120,14 +314,40 @@ class DatabricksSQLClient:
             default=600.0,
             min_value=0.0,
         )
-        self._pool_condition = threading.Condition()
-        self._pool_available: list[tuple[float, Any]] = []
-        self._pool_total_connections = 0
-        self._pool_closed = False
+        reporting_http_path = str(getattr(self.config, "databricks_reporting_http_path", "") or "").strip()
+        if reporting_http_path == str(self.config.databricks_http_path or "").strip():
+            reporting_http_path = ""
+        self._pools: dict[str, _WorkloadPool] = {
+            WORKLOAD_INTERACTIVE: _WorkloadPool(
+                name=WORKLOAD_INTERACTIVE,
+                max_size=self._pool_max_size,
+            ),
+            WORKLOAD_REPORTING: _WorkloadPool(
+                name=WORKLOAD_REPORTING,
+                max_size=get_env_int(TVENDOR_DB_POOL_REPORTING_MAX_SIZE, default=2, min_value=1),
+                http_path=reporting_http_path,
+            ),
+        }
 
         self._sql_trace_enabled = get_env_bool(TVENDOR_SQL_TRACE_ENABLED, default=False)
         self._sql_trace_max_len = get_env_int(TVENDOR_SQL_TRACE_MAX_LEN, default=180, min_value=80)
         self._slow_query_ms = get_env_float(TVENDOR_SLOW_QUERY_MS, default=750.0, min_value=1.0)
+        self._read_retry_max_attempts = get_env_int(
+            TVENDOR_DB_READ_RETRY_MAX_ATTEMPTS,
+            default=2,
+            min_value=0,
+            max_value=5,
+        )
+        self._read_retry_base_delay_ms = get_env_float(
+            TVENDOR_DB_READ_RETRY_BASE_DELAY_MS,
+            default=100.0,
+            min_value=0.0,
+        )
+        self._read_retry_max_delay_ms = get_env_float(
+            TVENDOR_DB_READ_RETRY_MAX_DELAY_MS,
+            default=1000.0,
+            min_value=0.0,
+        )
 
     def _validate(self) -> None:
         if self.config.use_local_db:
@@ -147,10 +367,10 @@ class DatabricksSQLClient:
         if missing:
             raise RuntimeError(f"Missing Databricks settings: {', '.join(missing)}")
 
-    def _connect_databricks(self):
+    def _connect_databricks(self, http_path: str = ""):
         common = {
             "server_hostname": self.config.databricks_server_hostname,
-            "http_path": self.config.databricks_http_path,
+            "http_path": str(http_path or "").strip() or self.config.databricks_http_path,
         }
         token = str(self.config.databricks_token or "").strip()
         if token:
@@ -208,62 +428,77 @@ class DatabricksSQLClient:
 
     @staticmethod
     def _is_connection_error(exc: BaseException) -> bool:
-        message = str(exc).lower()
-        signals = (
-            "connection",
-            "session",
-            "closed",
-            "timeout",
-            "unreachable",
-            "transport",
-            "network",
-            "socket",
-            "cannot open",
-            "failed to connect",
-        )
-        return any(token in message for token in signals)
+        seen: set[int] = set()
+        current: BaseException | None = exc
+        while current is not None and id(current) not in seen:
+            if isinstance(current, _NON_RETRYABLE_CONNECTION_ERROR_TYPES):
+                return False
+            if isinstance(current, _CONNECTION_ERROR_TYPES):
+                return True
+            seen.add(id(current))
+            current = current.__cause__
+        return False
+
+    def _pool_for_workload(self, workload_class: str | None = None) -> _WorkloadPool:
+        name = workload_class or current_workload_class()
+        return self._pools.get(name) or self._pools[WORKLOAD_INTERACTIVE]
+
+    def _open_workload_connection(self, pool: _WorkloadPool) -> Any:
+        if pool.http_path:
+            return self._connect_databricks(pool.http_path)
+        return self._connect_databricks()
+
+    def pool_snapshot(self) -> list[dict[str, Any]]:
+        if not self._pool_enabled:
+            return []
+        return [pool.snapshot() for pool in self._pools.values()]
 
-    def _collect_expired_pool_connections_locked(self, now: float) -> list[Any]:
+    def _collect_expired_pool_connections_locked(self, pool: _WorkloadPool, now: float) -> list[Any]:
         if self._pool_idle_ttl_sec <= 0:
             return []
         stale: list[Any] = []
         active: list[tuple[float, Any]] = []
-        for released_at, conn in self._pool_available:
+        for released_at, conn in pool.available:
             if (now - float(released_at)) >= float(self._pool_idle_ttl_sec):
                 stale.append(conn)
             else:
                 active.append((released_at, conn))
         if stale:
-            self._pool_available = active
-            self._pool_total_connections = max(0, self._pool_total_connections - len(stale))
+            pool.available = active
+            pool.total_connections = max(0, pool.total_connections - len(stale))
         return stale
 
-    def _acquire_pooled_connection(self) -> Any:
+    def _acquire_pooled_connection(self, pool: _WorkloadPool, *, fresh: bool = False) -> Any:
+        """Check out a pooled connection; ``fresh`` replaces any idle one with a new connection."""
         deadline = time.monotonic() + float(self._pool_acquire_timeout_sec)
         while True:
             stale_to_close: list[Any] = []
             candidate_conn = None
             should_create = False
-            with self._pool_condition:
-                if self._pool_closed:
+            with pool.condition:
+                if pool.closed:
                     raise DataConnectionError("Databricks SQL client pool is closed.")
                 now = time.monotonic()
-                stale_to_close = self._collect_expired_pool_connections_locked(now)
-                if self._pool_available:
-                    _, candidate_conn = self._pool_available.pop()
-                if candidate_conn is None and self._pool_total_connections < self._pool_max_size:
-                    self._pool_total_connections += 1
+                stale_to_close = self._collect_expired_pool_connections_locked(pool, now)
+                if pool.available and fresh:
+                    # Take over the idle connection's slot instead of reusing it.
+                    _, replaced_conn = pool.available.pop()
+                    stale_to_close.append(replaced_conn)
+                    pool.total_connections = max(0, pool.total_connections - 1)
+                elif pool.available:
+                    _, candidate_conn = pool.available.pop()
+                if candidate_conn is None and pool.total_connections < pool.max_size:
+                    pool.total_connections += 1
                     should_create = True
                 elif candidate_conn is None:
                     remaining = deadline - now
                     if remaining <= 0:
                         raise DataConnectionError(
-
-                                "Timed out waiting for Databricks SQL connection from pool. "
-                                f"max_size={self._pool_max_size}, timeout_sec={self._pool_acquire_timeout_sec:.1f}"
-
+                            "Timed out waiting for Databricks SQL connection from pool. "
+                            f"workload={pool.name}, max_size={pool.max_size}, "
+                            f"timeout_sec={self._pool_acquire_timeout_sec:.1f}"
                         )
-                    self._pool_condition.wait(timeout=remaining)
+                    pool.condition.wait(timeout=remaining)
 
             for conn in stale_to_close:
                 self._close_connection(conn)
@@ -276,47 +511,55 @@ class DatabricksSQLClient:
 
             self._validate()
             try:
-                return self._connect_databricks()
+                return self._open_workload_connection(pool)
             except Exception as exc:
-                with self._pool_condition:
-                    self._pool_total_connections = max(0, self._pool_total_connections - 1)
-                    self._pool_condition.notify()
+                with pool.condition:
+                    pool.total_connections = max(0, pool.total_connections - 1)
+                    pool.condition.notify()
                 details = str(exc).strip()
                 message = "Failed to connect to Databricks SQL warehouse."
                 if details:
                     message = f"{message} Details: {details}"
                 raise DataConnectionError(message) from exc
 
-    def _release_pooled_connection(self, conn: Any, *, broken: bool) -> None:
-        close_connection = False
-        with self._pool_condition:
-            if broken or self._pool_closed:
-                self._pool_total_connections = max(0, self._pool_total_connections - 1)
-                self._pool_condition.notify()
-                close_connection = True
+    def _release_pooled_connection(self, pool: _WorkloadPool, conn: Any, *, broken: bool) -> None:
+        to_close: list[Any] = []
+        with pool.condition:
+            if broken or pool.closed:
+                to_close.append(conn)
+                if broken and pool.available:
+                    # Idle connections usually die for the same reason (warehouse restart,
+                    # idle timeout), so drop them rather than hand them to the retry.
+                    to_close.extend(idle_conn for _, idle_conn in pool.available)
+                    pool.available.clear()
+                pool.total_connections = max(0, pool.total_connections - len(to_close))
+                pool.condition.notify_all()
             else:
-                self._pool_available.append((time.monotonic(), conn))
-                self._pool_condition.notify()
-        if close_connection:
-            self._close_connection(conn)
+                pool.available.append((time.monotonic(), conn))
+                pool.condition.notify()
+        for stale_conn in to_close:
+            self._close_connection(stale_conn)
 
     def close(self) -> None:
         if not self._pool_enabled:
             return
         to_close: list[Any] = []
-        with self._pool_condition:
-            self._pool_closed = True
-            if self._pool_available:
-                to_close = [conn for _, conn in self._pool_available]
-                self._pool_available.clear()
-                self._pool_total_connections = max(0, self._pool_total_connections - len(to_close))
-            self._pool_condition.notify_all()
+        for pool in self._pools.values():
+            with pool.condition:
+                pool.closed = True
+                if pool.available:
+                    pool_conns = [conn for _, conn in pool.available]
+                    pool.available.clear()
+                    pool.total_connections = max(0, pool.total_connections - len(pool_conns))
+                    to_close.extend(pool_conns)
+                pool.condition.notify_all()
         for conn in to_close:
             self._close_connection(conn)
 
     @contextmanager
-    def _connection(self):
+    def _connection(self, *, fresh: bool = False):
         conn = None
+        pool: _WorkloadPool | None = None
         close_after_use = False
         release_to_pool = False
         pooled_connection_broken = False
@@ -332,13 +575,14 @@ class DatabricksSQLClient:
                 raise DataConnectionError(f"Failed to connect to local SQLite DB at {db_path}.") from exc
             close_after_use = True
         else:
+            pool = self._pool_for_workload()
             if self._pool_enabled:
-                conn = self._acquire_pooled_connection()
+                conn = self._acquire_pooled_connection(pool, fresh=fresh)
                 release_to_pool = True
             else:
                 self._validate()
                 try:
-                    conn = self._connect_databricks()
+                    conn = self._open_workload_connection(pool)
                 except Exception as exc:
                     details = str(exc).strip()
                     message = "Failed to connect to Databricks SQL warehouse."
@@ -353,8 +597,8 @@ class DatabricksSQLClient:
                 pooled_connection_broken = True
             raise
         finally:
-            if release_to_pool and conn is not None:
-                self._release_pooled_connection(conn, broken=pooled_connection_broken)
+            if release_to_pool and pool is not None and conn is not None:
+                self._release_pooled_connection(pool, conn, broken=pooled_connection_broken)
             elif close_after_use and conn is not None:
                 self._close_connection(conn)
 
@@ -455,32 +699,44 @@ class DatabricksSQLClient:
         statement_text = str(statement or "")
         sql_hash = hashlib.sha1(statement_text.encode("utf-8", errors="ignore")).hexdigest()[:12]
         preview = self._sql_preview(statement_text, max_len=self._sql_trace_max_len)
+        workload_class = current_workload_class()
 
         request_ctx = get_request_perf_context()
         if request_ctx is not None:
-            request_ctx["db_calls"] = int(request_ctx.get("db_calls", 0)) + 1
-            request_ctx["db_total_ms"] = float(request_ctx.get("db_total_ms", 0.0)) + float(elapsed_ms)
-            request_ctx["db_max_ms"] = max(float(request_ctx.get("db_max_ms", 0.0)), float(elapsed_ms))
-            if cached:
-                request_ctx["db_cache_hits"] = int(request_ctx.get("db_cache_hits", 0)) + 1
-            if error:
-                request_ctx["db_errors"] = int(request_ctx.get("db_errors", 0)) + 1
-
-            slow_threshold = float(request_ctx.get("slow_query_ms", self._slow_query_ms))
-            if elapsed_ms >= slow_threshold:
-                slow_queries = request_ctx.setdefault("slow_queries", [])
-                if len(slow_queries) < 10:
-                    slow_queries.append(
-                        {
-                            "operation": operation,
-                            "elapsed_ms": round(float(elapsed_ms), 2),
-                            "cached": bool(cached),
-                            "rows": int(row_count) if row_count is not None else None,
-                            "sql_hash": sql_hash,
-                            "sql": preview,
-                            "error": bool(error),
-                        }
-                    )
+            with _REQUEST_PERF_LOCK:
+                request_ctx["db_calls"] = int(request_ctx.get("db_calls", 0)) + 1
+                request_ctx["db_total_ms"] = float(request_ctx.get("db_total_ms", 0.0)) + float(elapsed_ms)
+                request_ctx["db_max_ms"] = max(float(request_ctx.get("db_max_ms", 0.0)), float(elapsed_ms))
+                if cached:
+                    request_ctx["db_cache_hits"] = int(request_ctx.get("db_cache_hits", 0)) + 1
+                if error:
+                    request_ctx["db_errors"] = int(request_ctx.get("db_errors", 0)) + 1
+
+                # Same statement text with different params shares a fingerprint, so
+                # per-row lookups in a loop show up as one high-count entry.
+                fingerprints = request_ctx.setdefault("query_fingerprints", {})
+                fingerprint = fingerprints.get(sql_hash)
+                if fingerprint is not None:
+                    fingerprint["count"] = int(fingerprint.get("count", 0)) + 1
+                elif len(fingerprints) < 256:
+                    fingerprints[sql_hash] = {"count": 1, "operation": operation, "sql": preview}
+
+                slow_threshold = float(request_ctx.get("slow_query_ms", self._slow_query_ms))
+                if elapsed_ms >= slow_threshold:
+                    slow_queries = request_ctx.setdefault("slow_queries", [])
+                    if len(slow_queries) < 10:
+                        slow_queries.append(
+                            {
+                                "operation": operation,
+                                "elapsed_ms": round(float(elapsed_ms), 2),
+                                "cached": bool(cached),
+                                "rows": int(row_count) if row_count is not None else None,
+                                "sql_hash": sql_hash,
+                                "sql": preview,
+                                "error": bool(error),
+                                "workload": workload_class,
+                            }
+                        )
 
         should_log = self._sql_trace_enabled or elapsed_ms >= self._slow_query_ms or error
         if not should_log:
@@ -488,8 +744,9 @@ class DatabricksSQLClient:
 
         log_fn = PERF_LOGGER.warning if (elapsed_ms >= self._slow_query_ms or error) else PERF_LOGGER.info
         log_fn(
-            "sql_perf op=%s ms=%.2f cached=%s rows=%s error=%s hash=%s sql=%s",
+            "sql_perf op=%s workload=%s ms=%.2f cached=%s rows=%s error=%s hash=%s sql=%s",
             operation,
+            workload_class,
             float(elapsed_ms),
             str(bool(cached)).lower(),
             "-" if row_count is None else int(row_count),
@@ -499,6 +756,7 @@ class DatabricksSQLClient:
             extra={
                 "event": "sql_perf",
                 "operation": operation,
+                "workload": workload_class,
                 "elapsed_ms": round(float(elapsed_ms), 2),
                 "cached": bool(cached),
                 "rows": None if row_count is None else int(row_count),
@@ -555,7 +813,59 @@ class DatabricksSQLClient:
                 f"Write SQL verb '{verb}' is not allowed in prod. Allowed verbs: {allowed_text}."
             )
 
-    def query(self, statement: str, params: Iterable[Any] | None = None) -> pd.DataFrame:
+    def _fetch_frame(
+        self,
+        prepared_statement: str,
+        prepared_params: tuple[Any, ...],
+        *,
+        fresh_connection: bool = False,
+    ) -> pd.DataFrame:
+        with self._connection(fresh=fresh_connection) as conn:
+            if self.config.use_local_db:
+                cursor = conn.cursor()
+                cursor.execute(prepared_statement, prepared_params)
+                rows = cursor.fetchall()
+                cols = [desc[0] for desc in cursor.description] if cursor.description else []
+                cursor.close()
+                return pd.DataFrame(rows, columns=cols)
+            with conn.cursor() as cursor:
+                cursor.execute(prepared_statement, prepared_params)
+                rows = cursor.fetchall()
+                cols = [desc[0] for desc in cursor.description] if cursor.description else []
+                return pd.DataFrame(rows, columns=cols)
+
+    def _read_retry_delay_sec(self, attempt: int) -> float:
+        # Full jitter: uniform over [0, min(cap, base * 2^(attempt-1))].
+        ceiling_ms = min(
+            float(self._read_retry_max_delay_ms),
+            float(self._read_retry_base_delay_ms) * (2 ** max(0, int(attempt) - 1)),
+        )
+        return random.uniform(0.0, max(0.0, ceiling_ms)) / 1000.0
+
+    def _record_read_retry(self, *, statement: str, attempt: int, exc: BaseException) -> None:
+        request_ctx = get_request_perf_context()
+        if request_ctx is not None:
+            with _REQUEST_PERF_LOCK:
+                request_ctx["db_retries"] = int(request_ctx.get("db_retries", 0)) + 1
+        sql_hash = hashlib.sha1(str(statement or "").encode("utf-8", errors="ignore")).hexdigest()[:12]
+        PERF_LOGGER.warning(
+            "sql_retry attempt=%s max_attempts=%s workload=%s hash=%s error=%s",
+            int(attempt),
+            int(self._read_retry_max_attempts),
+            current_workload_class(),
+            sql_hash,
+            type(exc).__name__,
+            extra={
+                "event": "sql_retry",
+                "attempt": int(attempt),
+                "max_attempts": int(self._read_retry_max_attempts),
+                "workload": current_workload_class(),
+                "sql_hash": sql_hash,
+                "error_type": type(exc).__name__,
+            },
+        )
+
+    def query(self, statement: str, params: Iterable[Any] | None = None, *, use_cache: bool = True) -> pd.DataFrame:
         prepared_statement = ""
         try:
             prepared_statement = self._prepare(statement)
@@ -563,7 +873,8 @@ class DatabricksSQLClient:
             self._enforce_prod_sql_policy(prepared_statement, is_query=True)
 
             leading = self._leading_sql_keyword(prepared_statement)
-            use_cache = leading in {"SELECT", "WITH"}
+            is_read = leading in {"SELECT", "WITH"}
+            use_cache = is_read and use_cache
             cache_key = self._cache_key(prepared_statement, prepared_params)
             if use_cache:
                 cache_started = time.perf_counter()
@@ -578,40 +889,44 @@ class DatabricksSQLClient:
                     )
                     return cached
 
-            query_started = time.perf_counter()
-            with self._connection() as conn:
-                if self.config.use_local_db:
-                    cursor = conn.cursor()
-                    cursor.execute(prepared_statement, prepared_params)
-                    rows = cursor.fetchall()
-                    cols = [desc[0] for desc in cursor.description] if cursor.description else []
-                    cursor.close()
-                    frame = pd.DataFrame(rows, columns=cols)
-                    if use_cache:
-                        self._cache_put(cache_key, frame)
-                    self._record_query_perf(
-                        operation="query",
-                        statement=prepared_statement,
-                        elapsed_ms=(time.perf_counter() - query_started) * 1000.0,
-                        cached=False,
-                        row_count=len(frame.index),
+            retry_attempt = 0
+            while True:
+                query_started = time.perf_counter()
+                try:
+                    # Retries always open a new connection rather than reuse an idle pooled one.
+                    frame = self._fetch_frame(
+                        prepared_statement,
+                        prepared_params,
+                        fresh_connection=retry_attempt > 0,
                     )
-                    return frame
-                with conn.cursor() as cursor:
-                    cursor.execute(prepared_statement, prepared_params)
-                    rows = cursor.fetchall()
-                    cols = [desc[0] for desc in cursor.description] if cursor.description else []
-                    frame = pd.DataFrame(rows, columns=cols)
-                    if use_cache:
-                        self._cache_put(cache_key, frame)
-                    self._record_query_perf(
-                        operation="query",
+                    break
+                except DataConnectionError:
+                    raise
+                except Exception as exc:
+                    if not (
+                        is_read
+                        and retry_attempt < self._read_retry_max_attempts
+                        and self._is_connection_error(exc)
+                    ):
+                        raise
+                    retry_attempt += 1
+                    self._record_read_retry(
                         statement=prepared_statement,
-                        elapsed_ms=(time.perf_counter() - query_started) * 1000.0,
-                        cached=False,
-                        row_count=len(frame.index),
+                        attempt=retry_attempt,
+                        exc=exc,
                     )
-                    return frame
+                    time.sleep(self._read_retry_delay_sec(retry_attempt))
+
+            if use_cache:
+                self._cache_put(cache_key, frame)
+            self._record_query_perf(
+                operation="query",
+                statement=prepared_statement,
+                elapsed_ms=(time.perf_counter() - query_started) * 1000.0,
+                cached=False,
+                row_count=len(frame.index),
+            )
+            return frame
         except DataConnectionError:
             if prepared_statement:
                 self._record_query_perf(
@@ -635,7 +950,13 @@ class DatabricksSQLClient:
                 )
             raise DataQueryError("Query execution failed.") from exc
 
-    def execute(self, statement: str, params: Iterable[Any] | None = None) -> None:
+    def execute(
+        self,
+        statement: str,
+        params: Iterable[Any] | None = None,
+        *,
+        invalidate_cache: bool = True,
+    ) -> None:
         prepared_statement = ""
         try:
             prepared_statement = self._prepare(statement)
@@ -648,7 +969,9 @@ class DatabricksSQLClient:
                     cursor.execute(prepared_statement, prepared_params)
                     cursor.close()
                     conn.commit()
-                    self._cache_clear()
+                    if invalidate_cache:
+                        self._cache_clear()
+                        clear_request_memo()
                     self._record_query_perf(
                         operation="execute",
                         statement=prepared_statement,
@@ -659,7 +982,9 @@ class DatabricksSQLClient:
                     return
                 with conn.cursor() as cursor:
                     cursor.execute(prepared_statement, prepared_params)
-                self._cache_clear()
+                if invalidate_cache:
+                    self._cache_clear()
+                    clear_request_memo()
                 self._record_query_perf(
                     operation="execute",
                     statement=prepared_statement,
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+
+_NAME_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Legal-form and filler words that say nothing about which organization a name means.
+NAME_STOP_TOKENS = frozenset(
+    {
+        "ag",
+        "and",
+        "co",
+        "company",
+        "corp",
+        "corporation",
+        "gmbh",
+        "inc",
+        "incorporated",
+        "limited",
+        "llc",
+        "llp",
+        "lp",
+        "ltd",
+        "of",
+        "plc",
+        "sa",
+        "the",
+    }
+)
+
+
+def name_tokens(text: Any) -> tuple[str, ...]:
+    """Sorted distinct lowercase word tokens of ``text`` without ``NAME_STOP_TOKENS``.
+
+    A name made only of stop tokens keeps them, so "The Company" still matches itself.
+    """
+    tokens = set(_NAME_TOKEN_RE.findall(str(text or "").lower()))
+    meaningful = tokens - NAME_STOP_TOKENS
+    return tuple(sorted(meaningful or tokens))
+
+
+def normalize_name(text: Any) -> str:
+    return " ".join(name_tokens(text))
+
+
+class FuzzyNameIndex:
+    """Token-blocked fuzzy name matcher over a fixed list of rows.
+
+    Every non-empty ``name_fields`` value of a row is one entry. Entries are blocked by
+    their normalized tokens, so a query only scores entries sharing at least one token
+    with it. Scores are the mean of token Jaccard similarity and token containment (the
+    token-set ratio: 1.0 when one name's tokens are a subset of the other's), computed
+    for all candidate entries at once with numpy. A row scores as its best entry. Rows
+    are shared and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[dict[str, Any]],
+        *,
+        id_field: str,
+        name_fields: Sequence[str],
+        group_field: str | None = None,
+    ) -> None:
+        self.rows: list[dict[str, Any]] = list(rows)
+        self._by_id: dict[str, int] = {}
+        self._exact: dict[str, list[int]] = {}
+        postings: dict[str, list[int]] = {}
+        entry_rows: list[int] = []
+        entry_sizes: list[int] = []
+        for position, row in enumerate(self.rows):
+            row_id = str(row.get(id_field) or "").strip()
+            if row_id:
+                self._by_id.setdefault(row_id.lower(), position)
+            names = {str(row.get(field) or "").strip() for field in (id_field, *name_fields)}
+            for tokens in {name_tokens(name) for name in names if name}:
+                if not tokens:
+                    continue
+                self._exact.setdefault(" ".join(tokens), []).append(position)
+                entry = len(entry_rows)
+                entry_rows.append(position)
+                entry_sizes.append(len(tokens))
+                for token in tokens:
+                    postings.setdefault(token, []).append(entry)
+        self._postings = {token: np.asarray(entries, dtype=np.int32) for token, entries in postings.items()}
+        self._entry_rows = np.asarray(entry_rows, dtype=np.int32)
+        self._entry_sizes = np.asarray(entry_sizes, dtype=np.float64)
+        self._groups = (
+            np.asarray([str(row.get(group_field) or "").strip() for row in self.rows], dtype=object)
+            if group_field
+            else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def get(self, row_id: str) -> dict[str, Any] | None:
+        position = self._by_id.get(str(row_id or "").strip().lower())
+        return None if position is None else self.rows[position]
+
+    def exact(self, text: str, *, group: str | None = None) -> list[dict[str, Any]]:
+        """Rows whose id or a name normalizes to the same tokens as ``text``."""
+        positions = self._exact.get(normalize_name(text), [])
+        return [
+            self.rows[position]
+            for position in dict.fromkeys(positions)
+            if group is None or self._groups is None or self._groups[position] == group
+        ]
+
+    def match(
+        self,
+        text: str,
+        *,
+        limit: int = 10,
+        min_score: float = 0.5,
+        group: str | None = None,
+    ) -> list[tuple[dict[str, Any], float]]:
+        """Best ``limit`` rows scoring at least ``min_score``, best first; ties keep load order."""
+        tokens = name_tokens(text)
+        postings = [self._postings[token] for token in tokens if token in self._postings]
+        if not postings:
+            return []
+        entries, shared = np.unique(np.concatenate(postings), return_counts=True)
+        sizes = self._entry_sizes[entries]
+        jaccard = shared / (len(tokens) + sizes - shared)
+        containment = shared / np.minimum(len(tokens), sizes)
+        scores = (jaccard + containment) / 2.0
+        rows = self._entry_rows[entries]
+        keep = scores >= float(min_score)
+        if group is not None and self._groups is not None:
+            keep &= self._groups[rows] == group
+        rows, scores = rows[keep], scores[keep]
+        # Best score first, then load order; the first occurrence of a row is its best entry.
+        order = np.lexsort((rows, -scores))
+        results: list[tuple[dict[str, Any], float]] = []
+        seen: set[int] = set()
+        for index in order:
+            position = int(rows[index])
+            if position in seen:
+                continue
+            seen.add(position)
+            results.append((self.rows[position], round(float(scores[index]), 4)))
+            if len(results) >= limit:
+                break
+        return results
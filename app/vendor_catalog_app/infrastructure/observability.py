@@ -60,6 +60,18 @@ DB_DURATION_BUCKETS_MS: tuple[float, ...] = (
     1000.0,
     2500.0,
 )
+WORKER_QUEUE_WAIT_BUCKETS_MS: tuple[float, ...] = (
+    1.0,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    5000.0,
+)
 ALERT_REQUEST_P95_MS = "request_p95_ms"
 ALERT_ERROR_RATE_PCT = "error_rate_pct"
 ALERT_DB_AVG_MS = "db_avg_ms"
@@ -167,7 +179,16 @@ class ObservabilityManager:
         self._db_calls_total: dict[tuple[str, str], int] = {}
         self._db_cache_hits_total: dict[tuple[str, str], int] = {}
         self._db_errors_total: dict[tuple[str, str], int] = {}
+        self._db_retries_total: dict[tuple[str, str], int] = {}
         self._db_duration: dict[tuple[str, str], _HistogramState] = {}
+        self._worker_queue_wait = _HistogramState(buckets=[0 for _ in WORKER_QUEUE_WAIT_BUCKETS_MS])
+        self._worker_rejected_total = 0
+        self._worker_gauges: dict[str, int] = {
+            "active": 0,
+            "queued": 0,
+            "limit": 0,
+            "threads_busy": 0,
+        }
 
         self._alert_breaches_total: dict[str, int] = dict.fromkeys(_ALERT_NAMES, 0)
         self._alert_active: dict[str, int] = dict.fromkeys(_ALERT_NAMES, 0)
@@ -257,6 +278,7 @@ class ObservabilityManager:
         db_total_ms: float,
         db_cache_hits: int,
         db_errors: int,
+        db_retries: int = 0,
     ) -> None:
         method_label = self._clean_label(str(method or "").upper(), default="UNKNOWN", max_len=16)
         path_label = self._clean_label(path, default="/", max_len=160)
@@ -266,6 +288,7 @@ class ObservabilityManager:
         db_total_value = max(0.0, float(db_total_ms))
         db_cache_hits_value = max(0, int(db_cache_hits))
         db_errors_value = max(0, int(db_errors))
+        db_retries_value = max(0, int(db_retries))
         is_error = int(status_code) >= 500
         now = time.monotonic()
 
@@ -310,6 +333,12 @@ class ObservabilityManager:
                             (method_label, path_label),
                             amount=db_errors_value,
                         )
+                    if db_retries_value > 0:
+                        self._counter_inc(
+                            self._db_retries_total,
+                            (method_label, path_label),
+                            amount=db_retries_value,
+                        )
 
                 if self.alerts_enabled:
                     self._window.append(
@@ -337,6 +366,45 @@ class ObservabilityManager:
                 self._statsd.counter("db.cache_hits_total", db_cache_hits_value)
             if db_errors_value > 0:
                 self._statsd.counter("db.errors_total", db_errors_value)
+            if db_retries_value > 0:
+                self._statsd.counter("db.retries_total", db_retries_value)
+
+    def record_worker_admission(
+        self,
+        *,
+        queue_wait_ms: float | None,
+        active: int,
+        queued: int,
+        limit: int,
+        threads_busy: int,
+    ) -> None:
+        """Record one admission decision; ``queue_wait_ms=None`` means the request was rejected."""
+        if not self.metrics_enabled:
+            return
+        with self._lock:
+            if queue_wait_ms is None:
+                self._worker_rejected_total += 1
+            else:
+                wait_value = max(0.0, float(queue_wait_ms))
+                state = self._worker_queue_wait
+                state.count += 1
+                state.sum_value += wait_value
+                for idx, upper in enumerate(WORKER_QUEUE_WAIT_BUCKETS_MS):
+                    if wait_value <= upper:
+                        state.buckets[idx] += 1
+                        break
+            self._worker_gauges = {
+                "active": max(0, int(active)),
+                "queued": max(0, int(queued)),
+                "limit": max(0, int(limit)),
+                "threads_busy": max(0, int(threads_busy)),
+            }
+
+        if self._statsd.enabled:
+            if queue_wait_ms is None:
+                self._statsd.counter("worker.admission_rejected_total", 1)
+            else:
+                self._statsd.timing_ms("worker.queue_wait_ms", max(0.0, float(queue_wait_ms)))
 
     def _prune_window_locked(self, now: float) -> None:
         cutoff = now - float(self.alert_window_sec)
@@ -459,12 +527,20 @@ class ObservabilityManager:
             db_calls_total = dict(self._db_calls_total)
             db_cache_hits_total = dict(self._db_cache_hits_total)
             db_errors_total = dict(self._db_errors_total)
+            db_retries_total = dict(self._db_retries_total)
             db_duration = {
                 key: _HistogramState(buckets=list(state.buckets), count=state.count, sum_value=state.sum_value)
                 for key, state in self._db_duration.items()
             }
             alert_breaches_total = dict(self._alert_breaches_total)
             alert_active = dict(self._alert_active)
+            worker_queue_wait = _HistogramState(
+                buckets=list(self._worker_queue_wait.buckets),
+                count=self._worker_queue_wait.count,
+                sum_value=self._worker_queue_wait.sum_value,
+            )
+            worker_rejected_total = int(self._worker_rejected_total)
+            worker_gauges = dict(self._worker_gauges)
 
         lines: list[str] = []
         lines.append("# HELP tvendor_http_requests_total Total HTTP requests.")
@@ -522,6 +598,12 @@ class ObservabilityManager:
             labels = self._prom_labels({"method": method, "path": path})
             lines.append(f"tvendor_db_errors_total{labels} {int(value)}")
 
+        lines.append("# HELP tvendor_db_retries_total Total retried DB reads per request path.")
+        lines.append("# TYPE tvendor_db_retries_total counter")
+        for (method, path), value in sorted(db_retries_total.items()):
+            labels = self._prom_labels({"method": method, "path": path})
+            lines.append(f"tvendor_db_retries_total{labels} {int(value)}")
+
         lines.append("# HELP tvendor_db_duration_ms Total DB duration in milliseconds per request.")
         lines.append("# TYPE tvendor_db_duration_ms histogram")
         for (method, path), state in sorted(db_duration.items()):
@@ -545,6 +627,39 @@ class ObservabilityManager:
             )
             lines.append(f"tvendor_db_duration_ms_count{self._prom_labels(labels_base)} {int(state.count)}")
 
+        lines.append("# HELP tvendor_worker_requests_active Requests holding a worker slot.")
+        lines.append("# TYPE tvendor_worker_requests_active gauge")
+        lines.append(f"tvendor_worker_requests_active {int(worker_gauges['active'])}")
+
+        lines.append("# HELP tvendor_worker_requests_queued Requests waiting for a worker slot.")
+        lines.append("# TYPE tvendor_worker_requests_queued gauge")
+        lines.append(f"tvendor_worker_requests_queued {int(worker_gauges['queued'])}")
+
+        lines.append("# HELP tvendor_worker_threads_limit Configured worker thread limit for sync handlers.")
+        lines.append("# TYPE tvendor_worker_threads_limit gauge")
+        lines.append(f"tvendor_worker_threads_limit {int(worker_gauges['limit'])}")
+
+        lines.append("# HELP tvendor_worker_threads_active Worker threads currently running sync handlers.")
+        lines.append("# TYPE tvendor_worker_threads_active gauge")
+        lines.append(f"tvendor_worker_threads_active {int(worker_gauges['threads_busy'])}")
+
+        lines.append("# HELP tvendor_worker_admission_rejected_total Requests rejected because the worker queue was full.")
+        lines.append("# TYPE tvendor_worker_admission_rejected_total counter")
+        lines.append(f"tvendor_worker_admission_rejected_total {worker_rejected_total}")
+
+        lines.append("# HELP tvendor_worker_queue_wait_ms Time spent waiting for a worker slot in milliseconds.")
+        lines.append("# TYPE tvendor_worker_queue_wait_ms histogram")
+        cumulative = 0
+        for idx, upper in enumerate(WORKER_QUEUE_WAIT_BUCKETS_MS):
+            cumulative += int(worker_queue_wait.buckets[idx])
+            labels = self._prom_labels({"le": self._prom_float(upper)})
+            lines.append(f"tvendor_worker_queue_wait_ms_bucket{labels} {cumulative}")
+        lines.append(
+            f"tvendor_worker_queue_wait_ms_bucket{self._prom_labels({'le': '+Inf'})} {int(worker_queue_wait.count)}"
+        )
+        lines.append(f"tvendor_worker_queue_wait_ms_sum {self._prom_float(worker_queue_wait.sum_value)}")
+        lines.append(f"tvendor_worker_queue_wait_ms_count {int(worker_queue_wait.count)}")
+
         lines.append("# HELP tvendor_alert_breaches_total Total number of alert threshold breaches.")
         lines.append("# TYPE tvendor_alert_breaches_total counter")
         for alert_name, value in sorted(alert_breaches_total.items()):
@@ -570,6 +685,8 @@ class ObservabilityManager:
             )
             alert_breaches_total = {name: int(value) for name, value in self._alert_breaches_total.items()}
             window_sample_size = len(self._window)
+            worker_gauges = dict(self._worker_gauges)
+            worker_rejected_total = int(self._worker_rejected_total)
 
         return {
             "metrics_enabled": bool(self.metrics_enabled),
@@ -584,6 +701,10 @@ class ObservabilityManager:
             "active_alerts": active_alerts,
             "alert_breaches_total": alert_breaches_total,
             "window_sample_size": int(window_sample_size),
+            "worker_requests_active": int(worker_gauges["active"]),
+            "worker_requests_queued": int(worker_gauges["queued"]),
+            "worker_threads_limit": int(worker_gauges["limit"]),
+            "worker_admission_rejected_total": worker_rejected_total,
             "uptime_seconds": int(max(0, time.time() - self._started_ts)),
         }
 
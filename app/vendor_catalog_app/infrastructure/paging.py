@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+
+def cursor_scope(*parts: Any) -> str:
+    """Short fingerprint of a listing's filters and sort; cursors only apply to the same scope."""
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _cursor_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def encode_cursor(values: Sequence[Any], *, scope: str) -> str:
+    payload = json.dumps({"s": scope, "k": [_cursor_value(value) for value in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *, scope: str, size: int) -> list[Any] | None:
+    """Key values carried by ``cursor``, or None when it is empty, malformed or from another scope."""
+    raw = str(cursor or "").strip()
+    if not raw:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(raw + "=" * (-len(raw) % 4)).decode("utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if not isinstance(payload, dict) or payload.get("s") != scope:
+        return None
+    values = payload.get("k")
+    if not isinstance(values, list) or len(values) != size or any(value is None for value in values):
+        return None
+    return values
+
+
+def keyset_clause(keys: Sequence[tuple[str, str]]) -> str:
+    """Predicate selecting rows after a cursor for ``ORDER BY`` ``keys`` (expression, "asc"/"desc").
+
+    Expanded as ``(k1 > %s) OR (k1 = %s AND k2 > %s) ...`` so mixed directions work on
+    every backend; bind ``keyset_params(values)``. Key expressions must be non-null and
+    the last key unique, or rows sharing a key tuple are skipped.
+    """
+    branches = []
+    for index, (expr, direction) in enumerate(keys):
+        operator = "<" if str(direction).lower() == "desc" else ">"
+        terms = [f"{previous} = %s" for previous, _ in keys[:index]]
+        terms.append(f"{expr} {operator} %s")
+        branches.append("(" + " AND ".join(terms) + ")")
+    return "(" + " OR ".join(branches) + ")"
+
+
+def keyset_params(values: Sequence[Any]) -> list[Any]:
+    params: list[Any] = []
+    for index in range(len(values)):
+        params.extend(values[: index + 1])
+    return params
+
+
+class BackgroundCountCache:
+    """Stale-while-revalidate cache for list totals.
+
+    The first request for a key counts synchronously. Afterwards the cached total is
+    served immediately and, once it is older than ``ttl_seconds`` or was loaded under a
+    different ``version`` (e.g. before a write), recounted on a daemon thread. Concurrent
+    refreshes of the same key are collapsed. A ``ttl_seconds`` of 0 disables caching.
+    """
+
+    def __init__(self, *, ttl_seconds: int, max_entries: int = 256) -> None:
+        self._ttl_seconds = max(0, int(ttl_seconds))
+        self._max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, Hashable, int]] = OrderedDict()
+        self._refreshing: set[Hashable] = set()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key: Hashable, loader: Callable[[], int], *, version: Hashable = None) -> int:
+        if self._ttl_seconds <= 0:
+            return int(loader())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key, last=True)
+        if entry is None:
+            return self._load(key, loader, version)
+        loaded_at, loaded_version, total = entry
+        if loaded_version != version or time.monotonic() - loaded_at >= self._ttl_seconds:
+            self._refresh_async(key, loader, version)
+        return total
+
+    def _load(self, key: Hashable, loader: Callable[[], int], version: Hashable) -> int:
+        total = int(loader())
+        with self._lock:
+            self._entries[key] = (time.monotonic(), version, total)
+            self._entries.move_to_end(key, last=True)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return total
+
+    def _refresh_async(self, key: Hashable, loader: Callable[[], int], version: Hashable) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def _run() -> None:
+            try:
+                self._load(key, loader, version)
+            except Exception:
+                LOGGER.warning("Background count refresh failed; serving the previous total.", exc_info=True)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=_run, name="page-count-refresh", daemon=True).start()
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from vendor_catalog_app.core.env import (
+    TVENDOR_BUDGET_LOAD_MAX_WORKERS,
+    TVENDOR_PARALLEL_LOAD_ENABLED,
+    TVENDOR_PARALLEL_LOAD_MAX_WORKERS,
+    get_env_bool,
+    get_env_int,
+)
+from vendor_catalog_app.infrastructure.db import (
+    bind_request_perf_context,
+    fork_request_perf_context,
+    get_request_perf_context,
+    merge_request_perf_context,
+    record_request_phase_ms,
+)
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+# Budgeted loads may be abandoned while still running, so they get their own pool and
+# never hold LoadGraph workers.
+_BUDGET_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _load_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=get_env_int(TVENDOR_PARALLEL_LOAD_MAX_WORKERS, default=16, min_value=1, max_value=256),
+                thread_name_prefix="tvendor-load",
+            )
+        return _EXECUTOR
+
+
+def _budget_executor() -> ThreadPoolExecutor:
+    global _BUDGET_EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _BUDGET_EXECUTOR is None:
+            _BUDGET_EXECUTOR = ThreadPoolExecutor(
+                max_workers=get_env_int(TVENDOR_BUDGET_LOAD_MAX_WORKERS, default=8, min_value=1, max_value=256),
+                thread_name_prefix="tvendor-budget-load",
+            )
+        return _BUDGET_EXECUTOR
+
+
+class LoadGraph:
+    """Run named, independent data loads concurrently while honoring declared dependencies.
+
+    Each loader receives the results of the loads it runs ``after`` as keyword arguments.
+    Loaders run in a copy of the caller's context, so request perf counters, workload
+    routing and runtime overrides carry over. Per-load timings and the critical path are
+    recorded on the request perf context under ``load_graphs``.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = str(name or "load")
+        self._loaders: dict[str, Callable[..., Any]] = {}
+        self._after: dict[str, tuple[str, ...]] = {}
+
+    def add(self, name: str, loader: Callable[..., Any], *, after: Iterable[str] = ()) -> LoadGraph:
+        if name in self._loaders:
+            raise ValueError(f"Duplicate load name: {name!r}")
+        self._loaders[name] = loader
+        self._after[name] = tuple(after)
+        return self
+
+    def run(self) -> dict[str, Any]:
+        order = self._topological_order()
+        started = time.perf_counter()
+        results: dict[str, Any] = {}
+        timings: dict[str, tuple[float, float]] = {}
+        parallel = len(order) > 1 and get_env_bool(TVENDOR_PARALLEL_LOAD_ENABLED, default=True)
+        if parallel:
+            self._run_parallel(order, results, timings, started)
+        else:
+            for name in order:
+                results[name], timings[name] = self._run_one(name, self._dependency_results(name, results), started)
+        self._record(timings, wall_ms=(time.perf_counter() - started) * 1000.0, parallel=parallel)
+        return results
+
+    def _topological_order(self) -> list[str]:
+        order: list[str] = []
+        state: dict[str, int] = {}
+
+        def _visit(name: str) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Load graph '{self.name}' has a dependency cycle at {name!r}.")
+            state[name] = 1
+            for dependency in self._after[name]:
+                if dependency not in self._loaders:
+                    raise ValueError(f"Load {name!r} depends on unknown load {dependency!r}.")
+                _visit(dependency)
+            state[name] = 2
+            order.append(name)
+
+        for name in self._loaders:
+            _visit(name)
+        return order
+
+    def _dependency_results(self, name: str, results: dict[str, Any]) -> dict[str, Any]:
+        return {dependency: results[dependency] for dependency in self._after[name]}
+
+    def _run_one(self, name: str, kwargs: dict[str, Any], started: float) -> tuple[Any, tuple[float, float]]:
+        task_started = time.perf_counter()
+        value = self._loaders[name](**kwargs)
+        task_ended = time.perf_counter()
+        return value, ((task_started - started) * 1000.0, (task_ended - started) * 1000.0)
+
+    def _run_parallel(
+        self,
+        order: list[str],
+        results: dict[str, Any],
+        timings: dict[str, tuple[float, float]],
+        started: float,
+    ) -> None:
+        executor = _load_executor()
+        running: dict[Future, str] = {}
+        remaining = list(order)
+        try:
+            while remaining or running:
+                for name in list(remaining):
+                    if all(dependency in results for dependency in self._after[name]):
+                        remaining.remove(name)
+                        future = executor.submit(
+                            contextvars.copy_context().run,
+                            self._run_one,
+                            name,
+                            self._dependency_results(name, results),
+                            started,
+                        )
+                        running[future] = name
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    results[name], timings[name] = future.result()
+        finally:
+            for future in running:
+                future.cancel()
+
+    def _critical_path(self, timings: dict[str, tuple[float, float]]) -> list[str]:
+        if not timings:
+            return []
+        current = max(timings, key=lambda name: timings[name][1])
+        path = [current]
+        while self._after[current]:
+            current = max(self._after[current], key=lambda name: timings[name][1])
+            path.append(current)
+        return list(reversed(path))
+
+    def _record(self, timings: dict[str, tuple[float, float]], *, wall_ms: float, parallel: bool) -> None:
+        request_ctx = get_request_perf_context()
+        if request_ctx is None:
+            return
+        request_ctx.setdefault("load_graphs", []).append(
+            {
+                "name": self.name,
+                "parallel": parallel,
+                "wall_ms": round(wall_ms, 2),
+                "sum_ms": round(sum(end - start for start, end in timings.values()), 2),
+                "critical_path": self._critical_path(timings),
+                "loads_ms": {name: round(end - start, 2) for name, (start, end) in timings.items()},
+            }
+        )
+        record_request_phase_ms("load", wall_ms)
+
+
+def _run_detached(loader: Callable[[], Any], request_ctx: dict[str, Any] | None) -> Any:
+    bind_request_perf_context(request_ctx)
+    return loader()
+
+
+def run_within_budget(
+    loaders: dict[str, Callable[[], Any]],
+    *,
+    budget_ms: float,
+) -> tuple[dict[str, Any], list[str]]:
+    """Run independent loads concurrently; return the results that finished within ``budget_ms``
+    and the names of the loads that did not.
+
+    Late loads are abandoned, not interrupted: they finish on a dedicated bounded
+    executor and their results are dropped. Each load records into its own fork of the
+    request perf context, merged only when its result is used, so abandoned loads never
+    touch the request's counters. Loaders must handle their own errors.
+    """
+    started = time.perf_counter()
+    deadline = started + max(0.0, float(budget_ms)) / 1000.0
+    results: dict[str, Any] = {}
+    if len(loaders) <= 1 or not get_env_bool(TVENDOR_PARALLEL_LOAD_ENABLED, default=True):
+        for name, loader in loaders.items():
+            if time.perf_counter() >= deadline and results:
+                break
+            results[name] = loader()
+    else:
+        executor = _budget_executor()
+        forks: dict[Future, dict[str, Any] | None] = {}
+        futures: dict[Future, str] = {}
+        for name, loader in loaders.items():
+            request_ctx = fork_request_perf_context()
+            future = executor.submit(contextvars.copy_context().run, _run_detached, loader, request_ctx)
+            futures[future] = name
+            forks[future] = request_ctx
+        pending = set(futures)
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[futures[future]] = future.result()
+                merge_request_perf_context(forks[future])
+        for future in pending:
+            future.cancel()
+    record_request_phase_ms("load", (time.perf_counter() - started) * 1000.0)
+    return results, [name for name in loaders if name not in results]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+
+class VersionedRegistry:
+    """In-memory values compiled once per version of the data they were built from.
+
+    The version source is consulted at most once every ``revalidate_sec`` per entry, so
+    steady-state reads cost no I/O; a changed version rebuilds the entry. ``invalidate``
+    forces the next read to re-check, which is how same-process writes take effect at once.
+    Values are shared between callers and must be treated as read-only.
+
+    Builds are single-flight per name: concurrent readers of a missing entry wait for one
+    build. With ``rebuild_in_background`` a stale entry keeps being served while one
+    daemon thread rebuilds it, so readers never pay for a rebuild once an entry exists.
+    ``invalidate`` drops the entry instead, so the next read rebuilds inline; a build that
+    was already running when it was called is discarded rather than stored.
+    """
+
+    def __init__(self, *, revalidate_sec: float, rebuild_in_background: bool = False) -> None:
+        self._revalidate_sec = max(0.0, float(revalidate_sec))
+        self._rebuild_in_background = bool(rebuild_in_background)
+        self._lock = threading.Lock()
+        # name -> (version, checked_at, value)
+        self._entries: dict[Hashable, tuple[Any, float, Any]] = {}
+        self._build_locks: dict[Hashable, threading.Lock] = {}
+        self._rebuilding: dict[Hashable, threading.Thread] = {}
+        # Bumped by invalidate; builds that started under an older epoch are not stored.
+        self._epoch = 0
+        self._builds = 0
+
+    def get(self, name: Hashable, *, version: Callable[[], Any], build: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is not None and now - entry[1] < self._revalidate_sec:
+            return entry[2]
+        current_version = version()
+        if entry is not None and entry[0] == current_version:
+            with self._lock:
+                self._entries[name] = (current_version, now, entry[2])
+            return entry[2]
+        if entry is not None and self._rebuild_in_background:
+            self._rebuild_async(name, current_version, build)
+            return entry[2]
+        return self._build(name, current_version, build)
+
+    def _build_lock(self, name: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._build_locks.setdefault(name, threading.Lock())
+
+    def _build(self, name: Hashable, current_version: Any, build: Callable[[], Any]) -> Any:
+        with self._build_lock(name):
+            with self._lock:
+                entry = self._entries.get(name)
+                epoch = self._epoch
+            # Another caller finished the same build while this one waited.
+            if entry is not None and entry[0] == current_version:
+                return entry[2]
+            value = build()
+            with self._lock:
+                self._builds += 1
+                if epoch == self._epoch:
+                    self._entries[name] = (current_version, time.monotonic(), value)
+            return value
+
+    def _rebuild_async(self, name: Hashable, current_version: Any, build: Callable[[], Any]) -> None:
+        def _run() -> None:
+            try:
+                self._build(name, current_version, build)
+            except Exception:
+                LOGGER.warning("Background registry rebuild failed; serving the previous value. name=%s", name, exc_info=True)
+            finally:
+                with self._lock:
+                    self._rebuilding.pop(name, None)
+
+        with self._lock:
+            if name in self._rebuilding:
+                return
+            thread = self._rebuilding[name] = threading.Thread(target=_run, name="registry-rebuild", daemon=True)
+        thread.start()
+
+    def wait_for_rebuilds(self, timeout: float | None = None) -> bool:
+        """Wait for running background rebuilds; False if any is still running after ``timeout``."""
+        deadline = None if timeout is None else time.monotonic() + max(0.0, float(timeout))
+        while True:
+            with self._lock:
+                threads = list(self._rebuilding.values())
+            if not threads:
+                return True
+            for thread in threads:
+                thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+            if deadline is not None and time.monotonic() >= deadline:
+                with self._lock:
+                    return not self._rebuilding
+
+    def invalidate(self, name: Hashable | None = None) -> None:
+        with self._lock:
+            self._epoch += 1
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "builds": int(self._builds), "rebuilding": len(self._rebuilding)}
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+# Candidate sets are seeded from the rarest postings only; remaining trigrams are
+# cheaper to confirm with a substring check than to intersect.
+_MAX_INTERSECTED_POSTINGS = 2
+# Word-start entries keep only this many characters, bounding memory on long text fields.
+_WORD_PREFIX_CHARS = 24
+_BM25_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# A query token that only prefixes an index term (``vend`` -> ``vendor``) scores at this fraction.
+_BM25_PREFIX_WEIGHT = 0.5
+
+
+def match_tier(row: dict[str, Any], query: str, *, fields: Sequence[str], primary_fields: Sequence[str] = ()) -> int:
+    """Rank tier ``NgramIndex.search`` would give ``row``: 0 exact primary match, 1 primary
+    prefix, 2 word prefix, 3 substring, 4 no direct match (e.g. matched through a join).
+    """
+    needle = str(query or "").strip().lower()
+    texts = [str(row.get(field) or "").strip().lower() for field in fields]
+    primary = [str(row.get(field) or "").strip().lower() for field in primary_fields]
+    if not needle:
+        return 0
+    if needle in primary:
+        return 0
+    if any(text.startswith(needle) for text in primary):
+        return 1
+    if any(text.startswith(needle) or f" {needle}" in text for text in texts):
+        return 2
+    if any(needle in text for text in texts):
+        return 3
+    return 4
+
+
+class NgramIndex:
+    """In-memory substring index over a fixed list of rows, backed by trigram postings.
+
+    Matching follows the ``lower(field) LIKE '%q%'`` semantics of the SQL it replaces:
+    a row matches when any of ``fields`` contains the query, case-insensitively.
+    Results are ranked exact match on a ``primary_fields`` value first, then prefix of a
+    primary field, then word prefix in any field, then any substring; ties keep the
+    order the rows were loaded in. The first three tiers are answered from sorted
+    prefix lists, so broad queries stop as soon as ``limit`` rows are found instead of
+    ranking every match. Rows are shared and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[dict[str, Any]],
+        *,
+        fields: Sequence[str],
+        primary_fields: Sequence[str] = (),
+    ) -> None:
+        self.rows: list[dict[str, Any]] = list(rows)
+        primary = set(primary_fields)
+        self._primary = tuple(index for index, field in enumerate(fields) if field in primary)
+        self._texts: list[tuple[str, ...]] = [
+            tuple(str(row.get(field) or "").strip().lower() for field in fields) for row in self.rows
+        ]
+        self._postings: dict[str, array] = {}
+        primary_entries: list[tuple[str, int]] = []
+        word_entries: list[tuple[str, int]] = []
+        for position, texts in enumerate(self._texts):
+            for index in self._primary:
+                if texts[index]:
+                    primary_entries.append((texts[index], position))
+            for text in texts:
+                word_entries.extend(
+                    (text[start : start + _WORD_PREFIX_CHARS], position)
+                    for start in range(len(text))
+                    if text[start] != " " and (start == 0 or text[start - 1] == " ")
+                )
+            grams: set[str] = set()
+            for text in texts:
+                grams.update(text[start : start + 3] for start in range(len(text) - 2))
+            for gram in grams:
+                posting = self._postings.get(gram)
+                if posting is None:
+                    posting = self._postings[gram] = array("I")
+                posting.append(position)
+        primary_entries.sort()
+        word_entries.sort()
+        self._primary_entries = primary_entries
+        self._word_entries = word_entries
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _candidates(self, needle: str) -> Iterable[int]:
+        if len(needle) < 3:
+            return range(len(self.rows))
+        postings: list[array] = []
+        for gram in {needle[start : start + 3] for start in range(len(needle) - 2)}:
+            posting = self._postings.get(gram)
+            if posting is None:
+                return ()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:_MAX_INTERSECTED_POSTINGS]:
+            candidates.intersection_update(posting)
+        return candidates
+
+    @staticmethod
+    def _prefix_positions(entries: list[tuple[str, int]], needle: str, *, exact: bool = False) -> list[int]:
+        low = bisect_left(entries, (needle, -1))
+        high = bisect_left(entries, (needle, len(entries) + 1) if exact else (needle + "\uffff", -1))
+        return sorted({position for _, position in entries[low:high]})
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        where: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> list[dict[str, Any]]:
+        needle = str(query or "").strip().lower()
+        limit = max(1, int(limit))
+        chosen: list[int] = []
+        seen: set[int] = set()
+
+        def _take(positions: Iterable[int], verify: Callable[[str], bool] | None = None) -> bool:
+            for position in positions:
+                if position in seen:
+                    continue
+                if verify is not None and not any(verify(text) for text in self._texts[position]):
+                    continue
+                seen.add(position)
+                if where is not None and not where(self.rows[position]):
+                    continue
+                chosen.append(position)
+                if len(chosen) >= limit:
+                    return True
+            return False
+
+        if not needle:
+            _take(range(len(self.rows)))
+            return [self.rows[position] for position in chosen]
+
+        word_prefix = f" {needle}"
+        long_needle = len(needle) > _WORD_PREFIX_CHARS
+        # Tiers, best first; each is computed only if the previous ones left room.
+        tiers = (
+            (lambda: self._prefix_positions(self._primary_entries, needle, exact=True), None),
+            (lambda: self._prefix_positions(self._primary_entries, needle), None),
+            (
+                lambda: self._prefix_positions(self._word_entries, needle[:_WORD_PREFIX_CHARS]),
+                (lambda text: text.startswith(needle) or word_prefix in text) if long_needle else None,
+            ),
+            (lambda: sorted(self._candidates(needle)), lambda text: needle in text),
+        )
+        for positions, verify in tiers:
+            if _take(positions(), verify):
+                break
+        return [self.rows[position] for position in chosen]
+
+
+class Bm25Index:
+    """Inverted index over a fixed list of rows, scored with BM25 over weighted fields.
+
+    Each field's term frequencies are multiplied by its weight before the usual BM25
+    saturation and length normalization. Query tokens match index terms exactly or as a
+    prefix (at a discount), so a search only visits the postings of matching terms.
+    Postings also keep each term's first character offset in ``snippet_field``, which
+    ``snippet`` uses to cut an excerpt without rescanning the text. Rows are shared and
+    must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[dict[str, Any]],
+        *,
+        fields: dict[str, float],
+        snippet_field: str,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        self.rows: list[dict[str, Any]] = list(rows)
+        self._k1 = float(k1)
+        self._b = float(b)
+        self._snippet_texts: list[str] = []
+        self._lengths: list[float] = []
+        postings: dict[str, list[tuple[int, float, int]]] = {}
+        for position, row in enumerate(self.rows):
+            counts: dict[str, float] = {}
+            offsets: dict[str, int] = {}
+            length = 0.0
+            snippet_text = str(row.get(snippet_field) or "")
+            for field, weight in fields.items():
+                text = str(row.get(field) or "")
+                lowered = text.lower()
+                # Offsets index the original text, so they are only kept when lowering preserved length.
+                track_offsets = field == snippet_field and len(lowered) == len(text)
+                for match in _BM25_TOKEN_RE.finditer(lowered):
+                    term = match.group()
+                    counts[term] = counts.get(term, 0.0) + weight
+                    length += weight
+                    if track_offsets and term not in offsets:
+                        offsets[term] = match.start()
+            self._snippet_texts.append(snippet_text)
+            self._lengths.append(length)
+            for term, frequency in counts.items():
+                postings.setdefault(term, []).append((position, frequency, offsets.get(term, -1)))
+        self._postings = postings
+        self._terms = sorted(postings)
+        self._average_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 1.0
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _matching_terms(self, token: str) -> list[tuple[str, float]]:
+        start = bisect_left(self._terms, token)
+        end = bisect_left(self._terms, token + "\uffff")
+        return [(term, 1.0 if term == token else _BM25_PREFIX_WEIGHT) for term in self._terms[start:end]]
+
+    def search(
+        self,
+        query: str,
+        *,
+        where: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> list[tuple[int, float, int]]:
+        """``(position, score, snippet offset)`` for rows matching any query token, best first."""
+        tokens = dict.fromkeys(_BM25_TOKEN_RE.findall(str(query or "").lower()))
+        total_rows = len(self.rows)
+        scores: dict[int, float] = {}
+        offsets: dict[int, int] = {}
+        for token in tokens:
+            token_scores: dict[int, float] = {}
+            for term, term_weight in self._matching_terms(token):
+                posting = self._postings[term]
+                idf = math.log(1.0 + (total_rows - len(posting) + 0.5) / (len(posting) + 0.5))
+                for position, frequency, offset in posting:
+                    norm = self._k1 * (1.0 - self._b + self._b * self._lengths[position] / self._average_length)
+                    score = term_weight * idf * frequency * (self._k1 + 1.0) / (frequency + norm)
+                    if score > token_scores.get(position, 0.0):
+                        token_scores[position] = score
+                    if offset >= 0 and (position not in offsets or offset < offsets[position]):
+                        offsets[position] = offset
+            for position, score in token_scores.items():
+                scores[position] = scores.get(position, 0.0) + score
+        ranked = sorted(scores, key=lambda position: (-scores[position], position))
+        return [
+            (position, scores[position], offsets.get(position, -1))
+            for position in ranked
+            if where is None or where(self.rows[position])
+        ]
+
+    def snippet(self, position: int, offset: int, *, before: int = 40, after: int = 120) -> str:
+        """Excerpt of row ``position``'s snippet field around ``offset`` (the start when negative)."""
+        text = self._snippet_texts[position]
+        if offset < 0:
+            return text[: before + after].strip()
+        start = max(0, offset - before)
+        end = min(len(text), offset + after)
+        excerpt = text[start:end].strip()
+        if start > 0:
+            excerpt = "..." + excerpt
+        if end < len(text):
+            excerpt = excerpt + "..."
+        return excerpt
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+LOGGER = logging.getLogger(__name__)
+
+SPOOL_FILE_NAME = "spool.jsonl"
+SPOOL_OFFSET_FILE_NAME = "spool.offset"
+SPOOL_LOCK_FILE_NAME = "spool.lock"
+SPOOL_DEAD_LETTER_FILE_NAME = "spool.dead.jsonl"
+# How often a process that found the spool owned elsewhere tries to take it over.
+SPOOL_OWNERSHIP_RETRY_SEC = 30.0
+
+
+class DurableSpool:
+    """Append-only on-disk spool drained in batches by a background flusher thread.
+
+    Records are appended as JSON lines before ``append`` returns, and the flushed byte
+    offset is persisted only after ``flush_batch`` succeeds, so records survive restarts
+    and are delivered at least once; ``flush_batch`` must therefore be idempotent. One
+    process owns a spool directory (via an OS file lock); while it is owned elsewhere
+    ``append`` writes synchronously and ownership is retried every
+    ``ownership_retry_sec``. When a batch fails its records are retried one at a time, so
+    the good ones are delivered and only records that keep failing for ``max_attempts``
+    flushes are moved to a dead-letter file.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        directory: str | Path,
+        flush_batch: Callable[[list[dict[str, Any]]], None],
+        enabled: bool,
+        batch_size: int,
+        flush_interval_ms: int,
+        fsync: bool = True,
+        max_attempts: int = 5,
+        ownership_retry_sec: float = SPOOL_OWNERSHIP_RETRY_SEC,
+    ) -> None:
+        self.name = str(name or "spool")
+        self.directory = Path(directory)
+        self._flush_batch = flush_batch
+        self._requested = bool(enabled)
+        self._batch_size = max(1, int(batch_size))
+        self._flush_interval_sec = max(0.01, float(flush_interval_ms) / 1000.0)
+        self._fsync = bool(fsync)
+        self._max_attempts = max(1, int(max_attempts))
+        self._ownership_retry_sec = max(0.0, float(ownership_retry_sec))
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._unavailable = False
+        self._next_open_attempt = 0.0
+        self._owned_elsewhere_logged = False
+        self._owned = False
+        self._closed = False
+        self._lock_handle: Any = None
+        self._spool_handle: Any = None
+        self._offset = 0
+        self._pending = 0
+        self._failed_attempts = 0
+        self._thread: threading.Thread | None = None
+
+    @property
+    def spool_path(self) -> Path:
+        return self.directory / SPOOL_FILE_NAME
+
+    @property
+    def offset_path(self) -> Path:
+        return self.directory / SPOOL_OFFSET_FILE_NAME
+
+    @property
+    def dead_letter_path(self) -> Path:
+        return self.directory / SPOOL_DEAD_LETTER_FILE_NAME
+
+    def start(self) -> bool:
+        """Take ownership now and replay records left by a previous process.
+
+        When the spool is owned elsewhere the flusher keeps retrying ownership in the
+        background. Returns whether this process owns the spool.
+        """
+        owned = self._ensure_open()
+        if not owned and not self._unavailable:
+            with self._condition:
+                if not self._closed:
+                    self._ensure_thread_locked()
+        return owned
+
+    def append(self, record: dict[str, Any]) -> None:
+        if not self._ensure_open() or self._closed:
+            self._flush_batch([record])
+            return
+        line = (json.dumps(record, default=str, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._condition:
+            self._spool_handle.write(line)
+            self._spool_handle.flush()
+            if self._fsync:
+                os.fsync(self._spool_handle.fileno())
+            self._pending += 1
+            self._ensure_thread_locked()
+            if self._pending >= self._batch_size:
+                self._condition.notify()
+
+    def flush(self) -> int:
+        """Synchronously deliver every spooled record. Returns the number of records delivered."""
+        if not self._ensure_open():
+            return 0
+        delivered = 0
+        while True:
+            count = self._flush_once()
+            delivered += max(0, count)
+            # Stop after a failed delivery so the flusher backs off before the next attempt.
+            if count <= 0 or self._failed_attempts:
+                return delivered
+
+    def close(self, *, timeout_sec: float = 5.0) -> None:
+        with self._condition:
+            self._closed = True
+            thread = self._thread
+            self._condition.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=max(0.0, float(timeout_sec)))
+        if not self._owned:
+            return
+        self.flush()
+        with self._condition:
+            if self._spool_handle is not None:
+                self._spool_handle.close()
+                self._spool_handle = None
+            if self._lock_handle is not None:
+                self._lock_handle.close()
+                self._lock_handle = None
+            self._owned = False
+
+    def _ensure_open(self) -> bool:
+        if self._owned:
+            return True
+        if self._unavailable or time.monotonic() < self._next_open_attempt:
+            return False
+        with self._condition:
+            if self._owned:
+                return True
+            if self._closed or self._unavailable or time.monotonic() < self._next_open_attempt:
+                return False
+            if not self._requested or fcntl is None:
+                self._unavailable = True
+                return False
+            self._next_open_attempt = time.monotonic() + self._ownership_retry_sec
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                # Both handles stay open while this process owns the spool and are closed in ``close``.
+                lock_handle = open(self.directory / SPOOL_LOCK_FILE_NAME, "a+b")  # noqa: SIM115 - long-lived lock
+                try:
+                    fcntl.flock(lock_handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    lock_handle.close()
+                    log_fn = LOGGER.debug if self._owned_elsewhere_logged else LOGGER.info
+                    self._owned_elsewhere_logged = True
+                    log_fn(
+                        "Spool '%s' at %s is owned by another process; writing synchronously.",
+                        self.name,
+                        self.directory,
+                        extra={"event": "spool_owned_elsewhere", "spool": self.name},
+                    )
+                    return False
+                self._lock_handle = lock_handle
+                try:
+                    self._spool_handle = open(self.spool_path, "ab")  # noqa: SIM115 - long-lived append handle
+                    self._offset = self._read_offset()
+                    spool_size = self.spool_path.stat().st_size
+                except OSError:
+                    for handle in (self._spool_handle, self._lock_handle):
+                        if handle is not None:
+                            handle.close()
+                    self._spool_handle = None
+                    self._lock_handle = None
+                    raise
+                if self._offset > spool_size:
+                    self._offset = 0
+                self._owned = True
+            except OSError:
+                LOGGER.warning(
+                    "Failed to open spool '%s' at %s; writing synchronously.",
+                    self.name,
+                    self.directory,
+                    exc_info=True,
+                    extra={"event": "spool_open_failed", "spool": self.name},
+                )
+                return False
+            if self._offset < spool_size:
+                # Records left behind by a previous process are replayed by the flusher.
+                self._pending = 1
+                self._ensure_thread_locked()
+                self._condition.notify()
+            return True
+
+    def _read_offset(self) -> int:
+        try:
+            return max(0, int(self.offset_path.read_text(encoding="utf-8").strip() or "0"))
+        except (OSError, ValueError):
+            return 0
+
+    def _write_offset(self, offset: int) -> None:
+        temp_path = self.offset_path.with_suffix(".offset.tmp")
+        temp_path.write_text(str(int(offset)), encoding="utf-8")
+        os.replace(temp_path, self.offset_path)
+
+    def _read_batch(self) -> list[tuple[bytes, dict[str, Any] | None]]:
+        """Up to ``batch_size`` complete lines past the offset, each with its record (None if unreadable)."""
+        entries: list[tuple[bytes, dict[str, Any] | None]] = []
+        with open(self.spool_path, "rb") as handle:
+            handle.seek(self._offset)
+            while len(entries) < self._batch_size:
+                line = handle.readline()
+                if not line or not line.endswith(b"\n"):
+                    break
+                try:
+                    entries.append((line, json.loads(line)))
+                except ValueError:
+                    LOGGER.warning(
+                        "Skipping unreadable record in spool '%s'.",
+                        self.name,
+                        extra={"event": "spool_record_unreadable", "spool": self.name},
+                    )
+                    entries.append((line, None))
+        return entries
+
+    def _deliver_individually(
+        self,
+        entries: list[tuple[bytes, dict[str, Any] | None]],
+        *,
+        stop_on_failure: bool,
+    ) -> tuple[int, list[bytes]]:
+        """Deliver ``entries`` one record at a time.
+
+        Returns how many leading entries were handled and the lines that failed. With
+        ``stop_on_failure`` the pass ends at the first failure, so an outage costs one
+        extra call rather than one per record.
+        """
+        failed: list[bytes] = []
+        for index, (line, record) in enumerate(entries):
+            if record is None:
+                continue
+            try:
+                self._flush_batch([record])
+            except Exception:
+                if stop_on_failure:
+                    return index, [line]
+                failed.append(line)
+        return len(entries), failed
+
+    def _advance(self, entries: list[tuple[bytes, dict[str, Any] | None]]) -> None:
+        if not entries:
+            return
+        self._offset += sum(len(line) for line, _ in entries)
+        self._write_offset(self._offset)
+        with self._condition:
+            self._pending = max(0, self._pending - len(entries))
+
+    def _flush_once(self) -> int:
+        with self._flush_lock:
+            with self._condition:
+                self._spool_handle.flush()
+            entries = self._read_batch()
+            if not entries:
+                self._compact()
+                return 0
+            records = [record for _, record in entries if record is not None]
+            try:
+                if records:
+                    self._flush_batch(records)
+            except Exception:
+                final_attempt = self._failed_attempts + 1 >= self._max_attempts
+                LOGGER.warning(
+                    "Spool '%s' failed to deliver a batch of %s records; retrying them one at a time.",
+                    self.name,
+                    len(records),
+                    exc_info=True,
+                    extra={"event": "spool_flush_failed", "spool": self.name, "records": len(records)},
+                )
+                handled, failed = self._deliver_individually(entries, stop_on_failure=not final_attempt)
+                if failed and not final_attempt:
+                    self._failed_attempts += 1
+                    self._advance(entries[:handled])
+                    LOGGER.warning(
+                        "Spool '%s' delivered %s of %s records (attempt %s); will retry the rest.",
+                        self.name,
+                        handled,
+                        len(entries),
+                        self._failed_attempts,
+                        extra={"event": "spool_flush_retry", "spool": self.name, "records": len(entries) - handled},
+                    )
+                    return handled
+                if failed:
+                    LOGGER.error(
+                        "Spool '%s' moved %s undeliverable records to %s.",
+                        self.name,
+                        len(failed),
+                        self.dead_letter_path,
+                        extra={"event": "spool_dead_lettered", "spool": self.name, "records": len(failed)},
+                    )
+                    with open(self.dead_letter_path, "ab") as dead_letter:
+                        dead_letter.writelines(failed)
+            self._failed_attempts = 0
+            self._advance(entries)
+            return len(entries)
+
+    def _compact(self) -> None:
+        with self._condition:
+            if self._offset <= 0 or self._spool_handle is None:
+                return
+            if self.spool_path.stat().st_size != self._offset:
+                return
+            self._spool_handle.truncate(0)
+            self._spool_handle.seek(0)
+            self._offset = 0
+            self._pending = 0
+            self._write_offset(0)
+
+    def _ensure_thread_locked(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"tvendor-{self.name}-spool-flusher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                owned = self._owned
+                # After a failed delivery, back off a full interval even if the batch is full.
+                retrying = self._failed_attempts > 0 or not owned
+                interval = self._flush_interval_sec if owned else max(self._flush_interval_sec, self._ownership_retry_sec)
+                if not self._closed and (retrying or self._pending < self._batch_size):
+                    deadline = time.monotonic() + interval
+                    while not self._closed and (retrying or self._pending < self._batch_size):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(timeout=remaining)
+                if self._closed:
+                    return
+            try:
+                if not owned and not self._ensure_open():
+                    continue
+                self.flush()
+            except Exception:
+                LOGGER.warning("Spool '%s' flusher iteration failed.", self.name, exc_info=True)
@@ -0,0 +1,5 @@
+SELECT
+  article_id,
+  content_hash,
+  content_html
+FROM {app_help_article_render}
@@ -0,0 +1,20 @@
+﻿INSERT INTO {audit_entity_change}
+  (change_event_id, entity_name, entity_id, action_type, before_json, after_json, actor_user_principal, event_ts, request_id)
+SELECT
+  source.change_event_id,
+  source.entity_name,
+  source.entity_id,
+  source.action_type,
+  source.before_json,
+  source.after_json,
+  source.actor_user_principal,
+  source.event_ts,
+  source.request_id
+FROM VALUES
+  {values_rows}
+AS source(change_event_id, entity_name, entity_id, action_type, before_json, after_json, actor_user_principal, event_ts, request_id)
+WHERE NOT EXISTS (
+  SELECT 1
+  FROM {audit_entity_change} existing
+  WHERE existing.change_event_id = source.change_event_id
+)
@@ -0,0 +1,4 @@
+﻿INSERT INTO {app_help_article_render}
+  (article_id, content_hash, content_html, rendered_at)
+VALUES
+  {values_rows}
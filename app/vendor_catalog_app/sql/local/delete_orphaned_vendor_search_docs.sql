@@ -0,0 +1,3 @@
+﻿DELETE FROM {app_vendor_search_doc}
+WHERE {target_filter}
+  AND vendor_id NOT IN (SELECT vendor_id FROM {core_vendor})
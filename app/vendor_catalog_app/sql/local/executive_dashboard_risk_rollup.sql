@@ -0,0 +1,9 @@
+﻿SELECT owner_org_id AS org_id, 0 AS all_orgs, risk_tier, COUNT(*) AS vendor_count
+FROM {core_vendor}
+WHERE lifecycle_state = 'active'
+GROUP BY owner_org_id, risk_tier
+UNION ALL
+SELECT NULL, 1, risk_tier, COUNT(*)
+FROM {core_vendor}
+WHERE lifecycle_state = 'active'
+GROUP BY risk_tier
@@ -0,0 +1,31 @@
+﻿WITH spend AS (
+  SELECT
+    sf.org_id,
+    sf.category,
+    sf.month,
+    sf.vendor_id,
+    coalesce(v.display_name, v.legal_name) AS vendor_name,
+    v.risk_tier,
+    sf.amount
+  FROM {rpt_spend_fact} sf
+  LEFT JOIN {core_vendor} v
+    ON sf.vendor_id = v.vendor_id
+  WHERE sf.month >= add_months(date_trunc('month', current_date()), -{months_back})
+)
+SELECT org_id, 0 AS all_orgs, 'category' AS grain, category, NULL AS month, NULL AS vendor_id, NULL AS vendor_name, NULL AS risk_tier, SUM(amount) AS total_spend
+FROM spend GROUP BY org_id, category
+UNION ALL
+SELECT org_id, 0, 'month', NULL, month, NULL, NULL, NULL, SUM(amount)
+FROM spend GROUP BY org_id, month
+UNION ALL
+SELECT org_id, 0, 'vendor', NULL, NULL, vendor_id, vendor_name, risk_tier, SUM(amount)
+FROM spend GROUP BY org_id, vendor_id, vendor_name, risk_tier
+UNION ALL
+SELECT NULL, 1, 'category', category, NULL, NULL, NULL, NULL, SUM(amount)
+FROM spend GROUP BY category
+UNION ALL
+SELECT NULL, 1, 'month', NULL, month, NULL, NULL, NULL, SUM(amount)
+FROM spend GROUP BY month
+UNION ALL
+SELECT NULL, 1, 'vendor', NULL, NULL, vendor_id, vendor_name, risk_tier, SUM(amount)
+FROM spend GROUP BY vendor_id, vendor_name, risk_tier
@@ -0,0 +1,4 @@
+SELECT name
+FROM sqlite_master
+WHERE type = 'table'
+  AND name LIKE 'search_fts_%'
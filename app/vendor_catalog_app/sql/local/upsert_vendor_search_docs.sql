@@ -0,0 +1,59 @@
+﻿INSERT INTO {app_vendor_search_doc} (vendor_id, search_text, updated_at)
+SELECT
+  v.vendor_id,
+  lower(
+    coalesce(v.vendor_id, '')
+    || char(10) || coalesce(v.legal_name, '')
+    || char(10) || coalesce(v.display_name, '')
+    || char(10) || coalesce(v.owner_org_id, '')
+    || char(10) || coalesce(v.risk_tier, '')
+    || char(10) || coalesce(v.source_system, '')
+    || char(10) || coalesce(v.source_record_id, '')
+    || char(10) || coalesce(v.source_batch_id, '')
+    || char(10) || coalesce((
+      SELECT group_concat(coalesce(o.offering_id, '') || char(10) || coalesce(o.offering_name, '') || char(10) || coalesce(o.offering_type, '') || char(10) || coalesce(o.lob, '') || char(10) || coalesce(o.service_type, ''), char(10))
+      FROM {core_vendor_offering} o
+      WHERE o.vendor_id = v.vendor_id
+    ), '')
+    || char(10) || coalesce((
+      SELECT group_concat(coalesce(c.contract_id, '') || char(10) || coalesce(c.contract_number, '') || char(10) || coalesce(c.contract_status, ''), char(10))
+      FROM {core_contract} c
+      WHERE c.vendor_id = v.vendor_id
+    ), '')
+    || char(10) || coalesce((
+      SELECT group_concat(coalesce(bo.owner_user_principal, '') || char(10) || coalesce(bo.owner_role, ''), char(10))
+      FROM {core_vendor_business_owner} bo
+      WHERE bo.vendor_id = v.vendor_id
+    ), '')
+    || char(10) || coalesce((
+      SELECT group_concat(coalesce(obo.owner_user_principal, '') || char(10) || coalesce(obo.owner_role, ''), char(10))
+      FROM {core_offering_business_owner} obo
+      INNER JOIN {core_vendor_offering} o2 ON obo.offering_id = o2.offering_id
+      WHERE o2.vendor_id = v.vendor_id
+    ), '')
+    || char(10) || coalesce((
+      SELECT group_concat(coalesce(vc.full_name, '') || char(10) || coalesce(vc.email, '') || char(10) || coalesce(vc.contact_type, '') || char(10) || coalesce(vc.phone, ''), char(10))
+      FROM {core_vendor_contact} vc
+      WHERE vc.vendor_id = v.vendor_id
+    ), '')
+    || char(10) || coalesce((
+      SELECT group_concat(coalesce(oc.full_name, '') || char(10) || coalesce(oc.email, '') || char(10) || coalesce(oc.contact_type, '') || char(10) || coalesce(oc.phone, ''), char(10))
+      FROM {core_offering_contact} oc
+      INNER JOIN {core_vendor_offering} o3 ON oc.offering_id = o3.offering_id
+      WHERE o3.vendor_id = v.vendor_id
+    ), '')
+    || char(10) || coalesce((
+      SELECT group_concat(coalesce(d.demo_id, '') || char(10) || coalesce(d.offering_id, '') || char(10) || coalesce(d.selection_outcome, '') || char(10) || coalesce(d.non_selection_reason_code, '') || char(10) || coalesce(d.notes, ''), char(10))
+      FROM {core_vendor_demo} d
+      WHERE d.vendor_id = v.vendor_id
+    ), '')
+    || char(10) || coalesce((
+      SELECT group_concat(coalesce(p.project_id, '') || char(10) || coalesce(p.project_name, '') || char(10) || coalesce(p.project_type, '') || char(10) || coalesce(p.status, '') || char(10) || coalesce(p.owner_principal, '') || char(10) || coalesce(p.description, ''), char(10))
+      FROM {app_project} p
+      WHERE p.vendor_id = v.vendor_id AND coalesce(p.active_flag, true) = true
+    ), '')
+  ) AS search_text,
+  %s AS updated_at
+FROM {core_vendor} v
+WHERE {vendor_filter}
+ON CONFLICT (vendor_id) DO UPDATE SET search_text = excluded.search_text, updated_at = excluded.updated_at
@@ -0,0 +1,9 @@
+﻿SELECT
+  COUNT(*) AS total_demos,
+  SUM(CASE WHEN selection_outcome = 'not_selected' THEN 1 ELSE 0 END) AS not_selected_demos
+FROM (
+  SELECT selection_outcome
+  FROM {core_vendor_demo}
+  ORDER BY demo_date DESC
+  LIMIT {limit_rows}
+) recent_demos
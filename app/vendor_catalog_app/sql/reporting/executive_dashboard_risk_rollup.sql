@@ -0,0 +1,8 @@
+﻿SELECT
+  owner_org_id AS org_id,
+  GROUPING(owner_org_id) AS all_orgs,
+  risk_tier,
+  COUNT(*) AS vendor_count
+FROM {core_vendor}
+WHERE lifecycle_state = 'active'
+GROUP BY GROUPING SETS ((owner_org_id, risk_tier), (risk_tier))
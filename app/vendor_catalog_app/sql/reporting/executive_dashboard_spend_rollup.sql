@@ -0,0 +1,37 @@
+﻿WITH spend AS (
+  SELECT
+    sf.org_id,
+    sf.category,
+    sf.month,
+    sf.vendor_id,
+    coalesce(v.display_name, v.legal_name) AS vendor_name,
+    v.risk_tier,
+    sf.amount
+  FROM {rpt_spend_fact} sf
+  LEFT JOIN {core_vendor} v
+    ON sf.vendor_id = v.vendor_id
+  WHERE sf.month >= add_months(date_trunc('month', current_date()), -{months_back})
+)
+SELECT
+  org_id,
+  GROUPING(org_id) AS all_orgs,
+  CASE
+    WHEN GROUPING(category) = 0 THEN 'category'
+    WHEN GROUPING(month) = 0 THEN 'month'
+    ELSE 'vendor'
+  END AS grain,
+  category,
+  month,
+  vendor_id,
+  vendor_name,
+  risk_tier,
+  SUM(amount) AS total_spend
+FROM spend
+GROUP BY GROUPING SETS (
+  (org_id, category),
+  (org_id, month),
+  (org_id, vendor_id, vendor_name, risk_tier),
+  (category),
+  (month),
+  (vendor_id, vendor_name, risk_tier)
+)
@@ -0,0 +1,5 @@
+v.vendor_id IN (
+  SELECT sd.vendor_id
+  FROM {app_vendor_search_doc} sd
+  WHERE sd.search_text LIKE %s
+)
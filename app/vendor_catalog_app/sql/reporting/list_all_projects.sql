@@ -29,5 +29,5 @@ LEFT JOIN (
 ) d
   ON p.project_id = d.project_id
 WHERE {where_clause}
-ORDER BY p.status, p.project_name
+ORDER BY p.status, p.project_name, p.project_id
 LIMIT {limit}
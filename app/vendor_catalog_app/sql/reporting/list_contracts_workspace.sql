@@ -24,5 +24,6 @@ ORDER BY
   END,
   c.end_date ASC,
   lower(coalesce(v.display_name, v.legal_name, c.vendor_id)),
-  lower(coalesce(c.contract_number, c.contract_id))
+  lower(coalesce(c.contract_number, c.contract_id)),
+  c.contract_id
 LIMIT {limit}
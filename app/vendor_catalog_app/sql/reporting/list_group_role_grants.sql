@@ -8,5 +8,5 @@ SELECT
 FROM {sec_group_role_map} g
 LEFT JOIN {app_user_directory} gr
   ON lower(g.granted_by) = lower(gr.user_id)
-ORDER BY g.granted_at DESC
+ORDER BY g.granted_at DESC, g.group_principal, g.role_code, g.active_flag
 LIMIT 1000
@@ -10,5 +10,5 @@ LEFT JOIN {app_user_directory} u
   ON lower(g.user_principal) = lower(u.user_id)
 LEFT JOIN {app_user_directory} gr
   ON lower(g.granted_by) = lower(gr.user_id)
-ORDER BY g.granted_at DESC
+ORDER BY g.granted_at DESC, g.user_principal, g.role_code, g.active_flag
 LIMIT 1000
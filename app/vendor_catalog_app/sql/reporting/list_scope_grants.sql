@@ -7,5 +7,5 @@ SELECT
 FROM {sec_user_org_scope} s
 LEFT JOIN {app_user_directory} u
   ON lower(s.user_principal) = lower(u.user_id)
-ORDER BY s.granted_at DESC
+ORDER BY s.granted_at DESC, s.user_principal, s.org_id, s.scope_level, s.active_flag
 LIMIT 1000
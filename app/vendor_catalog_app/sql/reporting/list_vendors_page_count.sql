@@ -1,3 +1,3 @@
-SELECT COUNT(DISTINCT v.vendor_id) AS total_rows
+SELECT COUNT(*) AS total_rows
 FROM {core_vendor} v
 WHERE {where_clause}
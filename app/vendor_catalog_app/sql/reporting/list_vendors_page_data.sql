@@ -1,4 +1,4 @@
-SELECT DISTINCT
+SELECT
   v.vendor_id,
   v.legal_name,
   v.display_name,
@@ -6,7 +6,9 @@ SELECT DISTINCT
   v.owner_org_id,
   v.risk_tier,
   v.source_system,
-  v.updated_at
+  v.updated_at,
+  {sort_expr} AS sort_key,
+  lower(v.vendor_id) AS sort_key_id
 FROM {core_vendor} v
 WHERE {where_clause}
 ORDER BY {sort_expr} {sort_dir}, lower(v.vendor_id) ASC
@@ -0,0 +1,25 @@
+SELECT v.vendor_id FROM {core_vendor} v WHERE v.updated_at > %s
+UNION
+SELECT so.vendor_id FROM {core_vendor_offering} so WHERE so.updated_at > %s
+UNION
+SELECT c.vendor_id FROM {core_contract} c WHERE c.updated_at > %s
+UNION
+SELECT bo.vendor_id FROM {core_vendor_business_owner} bo WHERE bo.updated_at > %s
+UNION
+SELECT so.vendor_id
+FROM {core_offering_business_owner} obo
+INNER JOIN {core_vendor_offering} so
+  ON so.offering_id = obo.offering_id
+WHERE obo.updated_at > %s
+UNION
+SELECT vc.vendor_id FROM {core_vendor_contact} vc WHERE vc.updated_at > %s
+UNION
+SELECT so.vendor_id
+FROM {core_offering_contact} oc
+INNER JOIN {core_vendor_offering} so
+  ON so.offering_id = oc.offering_id
+WHERE oc.updated_at > %s
+UNION
+SELECT d.vendor_id FROM {core_vendor_demo} d WHERE d.updated_at > %s
+UNION
+SELECT p.vendor_id FROM {app_project} p WHERE p.updated_at > %s AND p.vendor_id IS NOT NULL
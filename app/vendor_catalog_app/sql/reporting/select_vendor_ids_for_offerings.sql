@@ -0,0 +1,3 @@
+SELECT DISTINCT so.vendor_id
+FROM {core_vendor_offering} so
+WHERE so.offering_id IN ({offering_ids_placeholders})
@@ -0,0 +1,4 @@
+SELECT
+  count(*) AS row_count,
+  max(updated_at) AS last_updated_at
+FROM {source_table}
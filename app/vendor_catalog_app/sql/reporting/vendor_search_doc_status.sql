@@ -0,0 +1,3 @@
+﻿SELECT
+  (SELECT count(*) FROM {core_vendor}) AS vendor_rows,
+  (SELECT count(*) FROM {app_vendor_search_doc}) AS doc_rows
@@ -0,0 +1,2 @@
+﻿DELETE FROM {app_help_article_render}
+WHERE article_id IN ({article_ids})
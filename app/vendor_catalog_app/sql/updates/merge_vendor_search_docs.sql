@@ -0,0 +1,65 @@
+﻿MERGE INTO {app_vendor_search_doc} AS t
+USING (
+  SELECT
+    v.vendor_id,
+    lower(concat_ws(
+      chr(10),
+      v.vendor_id,
+      v.legal_name,
+      v.display_name,
+      v.owner_org_id,
+      v.risk_tier,
+      v.source_system,
+      v.source_record_id,
+      v.source_batch_id,
+      (
+        SELECT concat_ws(chr(10), collect_list(concat_ws(chr(10), o.offering_id, o.offering_name, o.offering_type, o.lob, o.service_type)))
+        FROM {core_vendor_offering} o
+        WHERE o.vendor_id = v.vendor_id
+      ),
+      (
+        SELECT concat_ws(chr(10), collect_list(concat_ws(chr(10), c.contract_id, c.contract_number, c.contract_status)))
+        FROM {core_contract} c
+        WHERE c.vendor_id = v.vendor_id
+      ),
+      (
+        SELECT concat_ws(chr(10), collect_list(concat_ws(chr(10), bo.owner_user_principal, bo.owner_role)))
+        FROM {core_vendor_business_owner} bo
+        WHERE bo.vendor_id = v.vendor_id
+      ),
+      (
+        SELECT concat_ws(chr(10), collect_list(concat_ws(chr(10), obo.owner_user_principal, obo.owner_role)))
+        FROM {core_offering_business_owner} obo
+        INNER JOIN {core_vendor_offering} o2 ON obo.offering_id = o2.offering_id
+        WHERE o2.vendor_id = v.vendor_id
+      ),
+      (
+        SELECT concat_ws(chr(10), collect_list(concat_ws(chr(10), vc.full_name, vc.email, vc.contact_type, vc.phone)))
+        FROM {core_vendor_contact} vc
+        WHERE vc.vendor_id = v.vendor_id
+      ),
+      (
+        SELECT concat_ws(chr(10), collect_list(concat_ws(chr(10), oc.full_name, oc.email, oc.contact_type, oc.phone)))
+        FROM {core_offering_contact} oc
+        INNER JOIN {core_vendor_offering} o3 ON oc.offering_id = o3.offering_id
+        WHERE o3.vendor_id = v.vendor_id
+      ),
+      (
+        SELECT concat_ws(chr(10), collect_list(concat_ws(chr(10), d.demo_id, d.offering_id, d.selection_outcome, d.non_selection_reason_code, d.notes)))
+        FROM {core_vendor_demo} d
+        WHERE d.vendor_id = v.vendor_id
+      ),
+      (
+        SELECT concat_ws(chr(10), collect_list(concat_ws(chr(10), p.project_id, p.project_name, p.project_type, p.status, p.owner_principal, p.description)))
+        FROM {app_project} p
+        WHERE p.vendor_id = v.vendor_id AND coalesce(p.active_flag, true) = true
+      )
+    )) AS search_text,
+    %s AS updated_at
+  FROM {core_vendor} v
+  WHERE {vendor_filter}
+) AS s
+ON t.vendor_id = s.vendor_id
+WHEN MATCHED THEN UPDATE SET t.search_text = s.search_text, t.updated_at = s.updated_at
+WHEN NOT MATCHED THEN INSERT (vendor_id, search_text, updated_at) VALUES (s.vendor_id, s.search_text, s.updated_at)
+WHEN NOT MATCHED BY SOURCE AND {target_filter} THEN DELETE
@@ -7,7 +7,6 @@ from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from starlette.middleware.sessions import SessionMiddleware
 
 from vendor_catalog_app.infrastructure.logging import setup_app_logging
@@ -18,10 +17,12 @@ from vendor_catalog_app.web.http.middleware import (
     register_request_perf_middleware,
     register_security_headers_middleware,
 )
+from vendor_catalog_app.web.http.session_store import ServerSideSessionMiddleware
 from vendor_catalog_app.web.routers import router as web_router
 from vendor_catalog_app.web.system.lifespan import create_app_lifespan
 from vendor_catalog_app.web.system.metrics import register_prometheus_metrics_route
 from vendor_catalog_app.web.system.settings import load_app_runtime_settings
+from vendor_catalog_app.web.system.templating import TimedJinja2Templates, configure_template_bytecode_cache
 
 
 def _extract_role_from_json(payload_json_str: str | dict) -> str:
@@ -61,23 +62,36 @@ def create_app() -> FastAPI:
     app.state.startup_splash_run_id = uuid.uuid4().hex
 
     base_dir = Path(__file__).resolve().parent
-    templates = Jinja2Templates(directory=str(base_dir / "templates"))
+    templates = TimedJinja2Templates(directory=str(base_dir / "templates"))
     
     # Register custom Jinja2 filters
     templates.env.filters["extract_role"] = _extract_role_from_json
     templates.env.filters["format_date"] = _format_date
+    if settings.template_bytecode_cache_enabled:
+        configure_template_bytecode_cache(templates, settings.template_bytecode_cache_dir)
     
     app.state.templates = templates
 
     register_security_headers_middleware(app, settings)
     register_request_perf_middleware(app, settings, observability)
 
-    app.add_middleware(
-        SessionMiddleware,
-        secret_key=settings.session_secret,
-        same_site="lax",
-        https_only=settings.session_https_only,
-    )
+    if settings.session_store is not None:
+        app.add_middleware(
+            ServerSideSessionMiddleware,
+            store=settings.session_store,
+            secret_key=settings.session_secret,
+            max_age=settings.session_max_age_sec,
+            same_site="lax",
+            https_only=settings.session_https_only,
+        )
+    else:
+        app.add_middleware(
+            SessionMiddleware,
+            secret_key=settings.session_secret,
+            max_age=settings.session_max_age_sec,
+            same_site="lax",
+            https_only=settings.session_https_only,
+        )
 
     register_prometheus_metrics_route(
         app,
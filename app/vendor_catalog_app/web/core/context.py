@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from vendor_catalog_app.core.config import AppConfig
+from vendor_catalog_app.core.role_policy import CompiledRolePolicy
 from vendor_catalog_app.core.security import (
     ADMIN_PORTAL_ROLES,
     CHANGE_APPROVAL_LEVELS,
@@ -26,6 +27,7 @@ class UserContext:
     config: AppConfig
     role_override: str | None = None
     role_policy: dict[str, object] | None = None
+    compiled_policy: CompiledRolePolicy | None = None
 
     @property
     def is_admin(self) -> bool:
@@ -79,6 +81,8 @@ class UserContext:
         return approval_level_for_roles(self.roles)
 
     def can_apply_change(self, change_type: str) -> bool:
+        if self.compiled_policy is not None:
+            return self.compiled_policy.allows(change_type)
         if self.role_policy is not None:
             allowed_raw = self.role_policy.get("allowed_change_actions", [])
             allowed_actions = {
@@ -58,6 +58,10 @@ def _apply_runtime_override(base: AppConfig, override: dict[str, str]) -> AppCon
         base,
         databricks_server_hostname=(_clean_hostname(host) if host else base.databricks_server_hostname),
         databricks_http_path=(http_path if http_path else base.databricks_http_path),
+        # A runtime warehouse override routes every workload class to that warehouse.
+        databricks_reporting_http_path=(
+            "" if (host or http_path) else base.databricks_reporting_http_path
+        ),
         databricks_token=(
             str(values.get("databricks_token", "") or "").strip()
             if token_override
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from typing import Any
 
 from fastapi import Request
@@ -51,6 +52,8 @@ from vendor_catalog_app.web.core.runtime import get_repo, testing_role_override_
 from vendor_catalog_app.web.http.flash import pop_flashes
 from vendor_catalog_app.web.security.controls import CSRF_SESSION_KEY
 
+LOGGER = logging.getLogger(__name__)
+
 LOADING_OVERLAY_MIN_DELAY_MS = get_env_int(
     TVENDOR_LOADING_OVERLAY_MIN_DELAY_MS,
     default=DEFAULT_LOADING_OVERLAY_MIN_DELAY_MS,
@@ -110,6 +113,54 @@ def _lookup_values(
     return options or list(fallback)
 
 
+# Template context key, lookup type, prefer label over code, fallback options.
+_TEMPLATE_LOOKUP_OPTION_SPECS: tuple[tuple[str, str, bool, tuple[str, ...]], ...] = (
+    ("doc_source_options", LOOKUP_TYPE_DOC_SOURCE, False, tuple(DEFAULT_DOC_SOURCE_OPTIONS)),
+    ("doc_tag_options", LOOKUP_TYPE_DOC_TAG, False, tuple(DEFAULT_DOC_TAG_OPTIONS)),
+    ("owner_role_options", LOOKUP_TYPE_OWNER_ROLE, False, tuple(DEFAULT_OWNER_ROLE_OPTIONS)),
+    ("assignment_type_options", LOOKUP_TYPE_ASSIGNMENT_TYPE, False, tuple(DEFAULT_ASSIGNMENT_TYPE_OPTIONS)),
+    ("contact_type_options", LOOKUP_TYPE_CONTACT_TYPE, False, tuple(DEFAULT_CONTACT_TYPE_OPTIONS)),
+    ("project_type_options", LOOKUP_TYPE_PROJECT_TYPE, False, tuple(DEFAULT_PROJECT_TYPE_OPTIONS)),
+    (
+        "offering_type_options",
+        LOOKUP_TYPE_OFFERING_TYPE,
+        True,
+        tuple(label for _, label in DEFAULT_OFFERING_TYPE_CHOICES),
+    ),
+    (
+        "offering_lob_options",
+        LOOKUP_TYPE_OFFERING_LOB,
+        True,
+        tuple(label for _, label in DEFAULT_OFFERING_LOB_CHOICES),
+    ),
+    (
+        "offering_service_type_options",
+        LOOKUP_TYPE_OFFERING_SERVICE_TYPE,
+        True,
+        tuple(label for _, label in DEFAULT_OFFERING_SERVICE_TYPE_CHOICES),
+    ),
+)
+
+
+def _default_template_lookup_options() -> dict[str, tuple[str, ...]]:
+    return {key: fallback for key, _, _, fallback in _TEMPLATE_LOOKUP_OPTION_SPECS}
+
+
+def _compile_template_lookup_options(lookup_df) -> dict[str, tuple[str, ...]]:
+    lookup_rows = lookup_df.to_dict("records") if not lookup_df.empty else []
+    return {
+        key: tuple(
+            _lookup_values(
+                lookup_rows,
+                lookup_type=lookup_type,
+                prefer_label=prefer_label,
+                fallback=list(fallback),
+            )
+        )
+        for key, lookup_type, prefer_label, fallback in _TEMPLATE_LOOKUP_OPTION_SPECS
+    }
+
+
 def base_template_context(
     request: Request,
     context: UserContext,
@@ -152,86 +203,18 @@ def base_template_context(
     except Exception:
         user_display_name = display_name_for_principal(context.user_principal)
 
-    role_options = list(ROLE_CHOICES)
-    try:
-        role_options = repo.list_known_roles()
-    except Exception:
-        role_options = list(ROLE_CHOICES)
     testing_override_allowed = testing_role_override_enabled(context.config)
-    if not testing_override_allowed:
-        role_options = []
+    role_options: list[str] = []
+    if testing_override_allowed:
+        try:
+            role_options = list(repo.compiled_known_roles())
+        except Exception:
+            role_options = list(ROLE_CHOICES)
+    lookup_options = _default_template_lookup_options()
     try:
-        doc_owner_options = repo.search_user_directory(q="", limit=200).to_dict("records")
-    except Exception:
-        doc_owner_options = []
-    doc_source_options = list(DEFAULT_DOC_SOURCE_OPTIONS)
-    doc_tag_options = list(DEFAULT_DOC_TAG_OPTIONS)
-    owner_role_options = list(DEFAULT_OWNER_ROLE_OPTIONS)
-    assignment_type_options = list(DEFAULT_ASSIGNMENT_TYPE_OPTIONS)
-    contact_type_options = list(DEFAULT_CONTACT_TYPE_OPTIONS)
-    project_type_options = list(DEFAULT_PROJECT_TYPE_OPTIONS)
-    offering_type_options = [label for _, label in DEFAULT_OFFERING_TYPE_CHOICES]
-    offering_lob_options = [label for _, label in DEFAULT_OFFERING_LOB_CHOICES]
-    offering_service_type_options = [label for _, label in DEFAULT_OFFERING_SERVICE_TYPE_CHOICES]
-    try:
-        lookup_df = repo.list_lookup_options(active_only=True)
-        lookup_rows = lookup_df.to_dict("records") if not lookup_df.empty else []
-        doc_source_options = _lookup_values(
-            lookup_rows,
-            lookup_type=LOOKUP_TYPE_DOC_SOURCE,
-            prefer_label=False,
-            fallback=doc_source_options,
-        )
-        doc_tag_options = _lookup_values(
-            lookup_rows,
-            lookup_type=LOOKUP_TYPE_DOC_TAG,
-            prefer_label=False,
-            fallback=doc_tag_options,
-        )
-        owner_role_options = _lookup_values(
-            lookup_rows,
-            lookup_type=LOOKUP_TYPE_OWNER_ROLE,
-            prefer_label=False,
-            fallback=owner_role_options,
-        )
-        assignment_type_options = _lookup_values(
-            lookup_rows,
-            lookup_type=LOOKUP_TYPE_ASSIGNMENT_TYPE,
-            prefer_label=False,
-            fallback=assignment_type_options,
-        )
-        contact_type_options = _lookup_values(
-            lookup_rows,
-            lookup_type=LOOKUP_TYPE_CONTACT_TYPE,
-            prefer_label=False,
-            fallback=contact_type_options,
-        )
-        project_type_options = _lookup_values(
-            lookup_rows,
-            lookup_type=LOOKUP_TYPE_PROJECT_TYPE,
-            prefer_label=False,
-            fallback=project_type_options,
-        )
-        offering_type_options = _lookup_values(
-            lookup_rows,
-            lookup_type=LOOKUP_TYPE_OFFERING_TYPE,
-            prefer_label=True,
-            fallback=offering_type_options,
-        )
-        offering_lob_options = _lookup_values(
-            lookup_rows,
-            lookup_type=LOOKUP_TYPE_OFFERING_LOB,
-            prefer_label=True,
-            fallback=offering_lob_options,
-        )
-        offering_service_type_options = _lookup_values(
-            lookup_rows,
-            lookup_type=LOOKUP_TYPE_OFFERING_SERVICE_TYPE,
-            prefer_label=True,
-            fallback=offering_service_type_options,
-        )
+        lookup_options = repo.compiled_lookup_options("template_context", _compile_template_lookup_options)
     except Exception:
-        pass
+        LOGGER.warning("Failed to load lookup options for the page layout; using defaults.", exc_info=True)
 
     csrf_token = str(getattr(request.state, "csrf_token", "") or "").strip()
     if not csrf_token:
@@ -270,16 +253,6 @@ def base_template_context(
         "locked_mode": config_locked_mode,
         "csrf_token": csrf_token,
         "flashes": pop_flashes(request),
-        "doc_source_options": doc_source_options,
-        "doc_tag_options": doc_tag_options,
-        "doc_owner_options": doc_owner_options,
-        "owner_role_options": owner_role_options,
-        "assignment_type_options": assignment_type_options,
-        "contact_type_options": contact_type_options,
-        "project_type_options": project_type_options,
-        "offering_type_options": offering_type_options,
-        "offering_lob_options": offering_lob_options,
-        "offering_service_type_options": offering_service_type_options,
         "loading_overlay_min_delay_ms": min(
             LOADING_OVERLAY_MIN_DELAY_MS,
             LOADING_OVERLAY_MAX_DELAY_MS,
@@ -292,6 +265,7 @@ def base_template_context(
         "loading_overlay_slow_status_ms": LOADING_OVERLAY_SLOW_STATUS_MS,
         "loading_overlay_safety_ms": LOADING_OVERLAY_SAFETY_MS,
     }
+    payload.update({key: list(values) for key, values in lookup_options.items()})
     if extra:
         payload.update(extra)
     return payload
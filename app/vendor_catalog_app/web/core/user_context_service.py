@@ -13,6 +13,7 @@ from vendor_catalog_app.core.security import (
     ROLE_ADMIN,
     ROLE_CHOICES,
 )
+from vendor_catalog_app.infrastructure.db import request_phase_timer
 from vendor_catalog_app.repository import UNKNOWN_USER_PRINCIPAL, VendorRepository
 from vendor_catalog_app.web.core.context import UserContext
 from vendor_catalog_app.web.core.identity import (
@@ -81,7 +82,11 @@ def get_user_context(request: Request) -> UserContext:
     cached = getattr(request.state, "user_context", None)
     if cached is not None:
         return cached
+    with request_phase_timer("user_context"):
+        return _load_user_context(request)
 
+
+def _load_user_context(request: Request) -> UserContext:
     repo = get_repo()
     config = get_config()
     dev_allow_all_access = bool(
@@ -175,7 +180,12 @@ def get_user_context(request: Request) -> UserContext:
             if str(item).strip()
         } or set(raw_roles)
         role_override = str(snapshot.get("role_override") or "").strip() or None
-        role_policy = snapshot.get("role_policy") if isinstance(snapshot.get("role_policy"), dict) else None
+        snapshot_policy = snapshot.get("role_policy") if isinstance(snapshot.get("role_policy"), dict) else None
+        compiled_policy = repo.compiled_role_policy(
+            roles,
+            policy_version=policy_version,
+            resolved_policy=snapshot_policy,
+        )
     else:
         if user_principal == UNKNOWN_USER_PRINCIPAL:
             raw_roles = set()
@@ -191,12 +201,12 @@ def get_user_context(request: Request) -> UserContext:
             known_roles,
             allow_testing_override=testing_role_override_enabled(config),
         )
-        role_policy = repo.resolve_role_policy(roles)
+        compiled_policy = repo.compiled_role_policy(roles, policy_version=policy_version)
         if dev_allow_all_access:
             raw_roles = {ROLE_ADMIN}
             roles = {ROLE_ADMIN}
             role_override = None
-            role_policy = repo.resolve_role_policy(roles)
+            compiled_policy = repo.compiled_role_policy(roles, policy_version=policy_version)
         if isinstance(session, dict) and snapshot_ttl_sec > 0:
             session[snapshot_key] = {
                 "captured_at": now_ts,
@@ -205,7 +215,7 @@ def get_user_context(request: Request) -> UserContext:
                 "roles": sorted(roles),
                 "role_override": role_override or "",
                 "group_principals": sorted(group_principals),
-                "role_policy": dict(role_policy or {}),
+                "role_policy": dict(compiled_policy.policy),
                 "dev_allow_all_access": dev_allow_all_access,
             }
 
@@ -213,7 +223,7 @@ def get_user_context(request: Request) -> UserContext:
         raw_roles = {ROLE_ADMIN}
         roles = {ROLE_ADMIN}
         role_override = None
-        role_policy = repo.resolve_role_policy(roles)
+        compiled_policy = repo.compiled_role_policy(roles, policy_version=policy_version)
 
     context = UserContext(
         user_principal=user_principal,
@@ -221,7 +231,8 @@ def get_user_context(request: Request) -> UserContext:
         raw_roles=raw_roles,
         config=config,
         role_override=role_override,
-        role_policy=role_policy,
+        role_policy=compiled_policy.policy,
+        compiled_policy=compiled_policy,
     )
     request.state.user_context = context
     return context
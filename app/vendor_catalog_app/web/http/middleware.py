@@ -7,10 +7,12 @@ from urllib.parse import quote
 
 from fastapi import FastAPI, Request
 from fastapi.responses import PlainTextResponse, RedirectResponse
+from starlette.concurrency import run_in_threadpool
 
 from vendor_catalog_app.infrastructure.db import (
     clear_request_perf_context,
     get_request_perf_context,
+    record_request_phase_ms,
     start_request_perf_context,
 )
 from vendor_catalog_app.web.http.errors import api_error_response, is_api_request, normalize_exception
@@ -22,6 +24,7 @@ from vendor_catalog_app.web.security.controls import (
     request_requires_write_protection,
 )
 from vendor_catalog_app.web.system.settings import AppRuntimeSettings
+from vendor_catalog_app.web.system.worker_pool import worker_thread_limiter_snapshot
 
 LOGGER = logging.getLogger(__name__)
 PERF_LOGGER = logging.getLogger("vendor_catalog_app.perf")
@@ -38,6 +41,10 @@ PROTECTED_UI_PATH_PREFIXES = (
     "/workflows",
     "/pending-approvals",
 )
+WORKER_ADMISSION_BYPASS_PREFIXES = (
+    "/static",
+    "/api/health",
+)
 
 
 def _route_path_label(request: Request) -> str:
@@ -63,6 +70,58 @@ def _request_target_path(request: Request) -> str:
     return path
 
 
+def _bypasses_worker_admission(path: str, observability) -> bool:
+    if any(path == prefix or path.startswith(f"{prefix}/") for prefix in WORKER_ADMISSION_BYPASS_PREFIXES):
+        return True
+    metrics_path = str(getattr(observability, "prometheus_path", "") or "")
+    return bool(metrics_path) and path == metrics_path
+
+
+def _record_worker_admission(observability, gate, queue_wait_ms: float | None) -> None:
+    recorder = getattr(observability, "record_worker_admission", None)
+    if recorder is None:
+        return
+    gate_state = gate.snapshot()
+    threads = worker_thread_limiter_snapshot()
+    recorder(
+        queue_wait_ms=queue_wait_ms,
+        active=gate_state["active"],
+        queued=gate_state["queued"],
+        limit=threads["total_threads"],
+        threads_busy=threads["busy_threads"],
+    )
+
+
+def _server_timing_header(
+    *,
+    total_ms: float,
+    app_ms: float,
+    db_total_ms: float,
+    db_calls: int,
+    db_cache_hits: int,
+    phase_ms: dict[str, float],
+    load_graphs: list[dict] | None = None,
+) -> str:
+    entries = [
+        f'total;dur={total_ms:.2f};desc="Total"',
+        f'mw;dur={max(0.0, total_ms - app_ms):.2f};desc="Middleware"',
+        f'app;dur={app_ms:.2f};desc="Route handler"',
+        f'user;dur={float(phase_ms.get("user_context", 0.0)):.2f};desc="User context"',
+        f'db;dur={db_total_ms:.2f};desc="DB ({int(db_calls)} calls)"',
+        f'cache;desc="DB cache hits: {int(db_cache_hits)}"',
+        f'tpl;dur={float(phase_ms.get("template", 0.0)):.2f};desc="Template render"',
+    ]
+    if "queue" in phase_ms:
+        entries.append(f'queue;dur={float(phase_ms["queue"]):.2f};desc="Worker queue wait"')
+    for graph in load_graphs or []:
+        critical_path = " > ".join(str(name) for name in graph.get("critical_path") or [])
+        entries.append(
+            f'load;dur={float(graph.get("wall_ms") or 0.0):.2f};'
+            f'desc="{graph.get("name")} critical: {critical_path}"'
+        )
+    return ", ".join(entries)
+
+
 def register_security_headers_middleware(app: FastAPI, settings: AppRuntimeSettings) -> None:
     if not settings.security_headers_enabled:
         return
@@ -93,6 +152,7 @@ def register_request_perf_middleware(app: FastAPI, settings: AppRuntimeSettings,
             slow_query_ms=settings.slow_query_ms,
         )
         started = time.perf_counter()
+        app_ms = 0.0
         response = None
         status_code = 500
         runtime_override_tokens = None
@@ -173,7 +233,11 @@ def register_request_perf_middleware(app: FastAPI, settings: AppRuntimeSettings,
 
             if request_requires_write_protection(request.method):
                 limiter_key = f"{request_rate_limit_key(request)}:{request.method.upper()}"
-                allowed, retry_after = settings.write_rate_limiter.allow(limiter_key)
+                limiter = settings.write_rate_limiter
+                if limiter.blocking:
+                    allowed, retry_after = await run_in_threadpool(limiter.allow, limiter_key)
+                else:
+                    allowed, retry_after = limiter.allow(limiter_key)
                 if not allowed:
                     LOGGER.warning(
                         (
@@ -208,6 +272,44 @@ def register_request_perf_middleware(app: FastAPI, settings: AppRuntimeSettings,
                     status_code = response.status_code
                     return response
 
+            gate = settings.worker_admission_gate
+            admitted = False
+            if gate.enabled and not _bypasses_worker_admission(path, observability):
+                queue_wait_ms = await gate.acquire()
+                _record_worker_admission(observability, gate, queue_wait_ms)
+                if queue_wait_ms is None:
+                    LOGGER.warning(
+                        "Rejected request because the worker queue is full. method=%s path=%s max_queue=%s",
+                        request.method,
+                        request.url.path,
+                        gate.max_queue,
+                        extra={
+                            "event": "worker_admission_rejected",
+                            "method": request.method,
+                            "path": str(request.url.path),
+                            "max_concurrency": int(gate.max_concurrency),
+                            "max_queue": int(gate.max_queue),
+                            "retry_after_sec": int(gate.retry_after_sec),
+                        },
+                    )
+                    message = "Server is busy. Please retry shortly."
+                    if is_api_request(request):
+                        response = api_error_response(
+                            request,
+                            status_code=503,
+                            code="SERVICE_UNAVAILABLE",
+                            message=message,
+                        )
+                    else:
+                        response = PlainTextResponse(message, status_code=503)
+                    response.headers["Retry-After"] = str(gate.retry_after_sec)
+                    status_code = response.status_code
+                    return response
+                admitted = True
+                if queue_wait_ms > 0:
+                    record_request_phase_ms("queue", queue_wait_ms)
+
+            app_started = time.perf_counter()
             try:
                 response = await call_next(request)
             except Exception as exc:
@@ -224,6 +326,10 @@ def register_request_perf_middleware(app: FastAPI, settings: AppRuntimeSettings,
                 )
                 status_code = response.status_code
                 return response
+            finally:
+                app_ms = (time.perf_counter() - app_started) * 1000.0
+                if admitted:
+                    gate.release()
 
             status_code = response.status_code
             return response
@@ -235,7 +341,12 @@ def register_request_perf_middleware(app: FastAPI, settings: AppRuntimeSettings,
             db_max_ms = float(ctx.get("db_max_ms", 0.0))
             db_cache_hits = int(ctx.get("db_cache_hits", 0))
             db_errors = int(ctx.get("db_errors", 0))
+            db_retries = int(ctx.get("db_retries", 0))
+            memo_hits = int(ctx.get("memo_hits", 0))
             slow_queries = list(ctx.get("slow_queries", []))
+            query_fingerprints = dict(ctx.get("query_fingerprints", {}))
+            phase_ms = dict(ctx.get("phase_ms", {}))
+            load_graphs = list(ctx.get("load_graphs", []))
             request_id = str(ctx.get("request_id") or request_id or "-")
             route_path = _route_path_label(request)
 
@@ -248,13 +359,15 @@ def register_request_perf_middleware(app: FastAPI, settings: AppRuntimeSettings,
                 db_total_ms=db_total_ms,
                 db_cache_hits=db_cache_hits,
                 db_errors=db_errors,
+                db_retries=db_retries,
             )
 
             if settings.perf_enabled:
                 PERF_LOGGER.info(
                     (
                         "request_perf id=%s method=%s path=%s status=%s total_ms=%.2f "
-                        "db_calls=%s db_ms=%.2f db_max_ms=%.2f db_cache_hits=%s db_errors=%s"
+                        "db_calls=%s db_ms=%.2f db_max_ms=%.2f db_cache_hits=%s db_errors=%s db_retries=%s "
+                        "memo_hits=%s"
                     ),
                     request_id,
                     request.method,
@@ -266,6 +379,8 @@ def register_request_perf_middleware(app: FastAPI, settings: AppRuntimeSettings,
                     db_max_ms,
                     db_cache_hits,
                     db_errors,
+                    db_retries,
+                    memo_hits,
                     extra={
                         "event": "request_perf",
                         "request_id": request_id,
@@ -278,6 +393,8 @@ def register_request_perf_middleware(app: FastAPI, settings: AppRuntimeSettings,
                         "db_max_ms": round(float(db_max_ms), 2),
                         "db_cache_hits": int(db_cache_hits),
                         "db_errors": int(db_errors),
+                        "db_retries": int(db_retries),
+                        "memo_hits": int(memo_hits),
                     },
                 )
                 for query in slow_queries:
@@ -302,12 +419,71 @@ def register_request_perf_middleware(app: FastAPI, settings: AppRuntimeSettings,
                         },
                     )
 
+                for graph in load_graphs:
+                    critical_path = list(graph.get("critical_path") or [])
+                    PERF_LOGGER.info(
+                        "request_load_graph id=%s name=%s parallel=%s wall_ms=%.2f sum_ms=%.2f critical_path=%s",
+                        request_id,
+                        graph.get("name"),
+                        graph.get("parallel"),
+                        float(graph.get("wall_ms") or 0.0),
+                        float(graph.get("sum_ms") or 0.0),
+                        " > ".join(str(name) for name in critical_path),
+                        extra={
+                            "event": "request_load_graph",
+                            "request_id": request_id,
+                            "graph": graph.get("name"),
+                            "parallel": bool(graph.get("parallel")),
+                            "wall_ms": float(graph.get("wall_ms") or 0.0),
+                            "sum_ms": float(graph.get("sum_ms") or 0.0),
+                            "critical_path": critical_path,
+                            "loads_ms": dict(graph.get("loads_ms") or {}),
+                        },
+                    )
+
+            if settings.n_plus_one_threshold > 0:
+                for sql_hash, fingerprint in query_fingerprints.items():
+                    repeat_count = int(fingerprint.get("count", 0))
+                    if repeat_count < settings.n_plus_one_threshold:
+                        continue
+                    PERF_LOGGER.warning(
+                        "n_plus_one id=%s method=%s path=%s count=%s threshold=%s hash=%s sql=%s",
+                        request_id,
+                        request.method,
+                        route_path,
+                        repeat_count,
+                        settings.n_plus_one_threshold,
+                        sql_hash,
+                        fingerprint.get("sql"),
+                        extra={
+                            "event": "n_plus_one",
+                            "request_id": request_id,
+                            "method": request.method,
+                            "path": route_path,
+                            "count": repeat_count,
+                            "threshold": int(settings.n_plus_one_threshold),
+                            "sql_hash": sql_hash,
+                            "sql_preview": fingerprint.get("sql"),
+                        },
+                    )
+
             if response is not None:
                 if settings.request_id_header_enabled:
                     response.headers["X-Request-ID"] = request_id
                 if settings.perf_enabled and settings.perf_header_enabled:
                     response.headers["X-TVendor-Perf"] = (
-                        f"total_ms={elapsed_ms:.2f};db_ms={db_total_ms:.2f};db_calls={db_calls};cache_hits={db_cache_hits}"
+                        f"total_ms={elapsed_ms:.2f};db_ms={db_total_ms:.2f};db_calls={db_calls};cache_hits={db_cache_hits};"
+                        f"memo_hits={memo_hits}"
+                    )
+                if settings.server_timing_enabled:
+                    response.headers["Server-Timing"] = _server_timing_header(
+                        total_ms=elapsed_ms,
+                        app_ms=app_ms,
+                        db_total_ms=db_total_ms,
+                        db_calls=db_calls,
+                        db_cache_hits=db_cache_hits,
+                        phase_ms=phase_ms,
+                        load_graphs=load_graphs,
                     )
 
             if runtime_override_tokens is not None:
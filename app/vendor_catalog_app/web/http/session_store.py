@@ -0,0 +1,476 @@
+from __future__ import annotations
+
+import json
+import logging
+import secrets
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+import anyio
+import itsdangerous
+from itsdangerous.exc import BadSignature
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LOGGER = logging.getLogger(__name__)
+
+SESSION_BACKEND_COOKIE = "cookie"
+SESSION_BACKEND_MEMORY = "memory"
+SESSION_BACKEND_SQLITE = "sqlite"
+SESSION_BACKENDS = (SESSION_BACKEND_COOKIE, SESSION_BACKEND_MEMORY, SESSION_BACKEND_SQLITE)
+SESSION_SQLITE_FILE_NAME = "sessions.db"
+DEFAULT_SESSION_SQLITE_PATH = Path(tempfile.gettempdir()) / "tvendor_sessions" / SESSION_SQLITE_FILE_NAME
+DEFAULT_SESSION_MAX_AGE_SEC = 14 * 24 * 60 * 60
+
+
+def _encode_session(data: dict[str, Any]) -> str:
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class SessionStore(ABC):
+    """Server-side session payloads keyed by an opaque session id.
+
+    Payloads are the JSON text produced by the middleware; stores never parse them.
+    ``touch`` extends the expiry only once half of the TTL has elapsed and reports whether
+    it did, so the middleware refreshes the cookie at most that often.
+    """
+
+    name = "base"
+    blocking = False
+
+    def __init__(self, *, ttl_sec: int) -> None:
+        self.ttl_sec = max(1, int(ttl_sec))
+
+    @abstractmethod
+    def load(self, session_id: str) -> str | None:
+        ...
+
+    @abstractmethod
+    def save(self, session_id: str, payload: str) -> None:
+        ...
+
+    @abstractmethod
+    def touch(self, session_id: str) -> bool:
+        ...
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        ...
+
+    def close(self) -> None:
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": self.name}
+
+
+class InMemorySessionStore(SessionStore):
+    """Process-local LRU of session payloads. Suitable for a single worker."""
+
+    name = SESSION_BACKEND_MEMORY
+
+    def __init__(self, *, ttl_sec: int, max_entries: int) -> None:
+        super().__init__(ttl_sec=ttl_sec)
+        self._max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        # session_id -> (payload, expires_at)
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._evictions = 0
+
+    def load(self, session_id: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            if entry[1] <= now:
+                del self._entries[session_id]
+                return None
+            self._entries.move_to_end(session_id)
+            return entry[0]
+
+    def save(self, session_id: str, payload: str) -> None:
+        with self._lock:
+            self._entries[session_id] = (payload, time.time() + self.ttl_sec)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def touch(self, session_id: str) -> bool:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or entry[1] - now > self.ttl_sec / 2:
+                return False
+            self._entries[session_id] = (entry[0], now + self.ttl_sec)
+            return True
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def close(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"backend": self.name, "entries": len(self._entries), "evictions": int(self._evictions)}
+
+
+class SqliteSessionStore(SessionStore):
+    """Session payloads in a local SQLite file shared by every worker on the host.
+
+    Uses WAL so readers never block the single writer; each thread keeps its own
+    connection. The file is created on first use, not at construction. Expired rows are
+    ignored on read and purged every ``purge_every`` saves.
+    """
+
+    name = SESSION_BACKEND_SQLITE
+    blocking = True
+
+    def __init__(self, *, path: str | Path, ttl_sec: int, purge_every: int = 500) -> None:
+        super().__init__(ttl_sec=ttl_sec)
+        self.path = Path(path)
+        self._purge_every = max(1, int(purge_every))
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        self._saves = 0
+        self._schema_ready = False
+
+    def _ensure_schema(self) -> None:
+        with self._lock:
+            if self._schema_ready:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(str(self.path), timeout=5.0, isolation_level=None)) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS app_session ("
+                    "session_id TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_app_session_expires_at ON app_session (expires_at)")
+            self._schema_ready = True
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self._ensure_schema()
+            conn = sqlite3.connect(str(self.path), timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def load(self, session_id: str) -> str | None:
+        row = self._connection().execute(
+            "SELECT payload FROM app_session WHERE session_id = ? AND expires_at > ?",
+            (session_id, time.time()),
+        ).fetchone()
+        return None if row is None else str(row[0])
+
+    def save(self, session_id: str, payload: str) -> None:
+        now = time.time()
+        conn = self._connection()
+        conn.execute(
+            "INSERT INTO app_session (session_id, payload, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(session_id) DO UPDATE SET payload = excluded.payload, expires_at = excluded.expires_at",
+            (session_id, payload, now + self.ttl_sec),
+        )
+        with self._lock:
+            self._saves += 1
+            purge = self._saves % self._purge_every == 0
+        if purge:
+            conn.execute("DELETE FROM app_session WHERE expires_at <= ?", (now,))
+
+    def touch(self, session_id: str) -> bool:
+        now = time.time()
+        cursor = self._connection().execute(
+            "UPDATE app_session SET expires_at = ? WHERE session_id = ? AND expires_at > ? AND expires_at <= ?",
+            (now + self.ttl_sec, session_id, now, now + self.ttl_sec / 2),
+        )
+        return cursor.rowcount > 0
+
+    def delete(self, session_id: str) -> None:
+        self._connection().execute("DELETE FROM app_session WHERE session_id = ?", (session_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception:
+                LOGGER.debug("Failed to close session store connection.", exc_info=True)
+        self._local = threading.local()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"backend": self.name, "path": str(self.path), "saves": int(self._saves)}
+
+
+def build_session_store(
+    backend: str,
+    *,
+    ttl_sec: int,
+    sqlite_path: str | Path | None,
+    memory_max_entries: int,
+) -> SessionStore | None:
+    """Store for ``backend``; None for signed-cookie sessions. No store opens a file here."""
+    normalized = str(backend or "").strip().lower()
+    if normalized == SESSION_BACKEND_MEMORY:
+        return InMemorySessionStore(ttl_sec=ttl_sec, max_entries=memory_max_entries)
+    if normalized == SESSION_BACKEND_SQLITE:
+        return SqliteSessionStore(path=sqlite_path or DEFAULT_SESSION_SQLITE_PATH, ttl_sec=ttl_sec)
+    return None
+
+
+class LazySession(dict):
+    """Session dict that reads its payload from the store on first access.
+
+    Requests that never touch ``request.session`` (static assets, health checks, most API
+    reads) cost no store round trip and no commit. ``payload`` is the serialized form as loaded, which
+    the middleware compares against to skip writing unchanged sessions. A loader returning
+    None means the store could not be read; ``load_failed`` then stops the middleware from
+    writing the empty stand-in over the stored session.
+    """
+
+    def __init__(self, loader: Callable[[], dict[str, Any] | None]) -> None:
+        super().__init__()
+        self._loader = loader
+        self.loaded = False
+        self.accessed = False
+        self.load_failed = False
+        self.payload = _encode_session({})
+        self.rotate_id = False
+
+    def _ensure_loaded(self) -> None:
+        self.accessed = True
+        if not self.loaded:
+            self.set_loaded(self._loader())
+
+    def set_loaded(self, data: dict[str, Any] | None) -> None:
+        """Fill the session from an already loaded payload (None when the load failed)."""
+        self.loaded = True
+        self.load_failed = data is None
+        dict.update(self, data or {})
+        self.payload = _encode_session(data or {})
+
+    def __getitem__(self, key):
+        self._ensure_loaded()
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value) -> None:
+        self._ensure_loaded()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        self._ensure_loaded()
+        super().__delitem__(key)
+
+    def __contains__(self, key) -> bool:
+        self._ensure_loaded()
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self._ensure_loaded()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return super().__len__()
+
+    def __repr__(self) -> str:
+        self._ensure_loaded()
+        return super().__repr__()
+
+    def __eq__(self, other) -> bool:
+        self._ensure_loaded()
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def get(self, key, default=None):
+        self._ensure_loaded()
+        return super().get(key, default)
+
+    def setdefault(self, key, default=None):
+        self._ensure_loaded()
+        return super().setdefault(key, default)
+
+    def pop(self, key, *args):
+        self._ensure_loaded()
+        return super().pop(key, *args)
+
+    def popitem(self):
+        self._ensure_loaded()
+        return super().popitem()
+
+    def update(self, *args, **kwargs) -> None:
+        self._ensure_loaded()
+        super().update(*args, **kwargs)
+
+    def clear(self) -> None:
+        self._ensure_loaded()
+        super().clear()
+
+    def keys(self):
+        self._ensure_loaded()
+        return super().keys()
+
+    def values(self):
+        self._ensure_loaded()
+        return super().values()
+
+    def items(self):
+        self._ensure_loaded()
+        return super().items()
+
+    def copy(self) -> dict[str, Any]:
+        self._ensure_loaded()
+        return dict(super().items())
+
+
+def rotate_session_id(session: Any) -> None:
+    """Move ``session`` to a fresh id when the response is sent; call on login or privilege change.
+
+    The old id is deleted from the store, so a cookie captured before the change stops
+    working. Signed-cookie sessions carry no id and are left alone.
+    """
+    if isinstance(session, LazySession):
+        session._ensure_loaded()
+        session.rotate_id = True
+
+
+class ServerSideSessionMiddleware:
+    """Session middleware whose cookie carries only a signed session id.
+
+    Drop-in for Starlette's ``SessionMiddleware``: ``scope["session"]`` is still a dict,
+    but its contents live in ``store``. Non-blocking stores are read lazily on first access;
+    blocking ones are read in a worker thread before the app runs. Only sessions the app
+    accessed are committed: written when the serialized session changed, otherwise just
+    having their expiry extended once half of it has elapsed. Every write or extension re-signs the
+    cookie, and ``rotate_session_id`` swaps the id on login or privilege change.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        store: SessionStore,
+        secret_key: str,
+        session_cookie: str = "session",
+        max_age: int = DEFAULT_SESSION_MAX_AGE_SEC,
+        path: str = "/",
+        same_site: str = "lax",
+        https_only: bool = False,
+    ) -> None:
+        self.app = app
+        self.store = store
+        self.signer = itsdangerous.TimestampSigner(str(secret_key))
+        self.session_cookie = session_cookie
+        self.max_age = int(max_age)
+        self.path = path
+        self.security_flags = "httponly; samesite=" + same_site
+        if https_only:
+            self.security_flags += "; secure"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        session_id = self._session_id_from_cookie(HTTPConnection(scope))
+        session = LazySession(lambda: self._load(session_id))
+        if session_id and self.store.blocking:
+            # Async middleware reads request.session on the event loop; load it off-loop here.
+            session.set_loaded(await self._run_store(self._load, session_id))
+        scope["session"] = session
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                await self._commit(session, session_id, message)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _session_id_from_cookie(self, connection: HTTPConnection) -> str | None:
+        raw = connection.cookies.get(self.session_cookie)
+        if not raw:
+            return None
+        try:
+            return self.signer.unsign(raw.encode("utf-8"), max_age=self.max_age).decode("utf-8")
+        except (BadSignature, UnicodeDecodeError):
+            return None
+
+    def _load(self, session_id: str | None) -> dict[str, Any] | None:
+        if not session_id:
+            return {}
+        try:
+            payload = self.store.load(session_id)
+        except Exception:
+            LOGGER.warning("Failed to load server-side session; leaving it untouched.", exc_info=True)
+            return None
+        if not payload:
+            return {}
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    async def _run_store(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.store.blocking:
+            return await anyio.to_thread.run_sync(func, *args)
+        return func(*args)
+
+    async def _commit(self, session: LazySession, session_id: str | None, message: Message) -> None:
+        if not session.accessed or session.load_failed:
+            return
+        headers = MutableHeaders(scope=message)
+        headers.add_vary_header("Cookie")
+        if not dict.__len__(session):
+            if session_id:
+                await self._run_store(self.store.delete, session_id)
+                headers.append("Set-Cookie", self._cookie_header("null", expires=True))
+            return
+        payload = _encode_session(dict(session))
+        previous_id = session_id if session.rotate_id else None
+        try:
+            if session_id and not previous_id and payload == session.payload:
+                if not await self._run_store(self.store.touch, session_id):
+                    return
+            else:
+                if previous_id or not session_id:
+                    session_id = secrets.token_urlsafe(32)
+                await self._run_store(self.store.save, session_id, payload)
+                if previous_id:
+                    await self._run_store(self.store.delete, previous_id)
+        except Exception:
+            LOGGER.warning("Failed to persist server-side session.", exc_info=True)
+            return
+        # Re-signed on every commit so the cookie's signature age tracks the store expiry.
+        headers.append("Set-Cookie", self._cookie_header(self._sign(session_id)))
+
+    def _sign(self, session_id: str) -> str:
+        return self.signer.sign(session_id.encode("utf-8")).decode("utf-8")
+
+    def _cookie_header(self, value: str, *, expires: bool = False) -> str:
+        if expires:
+            lifetime = "expires=Thu, 01 Jan 1970 00:00:00 GMT; "
+        else:
+            lifetime = f"Max-Age={self.max_age}; " if self.max_age else ""
+        return f"{self.session_cookie}={value}; path={self.path}; {lifetime}{self.security_flags}"
@@ -10,6 +10,7 @@ from vendor_catalog_app.web.core.user_context_service import (
     get_user_context,
 )
 from vendor_catalog_app.web.http.flash import add_flash
+from vendor_catalog_app.web.http.session_store import rotate_session_id
 
 router = APIRouter(prefix="/admin")
 
@@ -43,5 +44,6 @@ async def set_testing_role(request: Request):
     else:
         request.session.pop(ADMIN_ROLE_OVERRIDE_SESSION_KEY, None)
         add_flash(request, "Testing role override cleared.", "success")
+    rotate_session_id(request.session)
     return RedirectResponse(url=f"{safe_return_to}", status_code=303)
 
@@ -165,7 +165,7 @@ def contracts(request: Request):
 
     cancellation_rows: list[dict[str, object]] = []
     if active_tab in {CONTRACT_TAB_OVERVIEW, CONTRACT_TAB_CANCELLED}:
-        cancellation_df = repo.contract_cancellations().head(250).copy()
+        cancellation_df = repo.contract_cancellations(limit=250).copy()
         if not cancellation_df.empty:
             cancellation_df["vendor_contract_url"] = cancellation_df.get("vendor_id", "").fillna("").map(
                 lambda vendor_id: (
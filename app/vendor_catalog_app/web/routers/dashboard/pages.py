@@ -156,23 +156,16 @@ def dashboard(
     months = clamp_months(months)
     horizon_days = clamp_horizon_days(horizon_days)
 
-    kpis = repo.dashboard_kpis()
-    summary = repo.executive_summary(org_id=selected_lob, months=months, horizon_days=horizon_days)
-    by_category_df = repo.executive_spend_by_category(org_id=selected_lob, months=months)
-    trend_df = repo.executive_monthly_spend_trend(org_id=selected_lob, months=months)
-    top_vendors_df = repo.executive_top_vendors_by_spend(org_id=selected_lob, months=months, limit=10)
-    risk_dist_df = repo.executive_risk_distribution(org_id=selected_lob)
-    renewals_df = repo.executive_renewal_pipeline(org_id=selected_lob, horizon_days=horizon_days)
-    recent_demos_df = repo.demo_outcomes().head(10)
-    recent_cancellations_df = repo.contract_cancellations().head(10)
-
-    by_category = by_category_df.to_dict("records")
-    trend = trend_df.to_dict("records")
-    top_vendors = top_vendors_df.to_dict("records")
-    risk_dist = risk_dist_df.to_dict("records")
-    renewals = renewals_df.to_dict("records")
-    recent_demos = recent_demos_df.to_dict("records")
-    recent_cancellations = recent_cancellations_df.to_dict("records")
+    data = repo.dashboard_data(org_id=selected_lob, months=months, horizon_days=horizon_days)
+    kpis = data["kpis"]
+    summary = data["summary"]
+    by_category = data["by_category"].to_dict("records")
+    trend = data["trend"].to_dict("records")
+    top_vendors = data["top_vendors"].to_dict("records")
+    risk_dist = data["risk_dist"].to_dict("records")
+    renewals = data["renewals"].to_dict("records")
+    recent_demos = data["recent_demos"].to_dict("records")
+    recent_cancellations = data["recent_cancellations"].to_dict("records")
 
     trend_max = max((_as_float(row.get("total_spend"), 0.0) for row in trend), default=0.0)
     category_max = max((_as_float(row.get("total_spend"), 0.0) for row in by_category), default=0.0)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import re
+from collections.abc import Callable
 from typing import Any
 
 from fastapi import APIRouter, Request, status
@@ -9,7 +9,7 @@ from vendor_catalog_app.web.core.activity import ensure_session_started, log_pag
 from vendor_catalog_app.web.core.runtime import get_repo
 from vendor_catalog_app.web.core.template_context import base_template_context
 from vendor_catalog_app.web.core.user_context_service import get_user_context
-from vendor_catalog_app.web.utils.markdown import render_safe_markdown
+from vendor_catalog_app.web.utils.markdown import render_help_article_html
 
 router = APIRouter(prefix="/help")
 
@@ -46,58 +46,10 @@ def _is_visible(visibility: str | None, role: str) -> bool:
     return False
 
 
-def _normalize_search_text(value: str) -> str:
-    text = str(value or "").lower()
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    return re.sub(r"\s+", " ", text).strip()
-
-
-def _strip_markdown(value: str) -> str:
-    text = str(value or "")
-    text = re.sub(r"`{1,3}.*?`{1,3}", " ", text, flags=re.S)
-    text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)
-    text = re.sub(r"[#>*_\-]+", " ", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
-
-
-def _score_article(query: str, article: dict[str, Any]) -> int:
-    normalized_query = _normalize_search_text(query)
-    if not normalized_query:
-        return 0
-    title = _normalize_search_text(str(article.get("title") or ""))
-    content = _normalize_search_text(str(article.get("content_md") or ""))
-    score = 0
-    if normalized_query in title:
-        score += 12
-    if normalized_query in content:
-        score += 4
-    for token in normalized_query.split(" "):
-        if token in title:
-            score += 5
-        if token in content:
-            score += 1
-    return score
-
-
-def _build_snippet(query: str, article: dict[str, Any]) -> str:
-    text = _strip_markdown(article.get("content_md") or "")
-    if not text:
-        return ""
-    normalized_query = _normalize_search_text(query)
-    if not normalized_query:
-        return text[:160].strip()
-    idx = _normalize_search_text(text).find(normalized_query)
-    if idx < 0:
-        return text[:160].strip()
-    start = max(0, idx - 40)
-    end = min(len(text), idx + 120)
-    snippet = text[start:end].strip()
-    if start > 0:
-        snippet = "..." + snippet
-    if end < len(text):
-        snippet = snippet + "..."
-    return snippet
+def help_article_visibility_filter(user) -> Callable[[dict[str, Any]], bool]:
+    """Predicate over help article rows: True when ``user`` may see the article."""
+    role = _role_tier(user)
+    return lambda row: _is_visible(row.get("role_visibility"), role)
 
 
 def _group_nav_items(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -129,24 +81,14 @@ def help_index(request: Request, q: str = ""):
     ensure_session_started(request, user)
     log_page_view(request, user, "Help Center")
 
-    role = _role_tier(user)
-    index_rows = [row for row in repo.list_help_article_index() if _is_visible(row.get("role_visibility"), role)]
+    visible = help_article_visibility_filter(user)
+    index_rows = [row for row in repo.list_help_article_index() if visible(row)]
     nav_sections = _group_nav_items(index_rows)
 
     search_query = (q or "").strip()
     search_results: list[dict[str, Any]] = []
     if search_query:
-        full_rows = [row for row in repo.list_help_articles_full() if _is_visible(row.get("role_visibility"), role)]
-        scored = []
-        for row in full_rows:
-            score = _score_article(search_query, row)
-            if score <= 0:
-                continue
-            record = dict(row)
-            record["score"] = score
-            record["snippet"] = _build_snippet(search_query, row)
-            scored.append(record)
-        search_results = sorted(scored, key=lambda row: (-int(row.get("score", 0)), str(row.get("title") or "")))
+        search_results = repo.search_help_articles(search_query, where=visible)
 
     context = _help_context(
         request,
@@ -210,7 +152,7 @@ def help_article(request: Request, slug: str):
             status_code=status.HTTP_403_FORBIDDEN,
         )
 
-    content_html = render_safe_markdown(str(article.get("content_md") or ""))
+    content_html = render_help_article_html(repo, article)
     context = _help_context(
         request,
         user,
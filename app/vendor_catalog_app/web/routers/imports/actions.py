@@ -46,8 +46,10 @@ from vendor_catalog_app.web.routers.imports.staging import (
 from vendor_catalog_app.web.routers.imports.store import (
     discard_preview_payload,
     load_preview_payload,
+    load_preview_source_rows,
     save_preview_payload,
 )
+from vendor_catalog_app.web.routers.imports.streaming import spool_upload, upload_size
 from vendor_catalog_app.web.security.rbac import require_permission
 
 router = APIRouter()
@@ -145,15 +147,16 @@ async def imports_preview(request: Request):
         add_flash(request, "Select a file to upload.", "error")
         return RedirectResponse(url="/imports", status_code=303)
     source_file_name = str(getattr(upload, "filename", "") or "").strip()
-    raw_bytes = await upload.read()
-    if not raw_bytes:
+    # Parse straight from the spooled upload (on disk past 1 MB) rather than reading it into memory.
+    upload_stream = spool_upload(upload.file)
+    if upload_size(upload_stream) <= 0:
         add_flash(request, "Uploaded file is empty.", "error")
         return RedirectResponse(url="/imports", status_code=303)
 
     try:
         parse_result = parse_layout_rows(
             selected_layout,
-            raw_bytes,
+            upload_stream,
             file_name=source_file_name,
             format_hint=format_hint,
             delimiter=delimiter,
@@ -296,9 +299,8 @@ async def imports_remap(request: Request):
     effective_file_type = str(payload.get("effective_format") or "").strip()
     parser_options = dict(payload.get("parser_options") or {})
     parser_warnings = list(payload.get("parser_warnings") or [])
-    source_rows = list(payload.get("source_rows") or [])
     source_fields = list(payload.get("source_fields") or [])
-    if not source_rows or not source_fields:
+    if not source_fields:
         add_flash(request, "Source preview metadata is unavailable. Upload the file again.", "error")
         return RedirectResponse(url="/imports", status_code=303)
 
@@ -324,6 +326,18 @@ async def imports_remap(request: Request):
         source_fields=source_fields,
         requested_mapping=resolved_field_mapping,
     )
+    # Read only the cached source columns the mappings use.
+    source_rows = load_preview_source_rows(
+        payload,
+        columns=[
+            "_line",
+            *[str(key) for key in resolved_source_target_mapping if resolved_source_target_mapping[key]],
+            *[str(key) for key in resolved_field_mapping.values() if key],
+        ],
+    )
+    if not source_rows:
+        add_flash(request, "Source preview metadata is unavailable. Upload the file again.", "error")
+        return RedirectResponse(url="/imports", status_code=303)
     stage_area_rows = build_stage_area_rows(
         source_rows=source_rows,
         source_target_mapping=resolved_source_target_mapping,
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import logging
 import re
 from typing import Any
 
+from vendor_catalog_app.infrastructure.fuzzy_match import FuzzyNameIndex
+
+LOGGER = logging.getLogger(__name__)
+# Minimum fuzzy score (see FuzzyNameIndex.match) for a name to count as a candidate.
+IMPORT_NAME_MATCH_MIN_SCORE = 0.5
+
 
 def _normalize_email(value: str) -> str:
     return str(value or "").strip().lower()
@@ -45,9 +52,29 @@ def _label_for_project_row(row: dict[str, Any]) -> str:
     return project_name or project_id
 
 
+def _indexed_search(index: FuzzyNameIndex, query: str, limit: int, group: str | None = None) -> list[dict[str, Any]]:
+    rows = index.exact(query, group=group)
+    for row, _score in index.match(query, limit=limit, min_score=IMPORT_NAME_MATCH_MIN_SCORE, group=group):
+        if len(rows) >= limit:
+            break
+        if not any(existing is row for existing in rows):
+            rows.append(row)
+    return rows[:limit]
+
+
 class ImportMatchContext:
+    """Per-preview lookups shared by every imported row.
+
+    Vendor, offering and project names are matched against ``repo.import_name_index``,
+    which is loaded once, so previews issue no per-row name queries. When an index is
+    unavailable the typeahead searches are used instead, memoized by query text. Id
+    lookups that miss the index fall back to the repository, since the index may not yet
+    hold records created since it was built.
+    """
+
     def __init__(self, repo) -> None:
         self.repo = repo
+        self._name_indexes: dict[str, FuzzyNameIndex | None] = {}
         self._vendor_profile_cache: dict[str, dict[str, Any] | None] = {}
         self._offering_cache: dict[str, dict[str, Any] | None] = {}
         self._project_cache: dict[str, dict[str, Any] | None] = {}
@@ -60,14 +87,27 @@ class ImportMatchContext:
         self._vendor_ids_by_phone: dict[str, set[str]] = {}
         self._vendor_ids_by_phone_suffix: dict[str, set[str]] = {}
 
+    def name_index(self, name: str) -> FuzzyNameIndex | None:
+        if name not in self._name_indexes:
+            try:
+                self._name_indexes[name] = self.repo.import_name_index(name)
+            except Exception:
+                LOGGER.warning("Import name index unavailable; using typeahead search. index=%s", name, exc_info=True)
+                self._name_indexes[name] = None
+        return self._name_indexes[name]
+
     def vendor_profile(self, vendor_id: str) -> dict[str, Any] | None:
         key = str(vendor_id or "").strip()
         if not key:
             return None
         if key in self._vendor_profile_cache:
             return self._vendor_profile_cache[key]
-        profile_df = self.repo.get_vendor_profile(key)
-        profile = profile_df.iloc[0].to_dict() if not profile_df.empty else None
+        index = self.name_index("vendors")
+        # The index can lag recent writes, so a miss is confirmed with a direct lookup.
+        profile = index.get(key) if index is not None else None
+        if profile is None:
+            profile_df = self.repo.get_vendor_profile(key)
+            profile = profile_df.iloc[0].to_dict() if not profile_df.empty else None
         self._vendor_profile_cache[key] = profile
         return profile
 
@@ -77,8 +117,11 @@ class ImportMatchContext:
             return None
         if key in self._offering_cache:
             return self._offering_cache[key]
-        rows = self.repo.get_offerings_by_ids([key])
-        item = rows.iloc[0].to_dict() if not rows.empty else None
+        index = self.name_index("offerings")
+        item = index.get(key) if index is not None else None
+        if item is None:
+            rows = self.repo.get_offerings_by_ids([key])
+            item = rows.iloc[0].to_dict() if not rows.empty else None
         self._offering_cache[key] = item
         return item
 
@@ -88,7 +131,11 @@ class ImportMatchContext:
             return None
         if key in self._project_cache:
             return self._project_cache[key]
-        project = self.repo.get_project_by_id(key)
+        index = self.name_index("projects")
+        # The project index only holds active projects; anything else is looked up directly.
+        project = index.get(key) if index is not None else None
+        if project is None:
+            project = self.repo.get_project_by_id(key)
         self._project_cache[key] = project
         return project
 
@@ -99,7 +146,11 @@ class ImportMatchContext:
         key = (query.lower(), int(limit))
         if key in self._vendor_search_cache:
             return self._vendor_search_cache[key]
-        rows = self.repo.search_vendors_typeahead(q=query, limit=limit).to_dict("records")
+        index = self.name_index("vendors")
+        if index is not None:
+            rows = _indexed_search(index, query, int(limit))
+        else:
+            rows = self.repo.search_vendors_typeahead(q=query, limit=limit).to_dict("records")
         self._vendor_search_cache[key] = rows
         return rows
 
@@ -111,7 +162,13 @@ class ImportMatchContext:
         key = (vendor_filter.lower(), query.lower(), int(limit))
         if key in self._offering_search_cache:
             return self._offering_search_cache[key]
-        rows = self.repo.search_offerings_typeahead(vendor_id=vendor_filter or None, q=query, limit=limit).to_dict("records")
+        index = self.name_index("offerings")
+        if index is not None:
+            rows = _indexed_search(index, query, int(limit), group=vendor_filter or None)
+        else:
+            rows = self.repo.search_offerings_typeahead(
+                vendor_id=vendor_filter or None, q=query, limit=limit
+            ).to_dict("records")
         self._offering_search_cache[key] = rows
         return rows
 
@@ -122,7 +179,11 @@ class ImportMatchContext:
         key = (query.lower(), int(limit))
         if key in self._project_search_cache:
             return self._project_search_cache[key]
-        rows = self.repo.search_projects_typeahead(q=query, limit=limit).to_dict("records")
+        index = self.name_index("projects")
+        if index is not None:
+            rows = _indexed_search(index, query, int(limit))
+        else:
+            rows = self.repo.search_projects_typeahead(q=query, limit=limit).to_dict("records")
         self._project_search_cache[key] = rows
         return rows
 
@@ -5,8 +5,10 @@ import io
 import json
 import re
 from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, TextIO
 import xml.etree.ElementTree as ET
 
 from vendor_catalog_app.web.routers.imports.config import (
@@ -19,8 +21,21 @@ from vendor_catalog_app.web.routers.imports.config import (
     import_target_field_groups,
     import_target_field_options,
 )
+from vendor_catalog_app.web.routers.imports.streaming import (
+    UPLOAD_SAMPLE_BYTES,
+    JsonRecordStream,
+    detect_upload_encoding,
+    iter_xml_records,
+    open_upload_text,
+    read_upload_head,
+    resolve_xml_record_tag,
+    upload_binary_stream,
+    xml_local_name,
+)
 from vendor_catalog_app.web.routers.vendors.constants import IMPORT_MERGE_REASON_OPTIONS
 
+UPLOAD_FORMAT_SAMPLE_BYTES = 4096
+
 
 def can_manage_imports(user) -> bool:
     return bool(getattr(user, "can_edit", False))
@@ -173,13 +188,17 @@ def _normalize_source_payload(source_payload: dict[str, Any]) -> dict[str, str]:
     return out
 
 
-def _parse_delimited_source_rows(*, text: str, delimiter: str) -> tuple[list[dict[str, str]], list[str]]:
-    stream = io.StringIO(text)
-    reader = csv.reader(stream, delimiter=delimiter)
-    headers = next(reader, None)
-    if headers is None:
-        raise ValueError("Delimited files must include a header row.")
+@contextmanager
+def _upload_text(stream: BinaryIO, encoding: str) -> Iterator[TextIO]:
+    text = open_upload_text(stream, encoding)
+    try:
+        yield text
+    finally:
+        # Detach so closing the text view never closes the caller's upload stream.
+        text.detach()
+
 
+def _delimited_source_keys(headers: list[str]) -> list[str]:
     source_keys: list[str] = []
     for index, header in enumerate(headers, start=1):
         normalized = normalize_source_key(str(header or ""))
@@ -191,20 +210,39 @@ def _parse_delimited_source_rows(*, text: str, delimiter: str) -> tuple[list[dic
             normalized = f"{base}_{suffix}"
             suffix += 1
         source_keys.append(normalized)
+    return source_keys
+
+
+def _read_delimited_headers(*, stream: BinaryIO, encoding: str, delimiter: str) -> list[str]:
+    with _upload_text(stream, encoding) as text:
+        headers = next(csv.reader(text, delimiter=delimiter), None)
+    if headers is None:
+        raise ValueError("Delimited files must include a header row.")
+    return [str(name or "") for name in headers]
 
-    rows: list[dict[str, str]] = []
-    for line_number, raw_row in enumerate(reader, start=2):
-        source_row: dict[str, str] = {}
-        has_data = False
-        for idx, source_key in enumerate(source_keys):
-            value = str(raw_row[idx] if idx < len(raw_row) else "").strip()
-            source_row[source_key] = value
-            if value:
-                has_data = True
-        if has_data:
-            source_row["_line"] = str(line_number)
-            rows.append(source_row)
-    return rows, [str(name or "") for name in headers]
+
+def _iter_delimited_source_rows(
+    *,
+    stream: BinaryIO,
+    encoding: str,
+    delimiter: str,
+    headers: list[str],
+) -> Iterator[dict[str, str]]:
+    source_keys = _delimited_source_keys(headers)
+    with _upload_text(stream, encoding) as text:
+        reader = csv.reader(text, delimiter=delimiter)
+        next(reader, None)
+        for line_number, raw_row in enumerate(reader, start=2):
+            source_row: dict[str, str] = {}
+            has_data = False
+            for idx, source_key in enumerate(source_keys):
+                value = str(raw_row[idx] if idx < len(raw_row) else "").strip()
+                source_row[source_key] = value
+                if value:
+                    has_data = True
+            if has_data:
+                source_row["_line"] = str(line_number)
+                yield source_row
 
 
 def _validate_strict_delimited_layout(
@@ -276,68 +314,46 @@ def _flatten_object(value: Any, prefix: str = "", out: dict[str, Any] | None = N
     return out
 
 
-def _resolve_json_record_path(payload: Any, record_path: str) -> tuple[list[Any], str]:
-    cleaned = str(record_path or "").strip()
-    if cleaned:
-        current = payload
-        for token in [part for part in cleaned.split(".") if part]:
-            if isinstance(current, dict):
-                current = current.get(token)
-            elif isinstance(current, list):
-                try:
-                    current = current[int(token)]
-                except Exception as exc:
-                    raise ValueError(f"JSON record path token '{token}' is not valid for list traversal.") from exc
-            else:
-                current = None
-                break
-        if current is None:
-            raise ValueError(f"JSON record path '{cleaned}' did not resolve to data.")
-        if isinstance(current, list):
-            return current, cleaned
-        return [current], cleaned
-
-    if isinstance(payload, list):
-        return payload, ""
-    if isinstance(payload, dict):
-        for key, value in payload.items():
-            if isinstance(value, list):
-                return value, key
-        return [payload], ""
-    return [payload], ""
-
-
-def _parse_json_source_rows(*, text: str, record_path: str) -> tuple[list[dict[str, str]], list[str], str]:
-    warnings: list[str] = []
-    try:
-        payload = json.loads(text)
-    except Exception as exc:
-        raise ValueError(f"JSON parse failed: {exc}") from exc
-
-    records, resolved_path = _resolve_json_record_path(payload, record_path)
-    if resolved_path and not record_path:
-        warnings.append(f"Detected JSON record path '{resolved_path}'.")
-    if not isinstance(records, list):
-        records = [records]
-
-    source_rows: list[dict[str, str]] = []
+def _iter_json_source_rows(records: Iterable[Any]) -> Iterator[dict[str, str]]:
     for line_number, record in enumerate(records, start=1):
         source_payload = _flatten_object(record if isinstance(record, (dict, list)) else {"value": record})
         source_row = _normalize_source_payload(source_payload)
         if _row_has_data(source_row):
             source_row["_line"] = str(line_number)
-            source_rows.append(source_row)
-    return source_rows, warnings, resolved_path
+            yield source_row
+
+
+def _stream_json_source_rows(
+    *,
+    stream: BinaryIO,
+    encoding: str,
+    record_path: str,
+) -> tuple[Iterator[dict[str, str]], list[str], str]:
+    warnings: list[str] = []
+    cleaned_path = str(record_path or "").strip()
+    text = open_upload_text(stream, encoding)
+    try:
+        records = JsonRecordStream(text, cleaned_path)
+        resolved_path = records.open() or cleaned_path
+    except Exception:
+        text.detach()
+        raise
+    if resolved_path and not cleaned_path:
+        warnings.append(f"Detected JSON record path '{resolved_path}'.")
 
+    def _rows() -> Iterator[dict[str, str]]:
+        try:
+            yield from _iter_json_source_rows(records)
+        finally:
+            text.detach()
 
-def _xml_local_name(tag: str) -> str:
-    return str(tag or "").split("}", 1)[-1]
+    return _rows(), warnings, resolved_path
 
 
 def _flatten_xml_element(element: ET.Element) -> dict[str, Any]:
     out: dict[str, Any] = {}
     for key, value in dict(element.attrib).items():
-        out[f"attr_{_xml_local_name(key)}"] = value
+        out[f"attr_{xml_local_name(key)}"] = value
 
     def walk(node: ET.Element, prefix: str) -> None:
         children = list(node)
@@ -348,10 +364,10 @@ def _flatten_xml_element(element: ET.Element) -> dict[str, Any]:
             return
         if text:
             out[prefix] = text
-        child_name_counts = Counter(_xml_local_name(child.tag) for child in children)
+        child_name_counts = Counter(xml_local_name(child.tag) for child in children)
         child_seen: dict[str, int] = {}
         for child in children:
-            base_name = _xml_local_name(child.tag)
+            base_name = xml_local_name(child.tag)
             child_seen[base_name] = child_seen.get(base_name, 0) + 1
             if child_name_counts[base_name] > 1:
                 child_prefix = f"{prefix}.{base_name}_{child_seen[base_name]}"
@@ -359,57 +375,52 @@ def _flatten_xml_element(element: ET.Element) -> dict[str, Any]:
                 child_prefix = f"{prefix}.{base_name}"
             walk(child, child_prefix)
 
-    walk(element, _xml_local_name(element.tag))
+    walk(element, xml_local_name(element.tag))
     return out
 
 
-def _resolve_xml_record_elements(root: ET.Element, record_tag: str) -> tuple[list[ET.Element], str]:
-    cleaned = str(record_tag or "").strip()
-    if cleaned:
-        matched = [element for element in root.iter() if _xml_local_name(element.tag) == cleaned]
-        if not matched:
-            raise ValueError(f"XML record tag '{cleaned}' was not found.")
-        return matched, cleaned
-
-    direct_children = list(root)
-    if not direct_children:
-        return [root], ""
-
-    direct_counts = Counter(_xml_local_name(child.tag) for child in direct_children)
-    repeated = [name for name, count in direct_counts.items() if count > 1]
-    if repeated:
-        selected = repeated[0]
-        return [child for child in direct_children if _xml_local_name(child.tag) == selected], selected
-
-    if len(direct_children) == 1:
-        nested_children = list(direct_children[0])
-        nested_counts = Counter(_xml_local_name(child.tag) for child in nested_children)
-        repeated_nested = [name for name, count in nested_counts.items() if count > 1]
-        if repeated_nested:
-            selected = repeated_nested[0]
-            return [child for child in nested_children if _xml_local_name(child.tag) == selected], selected
-    return direct_children, ""
-
-
-def _parse_xml_source_rows(*, text: str, record_tag: str) -> tuple[list[dict[str, str]], list[str], str]:
+def _stream_xml_source_rows(
+    *,
+    stream: BinaryIO,
+    encoding: str,
+    record_tag: str,
+) -> tuple[Iterator[dict[str, str]], list[str], str]:
     warnings: list[str] = []
-    try:
-        root = ET.fromstring(text)
-    except Exception as exc:
-        raise ValueError(f"XML parse failed: {exc}") from exc
-
-    records, resolved_tag = _resolve_xml_record_elements(root, record_tag)
-    if resolved_tag and not record_tag:
-        warnings.append(f"Detected XML record tag '{resolved_tag}'.")
-
+    cleaned_tag = str(record_tag or "").strip()
+    depth: int | None = None
+    resolved_tag = cleaned_tag
+    if not cleaned_tag:
+        with _upload_text(stream, encoding) as text:
+            resolved_tag, depth = resolve_xml_record_tag(text)
+        if resolved_tag:
+            warnings.append(f"Detected XML record tag '{resolved_tag}'.")
+
+    def _rows() -> Iterator[dict[str, str]]:
+        found = False
+        with _upload_text(stream, encoding) as text:
+            for line_number, element in enumerate(
+                iter_xml_records(text, record_tag=resolved_tag, depth=depth),
+                start=1,
+            ):
+                found = True
+                source_row = _normalize_source_payload(_flatten_xml_element(element))
+                if _row_has_data(source_row):
+                    source_row["_line"] = str(line_number)
+                    yield source_row
+        if cleaned_tag and not found:
+            raise ValueError(f"XML record tag '{cleaned_tag}' was not found.")
+
+    return _rows(), warnings, resolved_tag
+
+
+def _collect_source_rows(rows: Iterable[dict[str, str]]) -> list[dict[str, str]]:
+    """Drain a streaming parser, failing as soon as the upload passes ``IMPORT_MAX_ROWS``."""
     source_rows: list[dict[str, str]] = []
-    for line_number, element in enumerate(records, start=1):
-        source_payload = _flatten_xml_element(element)
-        source_row = _normalize_source_payload(source_payload)
-        if _row_has_data(source_row):
-            source_row["_line"] = str(line_number)
-            source_rows.append(source_row)
-    return source_rows, warnings, resolved_tag
+    for row in rows:
+        if len(source_rows) >= IMPORT_MAX_ROWS:
+            raise ValueError(f"Upload is too large. Maximum {IMPORT_MAX_ROWS} rows per import.")
+        source_rows.append(row)
+    return source_rows
 
 
 def _build_source_fields(source_rows: list[dict[str, str]]) -> list[dict[str, str]]:
@@ -704,68 +715,115 @@ def build_stage_area_rows(
     )
 
 
-def parse_layout_rows(
-    layout_key: str,
-    raw_bytes: bytes,
+def _parse_source_rows(
     *,
-    file_name: str = "",
-    format_hint: str = "auto",
-    delimiter: str = ",",
-    json_record_path: str = "",
-    xml_record_tag: str = "",
-    strict_layout: bool = False,
-    field_mapping: dict[str, str] | None = None,
-    source_target_mapping: dict[str, str] | None = None,
-) -> dict[str, Any]:
-    spec = IMPORT_LAYOUTS[layout_key]
-    allowed_fields = [str(field) for field in spec.get("fields", [])]
-    text = decode_upload_bytes(raw_bytes)
-    detected_format = detect_upload_format(file_name, raw_bytes)
-    requested_format = safe_format_hint(format_hint)
-    effective_format = detected_format if requested_format == "auto" else requested_format
-    selected_delimiter = safe_delimiter(delimiter)
-    used_delimiter = selected_delimiter
+    stream: BinaryIO,
+    encoding: str,
+    layout_key: str,
+    allowed_fields: list[str],
+    effective_format: str,
+    delimiter: str,
+    json_record_path: str,
+    xml_record_tag: str,
+    strict_layout: bool,
+) -> tuple[list[dict[str, str]], list[str], str, str]:
+    """Stream-parse the upload; returns (source rows, warnings, JSON record path, XML record tag)."""
     warnings: list[str] = []
     resolved_json_path = str(json_record_path or "").strip()
     resolved_xml_tag = str(xml_record_tag or "").strip()
-    source_rows: list[dict[str, str]] = []
-
-    if effective_format == "tsv":
-        source_rows, header_names = _parse_delimited_source_rows(text=text, delimiter="\t")
+    if effective_format in {"tsv", "csv", "delimited"}:
+        header_names = _read_delimited_headers(stream=stream, encoding=encoding, delimiter=delimiter)
         if strict_layout:
             _validate_strict_delimited_layout(
                 header_names=header_names,
                 allowed_fields=allowed_fields,
                 layout_key=layout_key,
             )
-        used_delimiter = "\t"
-    elif effective_format in {"csv", "delimited"}:
-        active_delimiter = selected_delimiter
-        if requested_format == "auto" and detected_format == "delimited" and selected_delimiter == ",":
-            active_delimiter = _infer_delimiter_from_text(text)
-        source_rows, header_names = _parse_delimited_source_rows(text=text, delimiter=active_delimiter)
-        if strict_layout:
-            _validate_strict_delimited_layout(
-                header_names=header_names,
-                allowed_fields=allowed_fields,
-                layout_key=layout_key,
-            )
-        used_delimiter = active_delimiter
+        row_stream = _iter_delimited_source_rows(
+            stream=stream,
+            encoding=encoding,
+            delimiter=delimiter,
+            headers=header_names,
+        )
     elif effective_format == "json":
         if strict_layout:
             raise ValueError("Quick upload supports approved CSV/TSV layouts only. Use Advanced Wizard for JSON.")
-        source_rows, warnings, resolved_json_path = _parse_json_source_rows(text=text, record_path=json_record_path)
+        row_stream, warnings, resolved_json_path = _stream_json_source_rows(
+            stream=stream,
+            encoding=encoding,
+            record_path=json_record_path,
+        )
     elif effective_format == "xml":
         if strict_layout:
             raise ValueError("Quick upload supports approved CSV/TSV layouts only. Use Advanced Wizard for XML.")
-        source_rows, warnings, resolved_xml_tag = _parse_xml_source_rows(text=text, record_tag=xml_record_tag)
+        row_stream, warnings, resolved_xml_tag = _stream_xml_source_rows(
+            stream=stream,
+            encoding=encoding,
+            record_tag=xml_record_tag,
+        )
     else:
         raise ValueError(f"Unsupported file format '{effective_format}'.")
+    return _collect_source_rows(row_stream), warnings, resolved_json_path, resolved_xml_tag
+
 
+def parse_layout_rows(
+    layout_key: str,
+    raw_bytes: bytes | BinaryIO,
+    *,
+    file_name: str = "",
+    format_hint: str = "auto",
+    delimiter: str = ",",
+    json_record_path: str = "",
+    xml_record_tag: str = "",
+    strict_layout: bool = False,
+    field_mapping: dict[str, str] | None = None,
+    source_target_mapping: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Parse an upload into layout rows, source rows, mappings and staging rows.
+
+    ``raw_bytes`` may also be a seekable binary file, such as a spooled upload. Encoding,
+    format and delimiter are detected from the first ``UPLOAD_SAMPLE_BYTES``; the upload
+    is then decoded and parsed as a stream (``csv`` over a text view, an incremental JSON
+    array reader, and a pull parser for XML), so only the parsed rows are held in memory
+    and an upload past ``IMPORT_MAX_ROWS`` stops at the first extra row.
+    """
+    spec = IMPORT_LAYOUTS[layout_key]
+    allowed_fields = [str(field) for field in spec.get("fields", [])]
+    stream = upload_binary_stream(raw_bytes)
+    sample = read_upload_head(stream, UPLOAD_SAMPLE_BYTES)
+    encoding = detect_upload_encoding(sample)
+    detected_format = detect_upload_format(file_name, sample[:UPLOAD_FORMAT_SAMPLE_BYTES])
+    requested_format = safe_format_hint(format_hint)
+    effective_format = detected_format if requested_format == "auto" else requested_format
+    used_delimiter = safe_delimiter(delimiter)
+    if effective_format == "tsv":
+        used_delimiter = "\t"
+    elif requested_format == "auto" and detected_format == "delimited" and used_delimiter == ",":
+        used_delimiter = _infer_delimiter_from_text(sample.decode(encoding, errors="ignore"))
+
+    parse_options = {
+        "stream": stream,
+        "layout_key": layout_key,
+        "allowed_fields": allowed_fields,
+        "effective_format": effective_format,
+        "delimiter": used_delimiter,
+        "json_record_path": json_record_path,
+        "xml_record_tag": xml_record_tag,
+        "strict_layout": strict_layout,
+    }
+    try:
+        source_rows, warnings, resolved_json_path, resolved_xml_tag = _parse_source_rows(
+            encoding=encoding,
+            **parse_options,
+        )
+    except UnicodeDecodeError:
+        # The sample was valid UTF-8 but a later byte is not; read the whole upload as latin-1.
+        source_rows, warnings, resolved_json_path, resolved_xml_tag = _parse_source_rows(
+            encoding="latin-1",
+            **parse_options,
+        )
     if not source_rows:
         raise ValueError("No data rows were found in the upload.")
-    if len(source_rows) > IMPORT_MAX_ROWS:
-        raise ValueError(f"Upload is too large. Maximum {IMPORT_MAX_ROWS} rows per import.")
     source_fields = _build_source_fields(source_rows)
     resolved_source_target_mapping = _resolve_source_target_mapping(
         source_fields=source_fields,
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+import zipfile
+from collections.abc import Collection, Iterable, Sequence
+from pathlib import Path
+
+from vendor_catalog_app.core.env import TVENDOR_IMPORT_SOURCE_CACHE_DIR, get_env
+
+LOGGER = logging.getLogger(__name__)
+
+SOURCE_CACHE_FORMAT_VERSION = 2
+_SOURCE_CACHE_SUFFIX = ".cols.zip"
+_SOURCE_CACHE_PARTIAL_SUFFIX = ".tmp"
+_MANIFEST_MEMBER = "manifest.json"
+
+
+def source_cache_dir() -> Path:
+    configured = get_env(TVENDOR_IMPORT_SOURCE_CACHE_DIR)
+    return Path(configured) if configured else Path(tempfile.gettempdir()) / "tvendor_import_source_cache"
+
+
+def _column_member(index: int) -> str:
+    return f"columns/{index}.json"
+
+
+def write_source_row_cache(rows: Sequence[dict[str, str]]) -> str:
+    """Store parsed source rows column by column and return the cache file path.
+
+    The cache is a zip archive with a manifest and one deflated member per column, so a
+    reader decompresses only the columns it asks for. Each column is dictionary-encoded:
+    its distinct values plus one code per row, where code 0 means the row has no such
+    key. Repeated values (status codes, org ids, empty strings) are stored once.
+    """
+    columns: dict[str, tuple[dict[str, int], list[int]]] = {}
+    for index, row in enumerate(rows):
+        for key, raw_value in row.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = ({}, [0] * len(rows))
+            lookup, codes = column
+            value = str(raw_value if raw_value is not None else "")
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(lookup) + 1
+            codes[index] = code
+    manifest = {"version": SOURCE_CACHE_FORMAT_VERSION, "row_count": len(rows), "columns": list(columns)}
+    directory = source_cache_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{uuid.uuid4().hex}{_SOURCE_CACHE_SUFFIX}"
+    partial = path.with_name(path.name + _SOURCE_CACHE_PARTIAL_SUFFIX)
+    try:
+        with zipfile.ZipFile(partial, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=3) as archive:
+            archive.writestr(_MANIFEST_MEMBER, json.dumps(manifest, separators=(",", ":")))
+            for index, (lookup, codes) in enumerate(columns.values()):
+                member = {"values": list(lookup), "codes": codes}
+                archive.writestr(_column_member(index), json.dumps(member, separators=(",", ":")))
+        os.replace(partial, path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    return str(path)
+
+
+def read_source_row_cache(path: str, *, columns: Iterable[str] | None = None) -> list[dict[str, str]] | None:
+    """Rows written by ``write_source_row_cache``, optionally only ``columns``; None if unreadable.
+
+    Only the manifest and the requested column members are read and decompressed.
+    """
+    try:
+        with zipfile.ZipFile(path) as archive:
+            manifest = json.loads(archive.read(_MANIFEST_MEMBER))
+            if not isinstance(manifest, dict) or manifest.get("version") != SOURCE_CACHE_FORMAT_VERSION:
+                return None
+            stored = {str(key): index for index, key in enumerate(manifest.get("columns") or [])}
+            wanted = list(stored) if columns is None else [key for key in dict.fromkeys(columns) if key in stored]
+            rows: list[dict[str, str]] = [{} for _ in range(int(manifest.get("row_count") or 0))]
+            for key in wanted:
+                member = json.loads(archive.read(_column_member(stored[key])))
+                values = [""] + list(member.get("values") or [])
+                for row, code in zip(rows, member.get("codes") or [], strict=True):
+                    if code:
+                        row[key] = values[code]
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        LOGGER.warning("Import source row cache is unreadable. path=%s", path, exc_info=True)
+        return None
+    return rows
+
+
+def delete_source_row_cache(path: str) -> None:
+    try:
+        Path(path).unlink(missing_ok=True)
+    except OSError:
+        LOGGER.warning("Failed to delete import source row cache. path=%s", path, exc_info=True)
+
+
+def touch_source_row_cache(path: str) -> None:
+    """Reset the cache's mtime so the orphan sweep dates it from the payload now using it."""
+    try:
+        os.utime(path)
+    except OSError:
+        LOGGER.warning("Failed to refresh import source row cache. path=%s", path, exc_info=True)
+
+
+def sweep_source_row_caches(*, older_than_sec: float, keep: Collection[str] = ()) -> int:
+    """Delete cache files (and partial writes) not modified within ``older_than_sec``; returns the count.
+
+    Removes files orphaned by a crash or restart. ``keep`` paths are never deleted. The
+    directory may be shared by several workers, so only files older than any live
+    preview are considered.
+    """
+    directory = source_cache_dir()
+    if not directory.is_dir():
+        return 0
+    cutoff = time.time() - older_than_sec
+    kept = {str(Path(item)) for item in keep}
+    removed = 0
+    for candidate in directory.iterdir():
+        name = candidate.name
+        if not (name.endswith(_SOURCE_CACHE_SUFFIX) or name.endswith(_SOURCE_CACHE_SUFFIX + _SOURCE_CACHE_PARTIAL_SUFFIX)):
+            continue
+        if str(candidate) in kept:
+            continue
+        try:
+            if candidate.stat().st_mtime >= cutoff:
+                continue
+            candidate.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError:
+            LOGGER.warning("Failed to delete orphaned import source row cache. path=%s", candidate, exc_info=True)
+            continue
+        removed += 1
+    return removed
@@ -1,34 +1,86 @@
 from __future__ import annotations
 
+import logging
 import threading
 import time
 import uuid
+from collections.abc import Iterable
 from copy import deepcopy
 from typing import Any
 
+from vendor_catalog_app.web.routers.imports.source_cache import (
+    delete_source_row_cache,
+    read_source_row_cache,
+    sweep_source_row_caches,
+    touch_source_row_cache,
+    write_source_row_cache,
+)
+
+LOGGER = logging.getLogger(__name__)
+
 IMPORT_PREVIEW_TTL_SEC = 1800.0
 IMPORT_PREVIEW_MAX_ITEMS = 64
 IMPORT_PREVIEW_LOCK = threading.Lock()
+# Payload key holding the on-disk source row cache path in place of ``source_rows``.
+IMPORT_SOURCE_CACHE_KEY = "source_rows_cache"
 _IMPORT_PREVIEW_STORE: dict[str, tuple[float, dict[str, Any]]] = {}
 
 
-def _prune_preview_store(now: float) -> None:
+def _prune_preview_store(now: float) -> list[dict[str, Any]]:
+    removed: list[dict[str, Any]] = []
     expired = [token for token, (created, _) in _IMPORT_PREVIEW_STORE.items() if (now - created) >= IMPORT_PREVIEW_TTL_SEC]
     for token in expired:
-        _IMPORT_PREVIEW_STORE.pop(token, None)
+        entry = _IMPORT_PREVIEW_STORE.pop(token, None)
+        if entry is not None:
+            removed.append(entry[1])
     while len(_IMPORT_PREVIEW_STORE) > IMPORT_PREVIEW_MAX_ITEMS:
         oldest_token = min(_IMPORT_PREVIEW_STORE, key=lambda key: _IMPORT_PREVIEW_STORE[key][0], default=None)
         if oldest_token is None:
             break
-        _IMPORT_PREVIEW_STORE.pop(oldest_token, None)
+        entry = _IMPORT_PREVIEW_STORE.pop(oldest_token, None)
+        if entry is not None:
+            removed.append(entry[1])
+    return removed
+
+
+def _unreferenced_source_caches(removed: Iterable[dict[str, Any]]) -> list[str]:
+    """Cache paths of ``removed`` payloads no stored payload still shares (remaps reuse them)."""
+    live = {str(payload.get(IMPORT_SOURCE_CACHE_KEY) or "") for _, payload in _IMPORT_PREVIEW_STORE.values()}
+    paths = {str(payload.get(IMPORT_SOURCE_CACHE_KEY) or "") for payload in removed}
+    return sorted(path for path in paths - live if path)
+
+
+def _delete_source_caches(paths: Iterable[str]) -> None:
+    # Called with IMPORT_PREVIEW_LOCK held so a concurrent save cannot start sharing a path
+    # between the reference check and the unlink.
+    for path in paths:
+        delete_source_row_cache(path)
 
 
 def save_preview_payload(payload: dict[str, Any]) -> str:
+    """Store ``payload`` and return its token.
+
+    ``source_rows`` are moved to an on-disk columnar cache (see ``load_preview_source_rows``)
+    so large uploads are not held in memory between preview and remap. If the cache cannot
+    be written the rows stay in the payload. A payload that already points at a cache
+    (a remap) refreshes that file's mtime so the orphan sweep ages it from now.
+    """
+    stored = dict(payload)
+    if "source_rows" in stored:
+        try:
+            stored[IMPORT_SOURCE_CACHE_KEY] = write_source_row_cache(list(stored["source_rows"] or []))
+            stored.pop("source_rows")
+        except OSError:
+            LOGGER.warning("Failed to write import source row cache; keeping rows in memory.", exc_info=True)
+    elif stored.get(IMPORT_SOURCE_CACHE_KEY):
+        # A remap reuses the previous preview's cache; restart its age for the new TTL.
+        touch_source_row_cache(str(stored[IMPORT_SOURCE_CACHE_KEY]))
     token = uuid.uuid4().hex
     now = time.monotonic()
     with IMPORT_PREVIEW_LOCK:
-        _prune_preview_store(now)
-        _IMPORT_PREVIEW_STORE[token] = (now, deepcopy(payload))
+        removed = _prune_preview_store(now)
+        _IMPORT_PREVIEW_STORE[token] = (now, deepcopy(stored))
+        _delete_source_caches(_unreferenced_source_caches(removed))
     return token
 
 
@@ -38,12 +90,21 @@ def load_preview_payload(token: str) -> dict[str, Any] | None:
         return None
     now = time.monotonic()
     with IMPORT_PREVIEW_LOCK:
-        _prune_preview_store(now)
+        removed = _prune_preview_store(now)
+        _delete_source_caches(_unreferenced_source_caches(removed))
         entry = _IMPORT_PREVIEW_STORE.get(key)
-        if entry is None:
-            return None
-        _, payload = entry
-        return deepcopy(payload)
+        payload = deepcopy(entry[1]) if entry is not None else None
+    return payload
+
+
+def load_preview_source_rows(payload: dict[str, Any], *, columns: Iterable[str] | None = None) -> list[dict[str, str]]:
+    """Parsed source rows of a stored preview, optionally only ``columns``; [] when unavailable."""
+    if "source_rows" in payload:
+        return list(payload.get("source_rows") or [])
+    path = str(payload.get(IMPORT_SOURCE_CACHE_KEY) or "").strip()
+    if not path:
+        return []
+    return read_source_row_cache(path, columns=columns) or []
 
 
 def discard_preview_payload(token: str) -> None:
@@ -51,5 +112,15 @@ def discard_preview_payload(token: str) -> None:
     if not key:
         return
     with IMPORT_PREVIEW_LOCK:
-        _IMPORT_PREVIEW_STORE.pop(key, None)
+        entry = _IMPORT_PREVIEW_STORE.pop(key, None)
+        _delete_source_caches(_unreferenced_source_caches([entry[1]] if entry is not None else []))
 
+
+def sweep_orphaned_source_caches() -> int:
+    """Delete on-disk source row caches older than any live preview; returns the count.
+
+    Caches outlive the in-memory store across restarts and crashes; run on startup.
+    """
+    with IMPORT_PREVIEW_LOCK:
+        live = [str(payload.get(IMPORT_SOURCE_CACHE_KEY) or "") for _, payload in _IMPORT_PREVIEW_STORE.values()]
+        return sweep_source_row_caches(older_than_sec=IMPORT_PREVIEW_TTL_SEC, keep=[path for path in live if path])
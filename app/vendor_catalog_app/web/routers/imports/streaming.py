@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import codecs
+import io
+import json
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any, BinaryIO, TextIO
+
+UPLOAD_READ_CHUNK_BYTES = 1 << 20
+UPLOAD_READ_CHUNK_CHARS = 1 << 16
+# Bytes inspected for encoding, format and delimiter detection.
+UPLOAD_SAMPLE_BYTES = 64 * 1024
+# Uploads larger than this are spooled to a temp file instead of memory.
+UPLOAD_SPOOL_MAX_MEMORY_BYTES = 1 << 20
+
+_JSON_WHITESPACE = " \t\n\r"
+
+
+def upload_binary_stream(source: bytes | BinaryIO) -> BinaryIO:
+    """Seekable binary stream over an upload given as bytes or an open file."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(bytes(source))
+    return source
+
+
+def spool_upload(source: BinaryIO) -> BinaryIO:
+    """Seekable copy of ``source``, kept in memory up to ``UPLOAD_SPOOL_MAX_MEMORY_BYTES`` then on disk.
+
+    Already seekable streams (e.g. Starlette's spooled ``UploadFile.file``) are used as is.
+    """
+    seekable = getattr(source, "seekable", None)
+    if seekable is not None and seekable():
+        source.seek(0)
+        return source
+    spooled = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_MEMORY_BYTES)  # noqa: SIM115 - returned to the caller as the upload stream
+    shutil.copyfileobj(source, spooled, UPLOAD_READ_CHUNK_BYTES)
+    spooled.seek(0)
+    return spooled
+
+
+def upload_size(stream: BinaryIO) -> int:
+    size = stream.seek(0, io.SEEK_END)
+    stream.seek(0)
+    return int(size)
+
+
+def read_upload_head(stream: BinaryIO, size: int) -> bytes:
+    stream.seek(0)
+    head = stream.read(size)
+    stream.seek(0)
+    return head
+
+
+def detect_upload_encoding(sample: bytes) -> str:
+    """``utf-8-sig`` when ``sample`` is valid UTF-8 (a trailing partial character is allowed), else ``latin-1``.
+
+    Only the sample is checked; callers re-decode as ``latin-1`` if invalid UTF-8 turns
+    up later in the stream.
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return "latin-1"
+    return "utf-8-sig"
+
+
+def open_upload_text(stream: BinaryIO, encoding: str) -> TextIO:
+    """Text view of ``stream`` that leaves newlines untranslated, as ``csv`` expects."""
+    stream.seek(0)
+    return io.TextIOWrapper(stream, encoding=encoding, newline="")
+
+
+class JsonRecordStream:
+    """Yields the records of a JSON document without loading the whole document.
+
+    The document is scanned with ``JSONDecoder.raw_decode`` over a sliding buffer.
+    ``open`` walks to the record container: ``record_path`` (dotted object keys and list
+    indexes) when given, otherwise the top-level array or the first array-valued key of
+    a top-level object. Iterating then decodes one array element at a time and finally
+    checks the rest of the document is well formed. Only a single record, the path
+    being walked and skipped non-array values are held in memory at once.
+    """
+
+    def __init__(self, stream: TextIO, record_path: str = "") -> None:
+        self._stream = stream
+        self._record_path = str(record_path or "").strip()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._open_containers: list[str] = []
+        self._single: list[Any] | None = None
+        self.resolved_path = ""
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"JSON parse failed: {json.JSONDecodeError(message, self._buffer, self._pos)}")
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._stream.read(UPLOAD_READ_CHUNK_CHARS)
+        if not chunk:
+            self._eof = True
+            return False
+        if self._pos > UPLOAD_READ_CHUNK_CHARS:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        self._buffer += chunk
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _JSON_WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            expected = " or ".join(repr(item) for item in chars)
+            raise self._error(f"Expecting {expected}")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        if not self._peek():
+            raise self._error("Expecting value")
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._fill():
+                    continue
+                raise ValueError(f"JSON parse failed: {exc}") from exc
+            # A number or literal running to the end of the buffer may continue in the next chunk.
+            if end >= len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _enter_key(self, token: str) -> bool:
+        """Consume object members up to ``token`` (left before its value); False at ``}``."""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return False
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == token:
+                self._open_containers.append("}")
+                return True
+            self._value()
+            if self._expect(",}") == "}":
+                return False
+
+    def _enter_index(self, token: str) -> None:
+        invalid = ValueError(f"JSON record path token '{token}' is not valid for list traversal.")
+        try:
+            index = int(token)
+        except ValueError as exc:
+            raise invalid from exc
+        self._expect("[")
+        for _ in range(index):
+            if self._peek() == "]":
+                raise invalid
+            self._value()
+            if self._expect(",]") == "]":
+                raise invalid
+        if index < 0 or self._peek() == "]":
+            raise invalid
+        self._open_containers.append("]")
+
+    def open(self) -> str:
+        """Position the stream at the records; returns the auto-detected record path, if any."""
+        if self._record_path:
+            for token in [part for part in self._record_path.split(".") if part]:
+                char = self._peek()
+                if char == "{":
+                    if not self._enter_key(token):
+                        raise ValueError(f"JSON record path '{self._record_path}' did not resolve to data.")
+                elif char == "[":
+                    self._enter_index(token)
+                else:
+                    self._value()
+                    raise ValueError(f"JSON record path '{self._record_path}' did not resolve to data.")
+            char = self._peek()
+            if char == "n":
+                self._value()
+                raise ValueError(f"JSON record path '{self._record_path}' did not resolve to data.")
+            if char != "[":
+                self._single = [self._value()]
+            return ""
+
+        char = self._peek()
+        if char == "{":
+            self._pos += 1
+            members: dict[str, Any] = {}
+            if self._peek() == "}":
+                self._pos += 1
+                self._single = [members]
+                return ""
+            while True:
+                key = self._value()
+                self._expect(":")
+                if self._peek() == "[":
+                    self._open_containers.append("}")
+                    self.resolved_path = str(key)
+                    return self.resolved_path
+                members[key] = self._value()
+                if self._expect(",}") == "}":
+                    self._single = [members]
+                    return ""
+        if char != "[":
+            self._single = [self._value()]
+        return ""
+
+    def _skip_rest(self, closer: str) -> None:
+        while True:
+            if self._expect("," + closer) == closer:
+                return
+            if closer == "}":
+                self._value()
+                self._expect(":")
+            self._value()
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._single is not None:
+            yield from self._single
+        else:
+            self._expect("[")
+            if self._peek() == "]":
+                self._pos += 1
+            else:
+                while True:
+                    yield self._value()
+                    if self._expect(",]") == "]":
+                        break
+        while self._open_containers:
+            self._skip_rest(self._open_containers.pop())
+        if self._peek():
+            raise self._error("Extra data")
+
+
+def xml_local_name(tag: str) -> str:
+    return str(tag or "").split("}", 1)[-1]
+
+
+def _xml_events(stream: TextIO) -> Iterator[tuple[str, ET.Element]]:
+    parser = ET.XMLPullParser(events=("start", "end"))
+    try:
+        while True:
+            chunk = stream.read(UPLOAD_READ_CHUNK_CHARS)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+    except ET.ParseError as exc:
+        raise ValueError(f"XML parse failed: {exc}") from exc
+
+
+def resolve_xml_record_tag(stream: TextIO) -> tuple[str, int]:
+    """Record (tag, depth) for an XML document without a configured record tag.
+
+    Mirrors the tree rules: the first repeated child tag of the root, else the first
+    repeated grandchild tag under a single child, else every child of the root (tag
+    ``""`` at depth 1), else the root itself. Counts tags in one pass that discards
+    elements as they close.
+    """
+    stack: list[ET.Element] = []
+    children: Counter[str] = Counter()
+    grandchildren: Counter[str] = Counter()
+    for event, element in _xml_events(stream):
+        if event == "start":
+            if len(stack) == 1:
+                children[xml_local_name(element.tag)] += 1
+            elif len(stack) == 2:
+                grandchildren[xml_local_name(element.tag)] += 1
+            stack.append(element)
+            continue
+        stack.pop()
+        element.clear()
+        if stack:
+            stack[-1].remove(element)
+    if not children:
+        return "", 0
+    for name, count in children.items():
+        if count > 1:
+            return name, 1
+    if sum(children.values()) == 1:
+        for name, count in grandchildren.items():
+            if count > 1:
+                return name, 2
+    return "", 1
+
+
+def iter_xml_records(stream: TextIO, *, record_tag: str, depth: int | None = None) -> Iterator[ET.Element]:
+    """Yield complete record elements in document order of their closing tags.
+
+    Records are elements named ``record_tag`` (any name when empty) at ``depth`` (any
+    depth when None). Each record is released once the consumer resumes, and elements
+    outside records are dropped as they close, so memory stays bounded by one record.
+    """
+    stack: list[ET.Element] = []
+    open_records = 0
+
+    def _is_record(element: ET.Element, level: int) -> bool:
+        if depth is not None and level != depth:
+            return False
+        return not record_tag or xml_local_name(element.tag) == record_tag
+
+    for event, element in _xml_events(stream):
+        if event == "start":
+            if _is_record(element, len(stack)):
+                open_records += 1
+            stack.append(element)
+            continue
+        stack.pop()
+        if _is_record(element, len(stack)):
+            open_records -= 1
+            yield element
+        if open_records == 0:
+            element.clear()
+            if stack:
+                stack[-1].remove(element)
@@ -25,6 +25,7 @@ from vendor_catalog_app.web.core.terms import (
 )
 from vendor_catalog_app.web.core.user_context_service import get_user_context
 from vendor_catalog_app.web.http.flash import add_flash
+from vendor_catalog_app.web.http.session_store import rotate_session_id
 
 router = APIRouter(prefix="/access")
 LOGGER = logging.getLogger(__name__)
@@ -395,6 +396,7 @@ async def bootstrap_initial_admin(request: Request):
         session = request.scope.get("session")
         if isinstance(session, dict):
             _clear_user_context_session_state(session, user.user_principal)
+            rotate_session_id(session)
         LOGGER.info(
             "Initial admin bootstrap succeeded for principal '%s'. request_id=%s",
             user.user_principal,
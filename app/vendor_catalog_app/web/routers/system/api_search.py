@@ -1,16 +1,71 @@
 from __future__ import annotations
 
+from typing import Any
+from urllib.parse import quote, urlencode
+
 from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 
 from vendor_catalog_app.web.core.activity import ensure_session_started
 from vendor_catalog_app.web.core.runtime import get_repo
 from vendor_catalog_app.web.core.user_context_service import get_user_context
+from vendor_catalog_app.web.routers.help.pages import help_article_visibility_filter
 from vendor_catalog_app.web.routers.system.common import _normalize_limit
 
 router = APIRouter(prefix="/api")
 
 
+def _global_search_item(kind: str, row: dict[str, Any]) -> dict[str, Any]:
+    vendor_id = str(row.get("vendor_id") or "")
+    if kind == "vendors":
+        item_id, url = vendor_id, f"/vendors/{quote(vendor_id, safe='')}/summary"
+    elif kind == "offerings":
+        item_id = str(row.get("offering_id") or "")
+        url = f"/vendors/{quote(vendor_id, safe='')}/offerings/{quote(item_id, safe='')}"
+    elif kind == "projects":
+        item_id = str(row.get("project_id") or "")
+        url = f"/projects/{quote(item_id, safe='')}/summary"
+    elif kind == "contracts":
+        item_id = str(row.get("contract_id") or "")
+        url = (
+            f"/vendors/{quote(vendor_id, safe='')}/contracts"
+            if vendor_id
+            else "/contracts?" + urlencode({"q": row.get("contract_number") or item_id})
+        )
+    elif kind == "contacts":
+        item_id = str(row.get("email") or row.get("full_name") or "")
+        url = f"/vendors/{quote(vendor_id, safe='')}/summary" if vendor_id else ""
+    else:
+        item_id = str(row.get("article_id") or "")
+        url = f"/help/{quote(str(row.get('slug') or ''), safe='')}"
+    label = str(row.get("label") or row.get("title") or item_id)
+    return {"type": kind, "id": item_id, "label": label, "url": url, "rank": row.get("rank"), "data": row}
+
+
+@router.get("/search")
+def api_global_search(request: Request, q: str = "", types: str = "", limit: int = 5):
+    repo = get_repo()
+    user = get_user_context(request)
+    ensure_session_started(request, user)
+    selected = [item.strip() for item in types.split(",") if item.strip()] or None
+    result = repo.search_global(
+        q=q,
+        limit_per_type=_normalize_limit(limit),
+        types=selected,
+        help_article_filter=help_article_visibility_filter(user),
+    )
+    groups = [
+        {
+            "type": group["type"],
+            "rank": group["rank"],
+            "has_more": group["has_more"],
+            "items": [_global_search_item(group["type"], row) for row in group["items"]],
+        }
+        for group in result["groups"]
+    ]
+    return JSONResponse({"query": q.strip(), "groups": groups, "timed_out": result["timed_out"]})
+
+
 @router.get("/vendors/search")
 def api_vendor_search(request: Request, q: str = "", limit: int = 20):
     repo = get_repo()
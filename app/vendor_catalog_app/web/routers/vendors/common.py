@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
 from urllib.parse import quote
 
 from fastapi import Request
@@ -11,6 +13,7 @@ from vendor_catalog_app.core.defaults import (
     DEFAULT_SOURCE_SYSTEM,
     DEFAULT_VENDOR_SUMMARY_MONTHS,
 )
+from vendor_catalog_app.infrastructure.parallel import LoadGraph
 from vendor_catalog_app.repository import GLOBAL_CHANGE_VENDOR_ID
 from vendor_catalog_app.web.core.activity import ensure_session_started, log_page_view
 from vendor_catalog_app.web.core.template_context import base_template_context
@@ -95,12 +98,40 @@ def _offering_nav(vendor_id: str, offering_id: str, return_to: str, active_key:
     return out
 
 
-def _vendor_base_context(repo, request: Request, vendor_id: str, section: str, return_to: str):
+def _vendor_base_context(
+    repo,
+    request: Request,
+    vendor_id: str,
+    section: str,
+    return_to: str,
+    *,
+    loads: dict[str, Callable[[], Any]] | None = None,
+):
+    """Load the shared Vendor 360 header data, plus any page ``loads``, in one parallel graph.
+
+    Page loads are returned under ``base["loads"]`` keyed by the names passed in. They
+    start once the profile is loaded and are skipped when the vendor does not exist.
+    """
     user = get_user_context(request)
     ensure_session_started(request, user)
     log_page_view(request, user, f"Vendor 360 - {section.title()}")
 
-    profile = repo.get_vendor_profile(vendor_id)
+    months = DEFAULT_VENDOR_SUMMARY_MONTHS
+    graph = LoadGraph(f"vendor_360_{section}")
+    graph.add("profile", lambda: repo.get_vendor_profile(vendor_id))
+    graph.add("offerings", lambda: repo.get_vendor_offerings(vendor_id))
+    graph.add("contracts", lambda: repo.get_vendor_contracts(vendor_id))
+    graph.add("demos", lambda: repo.get_vendor_demos(vendor_id))
+    graph.add("spend_trend", lambda: repo.vendor_monthly_spend_trend(vendor_id, months=months))
+    for name, loader in (loads or {}).items():
+        graph.add(
+            f"page:{name}",
+            lambda profile, _loader=loader: None if profile.empty else _loader(),
+            after=("profile",),
+        )
+    loaded = graph.run()
+
+    profile = loaded["profile"]
     if profile.empty:
         add_flash(request, f"Vendor {vendor_id} not found.", "error")
         return None
@@ -117,7 +148,16 @@ def _vendor_base_context(repo, request: Request, vendor_id: str, section: str, r
         "vendor_id": vendor_id,
         "return_to": return_to,
         "vendor_nav": _vendor_nav(vendor_id, return_to, section),
-        "summary": repo.vendor_summary(vendor_id, months=DEFAULT_VENDOR_SUMMARY_MONTHS),
+        "summary": repo.build_vendor_summary(
+            profile=profile,
+            offerings=loaded["offerings"],
+            contracts=loaded["contracts"],
+            demos=loaded["demos"],
+            spend=loaded["spend_trend"],
+        ),
+        "offerings": loaded["offerings"],
+        "spend_trend": loaded["spend_trend"],
+        "loads": {name: loaded[f"page:{name}"] for name in (loads or {})},
     }
 
 
@@ -58,6 +58,7 @@ def vendor_list(
     sort_by: str = DEFAULT_VENDOR_SORT_BY,
     sort_dir: str = DEFAULT_VENDOR_SORT_DIR,
     show_settings: int = 0,
+    cursor: str = "",
 ):
     repo = get_repo()
     user = get_user_context(request)
@@ -115,7 +116,9 @@ def vendor_list(
         page_size=page_size,
         sort_by=sort_by,
         sort_dir=sort_dir,
+        cursor=cursor,
     )
+    next_cursor = str(vendors_df.attrs.get("next_cursor") or "")
     vendors_df = vendors_df.reset_index(drop=True)
 
     available_fields = vendors_df.columns.tolist() if not vendors_df.empty else DEFAULT_VENDOR_FIELDS
@@ -273,6 +276,7 @@ def vendor_list(
                 sort_by=sort_by,
                 sort_dir=sort_dir,
                 show_settings=show_settings,
+                cursor=next_cursor if next_page == page + 1 else "",
             ),
             "settings_toggle_url": _vendor_list_url(
                 q=resolved_q,
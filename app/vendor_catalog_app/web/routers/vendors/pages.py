@@ -135,21 +135,24 @@ def _vendor_list_url(
     sort_by: str,
     sort_dir: str,
     show_settings: int,
+    cursor: str = "",
 ) -> str:
-    return "/vendors?" + urlencode(
-        {
-            "q": q,
-            "status": status,
-            "owner": owner,
-            "risk": risk,
-            "group": group,
-            "page": page,
-            "page_size": page_size,
-            "sort_by": sort_by,
-            "sort_dir": sort_dir,
-            "show_settings": show_settings,
-        }
-    )
+    params: dict[str, object] = {
+        "q": q,
+        "status": status,
+        "owner": owner,
+        "risk": risk,
+        "group": group,
+        "page": page,
+        "page_size": page_size,
+        "sort_by": sort_by,
+        "sort_dir": sort_dir,
+        "show_settings": show_settings,
+    }
+    if cursor:
+        # Lets the next page seek past the last row instead of scanning OFFSET rows.
+        params["cursor"] = cursor
+    return "/vendors?" + urlencode(params)
 
 
 def _series_with_bar_pct(rows: list[dict], value_key: str) -> list[dict]:
@@ -49,19 +49,33 @@ def vendor_default(request: Request, vendor_id: str, return_to: str = VENDOR_DEF
 @router.get("/{vendor_id}/summary")
 def vendor_summary_page(request: Request, vendor_id: str, return_to: str = VENDOR_DEFAULT_RETURN_TO):
     repo = get_repo()
-    base = _vendor_base_context(repo, request, vendor_id, "summary", return_to)
+    base = _vendor_base_context(
+        repo,
+        request,
+        vendor_id,
+        "summary",
+        return_to,
+        loads={
+            "contacts": lambda: repo.get_vendor_contacts(vendor_id),
+            "projects": lambda: repo.list_projects(vendor_id),
+            "docs": lambda: repo.list_docs("vendor", vendor_id),
+            "spend_category": lambda: repo.vendor_spend_by_category(vendor_id, months=DEFAULT_VENDOR_SUMMARY_MONTHS),
+            "doc_source_options": repo.list_doc_source_options,
+        },
+    )
     if base is None:
         return RedirectResponse(url=_safe_return_to(return_to), status_code=303)
 
+    loads = base["loads"]
     profile_row = base["profile_row"]
-    contacts = repo.get_vendor_contacts(vendor_id).to_dict("records")
+    contacts = loads["contacts"].to_dict("records")
     top_contacts = contacts[:3]
-    top_offerings = repo.get_vendor_offerings(vendor_id).head(5).to_dict("records")
+    top_offerings = base["offerings"].head(5).to_dict("records")
     for row in top_offerings:
         row["_offering_link"] = (
             f"/vendors/{vendor_id}/offerings/{row.get('offering_id')}?return_to={quote(base['return_to'], safe='')}"
         )
-    projects_df = repo.list_projects(vendor_id)
+    projects_df = loads["projects"]
     if "status" in projects_df.columns:
         active_projects = projects_df[projects_df["status"].astype(str).str.lower() == DEFAULT_PROJECT_STATUS_ACTIVE]
         projects_preview = (active_projects if not active_projects.empty else projects_df).head(5).to_dict("records")
@@ -71,13 +85,10 @@ def vendor_summary_page(request: Request, vendor_id: str, return_to: str = VENDO
         row["_project_link"] = (
             f"/vendors/{vendor_id}/projects/{row.get('project_id')}?return_to={quote(base['return_to'], safe='')}"
         )
-    docs_preview = repo.list_docs("vendor", vendor_id).head(5).to_dict("records")
+    docs_preview = loads["docs"].head(5).to_dict("records")
 
-    spend_category = _series_with_bar_pct(
-        repo.vendor_spend_by_category(vendor_id, months=DEFAULT_VENDOR_SUMMARY_MONTHS).to_dict("records"),
-        "total_spend",
-    )
-    spend_trend_rows = repo.vendor_monthly_spend_trend(vendor_id, months=DEFAULT_VENDOR_SUMMARY_MONTHS).to_dict("records")
+    spend_category = _series_with_bar_pct(loads["spend_category"].to_dict("records"), "total_spend")
+    spend_trend_rows = base["spend_trend"].to_dict("records")
     trend_points, spend_trend_plot_rows = _build_line_chart_points(spend_trend_rows, "month", "total_spend")
     raw_fields = [{"field": key, "value": value} for key, value in profile_row.items()]
 
@@ -111,7 +122,7 @@ def vendor_summary_page(request: Request, vendor_id: str, return_to: str = VENDO
             "projects_preview": projects_preview,
             "projects_page_link": f"/vendors/{vendor_id}/projects?return_to={quote(base['return_to'], safe='')}",
             "docs_preview": docs_preview,
-            "doc_source_options": repo.list_doc_source_options(),
+            "doc_source_options": loads["doc_source_options"],
             "spend_category": spend_category,
             "spend_trend_points": trend_points,
             "spend_trend_plot_rows": spend_trend_plot_rows,
@@ -124,11 +135,18 @@ def vendor_summary_page(request: Request, vendor_id: str, return_to: str = VENDO
 @router.get("/{vendor_id}/warnings")
 def vendor_warnings_page(request: Request, vendor_id: str, return_to: str = VENDOR_DEFAULT_RETURN_TO):
     repo = get_repo()
-    base = _vendor_base_context(repo, request, vendor_id, "warnings", return_to)
+    base = _vendor_base_context(
+        repo,
+        request,
+        vendor_id,
+        "warnings",
+        return_to,
+        loads={"warnings": lambda: repo.list_vendor_warnings(vendor_id, status="all")},
+    )
     if base is None:
         return RedirectResponse(url=_safe_return_to(return_to), status_code=303)
 
-    warnings_rows = repo.list_vendor_warnings(vendor_id, status="all").to_dict("records")
+    warnings_rows = base["loads"]["warnings"].to_dict("records")
     open_statuses = {"open", "monitoring"}
     open_warning_count = sum(1 for row in warnings_rows if str(row.get("warning_status") or "").strip().lower() in open_statuses)
 
@@ -158,12 +176,25 @@ def vendor_warnings_page(request: Request, vendor_id: str, return_to: str = VEND
 @router.get("/{vendor_id}/ownership")
 def vendor_ownership_page(request: Request, vendor_id: str, return_to: str = VENDOR_DEFAULT_RETURN_TO):
     repo = get_repo()
-    base = _vendor_base_context(repo, request, vendor_id, "ownership", return_to)
+    base = _vendor_base_context(
+        repo,
+        request,
+        vendor_id,
+        "ownership",
+        return_to,
+        loads={
+            "org_assignments": lambda: repo.get_vendor_org_assignments(vendor_id),
+            "lob_options": lambda: _offering_lob_options(repo),
+            "owners": lambda: repo.get_vendor_business_owners(vendor_id),
+            "contacts": lambda: repo.get_vendor_contacts(vendor_id),
+        },
+    )
     if base is None:
         return RedirectResponse(url=_safe_return_to(return_to), status_code=303)
 
+    loads = base["loads"]
     current_owner_org_id = str(base["profile_row"].get("owner_org_id") or "").strip()
-    org_assignments_rows = repo.get_vendor_org_assignments(vendor_id).to_dict("records")
+    org_assignments_rows = loads["org_assignments"].to_dict("records")
     ownership_active_lobs: list[str] = []
     for row in org_assignments_rows:
         active_flag = row.get("active_flag")
@@ -200,10 +231,10 @@ def vendor_ownership_page(request: Request, vendor_id: str, return_to: str = VEN
             "current_owner_org_id": current_owner_org_id,
             "ownership_active_lobs": ownership_active_lobs,
             "ownership_lob_items": ownership_lob_items,
-            "ownership_lob_options": _offering_lob_options(repo),
-            "owners": repo.get_vendor_business_owners(vendor_id).to_dict("records"),
+            "ownership_lob_options": loads["lob_options"],
+            "owners": loads["owners"].to_dict("records"),
             "org_assignments": org_assignments_rows,
-            "contacts": repo.get_vendor_contacts(vendor_id).to_dict("records"),
+            "contacts": loads["contacts"].to_dict("records"),
             "owner_add_reason_options": OWNER_ADD_REASON_OPTIONS,
             "org_assignment_reason_options": ORG_ASSIGNMENT_REASON_OPTIONS,
             "contact_add_reason_options": CONTACT_ADD_REASON_OPTIONS,
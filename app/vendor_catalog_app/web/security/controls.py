@@ -1,18 +1,27 @@
 from __future__ import annotations
 
+import contextlib
 import hmac
+import logging
+import math
 import secrets
+import sqlite3
+import tempfile
 import threading
 import time
-from collections import deque
+from collections import OrderedDict, deque
+from pathlib import Path
 from urllib.parse import urlparse
 
 from fastapi import Request
 
+LOGGER = logging.getLogger(__name__)
+
 CSRF_SESSION_KEY = "tvendor_csrf_token"
 CSRF_FORM_FIELD = "csrf_token"
 CSRF_HEADER = "x-csrf-token"
 UNSAFE_HTTP_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+DEFAULT_RATE_LIMIT_SQLITE_PATH = Path(tempfile.gettempdir()) / "tvendor_rate_limits" / "rate_limits.db"
 
 
 def _sanitize_identity_value(value: str, *, max_len: int = 320) -> str:
@@ -26,6 +35,10 @@ def _sanitize_identity_value(value: str, *, max_len: int = 320) -> str:
     return text
 
 
+def _normalize_rate_limit_key(key: str) -> str:
+    return _sanitize_identity_value(str(key or ""), max_len=512) or "anonymous"
+
+
 def request_requires_write_protection(method: str) -> bool:
     return str(method or "").upper() in UNSAFE_HTTP_METHODS
 
@@ -123,6 +136,14 @@ def request_rate_limit_key(request: Request) -> str:
 
 
 class SlidingWindowRateLimiter:
+    """Per-process sliding-window limiter.
+
+    Keys are kept in least-recently-seen order, so evicting past ``max_keys`` pops
+    from the front in O(1) instead of scanning every key under the lock.
+    """
+
+    blocking = False
+
     def __init__(
         self,
         *,
@@ -136,13 +157,12 @@ class SlidingWindowRateLimiter:
         self._window_seconds = max(1, int(window_seconds))
         self._max_keys = max(128, int(max_keys))
         self._lock = threading.Lock()
-        self._events: dict[str, deque[float]] = {}
-        self._last_seen: dict[str, float] = {}
+        self._events: OrderedDict[str, deque[float]] = OrderedDict()
 
     def allow(self, key: str) -> tuple[bool, int]:
         if not self._enabled:
             return True, 0
-        normalized_key = _sanitize_identity_value(str(key or ""), max_len=512) or "anonymous"
+        normalized_key = _normalize_rate_limit_key(key)
         now = time.monotonic()
         cutoff = now - float(self._window_seconds)
         with self._lock:
@@ -150,38 +170,127 @@ class SlidingWindowRateLimiter:
             if samples is None:
                 samples = deque()
                 self._events[normalized_key] = samples
+            else:
+                self._events.move_to_end(normalized_key)
             while samples and samples[0] <= cutoff:
                 samples.popleft()
 
             if len(samples) >= self._max_requests:
                 retry_after = max(1, int((samples[0] + float(self._window_seconds)) - now))
-                self._last_seen[normalized_key] = now
-                self._trim_locked(now)
+                self._trim_locked()
                 return False, retry_after
 
             samples.append(now)
-            self._last_seen[normalized_key] = now
-            self._trim_locked(now)
+            self._trim_locked()
             return True, 0
 
-    def _trim_locked(self, now: float) -> None:
-        if len(self._events) <= self._max_keys:
-            return
+    def _trim_locked(self) -> None:
+        while len(self._events) > self._max_keys:
+            self._events.popitem(last=False)
 
-        cutoff = now - float(self._window_seconds)
-        stale_keys: list[str] = []
-        for key, samples in self._events.items():
-            while samples and samples[0] <= cutoff:
-                samples.popleft()
-            if not samples:
-                stale_keys.append(key)
-        for key in stale_keys:
-            self._events.pop(key, None)
-            self._last_seen.pop(key, None)
+    def close(self) -> None:
+        return None
 
-        while len(self._events) > self._max_keys:
-            oldest_key = min(self._last_seen, key=self._last_seen.get, default=None)
-            if oldest_key is None:
-                break
-            self._events.pop(oldest_key, None)
-            self._last_seen.pop(oldest_key, None)
+
+class SharedGcraRateLimiter:
+    """GCRA limiter whose state lives in a SQLite file shared by every worker on the host.
+
+    Each key stores a single theoretical arrival time (TAT); a request is allowed when
+    pushing the TAT forward by one emission interval stays within the window, which
+    admits bursts of up to ``max_requests`` and then one request per
+    ``window_seconds / max_requests``. Each check is one short ``BEGIN IMMEDIATE``
+    transaction, so limits hold across uvicorn workers without a process-wide lock.
+    The file is opened on the first check, and a check that cannot reach it allows
+    the request rather than failing it.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        max_requests: int,
+        window_seconds: int,
+        path: str | Path | None = None,
+        purge_every: int = 1000,
+    ) -> None:
+        self._enabled = bool(enabled)
+        self._max_requests = max(1, int(max_requests))
+        self._window_seconds = float(max(1, int(window_seconds)))
+        self._emission_interval = self._window_seconds / float(self._max_requests)
+        self.path = Path(path) if path else DEFAULT_RATE_LIMIT_SQLITE_PATH
+        self._purge_every = max(1, int(purge_every))
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        self._checks = 0
+        self._schema_ready = False
+
+    def _ensure_schema(self) -> None:
+        with self._lock:
+            if self._schema_ready:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with contextlib.closing(sqlite3.connect(str(self.path), timeout=5.0, isolation_level=None)) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("CREATE TABLE IF NOT EXISTS app_rate_limit (limit_key TEXT PRIMARY KEY, tat REAL NOT NULL)")
+            self._schema_ready = True
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self._ensure_schema()
+            conn = sqlite3.connect(str(self.path), timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def allow(self, key: str) -> tuple[bool, int]:
+        if not self._enabled:
+            return True, 0
+        normalized_key = _normalize_rate_limit_key(key)
+        try:
+            return self._check(normalized_key)
+        except (OSError, sqlite3.Error):
+            LOGGER.warning("Shared rate limiter unavailable; allowing the request.", exc_info=True)
+            return True, 0
+
+    def _check(self, normalized_key: str) -> tuple[bool, int]:
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tat FROM app_rate_limit WHERE limit_key = ?", (normalized_key,)).fetchone()
+            new_tat = max(float(row[0]) if row else now, now) + self._emission_interval
+            allowed = new_tat - now <= self._window_seconds
+            if allowed:
+                conn.execute(
+                    "INSERT INTO app_rate_limit (limit_key, tat) VALUES (?, ?) "
+                    "ON CONFLICT(limit_key) DO UPDATE SET tat = excluded.tat",
+                    (normalized_key, new_tat),
+                )
+            with self._lock:
+                self._checks += 1
+                purge = self._checks % self._purge_every == 0
+            if purge:
+                conn.execute("DELETE FROM app_rate_limit WHERE tat < ?", (now,))
+            conn.execute("COMMIT")
+        except Exception:
+            with contextlib.suppress(sqlite3.Error):
+                conn.execute("ROLLBACK")
+            raise
+        if allowed:
+            return True, 0
+        return False, max(1, math.ceil(new_tat - self._window_seconds - now))
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            with contextlib.suppress(Exception):
+                conn.close()
+        self._local = threading.local()
@@ -12,6 +12,7 @@ from vendor_catalog_app.core.env import (
     get_env,
     get_env_bool,
 )
+from vendor_catalog_app.web.system.templating import template_precompile_stats
 
 RUNTIME_REQUIRED_TABLES = (
     "core_vendor",
@@ -214,6 +215,21 @@ def build_bootstrap_diagnostics_payload(repo, config, identity: dict[str, str])
         }
     )
 
+    precompile_stats = template_precompile_stats()
+    if precompile_stats:
+        checks.append(
+            {
+                "name": "template_precompile",
+                "status": "fail" if precompile_stats["errors"] else "pass",
+                "details": [
+                    f"templates={precompile_stats['templates']}",
+                    f"elapsed_ms={precompile_stats['elapsed_ms']}",
+                    f"bytecode_cache={precompile_stats['bytecode_cache']}",
+                    *precompile_stats["errors"],
+                ],
+            }
+        )
+
     connectivity_ok, connectivity_errors = probe(repo, "health/select_connectivity_check.sql")
     checks.append(
         {
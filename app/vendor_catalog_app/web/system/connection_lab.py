@@ -15,6 +15,7 @@ from vendor_catalog_app.core.env import (
     get_env_int,
 )
 from vendor_catalog_app.infrastructure.cache import LruTtlCache
+from vendor_catalog_app.web.http.session_store import rotate_session_id
 
 CONNECTION_LAB_AUTH_EXPIRES_AT_SESSION_KEY = "tvendor_connection_lab_auth_expires_at"
 CONNECTION_LAB_OVERRIDE_ID_SESSION_KEY = "tvendor_connection_lab_override_id"
@@ -75,6 +76,7 @@ def authorize_connection_lab(request: Request, provided_token: str) -> bool:
     if session is None:
         return False
     session[CONNECTION_LAB_AUTH_EXPIRES_AT_SESSION_KEY] = int(time.time()) + _connection_lab_auth_ttl_sec()
+    rotate_session_id(session)
     return True
 
 
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import logging
+import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
 from vendor_catalog_app.infrastructure.local_db_bootstrap import ensure_local_db_ready
 from vendor_catalog_app.web.core.runtime import get_config, get_repo
+from vendor_catalog_app.web.routers.imports.store import sweep_orphaned_source_caches
 from vendor_catalog_app.web.system.settings import AppRuntimeSettings
+from vendor_catalog_app.web.system.templating import precompile_templates
+from vendor_catalog_app.web.system.worker_pool import configure_worker_thread_limiter
+from vendor_catalog_app.web.utils.markdown import prerender_help_articles
 
 LOGGER = logging.getLogger(__name__)
 
@@ -16,7 +21,29 @@ def create_app_lifespan(settings: AppRuntimeSettings):
     @asynccontextmanager
     async def _app_lifespan(_app: FastAPI):
         runtime_config = get_config()
+        worker_threads = configure_worker_thread_limiter(settings.worker_threads)
+        LOGGER.info(
+            "Worker thread limiter configured. threads=%s",
+            worker_threads,
+            extra={"event": "worker_threads_configured", "worker_threads": worker_threads},
+        )
         ensure_local_db_ready(runtime_config)
+        # Replays audit records spooled but not delivered before the last shutdown or crash.
+        if get_repo().start_audit_spool():
+            LOGGER.info("Audit spool started.", extra={"event": "audit_spool_started"})
+        try:
+            swept = sweep_orphaned_source_caches()
+        except OSError:
+            LOGGER.warning("Failed to sweep orphaned import source row caches.", exc_info=True)
+        else:
+            if swept:
+                LOGGER.info(
+                    "Removed orphaned import source row caches. files=%s",
+                    swept,
+                    extra={"event": "import_source_cache_swept", "import_source_caches_removed": int(swept)},
+                )
+        # Builds vendor search docs here so searches never rebuild them inline.
+        get_repo().ensure_vendor_search_docs()
         if settings.sql_preload_on_startup:
             try:
                 loaded = get_repo().preload_sql_templates()
@@ -31,10 +58,82 @@ def create_app_lifespan(settings: AppRuntimeSettings):
                     "sql_files_loaded": int(loaded),
                 },
             )
+        if settings.template_precompile_on_startup:
+            templates = getattr(_app.state, "templates", None)
+            if templates is not None:
+                stats = precompile_templates(templates)
+                LOGGER.info(
+                    "Templates precompiled during startup. templates=%s elapsed_ms=%s bytecode_cache=%s errors=%s",
+                    stats["templates"],
+                    stats["elapsed_ms"],
+                    stats["bytecode_cache"],
+                    len(stats["errors"]),
+                    extra={
+                        "event": "template_precompile_startup",
+                        "templates_compiled": int(stats["templates"]),
+                        "template_compile_ms": float(stats["elapsed_ms"]),
+                        "template_compile_errors": len(stats["errors"]),
+                    },
+                )
+                for error in stats["errors"]:
+                    LOGGER.warning("Template failed to precompile: %s", error)
+        if settings.typeahead_index_warm_on_startup:
+            started = time.perf_counter()
+            counts = get_repo().warm_typeahead_indexes()
+            if counts:
+                elapsed_ms = round((time.perf_counter() - started) * 1000.0, 1)
+                LOGGER.info(
+                    "Typeahead indexes built during startup. rows=%s elapsed_ms=%s",
+                    counts,
+                    elapsed_ms,
+                    extra={
+                        "event": "typeahead_index_startup",
+                        "typeahead_index_rows": counts,
+                        "typeahead_index_build_ms": elapsed_ms,
+                    },
+                )
+        if settings.help_prerender_on_startup:
+            started = time.perf_counter()
+            try:
+                rendered = prerender_help_articles(get_repo())
+            except Exception:
+                LOGGER.warning("Help article pre-render failed during startup.", exc_info=True)
+            else:
+                elapsed_ms = round((time.perf_counter() - started) * 1000.0, 1)
+                LOGGER.info(
+                    "Help articles pre-rendered during startup. rendered=%s elapsed_ms=%s",
+                    rendered,
+                    elapsed_ms,
+                    extra={
+                        "event": "help_prerender_startup",
+                        "help_articles_rendered": int(rendered),
+                        "help_prerender_ms": elapsed_ms,
+                    },
+                )
         try:
             yield
         finally:
+            if settings.session_store is not None:
+                try:
+                    settings.session_store.close()
+                except Exception:
+                    LOGGER.warning("Failed to close session store cleanly.", exc_info=True)
+            try:
+                settings.write_rate_limiter.close()
+            except Exception:
+                LOGGER.warning("Failed to close write rate limiter cleanly.", exc_info=True)
             repo = get_repo()
+            try:
+                flushed = repo.flush_usage_events()
+            except Exception:
+                LOGGER.warning("Failed to drain buffered usage events on shutdown.", exc_info=True)
+            else:
+                if flushed:
+                    LOGGER.info(
+                        "Drained buffered usage events on shutdown. events=%s",
+                        flushed,
+                        extra={"event": "usage_log_drained", "usage_events_flushed": int(flushed)},
+                    )
             if repo.cache_info().currsize == 0:
                 return
             try:
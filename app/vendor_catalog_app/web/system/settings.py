@@ -16,31 +16,60 @@ from vendor_catalog_app.core.env import (
     TVENDOR_CSRF_ENABLED,
     TVENDOR_DATABRICKS_REPORTS_ALLOW_EMBED,
     TVENDOR_DATABRICKS_REPORTS_ALLOWED_HOSTS,
+    TVENDOR_HELP_PRERENDER_ON_STARTUP,
     TVENDOR_METRICS_ALLOW_UNAUTHENTICATED,
     TVENDOR_METRICS_AUTH_TOKEN,
+    TVENDOR_N_PLUS_ONE_THRESHOLD,
     TVENDOR_PERF_LOG_ENABLED,
     TVENDOR_PERF_RESPONSE_HEADER,
     TVENDOR_REQUEST_ID_HEADER_ENABLED,
     TVENDOR_SECURITY_HEADERS_ENABLED,
+    TVENDOR_SERVER_TIMING_ENABLED,
+    TVENDOR_SESSION_BACKEND,
     TVENDOR_SESSION_HTTPS_ONLY,
+    TVENDOR_SESSION_MAX_AGE_SEC,
+    TVENDOR_SESSION_MEMORY_MAX_ENTRIES,
     TVENDOR_SESSION_SECRET,
+    TVENDOR_SESSION_SQLITE_PATH,
     TVENDOR_SLOW_QUERY_MS,
     TVENDOR_SQL_PRELOAD_ON_STARTUP,
+    TVENDOR_TEMPLATE_BYTECODE_CACHE_DIR,
+    TVENDOR_TEMPLATE_BYTECODE_CACHE_ENABLED,
+    TVENDOR_TEMPLATE_PRECOMPILE_ON_STARTUP,
+    TVENDOR_TYPEAHEAD_INDEX_WARM_ON_STARTUP,
+    TVENDOR_WORKER_ADMISSION_ENABLED,
+    TVENDOR_WORKER_MAX_QUEUE,
+    TVENDOR_WORKER_RETRY_AFTER_SEC,
+    TVENDOR_WORKER_THREADS,
+    TVENDOR_WRITE_RATE_LIMIT_BACKEND,
     TVENDOR_WRITE_RATE_LIMIT_ENABLED,
     TVENDOR_WRITE_RATE_LIMIT_MAX_REQUESTS,
+    TVENDOR_WRITE_RATE_LIMIT_SQLITE_PATH,
     TVENDOR_WRITE_RATE_LIMIT_WINDOW_SEC,
     get_env,
     get_env_bool,
     get_env_float,
     get_env_int,
 )
-from vendor_catalog_app.web.security.controls import SlidingWindowRateLimiter
+from vendor_catalog_app.web.http.session_store import (
+    DEFAULT_SESSION_MAX_AGE_SEC,
+    SESSION_BACKEND_COOKIE,
+    SESSION_BACKEND_SQLITE,
+    SESSION_BACKENDS,
+    SessionStore,
+    build_session_store,
+)
+from vendor_catalog_app.web.security.controls import SharedGcraRateLimiter, SlidingWindowRateLimiter
+from vendor_catalog_app.web.system.worker_pool import WorkerAdmissionGate
 
 
 @dataclass(frozen=True)
 class AppRuntimeSettings:
     session_secret: str
     session_https_only: bool
+    session_backend: str
+    session_max_age_sec: int
+    session_store: SessionStore | None
     security_headers_enabled: bool
     metrics_allow_unauthenticated: bool
     metrics_auth_token: str
@@ -49,12 +78,21 @@ class AppRuntimeSettings:
     csp_policy: str
     perf_enabled: bool
     perf_header_enabled: bool
+    server_timing_enabled: bool
     request_id_header_enabled: bool
     sql_preload_on_startup: bool
+    template_precompile_on_startup: bool
+    template_bytecode_cache_enabled: bool
+    template_bytecode_cache_dir: str
+    typeahead_index_warm_on_startup: bool
+    help_prerender_on_startup: bool
     slow_query_ms: float
+    n_plus_one_threshold: int
     write_rate_limit_window_sec: int
     write_rate_limit_max_requests: int
-    write_rate_limiter: SlidingWindowRateLimiter
+    write_rate_limiter: SlidingWindowRateLimiter | SharedGcraRateLimiter
+    worker_threads: int
+    worker_admission_gate: WorkerAdmissionGate
 
 
 def normalize_host_value(raw_host: str) -> str:
@@ -120,6 +158,23 @@ def load_app_runtime_settings(config: AppConfig) -> AppRuntimeSettings:
         print(f"[SECURITY] Generated random session secret at runtime for {config.environment}", file=sys.stderr)
 
     session_https_only = get_env_bool(TVENDOR_SESSION_HTTPS_ONLY, default=not config.is_dev_env)
+    session_backend = get_env(
+        TVENDOR_SESSION_BACKEND,
+        SESSION_BACKEND_SQLITE if config.is_dev_env else SESSION_BACKEND_COOKIE,
+    ).strip().lower()
+    if session_backend not in SESSION_BACKENDS:
+        print(
+            f"[SECURITY] Unknown {TVENDOR_SESSION_BACKEND}={session_backend!r}; using signed cookie sessions",
+            file=sys.stderr,
+        )
+        session_backend = SESSION_BACKEND_COOKIE
+    session_max_age_sec = get_env_int(TVENDOR_SESSION_MAX_AGE_SEC, default=DEFAULT_SESSION_MAX_AGE_SEC, min_value=60)
+    session_store = build_session_store(
+        session_backend,
+        ttl_sec=session_max_age_sec,
+        sqlite_path=get_env(TVENDOR_SESSION_SQLITE_PATH) or None,
+        memory_max_entries=get_env_int(TVENDOR_SESSION_MEMORY_MAX_ENTRIES, default=10000, min_value=1),
+    )
     security_headers_enabled = get_env_bool(TVENDOR_SECURITY_HEADERS_ENABLED, default=True)
     metrics_allow_unauthenticated = get_env_bool(
         TVENDOR_METRICS_ALLOW_UNAUTHENTICATED,
@@ -154,19 +209,47 @@ def load_app_runtime_settings(config: AppConfig) -> AppRuntimeSettings:
 
     perf_enabled = get_env_bool(TVENDOR_PERF_LOG_ENABLED, default=False)
     perf_header_enabled = get_env_bool(TVENDOR_PERF_RESPONSE_HEADER, default=True)
+    server_timing_enabled = get_env_bool(TVENDOR_SERVER_TIMING_ENABLED, default=config.is_dev_env)
     request_id_header_enabled = get_env_bool(TVENDOR_REQUEST_ID_HEADER_ENABLED, default=True)
     sql_preload_on_startup = get_env_bool(TVENDOR_SQL_PRELOAD_ON_STARTUP, default=False)
+    template_precompile_on_startup = get_env_bool(TVENDOR_TEMPLATE_PRECOMPILE_ON_STARTUP, default=True)
+    template_bytecode_cache_enabled = get_env_bool(TVENDOR_TEMPLATE_BYTECODE_CACHE_ENABLED, default=True)
+    template_bytecode_cache_dir = get_env(TVENDOR_TEMPLATE_BYTECODE_CACHE_DIR, "")
+    typeahead_index_warm_on_startup = get_env_bool(TVENDOR_TYPEAHEAD_INDEX_WARM_ON_STARTUP, default=True)
+    help_prerender_on_startup = get_env_bool(TVENDOR_HELP_PRERENDER_ON_STARTUP, default=True)
     slow_query_ms = max(1.0, get_env_float(TVENDOR_SLOW_QUERY_MS, default=750.0, min_value=1.0))
+    n_plus_one_threshold = get_env_int(TVENDOR_N_PLUS_ONE_THRESHOLD, default=10, min_value=0)
+
+    write_rate_limit_backend = get_env(TVENDOR_WRITE_RATE_LIMIT_BACKEND, "memory").strip().lower()
+    write_rate_limiter: SlidingWindowRateLimiter | SharedGcraRateLimiter
+    if write_rate_limit_backend == "sqlite":
+        write_rate_limiter = SharedGcraRateLimiter(
+            enabled=write_rate_limit_enabled,
+            max_requests=write_rate_limit_max_requests,
+            window_seconds=write_rate_limit_window_sec,
+            path=get_env(TVENDOR_WRITE_RATE_LIMIT_SQLITE_PATH) or None,
+        )
+    else:
+        write_rate_limiter = SlidingWindowRateLimiter(
+            enabled=write_rate_limit_enabled,
+            max_requests=write_rate_limit_max_requests,
+            window_seconds=write_rate_limit_window_sec,
+        )
 
-    write_rate_limiter = SlidingWindowRateLimiter(
-        enabled=write_rate_limit_enabled,
-        max_requests=write_rate_limit_max_requests,
-        window_seconds=write_rate_limit_window_sec,
+    worker_threads = get_env_int(TVENDOR_WORKER_THREADS, default=40, min_value=1, max_value=1000)
+    worker_admission_gate = WorkerAdmissionGate(
+        enabled=get_env_bool(TVENDOR_WORKER_ADMISSION_ENABLED, default=True),
+        max_concurrency=worker_threads,
+        max_queue=get_env_int(TVENDOR_WORKER_MAX_QUEUE, default=100, min_value=0),
+        retry_after_sec=get_env_int(TVENDOR_WORKER_RETRY_AFTER_SEC, default=2, min_value=1),
     )
 
     return AppRuntimeSettings(
         session_secret=session_secret,
         session_https_only=session_https_only,
+        session_backend=session_backend,
+        session_max_age_sec=session_max_age_sec,
+        session_store=session_store,
         security_headers_enabled=security_headers_enabled,
         metrics_allow_unauthenticated=metrics_allow_unauthenticated,
         metrics_auth_token=metrics_auth_token,
@@ -175,10 +258,19 @@ def load_app_runtime_settings(config: AppConfig) -> AppRuntimeSettings:
         csp_policy=csp_policy,
         perf_enabled=perf_enabled,
         perf_header_enabled=perf_header_enabled,
+        server_timing_enabled=server_timing_enabled,
         request_id_header_enabled=request_id_header_enabled,
         sql_preload_on_startup=sql_preload_on_startup,
+        template_precompile_on_startup=template_precompile_on_startup,
+        template_bytecode_cache_enabled=template_bytecode_cache_enabled,
+        template_bytecode_cache_dir=template_bytecode_cache_dir,
+        typeahead_index_warm_on_startup=typeahead_index_warm_on_startup,
+        help_prerender_on_startup=help_prerender_on_startup,
         slow_query_ms=slow_query_ms,
+        n_plus_one_threshold=n_plus_one_threshold,
         write_rate_limit_window_sec=write_rate_limit_window_sec,
         write_rate_limit_max_requests=write_rate_limit_max_requests,
         write_rate_limiter=write_rate_limiter,
+        worker_threads=worker_threads,
+        worker_admission_gate=worker_admission_gate,
     )
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from vendor_catalog_app.infrastructure.db import request_phase_timer
+
+_PRECOMPILE_LOCK = threading.Lock()
+_PRECOMPILE_STATS: dict[str, Any] = {}
+
+
+class TimedJinja2Templates(Jinja2Templates):
+    """Jinja2 templates that record render time in the request perf context."""
+
+    def TemplateResponse(self, *args: Any, **kwargs: Any):  # noqa: N802 - Starlette API name
+        with request_phase_timer("template"):
+            return super().TemplateResponse(*args, **kwargs)
+
+
+def configure_template_bytecode_cache(templates: Jinja2Templates, directory: str = "") -> None:
+    """Persist compiled template bytecode so workers and restarts skip recompiling.
+
+    An empty ``directory`` lets Jinja pick a private per-user temp directory. Cache
+    entries are keyed by template and checked against the source checksum, so edited
+    templates are recompiled rather than served stale.
+    """
+    cache_dir = str(directory or "").strip()
+    if cache_dir:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    templates.env.bytecode_cache = FileSystemBytecodeCache(cache_dir or None)
+
+
+def precompile_templates(templates: Jinja2Templates) -> dict[str, Any]:
+    """Load every HTML template into the environment cache and return timing stats.
+
+    Templates that fail to compile are reported rather than raised, so one broken page
+    does not block startup; it fails on first render as it would without precompiling.
+    """
+    env = templates.env
+    started = time.perf_counter()
+    names = [name for name in env.list_templates() if name.endswith(".html")]
+    errors: list[str] = []
+    for name in names:
+        try:
+            env.get_template(name)
+        except Exception as exc:
+            errors.append(f"{name}: {exc.__class__.__name__}: {exc}")
+    stats = {
+        "templates": len(names) - len(errors),
+        "errors": errors,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 1),
+        "bytecode_cache": env.bytecode_cache is not None,
+    }
+    with _PRECOMPILE_LOCK:
+        _PRECOMPILE_STATS.clear()
+        _PRECOMPILE_STATS.update(stats)
+    return stats
+
+
+def template_precompile_stats() -> dict[str, Any]:
+    with _PRECOMPILE_LOCK:
+        return dict(_PRECOMPILE_STATS)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any
+
+import anyio
+from anyio import to_thread
+
+
+def configure_worker_thread_limiter(total_threads: int) -> int:
+    """Resize the anyio default thread limiter that runs sync route handlers."""
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(1, int(total_threads))
+    return int(limiter.total_tokens)
+
+
+def worker_thread_limiter_snapshot() -> dict[str, int]:
+    limiter = to_thread.current_default_thread_limiter()
+    stats = limiter.statistics()
+    return {
+        "total_threads": int(limiter.total_tokens),
+        "busy_threads": int(stats.borrowed_tokens),
+        "tasks_waiting": int(stats.tasks_waiting),
+    }
+
+
+class WorkerAdmissionGate:
+    """Bounded request admission in front of the sync handler thread pool.
+
+    At most ``max_concurrency`` requests run at once; up to ``max_queue`` more wait
+    in FIFO order, and anything beyond that is rejected so callers can shed load.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        max_concurrency: int,
+        max_queue: int,
+        retry_after_sec: int,
+    ) -> None:
+        self.enabled = bool(enabled)
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_queue = max(0, int(max_queue))
+        self.retry_after_sec = max(1, int(retry_after_sec))
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiters: deque[anyio.Event] = deque()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "active": int(self._active),
+                "queued": len(self._waiters),
+                "max_concurrency": int(self.max_concurrency),
+                "max_queue": int(self.max_queue),
+            }
+
+    async def acquire(self) -> float | None:
+        """Wait for a slot and return the queue wait in ms, or ``None`` when rejected."""
+        with self._lock:
+            if self._active < self.max_concurrency and not self._waiters:
+                self._active += 1
+                return 0.0
+            if len(self._waiters) >= self.max_queue:
+                return None
+            waiter = anyio.Event()
+            self._waiters.append(waiter)
+        started = time.perf_counter()
+        try:
+            await waiter.wait()
+        except BaseException:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    # The slot was already handed to this waiter; pass it on.
+                    self._release_locked()
+            raise
+        return (time.perf_counter() - started) * 1000.0
+
+    def release(self) -> None:
+        with self._lock:
+            self._release_locked()
+
+    def _release_locked(self) -> None:
+        if self._waiters:
+            # Hand the slot straight to the next waiter; the active count is unchanged.
+            self._waiters.popleft().set()
+            return
+        self._active = max(0, self._active - 1)
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
 from collections.abc import Iterable
+from typing import Any
 
 import bleach
 from markdown import markdown
 
+from vendor_catalog_app.core.env import TVENDOR_MARKDOWN_RENDER_CACHE_MAX_ENTRIES, get_env_int
+
+LOGGER = logging.getLogger(__name__)
+
+# Part of every content hash; bump when extensions or the sanitizer allow-lists change
+# so persisted renders are redone.
+MARKDOWN_RENDER_VERSION = "1"
+
 _ALLOWED_TAGS: list[str] = [
     "a",
     "p",
@@ -40,10 +53,43 @@ _ALLOWED_ATTRS: dict[str, Iterable[str]] = {
 _ALLOWED_PROTOCOLS = ["http", "https", "mailto"]
 
 
-def render_safe_markdown(text: str) -> str:
+_RENDER_CACHE: OrderedDict[str, str] = OrderedDict()
+_RENDER_CACHE_LOCK = threading.Lock()
+
+
+def _normalize_markdown(text: str) -> str:
     normalized = str(text or "")
     if "\\n" in normalized or "\\r" in normalized:
         normalized = normalized.replace("\\r\\n", "\n").replace("\\r", "\n").replace("\\n", "\n")
+    return normalized
+
+
+def markdown_content_hash(text: str) -> str:
+    payload = f"{MARKDOWN_RENDER_VERSION}\0{_normalize_markdown(text)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def remember_rendered_markdown(content_hash: str, html: str) -> None:
+    """Seed the in-process render cache, e.g. with a render persisted by another worker."""
+    max_entries = get_env_int(TVENDOR_MARKDOWN_RENDER_CACHE_MAX_ENTRIES, default=256, min_value=0)
+    if max_entries <= 0:
+        return
+    with _RENDER_CACHE_LOCK:
+        _RENDER_CACHE[content_hash] = html
+        _RENDER_CACHE.move_to_end(content_hash, last=True)
+        while len(_RENDER_CACHE) > max_entries:
+            _RENDER_CACHE.popitem(last=False)
+
+
+def _cached_render(content_hash: str) -> str | None:
+    with _RENDER_CACHE_LOCK:
+        html = _RENDER_CACHE.get(content_hash)
+        if html is not None:
+            _RENDER_CACHE.move_to_end(content_hash, last=True)
+        return html
+
+
+def _render(normalized: str) -> str:
     raw_html = markdown(
         normalized,
         extensions=["extra", "sane_lists"],
@@ -57,3 +103,52 @@ def render_safe_markdown(text: str) -> str:
         strip=True,
     )
     return bleach.linkify(cleaned, skip_tags=["pre", "code"])
+
+
+def render_safe_markdown(text: str) -> str:
+    """Sanitized HTML for ``text``, served from an LRU keyed by content hash."""
+    content_hash = markdown_content_hash(text)
+    html = _cached_render(content_hash)
+    if html is None:
+        html = _render(_normalize_markdown(text))
+        remember_rendered_markdown(content_hash, html)
+    return html
+
+
+def render_help_article_html(repo: Any, article: dict[str, Any]) -> str:
+    """Article HTML from the render cache, the persisted render, or a fresh render (then persisted)."""
+    content = str(article.get("content_md") or "")
+    content_hash = markdown_content_hash(content)
+    html = _cached_render(content_hash)
+    if html is not None:
+        return html
+    article_id = str(article.get("article_id") or "")
+    stored = repo.list_help_article_renders().get(article_id) if article_id else None
+    if stored and stored.get("content_hash") == content_hash:
+        remember_rendered_markdown(content_hash, stored["content_html"])
+        return stored["content_html"]
+    html = render_safe_markdown(content)
+    if article_id:
+        repo.save_help_article_renders([(article_id, content_hash, html)])
+    return html
+
+
+def prerender_help_articles(repo: Any) -> int:
+    """Warm the render cache for every help article, persisting renders that are missing or stale.
+
+    Returns the number of articles rendered (rather than loaded from storage).
+    """
+    stored = repo.list_help_article_renders()
+    fresh: list[tuple[str, str, str]] = []
+    for article in repo.list_help_articles_full():
+        article_id = str(article.get("article_id") or "")
+        content = str(article.get("content_md") or "")
+        content_hash = markdown_content_hash(content)
+        existing = stored.get(article_id)
+        if existing and existing.get("content_hash") == content_hash:
+            remember_rendered_markdown(content_hash, existing["content_html"])
+            continue
+        fresh.append((article_id, content_hash, render_safe_markdown(content)))
+    if fresh:
+        repo.save_help_article_renders(fresh)
+    return len(fresh)
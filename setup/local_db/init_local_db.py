@@ -198,6 +198,29 @@ def _apply_full_seed(conn: sqlite3.Connection) -> dict[str, int]:
     return seed_full_corporate(conn)
 
 
+def _rebuild_search_fts(conn: sqlite3.Connection) -> int:
+    """Re-index every ``search_fts_*`` table from its content table.
+
+    The FTS5 tables map to their content rows by implicit rowid, which VACUUM and bulk
+    rewrites may renumber on tables with TEXT primary keys, so they are rebuilt after
+    every (re)initialization rather than trusted to still line up.
+    """
+    cursor = conn.execute(
+        """
+        SELECT name
+        FROM sqlite_master
+        WHERE type = 'table'
+          AND name GLOB 'search_fts_*'
+          AND sql LIKE 'CREATE VIRTUAL TABLE%'
+        ORDER BY name
+        """
+    )
+    names = [str(row[0]) for row in cursor.fetchall()]
+    for name in names:
+        conn.execute(f"INSERT INTO {name}({name}) VALUES ('rebuild')")
+    return len(names)
+
+
 def _table_columns(conn: sqlite3.Connection, table_name: str) -> set[str]:
     cursor = conn.execute(f"PRAGMA table_info({table_name})")
     rows = cursor.fetchall()
@@ -306,6 +329,7 @@ def main() -> None:
         full_seed_counts: dict[str, int] | None = None
         if not args.skip_seed and args.seed_profile == "full":
             full_seed_counts = _apply_full_seed(conn)
+        _rebuild_search_fts(conn)
         conn.commit()
         if not args.skip_verify:
             schema_errors = verify_required_schema(conn)
@@ -646,3 +646,20 @@ CREATE TABLE IF NOT EXISTS app_import_stage_payment (
   area_payload_json STRING NOT NULL,
   created_at STRING NOT NULL
 ) USING DELTA;
+
+-- Denormalized vendor search text (vendor, offerings, contracts, owners, contacts,
+-- demos, active projects), refreshed by the app when those entities change.
+CREATE TABLE IF NOT EXISTS app_vendor_search_doc (
+  vendor_id STRING,
+  search_text STRING NOT NULL,
+  updated_at STRING NOT NULL
+) USING DELTA;
+
+-- Sanitized HTML of each help article, keyed by a hash of its markdown and renderer
+-- version, so workers reuse renders instead of re-running markdown and bleach.
+CREATE TABLE IF NOT EXISTS app_help_article_render (
+  article_id STRING,
+  content_hash STRING NOT NULL,
+  content_html STRING NOT NULL,
+  rendered_at STRING NOT NULL
+) USING DELTA;
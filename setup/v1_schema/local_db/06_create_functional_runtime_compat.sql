@@ -676,3 +676,20 @@ CREATE TABLE IF NOT EXISTS app_import_stage_project (
   created_at TEXT NOT NULL,
   FOREIGN KEY (import_job_id) REFERENCES app_import_job(import_job_id)
 );
+
+-- Denormalized vendor search text (vendor, offerings, contracts, owners, contacts,
+-- demos, active projects), refreshed by the app when those entities change.
+CREATE TABLE IF NOT EXISTS app_vendor_search_doc (
+  vendor_id TEXT PRIMARY KEY,
+  search_text TEXT NOT NULL,
+  updated_at TEXT NOT NULL
+);
+
+-- Sanitized HTML of each help article, keyed by a hash of its markdown and renderer
+-- version, so workers reuse renders instead of re-running markdown and bleach.
+CREATE TABLE IF NOT EXISTS app_help_article_render (
+  article_id TEXT PRIMARY KEY,
+  content_hash TEXT NOT NULL,
+  content_html TEXT NOT NULL,
+  rendered_at TEXT NOT NULL
+);
@@ -0,0 +1,154 @@
+PRAGMA foreign_keys = ON;
+
+-- Local-mode full-text search. Each FTS5 table indexes its content table through
+-- rowid with the trigram tokenizer, so MATCH on a quoted phrase answers the same
+-- case-insensitive substring question as lower(col) LIKE '%q%' (queries of 3+ chars).
+-- Triggers keep the indexes in sync; the final 'rebuild' backfills existing rows.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts_vendor USING fts5(
+  vendor_id, legal_name, display_name,
+  content='core_vendor',
+  content_rowid='rowid',
+  tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_vendor_ai AFTER INSERT ON core_vendor BEGIN
+  INSERT INTO search_fts_vendor(rowid, vendor_id, legal_name, display_name) VALUES (new.rowid, new.vendor_id, new.legal_name, new.display_name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_vendor_ad AFTER DELETE ON core_vendor BEGIN
+  INSERT INTO search_fts_vendor(search_fts_vendor, rowid, vendor_id, legal_name, display_name) VALUES ('delete', old.rowid, old.vendor_id, old.legal_name, old.display_name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_vendor_au AFTER UPDATE ON core_vendor BEGIN
+  INSERT INTO search_fts_vendor(search_fts_vendor, rowid, vendor_id, legal_name, display_name) VALUES ('delete', old.rowid, old.vendor_id, old.legal_name, old.display_name);
+  INSERT INTO search_fts_vendor(rowid, vendor_id, legal_name, display_name) VALUES (new.rowid, new.vendor_id, new.legal_name, new.display_name);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts_offering USING fts5(
+  offering_id, offering_name, offering_type, lob, service_type,
+  content='core_vendor_offering',
+  content_rowid='rowid',
+  tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_offering_ai AFTER INSERT ON core_vendor_offering BEGIN
+  INSERT INTO search_fts_offering(rowid, offering_id, offering_name, offering_type, lob, service_type) VALUES (new.rowid, new.offering_id, new.offering_name, new.offering_type, new.lob, new.service_type);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_offering_ad AFTER DELETE ON core_vendor_offering BEGIN
+  INSERT INTO search_fts_offering(search_fts_offering, rowid, offering_id, offering_name, offering_type, lob, service_type) VALUES ('delete', old.rowid, old.offering_id, old.offering_name, old.offering_type, old.lob, old.service_type);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_offering_au AFTER UPDATE ON core_vendor_offering BEGIN
+  INSERT INTO search_fts_offering(search_fts_offering, rowid, offering_id, offering_name, offering_type, lob, service_type) VALUES ('delete', old.rowid, old.offering_id, old.offering_name, old.offering_type, old.lob, old.service_type);
+  INSERT INTO search_fts_offering(rowid, offering_id, offering_name, offering_type, lob, service_type) VALUES (new.rowid, new.offering_id, new.offering_name, new.offering_type, new.lob, new.service_type);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts_project USING fts5(
+  project_id, project_name, project_type, status, owner_principal, description,
+  content='app_project',
+  content_rowid='rowid',
+  tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_project_ai AFTER INSERT ON app_project BEGIN
+  INSERT INTO search_fts_project(rowid, project_id, project_name, project_type, status, owner_principal, description) VALUES (new.rowid, new.project_id, new.project_name, new.project_type, new.status, new.owner_principal, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_project_ad AFTER DELETE ON app_project BEGIN
+  INSERT INTO search_fts_project(search_fts_project, rowid, project_id, project_name, project_type, status, owner_principal, description) VALUES ('delete', old.rowid, old.project_id, old.project_name, old.project_type, old.status, old.owner_principal, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_project_au AFTER UPDATE ON app_project BEGIN
+  INSERT INTO search_fts_project(search_fts_project, rowid, project_id, project_name, project_type, status, owner_principal, description) VALUES ('delete', old.rowid, old.project_id, old.project_name, old.project_type, old.status, old.owner_principal, old.description);
+  INSERT INTO search_fts_project(rowid, project_id, project_name, project_type, status, owner_principal, description) VALUES (new.rowid, new.project_id, new.project_name, new.project_type, new.status, new.owner_principal, new.description);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts_contract USING fts5(
+  contract_id, contract_number, vendor_id, offering_id, contract_status,
+  content='core_contract',
+  content_rowid='rowid',
+  tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_contract_ai AFTER INSERT ON core_contract BEGIN
+  INSERT INTO search_fts_contract(rowid, contract_id, contract_number, vendor_id, offering_id, contract_status) VALUES (new.rowid, new.contract_id, new.contract_number, new.vendor_id, new.offering_id, new.contract_status);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_contract_ad AFTER DELETE ON core_contract BEGIN
+  INSERT INTO search_fts_contract(search_fts_contract, rowid, contract_id, contract_number, vendor_id, offering_id, contract_status) VALUES ('delete', old.rowid, old.contract_id, old.contract_number, old.vendor_id, old.offering_id, old.contract_status);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_contract_au AFTER UPDATE ON core_contract BEGIN
+  INSERT INTO search_fts_contract(search_fts_contract, rowid, contract_id, contract_number, vendor_id, offering_id, contract_status) VALUES ('delete', old.rowid, old.contract_id, old.contract_number, old.vendor_id, old.offering_id, old.contract_status);
+  INSERT INTO search_fts_contract(rowid, contract_id, contract_number, vendor_id, offering_id, contract_status) VALUES (new.rowid, new.contract_id, new.contract_number, new.vendor_id, new.offering_id, new.contract_status);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts_vendor_contact USING fts5(
+  full_name, email, phone, contact_type,
+  content='core_vendor_contact',
+  content_rowid='rowid',
+  tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_vendor_contact_ai AFTER INSERT ON core_vendor_contact BEGIN
+  INSERT INTO search_fts_vendor_contact(rowid, full_name, email, phone, contact_type) VALUES (new.rowid, new.full_name, new.email, new.phone, new.contact_type);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_vendor_contact_ad AFTER DELETE ON core_vendor_contact BEGIN
+  INSERT INTO search_fts_vendor_contact(search_fts_vendor_contact, rowid, full_name, email, phone, contact_type) VALUES ('delete', old.rowid, old.full_name, old.email, old.phone, old.contact_type);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_vendor_contact_au AFTER UPDATE ON core_vendor_contact BEGIN
+  INSERT INTO search_fts_vendor_contact(search_fts_vendor_contact, rowid, full_name, email, phone, contact_type) VALUES ('delete', old.rowid, old.full_name, old.email, old.phone, old.contact_type);
+  INSERT INTO search_fts_vendor_contact(rowid, full_name, email, phone, contact_type) VALUES (new.rowid, new.full_name, new.email, new.phone, new.contact_type);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts_offering_contact USING fts5(
+  full_name, email, phone, contact_type,
+  content='core_offering_contact',
+  content_rowid='rowid',
+  tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_offering_contact_ai AFTER INSERT ON core_offering_contact BEGIN
+  INSERT INTO search_fts_offering_contact(rowid, full_name, email, phone, contact_type) VALUES (new.rowid, new.full_name, new.email, new.phone, new.contact_type);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_offering_contact_ad AFTER DELETE ON core_offering_contact BEGIN
+  INSERT INTO search_fts_offering_contact(search_fts_offering_contact, rowid, full_name, email, phone, contact_type) VALUES ('delete', old.rowid, old.full_name, old.email, old.phone, old.contact_type);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_offering_contact_au AFTER UPDATE ON core_offering_contact BEGIN
+  INSERT INTO search_fts_offering_contact(search_fts_offering_contact, rowid, full_name, email, phone, contact_type) VALUES ('delete', old.rowid, old.full_name, old.email, old.phone, old.contact_type);
+  INSERT INTO search_fts_offering_contact(rowid, full_name, email, phone, contact_type) VALUES (new.rowid, new.full_name, new.email, new.phone, new.contact_type);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts_vendor_search_doc USING fts5(
+  search_text,
+  content='app_vendor_search_doc',
+  content_rowid='rowid',
+  tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_vendor_search_doc_ai AFTER INSERT ON app_vendor_search_doc BEGIN
+  INSERT INTO search_fts_vendor_search_doc(rowid, search_text) VALUES (new.rowid, new.search_text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_vendor_search_doc_ad AFTER DELETE ON app_vendor_search_doc BEGIN
+  INSERT INTO search_fts_vendor_search_doc(search_fts_vendor_search_doc, rowid, search_text) VALUES ('delete', old.rowid, old.search_text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_fts_vendor_search_doc_au AFTER UPDATE ON app_vendor_search_doc BEGIN
+  INSERT INTO search_fts_vendor_search_doc(search_fts_vendor_search_doc, rowid, search_text) VALUES ('delete', old.rowid, old.search_text);
+  INSERT INTO search_fts_vendor_search_doc(rowid, search_text) VALUES (new.rowid, new.search_text);
+END;
+
+INSERT INTO search_fts_vendor(search_fts_vendor) VALUES ('rebuild');
+INSERT INTO search_fts_offering(search_fts_offering) VALUES ('rebuild');
+INSERT INTO search_fts_project(search_fts_project) VALUES ('rebuild');
+INSERT INTO search_fts_contract(search_fts_contract) VALUES ('rebuild');
+INSERT INTO search_fts_vendor_contact(search_fts_vendor_contact) VALUES ('rebuild');
+INSERT INTO search_fts_offering_contact(search_fts_offering_contact) VALUES ('rebuild');
+INSERT INTO search_fts_vendor_search_doc(search_fts_vendor_search_doc) VALUES ('rebuild');
@@ -20,6 +20,9 @@ ORDERED_SQL_FILES: tuple[str, ...] = (
     "90_create_indexes.sql",
 )
 
+# SQLite-only scripts, applied before the shared index script.
+LOCAL_ONLY_SQL_FILES: tuple[str, ...] = ("08_create_search_fts.sql",)
+
 TOKEN_PATTERN = re.compile(r"\$\{(CATALOG|SCHEMA)\}")
 
 
@@ -29,8 +32,9 @@ def _require_file(path: Path) -> Path:
     return path
 
 
-def _ordered_files(base_dir: Path) -> list[Path]:
-    return [_require_file(base_dir / name) for name in ORDERED_SQL_FILES]
+def _ordered_files(base_dir: Path, extra: tuple[str, ...] = ()) -> list[Path]:
+    names = [*ORDERED_SQL_FILES[:-1], *extra, ORDERED_SQL_FILES[-1]]
+    return [_require_file(base_dir / name) for name in names]
 
 
 def _run_sqlite(sql_files: Iterable[Path], db_path: Path) -> None:
@@ -192,7 +196,7 @@ if __name__ == "__main__":
 
     if args.target == "local":
         sql_dir = base_dir / "local_db"
-        sql_files = _ordered_files(sql_dir)
+        sql_files = _ordered_files(sql_dir, LOCAL_ONLY_SQL_FILES)
         local_db_path = Path(args.db_path).resolve()
         if args.recreate:
             _recreate_sqlite_db(local_db_path)
@@ -1,11 +1,42 @@
 from __future__ import annotations
 
+import os
+import shutil
+import sqlite3
 import subprocess
 import sys
+import tempfile
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import closing
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+APP_ROOT = REPO_ROOT / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+LOCAL_SCHEMA_ROOT = REPO_ROOT / "setup" / "v1_schema" / "local_db"
+# Audit columns for seeded rows: (updated_at, updated_by) / (created_at, created_by).
+SEED_STAMP = ("2024-01-01T00:00:00", "seed")
+_SESSION_STORE_DIR: str | None = None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Test modules build the app at import time, before any fixture runs, so the
+    # session store path is pinned for the whole run here.
+    global _SESSION_STORE_DIR
+    _SESSION_STORE_DIR = tempfile.mkdtemp(prefix="tvendor_test_sessions_")
+    os.environ["TVENDOR_SESSION_SQLITE_PATH"] = str(Path(_SESSION_STORE_DIR) / "sessions.db")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    os.environ.pop("TVENDOR_SESSION_SQLITE_PATH", None)
+    if _SESSION_STORE_DIR:
+        shutil.rmtree(_SESSION_STORE_DIR, ignore_errors=True)
+
 
 @pytest.fixture()
 def isolated_local_db(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
@@ -39,3 +70,219 @@ def isolated_local_db(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
     monkeypatch.setenv("TVENDOR_SESSION_SECRET", "test-session-secret")
     monkeypatch.setenv("TVENDOR_TERMS_ENFORCEMENT_ENABLED", "false")
     return db_path
+
+
+@pytest.fixture()
+def local_schema_db(tmp_path: Path) -> Path:
+    """Empty SQLite DB with the v1 local schema applied, without running the full bootstrap."""
+    db_path = tmp_path / "catalog.db"
+    with closing(sqlite3.connect(str(db_path))) as conn:
+        for script in sorted(LOCAL_SCHEMA_ROOT.glob("0*.sql")):
+            conn.executescript(script.read_text(encoding="utf-8-sig"))
+        conn.commit()
+    return db_path
+
+
+@pytest.fixture()
+def seed_local_db(local_schema_db: Path) -> Callable[[str, Iterable[Mapping[str, Any]]], None]:
+    """Return ``seed(table, rows)``, which inserts column -> value mappings into ``local_schema_db``."""
+
+    def _seed(table: str, rows: Iterable[Mapping[str, Any]]) -> None:
+        with closing(sqlite3.connect(str(local_schema_db))) as conn:
+            for row in rows:
+                columns = list(row)
+                conn.execute(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                    tuple(row[column] for column in columns),
+                )
+            conn.commit()
+
+    return _seed
+
+
+@pytest.fixture()
+def search_catalog_db(local_schema_db: Path, seed_local_db) -> Path:
+    """``local_schema_db`` seeded with one of each searchable entity type."""
+    updated = dict(zip(("updated_at", "updated_by"), SEED_STAMP, strict=True))
+    created = dict(zip(("created_at", "created_by"), SEED_STAMP, strict=True))
+    vendor = {"lifecycle_state": "active", "owner_org_id": "IT", "risk_tier": "low", **updated}
+    seed_local_db(
+        "core_vendor",
+        [
+            {"vendor_id": "v1", "legal_name": "Acme Corporation", "display_name": "Acme", **vendor},
+            {"vendor_id": "v2", "legal_name": "Globex LLC", "display_name": None, **vendor},
+            {"vendor_id": "v3", "legal_name": "Initech Inc", "display_name": "Initech", **vendor},
+        ],
+    )
+    offering = {"lifecycle_state": "active", **updated}
+    seed_local_db(
+        "core_vendor_offering",
+        [
+            {"offering_id": "o1", "vendor_id": "v1", "offering_name": "Acme Cloud", "offering_type": "saas", **offering},
+            {
+                "offering_id": "o2",
+                "vendor_id": "v2",
+                "offering_name": "Globex Support",
+                "offering_type": "services",
+                **offering,
+            },
+        ],
+    )
+    contract = {"contract_status": "active", **updated}
+    seed_local_db(
+        "core_contract",
+        [
+            {"contract_id": "k1", "vendor_id": "v1", "offering_id": "o1", "contract_number": "ACM-2024-01", **contract},
+            {"contract_id": "k2", "vendor_id": "v2", "offering_id": None, "contract_number": "GLX-77", **contract},
+        ],
+    )
+    seed_local_db(
+        "core_vendor_contact",
+        [
+            {
+                "vendor_contact_id": "c1",
+                "vendor_id": "v3",
+                "contact_type": "primary",
+                "full_name": "Peter Gibbons",
+                "email": "peter@initech.example",
+                **updated,
+            }
+        ],
+    )
+    seed_local_db(
+        "core_offering_contact",
+        [
+            {
+                "offering_contact_id": "oc1",
+                "offering_id": "o2",
+                "contact_type": "support",
+                "full_name": "Hank Scorpio",
+                "email": "hank@globex.example",
+                **updated,
+            }
+        ],
+    )
+    seed_local_db(
+        "app_project",
+        [
+            {
+                "project_id": "p1",
+                "vendor_id": "v2",
+                "project_name": "Hammock Rollout",
+                "status": "active",
+                "description": "Cloud migration",
+                **created,
+                **updated,
+            }
+        ],
+    )
+    seed_local_db(
+        "vendor_help_article",
+        [
+            {
+                "article_id": "h1",
+                "slug": "add-vendor",
+                "title": "Adding a vendor",
+                "section": "Basics",
+                "article_type": "guide",
+                "role_visibility": "viewer",
+                "content_md": "Open the **Vendors** page and choose New.",
+                "owned_by": "seed",
+                **updated,
+                **created,
+            }
+        ],
+    )
+    return local_schema_db
+
+
+@pytest.fixture()
+def help_articles_db(local_schema_db: Path, seed_local_db) -> Path:
+    """``local_schema_db`` seeded with three Help Center articles, one visible to admins only."""
+    article = {"section": "Basics", "article_type": "guide", "owned_by": "seed"}
+    article.update(zip(("updated_at", "updated_by"), SEED_STAMP, strict=True))
+    article.update(zip(("created_at", "created_by"), SEED_STAMP, strict=True))
+    seed_local_db(
+        "vendor_help_article",
+        [
+            {
+                "article_id": "h1",
+                "slug": "add-vendor",
+                "title": "Add a new vendor",
+                "role_visibility": "viewer",
+                "content_md": "Open the **Vendors** page and choose New.",
+                **article,
+            },
+            {
+                "article_id": "h2",
+                "slug": "contracts",
+                "title": "Contracts",
+                "role_visibility": "viewer",
+                "content_md": "Track renewals for each vendor contract.",
+                **article,
+            },
+            {
+                "article_id": "h3",
+                "slug": "admin-roles",
+                "title": "Managing roles",
+                "role_visibility": "admin",
+                "content_md": "Grant a [vendor role](/admin) to a user.",
+                **article,
+            },
+        ],
+    )
+    return local_schema_db
+
+
+@pytest.fixture()
+def local_repo(local_schema_db: Path, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[Callable[[], Any]]:
+    """Return a factory of local-mode ``VendorRepository`` instances over ``local_schema_db``.
+
+    Each repository gets the test's own audit spool directory and is closed at teardown.
+    Set feature env vars with ``monkeypatch`` before calling the factory.
+    """
+    from vendor_catalog_app.backend.repository import VendorRepository
+    from vendor_catalog_app.core.config import AppConfig
+
+    monkeypatch.setenv("TVENDOR_AUDIT_SPOOL_DIR", str(tmp_path / "audit_spool"))
+    repos: list[VendorRepository] = []
+
+    def _build() -> VendorRepository:
+        repo = VendorRepository(
+            AppConfig(
+                databricks_server_hostname="",
+                databricks_http_path="",
+                databricks_token="",
+                use_local_db=True,
+                local_db_path=str(local_schema_db),
+            )
+        )
+        repos.append(repo)
+        return repo
+
+    yield _build
+    for repo in repos:
+        repo.close()
+
+
+@pytest.fixture()
+def db_call_budget(monkeypatch: pytest.MonkeyPatch):
+    """Return an assert helper that caps DB calls for one response.
+
+    Enables the `X-TVendor-Perf` header, so apps must be created after this fixture runs.
+    """
+    monkeypatch.setenv("TVENDOR_PERF_LOG_ENABLED", "true")
+    monkeypatch.setenv("TVENDOR_PERF_RESPONSE_HEADER", "true")
+
+    def _assert_max_db_calls(response, max_calls: int) -> int:
+        header = str(response.headers.get("X-TVendor-Perf", ""))
+        fields = dict(part.split("=", 1) for part in header.split(";") if "=" in part)
+        assert "db_calls" in fields, f"Response has no X-TVendor-Perf db_calls field: {header!r}"
+        db_calls = int(fields["db_calls"])
+        assert db_calls <= max_calls, (
+            f"{response.request.method} {response.request.url.path} made {db_calls} DB calls "
+            f"(budget {max_calls})."
+        )
+        return db_calls
+
+    return _assert_max_db_calls
@@ -4,6 +4,7 @@ import sys
 from pathlib import Path
 
 import pytest
+from fastapi import Request
 from fastapi.testclient import TestClient
 
 APP_ROOT = Path(__file__).resolve().parents[1] / "app"
@@ -70,3 +71,147 @@ def test_prometheus_metrics_endpoint_exports_core_metrics(
     assert "tvendor_http_requests_total" in text
     assert "tvendor_http_request_duration_ms_bucket" in text
     assert 'path="/api/test-observe"' in text
+
+
+def test_repeated_query_fingerprint_logs_n_plus_one_and_counts_db_calls(
+    _reset_observability_cache: None,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    db_call_budget,
+) -> None:
+    from vendor_catalog_app.core.config import AppConfig
+    from vendor_catalog_app.infrastructure.db import DatabricksSQLClient
+
+    class _Cursor:
+        description = [("value",)]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def execute(self, statement, params):
+            return None
+
+        def fetchall(self):
+            return [(1,)]
+
+    class _Conn:
+        def cursor(self):
+            return _Cursor()
+
+        def close(self):
+            return None
+
+    monkeypatch.setenv("TVENDOR_N_PLUS_ONE_THRESHOLD", "5")
+    monkeypatch.setenv("TVENDOR_QUERY_CACHE_ENABLED", "false")
+    sql_client = DatabricksSQLClient(
+        AppConfig(
+            databricks_server_hostname="example.cloud.databricks.com",
+            databricks_http_path="/sql/1.0/warehouses/abc",
+            databricks_token="dapiXXX",
+            use_local_db=False,
+        )
+    )
+    monkeypatch.setattr(sql_client, "_connect_databricks", lambda: _Conn())
+    app = create_app()
+
+    @app.get("/api/test-n-plus-one")
+    def _test_n_plus_one_route() -> dict[str, bool]:
+        for vendor_id in range(6):
+            sql_client.query("SELECT * FROM contacts WHERE vendor_id = %s", params=(vendor_id,))
+        return {"ok": True}
+
+    client = TestClient(app)
+    with caplog.at_level("WARNING", logger="vendor_catalog_app.perf"):
+        response = client.get("/api/test-n-plus-one")
+
+    assert response.status_code == 200
+    assert db_call_budget(response, 6) == 6
+    events = [record for record in caplog.records if getattr(record, "event", "") == "n_plus_one"]
+    assert len(events) == 1
+    assert events[0].path == "/api/test-n-plus-one"
+    assert events[0].count == 6
+    with pytest.raises(AssertionError):
+        db_call_budget(response, 5)
+
+
+def test_server_timing_header_breaks_down_request_phases(
+    _reset_observability_cache: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("TVENDOR_SERVER_TIMING_ENABLED", "true")
+    app = create_app()
+
+    @app.get("/api/test-server-timing")
+    def _test_server_timing_route(request: Request):
+        return request.app.state.templates.TemplateResponse(request, "404.html", {})
+
+    client = TestClient(app)
+    response = client.get("/api/test-server-timing")
+
+    assert response.status_code == 200
+    entries = {
+        item.strip().split(";", 1)[0]: item.strip()
+        for item in response.headers["Server-Timing"].split(",")
+    }
+    assert {"total", "mw", "app", "user", "db", "cache", "tpl"}.issubset(entries)
+    template_ms = float(entries["tpl"].split("dur=", 1)[1].split(";", 1)[0])
+    assert template_ms > 0
+
+
+def test_server_timing_header_can_be_disabled(
+    _reset_observability_cache: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("TVENDOR_SERVER_TIMING_ENABLED", "false")
+    app = create_app()
+
+    @app.get("/api/test-server-timing-off")
+    def _test_server_timing_off_route() -> dict[str, bool]:
+        return {"ok": True}
+
+    response = TestClient(app).get("/api/test-server-timing-off")
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
+
+
+def test_worker_admission_rejects_with_retry_after_when_queue_is_full(
+    _reset_observability_cache: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("TVENDOR_METRICS_ENABLED", "true")
+    monkeypatch.setenv("TVENDOR_METRICS_PROMETHEUS_ENABLED", "true")
+    monkeypatch.setenv("TVENDOR_METRICS_ALLOW_UNAUTHENTICATED", "true")
+    monkeypatch.setenv("TVENDOR_WORKER_THREADS", "1")
+    monkeypatch.setenv("TVENDOR_WORKER_MAX_QUEUE", "0")
+    monkeypatch.setenv("TVENDOR_WORKER_RETRY_AFTER_SEC", "7")
+    app = create_app()
+
+    @app.get("/api/test-worker-busy")
+    def _test_worker_busy_route() -> dict[str, object]:
+        # The outer request holds the only worker slot while this nested call is made.
+        nested = TestClient(app).get("/api/test-worker-inner")
+        return {
+            "status": nested.status_code,
+            "retry_after": nested.headers.get("Retry-After"),
+            "code": nested.json()["error"]["code"],
+        }
+
+    @app.get("/api/test-worker-inner")
+    def _test_worker_inner_route() -> dict[str, bool]:
+        return {"ok": True}
+
+    client = TestClient(app)
+    response = client.get("/api/test-worker-busy")
+    assert response.status_code == 200
+    assert response.json() == {"status": 503, "retry_after": "7", "code": "SERVICE_UNAVAILABLE"}
+
+    # The slot is released once the outer request completes.
+    assert client.get("/api/test-worker-inner").status_code == 200
+
+    metrics = client.get("/api/metrics").text
+    assert "tvendor_worker_admission_rejected_total 1" in metrics
+    assert "tvendor_worker_queue_wait_ms_count" in metrics
+    assert "tvendor_worker_requests_queued 0" in metrics
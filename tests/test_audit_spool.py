@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import sqlite3
+import sys
+import time
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.infrastructure import spool as spool_module
+from vendor_catalog_app.infrastructure.spool import DurableSpool
+
+pytestmark = pytest.mark.skipif(spool_module.fcntl is None, reason="spool ownership needs POSIX file locks")
+
+
+def _spool(directory: Path, flush_batch, **overrides) -> DurableSpool:
+    options = {
+        "name": "test",
+        "directory": directory,
+        "flush_batch": flush_batch,
+        "enabled": True,
+        "batch_size": 100,
+        "flush_interval_ms": 60000,
+        "fsync": False,
+        "max_attempts": 2,
+    }
+    options.update(overrides)
+    return DurableSpool(**options)
+
+
+def test_spooled_records_are_redelivered_after_restart(tmp_path: Path) -> None:
+    def _unavailable(_records) -> None:
+        raise ConnectionError("warehouse unavailable")
+
+    first = _spool(tmp_path, _unavailable, max_attempts=10)
+    for idx in range(3):
+        first.append({"change_event_id": f"chg-{idx}"})
+    first.close(timeout_sec=1.0)
+    assert (tmp_path / "spool.jsonl").stat().st_size > 0
+
+    delivered: list[list[dict]] = []
+    second = _spool(tmp_path, delivered.append)
+    assert second.flush() == 3
+    assert [record["change_event_id"] for record in delivered[0]] == ["chg-0", "chg-1", "chg-2"]
+
+    # Fully delivered spools are compacted on the next flush.
+    assert second.flush() == 0
+    assert (tmp_path / "spool.jsonl").stat().st_size == 0
+    second.close(timeout_sec=1.0)
+
+
+def test_second_owner_writes_synchronously_and_poison_batches_are_dead_lettered(tmp_path: Path) -> None:
+    def _reject(_records) -> None:
+        raise ValueError("bad record")
+
+    owner = _spool(tmp_path, _reject)
+    owner.append({"change_event_id": "chg-poison"})
+    assert owner.flush() == 0
+    assert owner.flush() == 1
+    assert "chg-poison" in (tmp_path / "spool.dead.jsonl").read_text(encoding="utf-8")
+
+    delivered: list[list[dict]] = []
+    other = _spool(tmp_path, delivered.append)
+    other.append({"change_event_id": "chg-direct"})
+    assert delivered == [[{"change_event_id": "chg-direct"}]]
+
+    other.close(timeout_sec=1.0)
+    owner.close(timeout_sec=1.0)
+
+
+def test_failed_batches_are_retried_per_record_so_good_records_are_delivered(tmp_path: Path) -> None:
+    delivered: list[str] = []
+
+    def _write(records) -> None:
+        if any(record["change_event_id"] == "chg-poison" for record in records):
+            raise ValueError("bad record")
+        delivered.extend(record["change_event_id"] for record in records)
+
+    spool = _spool(tmp_path, _write)
+    for change_event_id in ("chg-1", "chg-poison", "chg-2"):
+        spool.append({"change_event_id": change_event_id})
+
+    # The first failure stops at the bad record and keeps it for a retry.
+    assert spool.flush() == 1
+    assert delivered == ["chg-1"]
+    # The final attempt delivers what it can and dead-letters only the bad record.
+    assert spool.flush() == 2
+    assert delivered == ["chg-1", "chg-2"]
+    assert (tmp_path / "spool.dead.jsonl").read_text(encoding="utf-8").splitlines() == ['{"change_event_id":"chg-poison"}']
+    spool.close(timeout_sec=1.0)
+
+
+def test_spool_ownership_is_retried_and_backlog_replayed_on_start(tmp_path: Path) -> None:
+    def _unavailable(_records) -> None:
+        raise ConnectionError("warehouse unavailable")
+
+    owner = _spool(tmp_path, _unavailable, max_attempts=10)
+    owner.append({"change_event_id": "chg-left-behind"})
+
+    delivered: list[str] = []
+    waiting = _spool(
+        tmp_path,
+        lambda records: delivered.extend(record["change_event_id"] for record in records),
+        flush_interval_ms=10,
+        ownership_retry_sec=0.0,
+    )
+    assert waiting.start() is False
+    owner.close(timeout_sec=1.0)
+
+    deadline = time.monotonic() + 5
+    while delivered != ["chg-left-behind"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert delivered == ["chg-left-behind"]
+    waiting.append({"change_event_id": "chg-spooled"})
+    assert (tmp_path / "spool.jsonl").read_bytes().endswith(b'{"change_event_id":"chg-spooled"}\n')
+    waiting.close(timeout_sec=1.0)
+    assert delivered == ["chg-left-behind", "chg-spooled"]
+
+
+def test_audit_batch_insert_skips_records_already_written(local_schema_db: Path, local_repo, monkeypatch) -> None:
+    repo = local_repo()
+    monkeypatch.setattr(repo, "_actor_ref", lambda principal: principal)
+    records = [
+        {
+            "change_event_id": f"chg-{index}",
+            "entity_name": "core_vendor",
+            "entity_id": "v1",
+            "action_type": "update",
+            "actor_user_principal": "admin@example.com",
+            "event_ts": "2024-01-01T00:00:00",
+        }
+        for index in range(1, 4)
+    ]
+    repo._write_audit_entity_change_batch(records[:2])
+    # A replay after a crash between the insert and the offset write.
+    repo._write_audit_entity_change_batch(records)
+
+    with closing(sqlite3.connect(str(local_schema_db))) as conn:
+        rows = conn.execute("SELECT change_event_id FROM audit_entity_change ORDER BY change_event_id").fetchall()
+    assert [row[0] for row in rows] == ["chg-1", "chg-2", "chg-3"]
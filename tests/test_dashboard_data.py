@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+
+def _seed_reporting_db(seed_local_db) -> None:
+    today = date.today()
+    this_month = today.replace(day=1)
+    last_month = (this_month - timedelta(days=1)).replace(day=1)
+    updated = {"updated_at": "2024-01-01T00:00:00", "updated_by": "seed"}
+    created = {"created_at": "2024-01-01T00:00:00", "created_by": "seed"}
+    seed_local_db(
+        "core_vendor",
+        [
+            {"vendor_id": vendor_id, "legal_name": legal, "display_name": display, "lifecycle_state": state,
+             "owner_org_id": org, "risk_tier": tier, **updated}
+            for vendor_id, legal, display, state, org, tier in (
+                ("v1", "Acme Corp", "Acme", "active", "IT", "high"),
+                ("v2", "Globex LLC", "Globex", "active", "IT", "low"),
+                ("v3", "Initech Inc", "Initech", "active", "FIN", "critical"),
+                ("v4", "Umbrella Co", "Umbrella", "retired", "FIN", "high"),
+            )
+        ],
+    )
+    seed_local_db(
+        "core_vendor_offering",
+        [
+            {"offering_id": offering_id, "vendor_id": vendor_id, "offering_name": name, "offering_type": kind,
+             "lifecycle_state": "active", **updated}
+            for offering_id, vendor_id, name, kind in (
+                ("o1", "v1", "Acme Cloud", "saas"),
+                ("o2", "v2", "Globex Support", "services"),
+                ("o3", "v3", "Initech Ledger", "saas"),
+            )
+        ],
+    )
+    seed_local_db(
+        "app_offering_invoice",
+        [
+            {"invoice_id": invoice_id, "offering_id": offering_id, "vendor_id": vendor_id, "invoice_number": number,
+             "invoice_date": when.isoformat(), "amount": amount, "currency_code": "USD", "invoice_status": "paid",
+             **created, **updated}
+            for invoice_id, offering_id, vendor_id, number, when, amount in (
+                ("i1", "o1", "v1", "A-1", this_month, 100.0),
+                ("i2", "o1", "v1", "A-2", last_month, 50.0),
+                ("i3", "o2", "v2", "G-1", this_month, 30.0),
+                ("i4", "o3", "v3", "I-1", last_month, 70.0),
+            )
+        ],
+    )
+    seed_local_db(
+        "core_contract",
+        [
+            {"contract_id": contract_id, "vendor_id": vendor_id, "offering_id": offering_id, "contract_status": "active",
+             "end_date": (today + timedelta(days=days)).isoformat(), "annual_value": value, **updated}
+            for contract_id, vendor_id, offering_id, days, value in (
+                ("c1", "v1", "o1", 20, 1200.0),
+                ("c2", "v3", "o3", 90, 800.0),
+            )
+        ],
+    )
+    seed_local_db(
+        "core_vendor_demo",
+        [
+            {"demo_id": f"d{index}", "vendor_id": "v1", "demo_date": f"2024-02-{index:02d}",
+             "selection_outcome": outcome, **updated}
+            for index, outcome in enumerate(["selected", "not_selected", "not_selected", "selected"], start=1)
+        ],
+    )
+
+
+def _records(frame: pd.DataFrame, columns: list[str]) -> list[dict]:
+    return frame[columns].to_dict("records")
+
+
+def test_dashboard_data_matches_per_widget_queries(seed_local_db, local_repo) -> None:
+    _seed_reporting_db(seed_local_db)
+    repo = local_repo()
+    for org_id in ("all", "IT", "FIN"):
+        data = repo.dashboard_data(org_id=org_id, months=6, horizon_days=180)
+
+        assert _records(data["by_category"], ["category", "total_spend"]) == _records(
+            repo.executive_spend_by_category(org_id=org_id, months=6), ["category", "total_spend"]
+        )
+        assert _records(data["trend"], ["month", "total_spend"]) == _records(
+            repo.executive_monthly_spend_trend(org_id=org_id, months=6), ["month", "total_spend"]
+        )
+        top_columns = ["vendor_id", "vendor_name", "risk_tier", "total_spend"]
+        assert _records(data["top_vendors"], top_columns) == _records(
+            repo.executive_top_vendors_by_spend(org_id=org_id, months=6, limit=10), top_columns
+        )
+        assert sorted(_records(data["risk_dist"], ["risk_tier", "vendor_count"]), key=str) == sorted(
+            _records(repo.executive_risk_distribution(org_id=org_id), ["risk_tier", "vendor_count"]), key=str
+        )
+        assert data["summary"] == repo.executive_summary(org_id=org_id, months=6, horizon_days=180)
+
+    all_orgs = repo.dashboard_data(org_id="all", months=6, horizon_days=180)
+    assert all_orgs["summary"]["total_spend_window"] == 250.0
+    assert all_orgs["summary"]["high_risk_vendors"] == 2.0
+    assert all_orgs["summary"]["not_selected_demo_rate"] == 0.5
+    assert list(all_orgs["recent_demos"]["demo_id"]) == ["d4", "d3", "d2", "d1"]
+    assert len(repo.dashboard_data(org_id="all", months=6, horizon_days=180, recent_limit=2)["recent_demos"]) == 2
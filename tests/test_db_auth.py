@@ -4,6 +4,7 @@ import sys
 from pathlib import Path
 
 import pytest
+from databricks.sql import exc as dbsql_exc
 
 APP_ROOT = Path(__file__).resolve().parents[1] / "app"
 if str(APP_ROOT) not in sys.path:
@@ -247,3 +248,179 @@ def test_databricks_query_cache_hit_and_execute_invalidation(monkeypatch: pytest
 
     assert connects["count"] == 1
     assert len(owner.executions) == 3
+
+
+def test_reporting_workload_uses_dedicated_pool_and_warehouse(monkeypatch: pytest.MonkeyPatch) -> None:
+    owner = type("Owner", (), {"executions": []})()
+    connect_paths: list[str] = []
+
+    def _fake_connect_databricks(http_path: str = ""):
+        connect_paths.append(http_path)
+        return _FakeConn(owner)
+
+    monkeypatch.setenv("TVENDOR_QUERY_CACHE_ENABLED", "false")
+    monkeypatch.setenv("TVENDOR_DB_POOL_REPORTING_MAX_SIZE", "1")
+    config = AppConfig(
+        databricks_server_hostname="example.cloud.databricks.com",
+        databricks_http_path="/sql/1.0/warehouses/abc",
+        databricks_token="dapiXXX",
+        use_local_db=False,
+        databricks_reporting_http_path="/sql/1.0/warehouses/reports",
+    )
+    client = DatabricksSQLClient(config)
+    monkeypatch.setattr(client, "_connect_databricks", _fake_connect_databricks)
+
+    client.query("SELECT 1")
+    with db_module.workload_scope(db_module.WORKLOAD_REPORTING):
+        client.query("SELECT 2")
+        client.query("SELECT 3")
+
+    assert connect_paths == ["", "/sql/1.0/warehouses/reports"]
+    snapshot = {item["workload"]: item for item in client.pool_snapshot()}
+    assert snapshot["interactive"]["open_connections"] == 1
+    assert snapshot["reporting"]["open_connections"] == 1
+    assert snapshot["reporting"]["max_size"] == 1
+    assert snapshot["reporting"]["dedicated_warehouse"] is True
+    assert db_module.current_workload_class() == db_module.WORKLOAD_INTERACTIVE
+
+
+def test_databricks_read_retries_on_dropped_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    owner = type("Owner", (), {"executions": []})()
+    connects = {"count": 0}
+
+    class _DroppedCursor(_FakeCursor):
+        def execute(self, statement, params):
+            raise dbsql_exc.SessionAlreadyClosedError("Session closed by server")
+
+    class _DroppedConn(_FakeConn):
+        def cursor(self):
+            return _DroppedCursor(self._owner)
+
+    def _fake_connect_databricks():
+        connects["count"] += 1
+        if connects["count"] == 1:
+            return _DroppedConn(owner)
+        return _FakeConn(owner)
+
+    monkeypatch.setenv("TVENDOR_QUERY_CACHE_ENABLED", "false")
+    monkeypatch.setenv("TVENDOR_DB_READ_RETRY_BASE_DELAY_MS", "0")
+    client = DatabricksSQLClient(_databricks_config())
+    monkeypatch.setattr(client, "_connect_databricks", _fake_connect_databricks)
+
+    token = db_module.start_request_perf_context(
+        request_id="req-1",
+        method="GET",
+        path="/vendors",
+        slow_query_ms=750.0,
+    )
+    try:
+        frame = client.query("SELECT 1")
+        ctx = db_module.get_request_perf_context()
+        assert ctx is not None and ctx["db_retries"] == 1
+    finally:
+        db_module.clear_request_perf_context(token)
+
+    assert list(frame["value"]) == [1]
+    assert connects["count"] == 2
+
+
+def test_databricks_does_not_retry_writes_on_dropped_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    owner = type("Owner", (), {"executions": []})()
+
+    class _DroppedCursor(_FakeCursor):
+        def execute(self, statement, params):
+            raise dbsql_exc.SessionAlreadyClosedError("Session closed by server")
+
+    class _DroppedConn(_FakeConn):
+        def cursor(self):
+            return _DroppedCursor(self._owner)
+
+    monkeypatch.setenv("TVENDOR_DB_READ_RETRY_BASE_DELAY_MS", "0")
+    client = DatabricksSQLClient(_databricks_config())
+    monkeypatch.setattr(client, "_connect_databricks", lambda: _DroppedConn(owner))
+
+    with pytest.raises(db_module.DataExecutionError):
+        client.execute("UPDATE t SET id = %s WHERE id = %s", params=(1, 2))
+
+
+def test_databricks_read_retry_replaces_idle_pooled_connections(monkeypatch: pytest.MonkeyPatch) -> None:
+    owner = type("Owner", (), {"executions": []})()
+    opened: list[_FakeConn] = []
+
+    class _IdleTimedOutCursor(_FakeCursor):
+        def __init__(self, owner, conn):
+            super().__init__(owner)
+            self._conn = conn
+
+        def execute(self, statement, params):
+            if self._conn.dead:
+                raise dbsql_exc.RequestError("Connection reset by peer")
+            super().execute(statement, params)
+
+    class _IdleTimedOutConn(_FakeConn):
+        dead = False
+
+        def cursor(self):
+            return _IdleTimedOutCursor(self._owner, self)
+
+    def _fake_connect_databricks():
+        conn = _IdleTimedOutConn(owner)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setenv("TVENDOR_QUERY_CACHE_ENABLED", "false")
+    monkeypatch.setenv("TVENDOR_DB_READ_RETRY_BASE_DELAY_MS", "0")
+    monkeypatch.setenv("TVENDOR_DB_READ_RETRY_MAX_ATTEMPTS", "1")
+    client = DatabricksSQLClient(_databricks_config())
+    monkeypatch.setattr(client, "_connect_databricks", _fake_connect_databricks)
+
+    pool = client._pool_for_workload()
+    idle = [client._acquire_pooled_connection(pool) for _ in range(3)]
+    for conn in idle:
+        client._release_pooled_connection(pool, conn, broken=False)
+    # Every connection timed out while parked in the pool.
+    for conn in opened:
+        conn.dead = True
+
+    frame = client.query("SELECT 1")
+
+    assert list(frame["value"]) == [1]
+    # One dead idle connection is tried, then the retry opens a new one.
+    assert len(opened) == 4
+    snapshot = client.pool_snapshot()[0]
+    assert snapshot["open_connections"] == 1
+    assert snapshot["idle_connections"] == 1
+
+
+def test_databricks_does_not_retry_statement_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    owner = type("Owner", (), {"executions": []})()
+    connects = {"count": 0}
+
+    class _TimeoutCursor(_FakeCursor):
+        def execute(self, statement, params):
+            raise dbsql_exc.ServerOperationError("Query timed out: statement timeout exceeded, session closed")
+
+    class _TimeoutConn(_FakeConn):
+        def cursor(self):
+            return _TimeoutCursor(self._owner)
+
+    def _fake_connect_databricks():
+        connects["count"] += 1
+        return _TimeoutConn(owner)
+
+    monkeypatch.setenv("TVENDOR_QUERY_CACHE_ENABLED", "false")
+    monkeypatch.setenv("TVENDOR_DB_READ_RETRY_BASE_DELAY_MS", "0")
+    client = DatabricksSQLClient(_databricks_config())
+    monkeypatch.setattr(client, "_connect_databricks", _fake_connect_databricks)
+
+    with pytest.raises(db_module.DataQueryError):
+        client.query("SELECT 1")
+
+    assert connects["count"] == 1
+    # The connection itself is healthy, so it goes back to the pool.
+    assert client.pool_snapshot()[0]["idle_connections"] == 1
+    assert DatabricksSQLClient._is_connection_error(RuntimeError("connection timeout")) is False
+    assert DatabricksSQLClient._is_connection_error(dbsql_exc.MaxRetryDurationError("retry budget")) is False
+    wrapped = RuntimeError("driver failure")
+    wrapped.__cause__ = ConnectionResetError("reset")
+    assert DatabricksSQLClient._is_connection_error(wrapped) is True
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.infrastructure import parallel
+from vendor_catalog_app.infrastructure.db import (
+    clear_request_perf_context,
+    get_request_perf_context,
+    record_request_phase_ms,
+    start_request_perf_context,
+)
+
+
+def _expire_when_one_left(monkeypatch) -> None:
+    """Stub the budget clock so it runs out once every load but one has finished."""
+    clock = {"now": 100.0}
+    real_wait = parallel.wait
+
+    def _wait(futures, *, timeout, return_when):
+        done, pending = real_wait(futures, timeout=min(timeout, 0.05), return_when=return_when)
+        if len(pending) == 1:
+            clock["now"] += 60.0
+        return done, pending
+
+    monkeypatch.setattr(parallel, "time", SimpleNamespace(perf_counter=lambda: clock["now"]))
+    monkeypatch.setattr(parallel, "wait", _wait)
+
+
+def test_global_search_groups_and_ranks_types(search_catalog_db: Path, local_repo) -> None:
+    repo = local_repo()
+
+    result = repo.search_global(q="acme", limit_per_type=1)
+    assert result["timed_out"] == []
+    groups = {group["type"]: group for group in result["groups"]}
+    assert [group["type"] for group in result["groups"]][:2] == ["vendors", "offerings"]
+    assert [row["vendor_id"] for row in groups["vendors"]["items"]] == ["v1"]
+    assert groups["vendors"]["rank"] == 0
+    assert groups["offerings"]["items"][0]["offering_id"] == "o1"
+    assert groups["contracts"]["has_more"] is False
+
+    # Groups with equal best ranks keep the display order; types without hits are dropped.
+    cloud = repo.search_global(q="cloud", types=["projects", "offerings", "help_articles"])
+    assert [group["type"] for group in cloud["groups"]] == ["offerings", "projects"]
+
+    assert repo.search_global(q="vendors", types=["help_articles"])["groups"][0]["items"][0]["slug"] == "add-vendor"
+    hidden = repo.search_global(q="vendors", types=["help_articles"], help_article_filter=lambda row: False)
+    assert hidden["groups"] == []
+    assert repo.search_global(q="  ")["groups"] == []
+
+
+def test_global_search_reports_types_over_budget(search_catalog_db: Path, local_repo, monkeypatch) -> None:
+    repo = local_repo()
+    release = threading.Event()
+    original = repo._global_search_rows
+
+    def _rows(name, q, limit, where):
+        if name == "projects":
+            release.wait(timeout=10)
+        return original(name, q, limit, where)
+
+    monkeypatch.setattr(repo, "_global_search_rows", _rows)
+    _expire_when_one_left(monkeypatch)
+    try:
+        result = repo.search_global(q="hammock", budget_ms=100)
+    finally:
+        release.set()
+    assert result["timed_out"] == ["projects"]
+    assert result["groups"] == []
+
+
+def test_late_budget_loads_do_not_write_to_the_request_perf_context(monkeypatch) -> None:
+    release = threading.Event()
+    late_finished = threading.Event()
+
+    def _fast():
+        record_request_phase_ms("fast", 5.0)
+        return "fast"
+
+    def _late():
+        release.wait(timeout=10)
+        record_request_phase_ms("late", 5.0)
+        late_finished.set()
+        return "late"
+
+    _expire_when_one_left(monkeypatch)
+    token = start_request_perf_context(request_id="r1", method="GET", path="/api/search", slow_query_ms=500)
+    try:
+        try:
+            results, timed_out = parallel.run_within_budget({"fast": _fast, "late": _late}, budget_ms=100)
+        finally:
+            release.set()
+        assert late_finished.wait(timeout=10)
+        assert results == {"fast": "fast"}
+        assert timed_out == ["late"]
+        phases = get_request_perf_context()["phase_ms"]
+        assert phases["fast"] == 5.0
+        assert "late" not in phases
+    finally:
+        clear_request_perf_context(token)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def test_help_search_ranks_and_snippets_from_index(help_articles_db: Path, local_repo) -> None:
+    repo = local_repo()
+
+    results = repo.search_help_articles("add vendor")
+    assert [row["slug"] for row in results][0] == "add-vendor"
+    assert {row["slug"] for row in results} == {"add-vendor", "admin-roles", "contracts"}
+    snippets = {row["slug"]: row["snippet"] for row in results}
+    assert snippets["add-vendor"] == "Open the Vendors page and choose New."
+    assert snippets["admin-roles"] == "Grant a vendor role to a user."
+    assert "search_text" not in results[0]
+
+    assert [row["slug"] for row in repo.search_help_articles("renew")] == ["contracts"]
+    assert repo.search_help_articles("zzz") == []
+    visible = repo.search_help_articles("vendor", where=lambda row: row.get("role_visibility") != "admin")
+    assert [row["slug"] for row in visible] == ["add-vendor", "contracts"]
+
+
+def test_help_search_index_includes_created_articles(help_articles_db: Path, local_repo) -> None:
+    repo = local_repo()
+    assert repo.search_help_articles("spreadsheet") == []
+
+    repo.create_help_article(
+        slug="imports",
+        title="Importing a spreadsheet",
+        section="Basics",
+        article_type="guide",
+        role_visibility="viewer",
+        content_md="Upload a CSV file.",
+        owned_by="seed",
+        actor_user_principal="seed:system",
+    )
+    assert [row["slug"] for row in repo.search_help_articles("spreadsheet")] == ["imports"]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.infrastructure.fuzzy_match import FuzzyNameIndex, normalize_name
+from vendor_catalog_app.web.routers.imports.matching import ImportMatchContext, build_preview_rows
+
+
+def test_fuzzy_name_index_scores_token_overlap() -> None:
+    index = FuzzyNameIndex(
+        [
+            {"vendor_id": "v1", "legal_name": "Acme Corporation", "display_name": "Acme"},
+            {"vendor_id": "v2", "legal_name": "Acme Cloud Services Ltd", "display_name": None},
+            {"vendor_id": "v3", "legal_name": "Globex LLC", "display_name": "Globex"},
+        ],
+        id_field="vendor_id",
+        name_fields=("display_name", "legal_name"),
+    )
+    assert normalize_name("The ACME Corp.") == "acme"
+    assert [row["vendor_id"] for row in index.exact("ACME, Inc.")] == ["v1"]
+    assert [row["vendor_id"] for row in index.exact("V3")] == ["v3"]
+    matches = index.match("Services Acme Cloud", limit=5)
+    assert [(row["vendor_id"], score) for row, score in matches] == [("v2", 1.0), ("v1", 0.6667)]
+    assert index.match("Initech", limit=5) == []
+
+
+def test_preview_matches_names_without_per_row_queries(seed_local_db, local_repo, monkeypatch) -> None:
+    stamp = {"updated_at": "2024-01-01T00:00:00", "updated_by": "seed"}
+    vendor = {"lifecycle_state": "active", "owner_org_id": "IT", "risk_tier": "low", **stamp}
+    seed_local_db(
+        "core_vendor",
+        [
+            {"vendor_id": "v1", "legal_name": "Acme Corporation", "display_name": "Acme", **vendor},
+            {"vendor_id": "v2", "legal_name": "Globex LLC", "display_name": None, **vendor},
+            {"vendor_id": "v3", "legal_name": "Initech Inc", "display_name": "Initech", **vendor},
+        ],
+    )
+    offering = {"offering_type": "saas", "lifecycle_state": "active", **stamp}
+    seed_local_db(
+        "core_vendor_offering",
+        [
+            {"offering_id": "o1", "vendor_id": "v1", "offering_name": "Acme Cloud Platform", **offering},
+            {"offering_id": "o2", "vendor_id": "v2", "offering_name": "Cloud Platform", **offering},
+        ],
+    )
+    repo = local_repo()
+    rows = [
+        {"legal_name": "ACME Corp.", "_line": "2"},
+        {"legal_name": "Globex", "_line": "3"},
+        {"legal_name": "Initech Software", "_line": "4"},
+        {"legal_name": "Umbrella Corp", "_line": "5"},
+        {"vendor_id": "v3", "legal_name": "Initech", "_line": "6"},
+    ] * 40
+
+    calls = {"count": 0}
+    query = repo.client.query
+
+    def _counting_query(*args, **kwargs):
+        calls["count"] += 1
+        return query(*args, **kwargs)
+
+    monkeypatch.setattr(repo.client, "query", _counting_query)
+    preview = build_preview_rows(repo, "vendors", rows)
+    # One load for the name index and one for the contact map, regardless of row count.
+    assert calls["count"] <= 3
+    assert [row["suggested_target_id"] for row in preview[:5]] == ["v1", "v2", "v3", "", "v3"]
+    assert "Single near-match found by name." in preview[2]["notes"]
+
+    offerings = build_preview_rows(
+        repo,
+        "offerings",
+        [{"offering_name": "Cloud Platform", "vendor_name": "Acme Corporation", "_line": "2"}],
+    )
+    assert offerings[0]["suggested_target_id"] == "o1"
+    assert offerings[0]["suggested_target_vendor_id"] == "v1"
+
+
+def test_id_lookups_fall_back_to_repo_when_the_index_lags(seed_local_db, local_repo) -> None:
+    stamp = {"updated_at": "2024-01-01T00:00:00", "updated_by": "seed"}
+    vendor = {"lifecycle_state": "active", "owner_org_id": "IT", "risk_tier": "low", **stamp}
+    seed_local_db("core_vendor", [{"vendor_id": "v1", "legal_name": "Acme Corporation", **vendor}])
+    repo = local_repo()
+    warm = ImportMatchContext(repo)
+    assert warm.vendor_profile("v1") is not None
+    assert warm.offering_by_id("o1") is None
+
+    # Written behind the cached indexes, as just-created records would be.
+    offering = {"offering_type": "saas", "lifecycle_state": "active", **stamp}
+    seed_local_db("core_vendor", [{"vendor_id": "v2", "legal_name": "Globex LLC", **vendor}])
+    seed_local_db(
+        "core_vendor_offering",
+        [{"offering_id": "o2", "vendor_id": "v2", "offering_name": "Globex Cloud", **offering}],
+    )
+    context = ImportMatchContext(repo)
+    assert context.name_index("vendors").get("v2") is None
+    assert context.name_index("offerings").get("o2") is None
+    assert context.vendor_profile("v2")["legal_name"] == "Globex LLC"
+    assert context.offering_by_id("o2")["vendor_id"] == "v2"
+    assert context.vendor_profile("missing") is None
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.web.routers.imports import store
+from vendor_catalog_app.web.routers.imports.source_cache import (
+    read_source_row_cache,
+    sweep_source_row_caches,
+    write_source_row_cache,
+)
+
+
+def test_source_row_cache_round_trips_sparse_rows(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("TVENDOR_IMPORT_SOURCE_CACHE_DIR", str(tmp_path))
+    rows = [
+        {"vendor.name": "Acme", "vendor.status": "active", "_line": "2"},
+        {"vendor.name": "Globex", "vendor.status": "", "_line": "3"},
+        {"vendor.name": "Acme", "contact_1.email": "a@acme.example", "_line": "4"},
+    ]
+    path = write_source_row_cache(rows)
+    assert Path(path).parent == tmp_path
+    assert read_source_row_cache(path) == rows
+    assert read_source_row_cache(path, columns=["_line", "vendor.status", "missing"]) == [
+        {"_line": "2", "vendor.status": "active"},
+        {"_line": "3", "vendor.status": ""},
+        {"_line": "4"},
+    ]
+    assert read_source_row_cache(str(tmp_path / "gone.cols.zip")) is None
+
+
+def test_source_row_cache_reads_only_requested_column_members(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("TVENDOR_IMPORT_SOURCE_CACHE_DIR", str(tmp_path))
+    path = write_source_row_cache([{"a": "1", "b": "2", "c": "3"}])
+    read_members: list[str] = []
+    original_read = zipfile.ZipFile.read
+
+    def _tracking_read(self, name, pwd=None):
+        read_members.append(str(name))
+        return original_read(self, name, pwd)
+
+    monkeypatch.setattr(zipfile.ZipFile, "read", _tracking_read)
+    assert read_source_row_cache(path, columns=["b"]) == [{"b": "2"}]
+    assert read_members == ["manifest.json", "columns/1.json"]
+
+
+def test_sweep_removes_only_stale_unreferenced_caches(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("TVENDOR_IMPORT_SOURCE_CACHE_DIR", str(tmp_path))
+    fresh = Path(write_source_row_cache([{"a": "1"}]))
+    stale = Path(write_source_row_cache([{"a": "2"}]))
+    kept = Path(write_source_row_cache([{"a": "3"}]))
+    partial = tmp_path / "crashed.cols.zip.tmp"
+    partial.write_bytes(b"")
+    unrelated = tmp_path / "notes.txt"
+    unrelated.write_text("x")
+    old = time.time() - 3600
+    for path in (stale, kept, partial, unrelated):
+        os.utime(path, (old, old))
+
+    assert sweep_source_row_caches(older_than_sec=60, keep=[str(kept)]) == 2
+    assert fresh.exists() and kept.exists() and unrelated.exists()
+    assert not stale.exists() and not partial.exists()
+
+
+def test_preview_store_keeps_source_rows_on_disk_until_unreferenced(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("TVENDOR_IMPORT_SOURCE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(store, "_IMPORT_PREVIEW_STORE", {})
+    rows = [{"legal_name": "Acme", "_line": "2"}]
+    token = store.save_preview_payload({"layout_key": "vendors", "source_rows": rows})
+    payload = store.load_preview_payload(token)
+    assert payload is not None and "source_rows" not in payload
+    assert store.load_preview_source_rows(payload) == rows
+    cache_path = Path(payload[store.IMPORT_SOURCE_CACHE_KEY])
+    assert cache_path.exists()
+
+    # A remap stores a new payload sharing the cache, then discards the old token.
+    old = time.time() - 3600
+    os.utime(cache_path, (old, old))
+    next_token = store.save_preview_payload(dict(payload, layout_key="vendors"))
+    store.discard_preview_payload(token)
+    assert cache_path.exists()
+    assert cache_path.stat().st_mtime > old + 60
+    store.discard_preview_payload(next_token)
+    assert not cache_path.exists()
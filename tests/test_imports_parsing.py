@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import io
+import json
 import pytest
 import sys
 from pathlib import Path
@@ -8,6 +10,8 @@ APP_ROOT = Path(__file__).resolve().parents[1] / "app"
 if str(APP_ROOT) not in sys.path:
     sys.path.insert(0, str(APP_ROOT))
 
+from vendor_catalog_app.web.routers.imports import streaming
+from vendor_catalog_app.web.routers.imports.config import IMPORT_MAX_ROWS
 from vendor_catalog_app.web.routers.imports.parsing import parse_layout_rows
 
 
@@ -125,3 +129,63 @@ def test_parse_layout_rows_json_repeating_contacts_emit_multiple_stage_rows() ->
     assert names == ["A One", "B Two"]
     group_keys = sorted([str(row.get("source_group_key") or "") for row in contact_rows])
     assert group_keys == ["contacts_1", "contacts_2"]
+
+
+def test_parse_layout_rows_streams_file_objects_across_chunk_boundaries(monkeypatch) -> None:
+    monkeypatch.setattr(streaming, "UPLOAD_READ_CHUNK_CHARS", 5)
+    payload = {
+        "meta": {"source": "erp", "count": 2},
+        "vendors": [
+            {"legal_name": "Caf\u00e9 Vendor", "owner_org_id": "IT", "score": 12345},
+            {"legal_name": "Second Vendor", "owner_org_id": "FIN", "tags": ["a", "b"]},
+        ],
+        "trailer": [1, 2, 3],
+    }
+    upload = io.BytesIO(json.dumps(payload).encode("utf-8"))
+    parsed = parse_layout_rows("vendors", upload, file_name="vendors.json")
+    assert [row["legal_name"] for row in parsed["rows"]] == ["Caf\u00e9 Vendor", "Second Vendor"]
+    assert parsed["parser_options"]["json_record_path"] == "vendors"
+    assert not upload.closed
+
+    xml_upload = io.BytesIO(
+        b"<export><batch>"
+        b"<vendor id='1'><legal_name>One &amp; Co</legal_name></vendor>"
+        b"<vendor id='2'><legal_name>Two</legal_name></vendor>"
+        b"</batch></export>"
+    )
+    parsed = parse_layout_rows("vendors", xml_upload, file_name="vendors.xml")
+    assert [row["legal_name"] for row in parsed["rows"]] == ["One & Co", "Two"]
+    assert parsed["parser_options"]["xml_record_tag"] == "vendor"
+
+    with pytest.raises(ValueError, match="JSON parse failed"):
+        parse_layout_rows("vendors", b'[{"legal_name": "A"}] trailing', file_name="vendors.json")
+
+
+def test_parse_layout_rows_stops_at_row_cap() -> None:
+    body = b"legal_name,owner_org_id\n" + b"Vendor,IT\n" * (IMPORT_MAX_ROWS * 20)
+    with pytest.raises(ValueError, match="Upload is too large"):
+        parse_layout_rows("vendors", io.BytesIO(body), file_name="vendors.csv")
+
+
+def test_parse_layout_rows_falls_back_to_latin1_past_the_sample() -> None:
+    filler = b"".join(b"Vendor %d,IT\n" % index for index in range(streaming.UPLOAD_SAMPLE_BYTES // 10))
+    body = b"legal_name,owner_org_id\n" + filler + "Caf\u00e9 Latin,IT\n".encode("latin-1")
+    parsed = parse_layout_rows("vendors", io.BytesIO(body), file_name="vendors.csv")
+    assert parsed["rows"][-1]["legal_name"] == "Caf\u00e9 Latin"
+
+
+def test_spool_upload_copies_unseekable_streams() -> None:
+    class _Unseekable(io.RawIOBase):
+        def __init__(self, data: bytes) -> None:
+            self._inner = io.BytesIO(data)
+
+        def readable(self) -> bool:
+            return True
+
+        def readinto(self, buffer) -> int:
+            return self._inner.readinto(buffer)
+
+    spooled = streaming.spool_upload(_Unseekable(b"legal_name\nAcme\n"))
+    assert streaming.upload_size(spooled) == 16
+    parsed = parse_layout_rows("vendors", spooled, file_name="vendors.csv")
+    assert [row["legal_name"] for row in parsed["rows"]] == ["Acme"]
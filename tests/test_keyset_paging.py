@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.infrastructure.paging import BackgroundCountCache, decode_cursor, encode_cursor
+
+
+def test_cursor_pages_match_offset_pages(seed_local_db, local_repo) -> None:
+    vendor = {"lifecycle_state": "active", "owner_org_id": "IT", "updated_by": "seed"}
+    seed_local_db(
+        "core_vendor",
+        [
+            {**vendor, "vendor_id": vendor_id, "legal_name": legal, "display_name": display, "risk_tier": tier, "updated_at": at}
+            for vendor_id, legal, display, tier, at in (
+                ("v1", "Acme Corporation", "Acme", "low", "2024-01-03"),
+                ("v2", "Globex LLC", "Globex", "high", "2024-01-01"),
+                ("v3", "Initech Inc", "Initech", "low", "2024-01-02"),
+                ("v4", "Acme Holdings", "Acme", "medium", "2024-01-02"),
+                ("v5", "Umbrella Corp", None, "low", "2024-01-05"),
+                ("v6", "Hooli", "Hooli", "high", "2024-01-04"),
+                ("v7", "Stark Industries", "Stark", "low", "2024-01-01"),
+            )
+        ],
+    )
+    repo = local_repo()
+
+    for sort_by, sort_dir in (("vendor_name", "asc"), ("vendor_name", "desc"), ("updated_at", "desc"), ("risk_tier", "asc")):
+        offset_ids: list[str] = []
+        cursor_ids: list[str] = []
+        cursor = ""
+        for page in (1, 2, 3):
+            rows, total = repo.list_vendors_page(page=page, page_size=3, sort_by=sort_by, sort_dir=sort_dir)
+            offset_ids.extend(rows["vendor_id"])
+            assert total == 7
+            rows, _total = repo.list_vendors_page(
+                page=page, page_size=3, sort_by=sort_by, sort_dir=sort_dir, cursor=cursor
+            )
+            cursor_ids.extend(rows["vendor_id"])
+            cursor = rows.attrs.get("next_cursor", "")
+        assert cursor == ""
+        assert cursor_ids == offset_ids, (sort_by, sort_dir)
+        assert sorted(cursor_ids) == [f"v{index}" for index in range(1, 8)]
+
+    # A cursor from another sort or filter is ignored rather than misapplied.
+    rows, _total = repo.list_vendors_page(page=1, page_size=3)
+    stray = rows.attrs["next_cursor"]
+    rows, _total = repo.list_vendors_page(page=1, page_size=3, risk_tier="low", cursor=stray)
+    assert list(rows["vendor_id"]) == ["v1", "v3", "v7"]
+
+
+def test_cursor_round_trip_rejects_foreign_scope() -> None:
+    cursor = encode_cursor(["acme", "v1"], scope="a")
+    assert decode_cursor(cursor, scope="a", size=2) == ["acme", "v1"]
+    assert decode_cursor(cursor, scope="b", size=2) is None
+    assert decode_cursor("not-a-cursor", scope="a", size=2) is None
+
+
+def test_count_cache_serves_stale_total_while_refreshing() -> None:
+    counts = iter([5, 6])
+    cache = BackgroundCountCache(ttl_seconds=60)
+    assert cache.get("k", lambda: next(counts), version=1) == 5
+    assert cache.get("k", lambda: next(counts), version=1) == 5
+    assert cache.get("k", lambda: next(counts), version=2) == 5
+    deadline = time.monotonic() + 5
+    while cache.get("k", lambda: 0, version=2) != 6 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.get("k", lambda: 0, version=2) == 6
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.backend.repository import VendorRepository
+
+
+def _repo(local_repo, monkeypatch, *, fts: bool) -> VendorRepository:
+    monkeypatch.setenv("TVENDOR_TYPEAHEAD_INDEX_ENABLED", "false")
+    monkeypatch.setenv("TVENDOR_LOCAL_FTS_ENABLED", "true" if fts else "false")
+    return local_repo()
+
+
+def _searches(repo: VendorRepository, query: str) -> dict[str, list]:
+    return {
+        "vendors": repo.search_vendors_typeahead(q=query)["vendor_id"].tolist(),
+        "offerings": repo.search_offerings_typeahead(q=query)["offering_id"].tolist(),
+        "projects": repo.search_projects_typeahead(q=query)["project_id"].tolist(),
+        "contracts": repo.search_contracts_typeahead(q=query)["contract_id"].tolist(),
+        "contacts": repo.search_contacts_typeahead(q=query)["full_name"].tolist(),
+        "workspace": repo.list_contracts_workspace(search_text=query)["contract_id"].tolist(),
+        "all_projects": repo.list_all_projects(search_text=query)["project_id"].tolist(),
+        "vendor_page": repo.list_vendors_page(search_text=query)[0]["vendor_id"].tolist(),
+    }
+
+
+def test_local_fts_search_matches_like_search(search_catalog_db: Path, local_repo, monkeypatch) -> None:
+    like_repo = _repo(local_repo, monkeypatch, fts=False)
+    fts_repo = _repo(local_repo, monkeypatch, fts=True)
+    assert "search_fts_vendor" in fts_repo._local_fts_tables()
+    assert like_repo._local_fts_tables() == frozenset()
+
+    for query in ("acme", "GLOBEX", "cloud", "gibbons", "scorpio", "acm-2024", "hammock", "ac", "o_1", "zzz"):
+        assert _searches(fts_repo, query) == _searches(like_repo, query), query
+    assert _searches(fts_repo, "globex")["contracts"] == ["k2"]
+
+
+def test_local_fts_indexes_follow_writes(search_catalog_db: Path, local_repo, monkeypatch) -> None:
+    repo = _repo(local_repo, monkeypatch, fts=True)
+    assert repo.search_offerings_typeahead(q="orbital").empty
+
+    repo.client.execute("UPDATE core_vendor_offering SET offering_name = 'Orbital Analytics' WHERE offering_id = 'o2'")
+    repo._cache_clear()
+    assert repo.search_offerings_typeahead(q="orbital")["offering_id"].tolist() == ["o2"]
+    assert repo.search_offerings_typeahead(q="globex support").empty
+
+    repo.client.execute("DELETE FROM core_offering_contact WHERE offering_contact_id = 'oc1'")
+    repo._cache_clear()
+    assert repo.search_contacts_typeahead(q="scorpio").empty
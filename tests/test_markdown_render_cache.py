@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.web.utils import markdown as markdown_utils
+
+
+def test_help_renders_are_persisted_and_reused(help_articles_db: Path, local_repo, monkeypatch) -> None:
+    repo = local_repo()
+    monkeypatch.setattr(markdown_utils, "_RENDER_CACHE", type(markdown_utils._RENDER_CACHE)())
+
+    assert markdown_utils.prerender_help_articles(repo) == 3
+    assert markdown_utils.prerender_help_articles(repo) == 0
+    html = markdown_utils.render_help_article_html(repo, repo.get_help_article_by_slug("add-vendor"))
+    assert html == "<p>Open the <strong>Vendors</strong> page and choose New.</p>"
+
+    # Another worker: empty in-process cache, renders come from the table.
+    other = local_repo()
+    monkeypatch.setattr(markdown_utils, "_RENDER_CACHE", type(markdown_utils._RENDER_CACHE)())
+    monkeypatch.setattr(markdown_utils, "_render", lambda text: pytest.fail("rendered again"))
+    assert markdown_utils.prerender_help_articles(other) == 0
+    assert markdown_utils.render_help_article_html(other, other.get_help_article_by_slug("add-vendor")) == html
+
+
+def test_help_render_follows_content_changes(help_articles_db: Path, local_repo, monkeypatch) -> None:
+    repo = local_repo()
+    markdown_utils.prerender_help_articles(repo)
+
+    article = dict(repo.get_help_article_by_slug("contracts"))
+    article["content_md"] = "Renewals are tracked in <script>alert(1)</script> **one** place."
+    html = markdown_utils.render_help_article_html(repo, article)
+    assert html == "<p>Renewals are tracked in alert(1) <strong>one</strong> place.</p>"
+    stored = local_repo().list_help_article_renders()["h2"]
+    assert stored["content_hash"] == markdown_utils.markdown_content_hash(article["content_md"])
+    assert stored["content_html"] == html
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.infrastructure.registry import VersionedRegistry
+from vendor_catalog_app.web.core.template_context import _compile_template_lookup_options
+
+
+def test_registry_rebuilds_only_when_version_changes() -> None:
+    registry = VersionedRegistry(revalidate_sec=0)
+    state = {"version": 1, "builds": 0}
+
+    def _build() -> str:
+        state["builds"] += 1
+        return f"v{state['version']}"
+
+    def _read() -> str:
+        return registry.get("options", version=lambda: state["version"], build=_build)
+
+    assert _read() == "v1"
+    assert _read() == "v1"
+    assert state["builds"] == 1
+
+    state["version"] = 2
+    assert _read() == "v2"
+    assert state["builds"] == 2
+
+
+def test_registry_skips_version_checks_within_revalidate_window() -> None:
+    registry = VersionedRegistry(revalidate_sec=3600)
+    checks = {"count": 0}
+
+    def _version() -> int:
+        checks["count"] += 1
+        return 1
+
+    for _ in range(5):
+        registry.get("roles", version=_version, build=lambda: ("vendor_viewer",))
+    assert checks["count"] == 1
+
+    registry.invalidate("roles")
+    registry.get("roles", version=_version, build=lambda: ("vendor_viewer",))
+    assert checks["count"] == 2
+
+
+def test_registry_serves_stale_value_while_one_background_rebuild_runs() -> None:
+    registry = VersionedRegistry(revalidate_sec=0, rebuild_in_background=True)
+    state = {"version": 1, "builds": 0}
+    release = threading.Event()
+
+    def _build() -> str:
+        state["builds"] += 1
+        if state["builds"] > 1:
+            release.wait(timeout=10)
+        return f"v{state['version']}"
+
+    def _read() -> str:
+        return registry.get("index", version=lambda: state["version"], build=_build)
+
+    assert _read() == "v1"
+    state["version"] = 2
+    try:
+        assert [_read() for _ in range(5)] == ["v1"] * 5
+        assert registry.stats()["rebuilding"] == 1
+    finally:
+        release.set()
+    assert registry.wait_for_rebuilds(timeout=10)
+    assert _read() == "v2"
+    assert state["builds"] == 2
+
+
+def test_registry_first_build_is_single_flight() -> None:
+    registry = VersionedRegistry(revalidate_sec=0)
+    builds = {"count": 0}
+    started = threading.Event()
+    release = threading.Event()
+
+    def _build() -> str:
+        builds["count"] += 1
+        started.set()
+        release.wait(timeout=10)
+        return "built"
+
+    results: list[str] = []
+    readers = [
+        threading.Thread(target=lambda: results.append(registry.get("index", version=lambda: 1, build=_build)))
+        for _ in range(4)
+    ]
+    readers[0].start()
+    assert started.wait(timeout=10)
+    for reader in readers[1:]:
+        reader.start()
+    release.set()
+    for reader in readers:
+        reader.join(timeout=10)
+    assert results == ["built"] * 4
+    assert builds["count"] == 1
+
+
+def test_template_lookup_options_compile_once_per_lookup_version(local_repo, monkeypatch) -> None:
+    repo = local_repo()
+    calls = {"lookups": 0}
+    version = {"value": 1}
+
+    def _list_lookup_options(lookup_type=None, *, active_only=False, as_of_ts=None) -> pd.DataFrame:
+        calls["lookups"] += 1
+        return pd.DataFrame(
+            [
+                {"lookup_type": "doc_source", "option_code": "SharePoint", "option_label": "SharePoint"},
+                {"lookup_type": "offering_type", "option_code": "saas", "option_label": "SaaS"},
+            ]
+        )
+
+    monkeypatch.setattr(repo, "list_lookup_options", _list_lookup_options)
+    monkeypatch.setattr(repo, "get_lookup_options_version", lambda: version["value"])
+    repo._option_registry = VersionedRegistry(revalidate_sec=0)
+
+    first = repo.compiled_lookup_options("template_context", _compile_template_lookup_options)
+    second = repo.compiled_lookup_options("template_context", _compile_template_lookup_options)
+    assert first["doc_source_options"] == ("sharepoint",)
+    assert first["offering_type_options"] == ("SaaS",)
+    assert second is first
+    assert calls["lookups"] == 1
+
+    version["value"] = 2
+    repo.compiled_lookup_options("template_context", _compile_template_lookup_options)
+    assert calls["lookups"] == 2
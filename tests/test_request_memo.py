@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.backend.repository import VendorRepository
+from vendor_catalog_app.infrastructure.db import (
+    clear_request_perf_context,
+    get_request_perf_context,
+    start_request_perf_context,
+)
+
+
+class _CountingClient:
+    def __init__(self) -> None:
+        self.queries = 0
+        self.executes = 0
+
+    def query(self, statement, params=None, *, use_cache=True) -> pd.DataFrame:
+        self.queries += 1
+        return pd.DataFrame([{"vendor_id": (params or ("",))[0], "display_name": "Acme"}])
+
+    def execute(self, statement, params=None, *, invalidate_cache: bool = True) -> None:
+        self.executes += 1
+
+    def close(self) -> None:
+        return None
+
+
+def _repo(local_repo) -> tuple[VendorRepository, _CountingClient]:
+    repo = local_repo()
+    client = _CountingClient()
+    repo.client = client
+    return repo, client
+
+
+def test_identical_reads_are_deduped_within_a_request(local_repo) -> None:
+    repo, client = _repo(local_repo)
+    token = start_request_perf_context(request_id="memo", method="GET", path="/vendors/v1", slow_query_ms=1000.0)
+    try:
+        first = repo.get_vendor_profile("v1")
+        first.loc[0, "display_name"] = "mutated by caller"
+        second = repo.get_vendor_profile("v1")
+        repo.get_vendor_profile("v2")
+
+        assert client.queries == 2
+        assert second.iloc[0]["display_name"] == "Acme"
+        assert get_request_perf_context()["memo_hits"] == 1
+
+        repo._execute_file("inserts/log_usage_event.sql", params=("a",) * 6, app_usage_log="app_usage_log")
+        repo.get_vendor_profile("v1")
+        assert client.queries == 3
+    finally:
+        clear_request_perf_context(token)
+        repo.close()
+
+
+def test_reads_outside_a_request_are_not_memoized(local_repo) -> None:
+    repo, client = _repo(local_repo)
+    repo.get_vendor_profile("v1")
+    repo.get_vendor_profile("v1")
+    assert client.queries == 2
+    repo.close()
+
+
+def test_load_graph_runs_independent_loads_concurrently_and_records_critical_path() -> None:
+    import threading
+    import time
+
+    from vendor_catalog_app.infrastructure.parallel import LoadGraph
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _slow(value: str) -> str:
+        # Both loads must be in flight at once to pass the barrier.
+        barrier.wait()
+        time.sleep(0.02)
+        return value
+
+    token = start_request_perf_context(request_id="graph", method="GET", path="/vendors/v1", slow_query_ms=1000.0)
+    try:
+        graph = LoadGraph("vendor_360_summary")
+        graph.add("profile", lambda: _slow("profile"))
+        graph.add("contacts", lambda: _slow("contacts"))
+        graph.add("summary", lambda profile, contacts: f"{profile}+{contacts}", after=("profile", "contacts"))
+        results = graph.run()
+
+        assert results["summary"] == "profile+contacts"
+        recorded = get_request_perf_context()["load_graphs"][0]
+        assert recorded["name"] == "vendor_360_summary"
+        assert recorded["parallel"] is True
+        assert recorded["critical_path"][-1] == "summary"
+        assert recorded["critical_path"][0] in {"profile", "contacts"}
+        assert set(recorded["loads_ms"]) == {"profile", "contacts", "summary"}
+    finally:
+        clear_request_perf_context(token)
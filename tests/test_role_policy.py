@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.core.config import AppConfig
+from vendor_catalog_app.core.role_policy import CompiledRolePolicy, RolePolicyTable
+from vendor_catalog_app.core.security import CHANGE_ACTION_CHOICES
+from vendor_catalog_app.web.core.context import UserContext
+
+_POLICIES = [
+    {"roles": ["vendor_viewer"], "approval_level": 0, "allowed_change_actions": ["request_access"]},
+    {"roles": ["vendor_editor"], "approval_level": 4, "allowed_change_actions": ["add_vendor_contact", "grant_role"]},
+    {"roles": ["vendor_steward"], "approval_level": 6, "allowed_change_actions": list(CHANGE_ACTION_CHOICES)},
+    {"roles": ["vendor_admin"], "approval_level": 10, "allowed_change_actions": list(CHANGE_ACTION_CHOICES)},
+]
+
+
+def test_compiled_policy_matches_dict_policy_checks() -> None:
+    config = AppConfig("", "", "", use_local_db=False)
+    change_types = [*CHANGE_ACTION_CHOICES, "vendor_contract_map", "offering_profile_edit", ""]
+    for policy in _POLICIES:
+        roles = set(policy["roles"])
+        legacy = UserContext("user@example.com", roles, roles, config, role_policy=policy)
+        compiled = UserContext(
+            "user@example.com",
+            roles,
+            roles,
+            config,
+            role_policy=policy,
+            compiled_policy=CompiledRolePolicy.from_policy(policy),
+        )
+        for change_type in change_types:
+            assert compiled.can_apply_change(change_type) == legacy.can_apply_change(change_type), (
+                policy["roles"],
+                change_type,
+            )
+
+
+def test_role_policy_table_shares_entries_and_drops_old_versions() -> None:
+    table = RolePolicyTable()
+    resolved = {"count": 0}
+
+    def _resolve() -> dict:
+        resolved["count"] += 1
+        return dict(_POLICIES[1])
+
+    first = table.get({"vendor_editor"}, 1, _resolve)
+    assert table.get(["vendor_editor"], 1, _resolve) is first
+    assert resolved["count"] == 1
+
+    table.get({"vendor_viewer"}, 1, _resolve)
+    table.get({"vendor_editor"}, 2, _resolve)
+    assert resolved["count"] == 3
+    assert table.stats() == {"entries": 1, "compiles": 3, "policy_version": 2}
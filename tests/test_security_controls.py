@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import sqlite3
 import sys
 from pathlib import Path
 
@@ -16,6 +17,8 @@ from vendor_catalog_app.web.app import create_app
 from vendor_catalog_app.web.security.controls import (
     CSRF_HEADER,
     CSRF_SESSION_KEY,
+    SharedGcraRateLimiter,
+    SlidingWindowRateLimiter,
     request_matches_csrf_token,
 )
 
@@ -198,3 +201,47 @@ def test_security_headers_include_frame_src_for_databricks_embed(
     csp = response.headers.get("Content-Security-Policy", "")
     assert "frame-src 'self' https://dbc-123.cloud.databricks.com" in csp
 
+
+
+def test_sliding_window_limiter_evicts_least_recently_seen_keys() -> None:
+    limiter = SlidingWindowRateLimiter(enabled=True, max_requests=1, window_seconds=60, max_keys=128)
+    assert limiter.allow("user:first") == (True, 0)
+    for index in range(128):
+        limiter.allow(f"user:{index}")
+    assert limiter.allow("user:first") == (True, 0)
+    assert limiter.allow("user:first")[0] is False
+    assert limiter.allow("user:127")[0] is False
+
+
+def test_shared_gcra_limiter_holds_across_workers(tmp_path: Path) -> None:
+    path = tmp_path / "rate_limits.db"
+    worker_a = SharedGcraRateLimiter(enabled=True, max_requests=2, window_seconds=60, path=path)
+    worker_b = SharedGcraRateLimiter(enabled=True, max_requests=2, window_seconds=60, path=path)
+    try:
+        assert worker_a.allow("user:alice:POST") == (True, 0)
+        assert worker_b.allow("user:alice:POST") == (True, 0)
+        allowed, retry_after = worker_a.allow("user:alice:POST")
+        assert allowed is False
+        assert 1 <= retry_after <= 30
+        assert worker_b.allow("user:bob:POST") == (True, 0)
+    finally:
+        worker_a.close()
+        worker_b.close()
+
+
+def test_shared_gcra_limiter_opens_lazily_and_fails_open_when_locked(tmp_path: Path) -> None:
+    path = tmp_path / "limits" / "rate_limits.db"
+    limiter = SharedGcraRateLimiter(enabled=True, max_requests=1, window_seconds=60, path=path)
+    assert not path.parent.exists()
+    assert limiter.allow("user:alice:POST") == (True, 0)
+    assert path.exists()
+
+    holder = sqlite3.connect(str(path), isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
+    limiter._connection().execute("PRAGMA busy_timeout=0")
+    try:
+        assert limiter.allow("user:alice:POST") == (True, 0)
+    finally:
+        holder.execute("ROLLBACK")
+        holder.close()
+        limiter.close()
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.web.http.session_store import (
+    InMemorySessionStore,
+    ServerSideSessionMiddleware,
+    SessionStore,
+    SqliteSessionStore,
+    rotate_session_id,
+)
+
+
+class _CountingStore(InMemorySessionStore):
+    def __init__(self) -> None:
+        super().__init__(ttl_sec=3600, max_entries=100)
+        self.calls = {"load": 0, "save": 0}
+
+    def load(self, session_id: str) -> str | None:
+        self.calls["load"] += 1
+        return super().load(session_id)
+
+    def save(self, session_id: str, payload: str) -> None:
+        self.calls["save"] += 1
+        super().save(session_id, payload)
+
+
+def _app(store: SessionStore) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ServerSideSessionMiddleware, store=store, secret_key="test-secret")
+
+    @app.get("/set")
+    def _set(request: Request, value: str) -> dict[str, str]:
+        request.session["value"] = value
+        return {"value": value}
+
+    @app.get("/get")
+    def _get(request: Request) -> dict[str, str]:
+        return {"value": str(request.session.get("value", ""))}
+
+    @app.get("/aget")
+    async def _aget(request: Request) -> dict[str, str]:
+        return {"value": str(request.session.get("value", ""))}
+
+    @app.get("/clear")
+    def _clear(request: Request) -> dict[str, bool]:
+        request.session.clear()
+        return {"ok": True}
+
+    @app.get("/rotate")
+    def _rotate(request: Request) -> dict[str, bool]:
+        request.session["role"] = "admin"
+        rotate_session_id(request.session)
+        return {"ok": True}
+
+    @app.get("/plain")
+    def _plain() -> dict[str, bool]:
+        return {"ok": True}
+
+    return app
+
+
+def test_cookie_holds_only_session_id_and_unchanged_sessions_skip_writes() -> None:
+    store = _CountingStore()
+    client = TestClient(_app(store))
+
+    created = client.get("/set", params={"value": "x" * 2000})
+    cookie = created.cookies.get("session")
+    assert cookie and len(cookie) < 100
+    assert store.calls["save"] == 1
+
+    assert client.get("/get").json() == {"value": "x" * 2000}
+    assert client.get("/get").json() == {"value": "x" * 2000}
+    assert store.calls == {"load": 2, "save": 1}
+
+    plain = client.get("/plain")
+    assert "set-cookie" not in plain.headers
+    assert store.calls["load"] == 2
+
+    client.get("/clear")
+    assert store.stats()["entries"] == 0
+    assert client.get("/get").json() == {"value": ""}
+
+
+def test_tampered_cookie_starts_a_new_session() -> None:
+    store = _CountingStore()
+    client = TestClient(_app(store))
+    client.get("/set", params={"value": "a"})
+    client.cookies.set("session", "forged-session-id")
+    assert client.get("/get").json() == {"value": ""}
+
+
+def test_sqlite_store_is_shared_between_workers(tmp_path: Path) -> None:
+    path = tmp_path / "sessions.db"
+    worker_a = SqliteSessionStore(path=path, ttl_sec=3600)
+    worker_b = SqliteSessionStore(path=path, ttl_sec=3600)
+    try:
+        client_a = TestClient(_app(worker_a))
+        client_b = TestClient(_app(worker_b))
+        client_a.get("/set", params={"value": "shared"})
+        client_b.cookies.set("session", client_a.cookies.get("session"))
+        assert client_b.get("/get").json() == {"value": "shared"}
+        assert worker_b.touch("missing") is False
+    finally:
+        worker_a.close()
+        worker_b.close()
+
+
+def test_memory_store_evicts_least_recently_used_sessions() -> None:
+    store = InMemorySessionStore(ttl_sec=3600, max_entries=2)
+    store.save("a", "{}")
+    store.save("b", "{}")
+    assert store.load("a") == "{}"
+    store.save("c", "{}")
+    assert store.load("b") is None
+    assert store.load("a") == "{}"
+    assert store.stats()["evictions"] == 1
+
+
+def test_changed_session_re_signs_cookie_and_rotation_drops_the_old_id() -> None:
+    store = _CountingStore()
+    client = TestClient(_app(store))
+    client.get("/set", params={"value": "a"})
+    first = client.cookies.get("session")
+
+    updated = client.get("/set", params={"value": "b"})
+    assert "set-cookie" in updated.headers
+    assert client.cookies.get("session").split(".")[0] == first.split(".")[0]
+
+    client.get("/rotate")
+    rotated = client.cookies.get("session")
+    assert rotated.split(".")[0] != first.split(".")[0]
+    assert store.load(first.split(".")[0]) is None
+    assert client.get("/get").json() == {"value": "b"}
+
+    client.cookies.set("session", first)
+    assert client.get("/get").json() == {"value": ""}
+
+
+def test_sqlite_store_opens_its_file_on_first_use(tmp_path: Path) -> None:
+    path = tmp_path / "state" / "sessions.db"
+    store = SqliteSessionStore(path=path, ttl_sec=3600)
+    try:
+        assert not path.parent.exists()
+        store.save("a", "{}")
+        assert path.exists()
+        assert store.load("a") == "{}"
+    finally:
+        store.close()
+
+
+def test_session_store_requires_the_storage_methods() -> None:
+    with pytest.raises(TypeError):
+        SessionStore(ttl_sec=60)  # type: ignore[abstract]
+
+
+class _FlakyStore(_CountingStore):
+    blocking = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.fail_loads = False
+        self.loads_on_event_loop: list[bool] = []
+
+    def load(self, session_id: str) -> str | None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.loads_on_event_loop.append(False)
+        else:
+            self.loads_on_event_loop.append(True)
+        if self.fail_loads:
+            raise sqlite3.OperationalError("database is locked")
+        return super().load(session_id)
+
+
+def test_failed_session_load_leaves_the_stored_session_untouched() -> None:
+    store = _FlakyStore()
+    client = TestClient(_app(store))
+    client.get("/set", params={"value": "kept"})
+    cookie = client.cookies.get("session")
+
+    store.fail_loads = True
+    response = client.get("/set", params={"value": "lost"})
+    assert "set-cookie" not in response.headers
+    store.fail_loads = False
+    assert client.cookies.get("session") == cookie
+    assert client.get("/get").json() == {"value": "kept"}
+
+
+def test_blocking_store_is_loaded_off_the_event_loop() -> None:
+    store = _FlakyStore()
+    client = TestClient(_app(store))
+    client.get("/set", params={"value": "a"})
+    assert client.get("/aget").json() == {"value": "a"}
+    assert store.loads_on_event_loop and not any(store.loads_on_event_loop)
+    assert store.calls["save"] == 1
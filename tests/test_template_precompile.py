@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.web.app import create_app
+from vendor_catalog_app.web.system.templating import precompile_templates, template_precompile_stats
+
+
+def test_precompile_templates_fills_bytecode_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "jinja"
+    monkeypatch.setenv("TVENDOR_TEMPLATE_BYTECODE_CACHE_DIR", str(cache_dir))
+    templates = create_app().state.templates
+
+    stats = precompile_templates(templates)
+    assert stats["errors"] == []
+    assert stats["templates"] >= 40
+    assert stats["bytecode_cache"] is True
+    assert len(list(cache_dir.glob("*.cache"))) == stats["templates"]
+    assert template_precompile_stats() == stats
+
+    warm = create_app().state.templates
+    assert precompile_templates(warm)["templates"] == stats["templates"]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.infrastructure.search_index import NgramIndex
+
+
+def test_ngram_index_matches_substring_semantics_and_ranks_prefixes_first() -> None:
+    rows = [
+        {"id": "v1", "name": "Northwind Traders", "alias": "nw"},
+        {"id": "v2", "name": "Contoso", "alias": "wind power partner"},
+        {"id": "v3", "name": "Wind", "alias": ""},
+        {"id": "v4", "name": "Fabrikam", "alias": None},
+    ]
+    index = NgramIndex(rows, fields=("id", "name", "alias"), primary_fields=("name",))
+
+    for query in ("wind", "WIN", "in", "o", "trad", "zzz", "v4", "nw"):
+        expected = {
+            row["id"]
+            for row in rows
+            if any(query.lower() in str(row.get(field) or "").lower() for field in ("id", "name", "alias"))
+        }
+        assert {row["id"] for row in index.search(query, limit=10)} == expected
+
+    assert [row["id"] for row in index.search("wind", limit=10)] == ["v3", "v2", "v1"]
+    assert [row["id"] for row in index.search("", limit=2)] == ["v1", "v2"]
+    assert [row["id"] for row in index.search("wind", limit=10, where=lambda row: row["id"] != "v3")] == ["v2", "v1"]
+
+
+def _seed(seed_local_db) -> None:
+    stamp = {"updated_at": "2024-01-01T00:00:00", "updated_by": "seed"}
+    vendor = {"lifecycle_state": "active", "owner_org_id": "IT", "risk_tier": "low", **stamp}
+    seed_local_db(
+        "core_vendor",
+        [
+            {"vendor_id": "v1", "legal_name": "Acme Corporation", "display_name": "Acme", **vendor},
+            {"vendor_id": "v2", "legal_name": "Globex LLC", "display_name": "Globex", **vendor},
+            {"vendor_id": "v3", "legal_name": "Acme Labs Inc", "display_name": "Acme Labs", **vendor},
+        ],
+    )
+    offering = {"lifecycle_state": "active", **stamp}
+    seed_local_db(
+        "core_vendor_offering",
+        [
+            {"offering_id": "o1", "vendor_id": "v1", "offering_name": "Acme Cloud", "offering_type": "saas", **offering},
+            {
+                "offering_id": "o2",
+                "vendor_id": "v2",
+                "offering_name": "Globex Support",
+                "offering_type": "services",
+                **offering,
+            },
+        ],
+    )
+
+
+def test_typeahead_index_matches_sql_search_and_rebuilds_after_writes(seed_local_db, local_repo) -> None:
+    _seed(seed_local_db)
+    repo = local_repo()
+    for query in ("acme", "glo", "v", "labs", "cloud", "missing"):
+        indexed = repo.search_vendors_typeahead(q=query)
+        repo._typeahead_index_enabled = False
+        from_sql = repo.search_vendors_typeahead(q=query)
+        repo._typeahead_index_enabled = True
+        assert sorted(indexed["vendor_id"]) == sorted(from_sql["vendor_id"])
+        assert list(indexed.columns) == list(from_sql.columns)
+
+    assert list(repo.search_vendors_typeahead(q="acme")["vendor_id"]) == ["v1", "v3"]
+    offerings = repo.search_offerings_typeahead(vendor_id="v2", q="o")
+    assert list(offerings["offering_id"]) == ["o2"]
+
+    counts = repo.warm_typeahead_indexes()
+    assert counts["vendors"] == 3
+    assert counts["offerings"] == 2
+
+    # A write in this process to an indexed table is visible to the very next search.
+    repo.client.execute(
+        "INSERT INTO core_vendor (vendor_id, legal_name, display_name, lifecycle_state, owner_org_id, risk_tier, "
+        "updated_at, updated_by) VALUES ('v4', 'Initech', 'Initech', 'active', 'IT', 'low', '2024-01-01', 'seed')"
+    )
+    builds = repo._typeahead_registry.stats()["builds"]
+    repo._cache_clear(tables=["app_user_settings"])
+    repo.search_vendors_typeahead(q="initech")
+    assert repo._typeahead_registry.stats()["builds"] == builds
+    repo._cache_clear(tables=["core_vendor"])
+    assert list(repo.search_vendors_typeahead(q="initech")["vendor_id"]) == ["v4"]
+
+
+def test_typeahead_index_picks_up_other_workers_writes_by_data_version(
+    seed_local_db, local_repo, monkeypatch
+) -> None:
+    _seed(seed_local_db)
+    monkeypatch.setenv("TVENDOR_TYPEAHEAD_INDEX_REVALIDATE_SEC", "0")
+    repo = local_repo()
+    other_worker = local_repo()
+    assert repo.search_vendors_typeahead(q="initech").empty
+    builds = repo._typeahead_registry.stats()["builds"]
+    repo.search_vendors_typeahead(q="acme")
+    assert repo._typeahead_registry.stats()["builds"] == builds
+
+    other_worker.client.execute(
+        "INSERT INTO core_vendor (vendor_id, legal_name, display_name, lifecycle_state, owner_org_id, risk_tier, "
+        "updated_at, updated_by) VALUES ('v4', 'Initech', 'Initech', 'active', 'IT', 'low', '2024-02-01', 'seed')"
+    )
+    # The changed version starts one background rebuild; the previous index keeps serving meanwhile.
+    repo.search_vendors_typeahead(q="initech")
+    assert repo._typeahead_registry.wait_for_rebuilds(timeout=10)
+    assert list(repo.search_vendors_typeahead(q="initech")["vendor_id"]) == ["v4"]
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.backend.repository import VendorRepository
+from vendor_catalog_app.infrastructure.buffered_writer import BufferedBatchWriter
+from vendor_catalog_app.infrastructure.db import DataExecutionError
+
+
+class _RecordingClient:
+    def __init__(self) -> None:
+        self.executed: list[tuple[str, tuple, bool]] = []
+
+    def execute(self, statement, params=None, *, invalidate_cache: bool = True) -> None:
+        self.executed.append((statement, tuple(params or ()), invalidate_cache))
+
+    def close(self) -> None:
+        return None
+
+
+def _repo(local_repo, monkeypatch: pytest.MonkeyPatch) -> tuple[VendorRepository, _RecordingClient]:
+    monkeypatch.setenv("TVENDOR_USAGE_LOG_ENABLED", "true")
+    monkeypatch.setenv("TVENDOR_USAGE_LOG_MIN_INTERVAL_SEC", "0")
+    monkeypatch.setenv("TVENDOR_USAGE_LOG_FLUSH_INTERVAL_MS", "60000")
+    repo = local_repo()
+    client = _RecordingClient()
+    repo.client = client
+    monkeypatch.setattr(repo, "_actor_ref", lambda principal: f"usr:{principal}")
+    return repo, client
+
+
+def test_usage_events_are_buffered_and_flushed_as_one_multi_row_insert(
+    local_repo, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo, client = _repo(local_repo, monkeypatch)
+
+    repo.log_usage_event("a@example.com", "vendors", "page_view")
+    repo.log_usage_event("b@example.com", "projects", "page_view")
+    repo.log_usage_event("a@example.com", "app", "session_start", {"locked_mode": False})
+    assert client.executed == []
+
+    assert repo.flush_usage_events() == 3
+    assert len(client.executed) == 1
+    statement, params, invalidate_cache = client.executed[0]
+    assert statement.count("(%s, %s, %s, %s, %s, %s)") == 3
+    assert len(params) == 18
+    assert params[1] == "usr:a@example.com"
+    assert params[7] == "usr:b@example.com"
+    assert invalidate_cache is False
+    repo.close()
+
+
+def test_failed_usage_batch_is_counted_by_the_writer(local_repo, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo, client = _repo(local_repo, monkeypatch)
+
+    def _fail(statement, params=None, *, invalidate_cache: bool = True) -> None:
+        raise DataExecutionError("warehouse unavailable")
+
+    monkeypatch.setattr(client, "execute", _fail)
+    repo.log_usage_event("a@example.com", "vendors", "page_view")
+    repo.log_usage_event("b@example.com", "projects", "page_view")
+
+    repo.flush_usage_events()
+    stats = repo._usage_writer.stats()
+    assert stats["failed_total"] == 2
+    assert stats["written_total"] == 0
+    repo.close()
+
+
+def test_buffered_writer_drops_when_full_and_drains_on_close() -> None:
+    written: list[list[int]] = []
+    writer = BufferedBatchWriter[int](
+        name="test",
+        flush_batch=written.append,
+        enabled=True,
+        max_queue=4,
+        batch_size=100,
+        flush_interval_ms=60000,
+        backpressure_sample_rate=1.0,
+    )
+
+    accepted = [writer.submit(value) for value in range(6)]
+    assert accepted == [True, True, True, True, False, False]
+    assert writer.stats()["dropped_total"] == 2
+
+    writer.close(timeout_sec=1.0)
+    assert written == [[0, 1, 2, 3]]
+    assert writer.stats()["queued"] == 0
@@ -10,6 +10,7 @@ if str(APP_ROOT) not in sys.path:
     sys.path.insert(0, str(APP_ROOT))
 
 from vendor_catalog_app.core.config import AppConfig
+from vendor_catalog_app.core.role_policy import RolePolicyTable
 from vendor_catalog_app.core.security import ROLE_ADMIN, ROLE_VIEWER
 from vendor_catalog_app.repository import UNKNOWN_USER_PRINCIPAL
 from vendor_catalog_app.web.core import identity, user_context_service
@@ -26,6 +27,7 @@ class _FakeRepo:
         self.synced_users: list[str] = []
         self.synced_identity_payloads: list[dict[str, str | None]] = []
         self.last_group_principals: set[str] = set()
+        self.role_policy_table = RolePolicyTable()
 
     def ensure_runtime_tables(self) -> None:
         self.ensure_called += 1
@@ -60,6 +62,14 @@ class _FakeRepo:
             "allowed_change_actions": [],
         }
 
+    def compiled_role_policy(self, user_roles: set[str], *, policy_version=None, resolved_policy=None):
+        version = self.policy_version if policy_version is None else policy_version
+        return self.role_policy_table.get(
+            user_roles,
+            version,
+            lambda: resolved_policy if resolved_policy is not None else self.resolve_role_policy(set(user_roles)),
+        )
+
     def get_security_policy_version(self) -> int:
         return self.policy_version
 
@@ -239,6 +249,22 @@ def test_session_policy_snapshot_refreshes_on_policy_version_change(monkeypatch)
     assert repo.resolve_policy_called == 2
 
 
+def test_users_with_the_same_roles_share_one_compiled_policy(monkeypatch) -> None:
+    repo = _FakeRepo(current_user="editor@example.com", roles={"vendor_editor"})
+    config = AppConfig("", "", "", use_local_db=False)
+    monkeypatch.setattr(user_context_service, "get_repo", lambda: repo)
+    monkeypatch.setattr(user_context_service, "get_config", lambda: config)
+    monkeypatch.setattr(identity, "get_config", lambda: config)
+
+    first = user_context_service.get_user_context(_request(session={}))
+    repo.current_user = "other.editor@example.com"
+    second = user_context_service.get_user_context(_request(session={}))
+
+    assert first.user_principal != second.user_principal
+    assert second.compiled_policy is first.compiled_policy
+    assert repo.resolve_policy_called == 1
+
+
 def test_dev_allow_all_access_forces_admin_role(monkeypatch) -> None:
     repo = _FakeRepo(current_user="viewer@example.com", roles={ROLE_VIEWER})
     config = AppConfig("", "", "", use_local_db=False, env="dev", dev_allow_all_access=True)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parents[1] / "app"
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from vendor_catalog_app.backend.repository import VendorRepository
+
+
+def _page_ids(repo: VendorRepository, search_text: str) -> list[str]:
+    rows, total = repo.list_vendors_page(search_text=search_text, page_size=50)
+    assert total == len(rows)
+    return list(rows["vendor_id"])
+
+
+def test_search_doc_paging_matches_per_table_clause(search_catalog_db: Path, local_repo) -> None:
+    repo = local_repo()
+    legacy = local_repo()
+    legacy._vendor_search_doc_enabled = False
+    assert repo.ensure_vendor_search_docs() is True
+
+    for query in ("acme", "CLOUD", "gibbons", "initech.example", "hammock", "v2", "saas", "zzz"):
+        assert _page_ids(repo, query) == _page_ids(legacy, query), query
+    assert repo._vendor_search_doc_available is True
+    assert _page_ids(repo, "cloud") == ["v1", "v2"]
+
+
+def test_search_doc_refreshes_when_audited_changes_flush(search_catalog_db: Path, local_repo, monkeypatch) -> None:
+    repo = local_repo()
+    monkeypatch.setattr(repo, "_actor_ref", lambda principal: principal)
+    assert repo.ensure_vendor_search_docs() is True
+    assert _page_ids(repo, "orbital") == []
+
+    repo.client.execute("UPDATE core_vendor_offering SET offering_name = 'Orbital Analytics' WHERE offering_id = 'o2'")
+    repo._write_audit_entity_change(
+        entity_name="core_vendor_offering",
+        entity_id="o2",
+        action_type="update",
+        actor_user_principal="admin@example.com",
+        before_json={"offering_id": "o2", "vendor_id": "v2", "offering_name": "Globex Support"},
+        after_json={"offering_id": "o2", "vendor_id": "v2", "offering_name": "Orbital Analytics"},
+    )
+    # Searches do not flush the spool; the flusher thread delivers the record.
+    repo.flush_audit_entity_changes()
+    assert _page_ids(repo, "orbital") == ["v2"]
+    assert _page_ids(repo, "globex support") == []
+
+    # Vendors added without an audit record are picked up by the row-count check.
+    repo.client.execute(
+        "INSERT INTO core_vendor (vendor_id, legal_name, display_name, lifecycle_state, owner_org_id, risk_tier, "
+        "updated_at, updated_by) VALUES ('v4', 'Orbital Dynamics', 'Orbital', 'active', 'IT', 'low', 'now', 'seed')"
+    )
+    repo._vendor_search_doc_checked_at = None
+    # The drift is repaired in the background; the search meanwhile uses the per-table clause.
+    assert sorted(_page_ids(repo, "orbital")) == ["v2", "v4"]
+    assert repo._vendor_search_doc_available is False
+    repo._vendor_search_doc_sync_thread.join(timeout=10)
+    assert sorted(_page_ids(repo, "orbital")) == ["v2", "v4"]
+    assert repo._vendor_search_doc_available is True
+
+
+def test_search_doc_catches_up_unaudited_and_offering_keyed_changes(search_catalog_db: Path, local_repo) -> None:
+    repo = local_repo()
+    assert repo.ensure_vendor_search_docs() is True
+    assert _page_ids(repo, "zephyr") == []
+
+    # No audit record: another worker's write, or a write path that is not audited.
+    repo.client.execute(
+        "UPDATE core_vendor_contact SET full_name = 'Zephyr Quill', updated_at = '9999-01-01' WHERE vendor_contact_id = 'c1'"
+    )
+    repo._mark_vendor_search_docs_stale(["core_vendor_contact"])
+    assert repo._vendor_search_doc_checked_at is None
+    _page_ids(repo, "zephyr")
+    repo._vendor_search_doc_sync_thread.join(timeout=10)
+    assert repo._vendor_search_doc_available is True
+    assert _page_ids(repo, "zephyr") == ["v3"]
+
+    statements: list[str] = []
+    execute = repo.client.execute
+
+    def _recording_execute(statement, params=None, **kwargs):
+        statements.append(statement)
+        return execute(statement, params, **kwargs)
+
+    repo.client.execute = _recording_execute
+    repo.refresh_vendor_search_docs(offering_ids=["o2"])
+    assert statements and not any("offering_id IN" in statement for statement in statements)
+
+
+def test_search_doc_refresh_is_idempotent_and_drops_deleted_vendors(search_catalog_db: Path, local_repo) -> None:
+    repo = local_repo()
+    repo.refresh_vendor_search_docs()
+    repo.refresh_vendor_search_docs(vendor_ids=["v1", "v2"])
+    repo.refresh_vendor_search_docs()
+    docs = repo.client.query("SELECT vendor_id FROM app_vendor_search_doc ORDER BY vendor_id")
+    vendors = repo.client.query("SELECT vendor_id FROM core_vendor ORDER BY vendor_id")
+    assert list(docs["vendor_id"]) == list(vendors["vendor_id"])
+
+    repo.client.execute("DELETE FROM core_vendor WHERE vendor_id = 'v3'")
+    repo.refresh_vendor_search_docs(vendor_ids=["v3"])
+    docs = repo.client.query("SELECT vendor_id FROM app_vendor_search_doc ORDER BY vendor_id")
+    assert "v3" not in list(docs["vendor_id"])